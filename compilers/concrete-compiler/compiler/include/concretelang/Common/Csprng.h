@@ -9,6 +9,7 @@
 #include "concrete-cpu.h"
 #include <cassert>
 #include <memory>
+#include <vector>
 
 namespace concretelang {
 namespace csprng {
@@ -55,6 +56,14 @@ public:
   EncryptionCSPRNG(EncryptionCSPRNG &) = delete;
   EncryptionCSPRNG(EncryptionCSPRNG &&other);
   ~EncryptionCSPRNG();
+
+  /// Draws a seed from the mask stream of the csprng (e.g., to seed a
+  /// compressed ciphertext).
+  void drawSeed(struct Uint128 &seed);
+
+  /// Forks `count` csprngs, whose mask streams are independent from each
+  /// other, and deterministic given the state of this csprng.
+  std::vector<EncryptionCSPRNG> fork(size_t count);
 };
 
 void writeSeed(struct Uint128 seed, uint64_t *buffer);
@@ -10,9 +10,12 @@
 #include "concretelang/Common/Csprng.h"
 #include "concretelang/Common/Error.h"
 #include "concretelang/Common/Keys.h"
+#include <atomic>
 #include <functional>
 #include <map>
 #include <memory>
+#include <mutex>
+#include <optional>
 #include <stdlib.h>
 #include <string>
 
@@ -71,16 +74,55 @@ struct Keyset {
   Keyset(ServerKeyset server, ClientKeyset client)
       : server(server), client(client) {}
 
+  /// @brief Creates a keyset whose server keyset is only loaded, using
+  /// `loadServer`, when it is needed (see `ensureServerLoaded`).
+  Keyset(std::function<Result<ServerKeyset>()> loadServer,
+         ClientKeyset client);
+
+  /// @brief Loads the server keyset if its loading has been deferred.
+  ///
+  /// It must be called before using `server`. The server keyset is loaded once
+  /// for a keyset and all its copies.
+  Result<void> ensureServerLoaded();
+
   static Keyset fromProto(const Message<concreteprotocol::Keyset> &proto);
 
+  /// @brief Returns the serialized form of the keyset (the server keyset must
+  /// be loaded).
   Message<concreteprotocol::Keyset> toProto() const;
+
+private:
+  struct DeferredServerKeyset {
+    std::mutex mutex;
+    std::function<Result<ServerKeyset>()> load;
+    std::optional<ServerKeyset> loaded;
+  };
+
+  std::shared_ptr<DeferredServerKeyset> deferredServer;
+};
+
+/// Counters of a keyset cache, shared by its copies.
+struct KeysetCacheStatistics {
+  std::atomic<uint64_t> hits{0};
+  std::atomic<uint64_t> misses{0};
+  std::atomic<uint64_t> evictions{0};
 };
 
+/// A cache of keysets, stored in a directory which can be shared by several
+/// processes.
+///
+/// Each keyset is stored in a folder named after the SHA-256 hash of what it is
+/// generated from, and is generated by a single process at a time (others wait
+/// for it, then load it). If `maxSize` is not 0, the least recently used
+/// keysets are evicted after a keyset is generated, until the size of the
+/// directory is under `maxSize` bytes.
 class KeysetCache {
   std::string backingDirectoryPath;
+  uint64_t maxSize;
+  std::shared_ptr<KeysetCacheStatistics> statistics;
 
 public:
-  KeysetCache(std::string backingDirectoryPath);
+  KeysetCache(std::string backingDirectoryPath, uint64_t maxSize = 0);
 
   Result<Keyset>
   getKeyset(const Message<concreteprotocol::KeysetInfo> &keysetInfo,
@@ -88,8 +130,37 @@ public:
             std::map<uint32_t, LweSecretKey> lweSecretKeys =
                 std::map<uint32_t, LweSecretKey>());
 
+  /// Same as `getKeyset`, but if the keyset is cached, only its client keyset
+  /// is loaded, and its server keyset is loaded when it is needed (see
+  /// `Keyset::ensureServerLoaded`).
+  Result<Keyset>
+  getLazyKeyset(const Message<concreteprotocol::KeysetInfo> &keysetInfo,
+                __uint128_t secret_seed, __uint128_t encryption_seed,
+                std::map<uint32_t, LweSecretKey> lweSecretKeys =
+                    std::map<uint32_t, LweSecretKey>());
+
+  /// Returns the number of keysets loaded from the cache.
+  uint64_t hits() const { return statistics->hits; }
+
+  /// Returns the number of keysets generated because they were not cached.
+  uint64_t misses() const { return statistics->misses; }
+
+  /// Returns the number of keysets evicted from the cache.
+  uint64_t evictions() const { return statistics->evictions; }
+
 private:
   KeysetCache() = default;
+
+  /// Evicts the least recently used keysets, but `keptEntry`, until the size
+  /// of the cache is under `maxSize` (keysets in use are skipped).
+  void evict(const std::string &keptEntry);
+
+  /// Loads the server keyset of a cached keyset, generating it again from the
+  /// secret keys of `client` if it has been evicted since `client` was loaded.
+  Result<ServerKeyset>
+  loadServerKeyset(const std::string &entryName,
+                   const Message<concreteprotocol::KeysetInfo> &keysetInfo,
+                   __uint128_t encryption_seed, const ClientKeyset &client);
 };
 
 } // namespace keysets
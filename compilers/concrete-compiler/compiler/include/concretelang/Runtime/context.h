@@ -12,6 +12,7 @@
 #include <assert.h>
 #include <complex>
 #include <map>
+#include <memory>
 #include <mutex>
 #include <pthread.h>
 #include <vector>
@@ -39,10 +40,31 @@ typedef struct FFT {
   size_t polynomial_size;
 } FFT;
 
+/// Buffers used to bootstrap ciphertexts with a set of parameters.
+struct BootstrapBuffers {
+  BootstrapBuffers(size_t polynomial_size, size_t glwe_dimension,
+                   const struct Fft *fft);
+  BootstrapBuffers(const BootstrapBuffers &other) = delete;
+  ~BootstrapBuffers();
+
+  /// The accumulator (i.e., trivially encrypted glwe ciphertext).
+  uint64_t *glwe_ct;
+  /// The scratch space of the bootstrap.
+  uint8_t *scratch;
+  size_t scratch_size;
+};
+
 typedef struct RuntimeContext {
 
   RuntimeContext() = delete;
   RuntimeContext(ServerKeyset serverKeyset);
+  /// Creates a context using bootstrap keys already converted to the fourier
+  /// domain (e.g., loaded from a file), instead of converting the bootstrap
+  /// keys of the keyset. An empty vector converts the keys of the keyset.
+  RuntimeContext(
+      ServerKeyset serverKeyset,
+      std::vector<std::shared_ptr<const std::complex<double>>>
+          fourierBootstrapKeys);
   virtual ~RuntimeContext() {
 #ifdef CONCRETELANG_CUDA_SUPPORT
     for (int i = 0; i < num_devices; ++i) {
@@ -62,7 +84,7 @@ typedef struct RuntimeContext {
 
   virtual const std::complex<double> *
   fourier_bootstrap_key_buffer(size_t keyId) {
-    return fourier_bootstrap_keys[keyId]->data();
+    return fourier_bootstrap_keys[keyId].get();
   }
 
   virtual const uint64_t *fp_keyswitch_key_buffer(size_t keyId) {
@@ -73,9 +95,21 @@ typedef struct RuntimeContext {
 
   const ServerKeyset getKeys() const { return serverKeyset; }
 
+  /// Returns the bootstrap buffers of the calling thread for a set of
+  /// parameters. Buffers are allocated on first use and then reused by all
+  /// bootstraps of the thread with the same parameters (whatever the context),
+  /// until the thread exits.
+  static BootstrapBuffers &bootstrap_buffers(size_t polynomial_size,
+                                             size_t glwe_dimension,
+                                             const struct Fft *fft);
+
+  /// Returns the number of times bootstrap buffers were allocated in the
+  /// process.
+  static size_t bootstrap_buffers_allocations();
+
 protected:
   ServerKeyset serverKeyset;
-  std::vector<std::shared_ptr<std::vector<std::complex<double>>>>
+  std::vector<std::shared_ptr<const std::complex<double>>>
       fourier_bootstrap_keys;
   std::vector<FFT> ffts;
   std::pair<FFT, std::shared_ptr<std::vector<std::complex<double>>>>
@@ -0,0 +1,79 @@
+// Part of the Concrete Compiler Project, under the BSD3 License with Zama
+// Exceptions. See
+// https://github.com/zama-ai/concrete/blob/main/LICENSE.txt
+// for license information.
+
+#ifndef CONCRETELANG_RUNTIME_WORKER_POOL_H
+#define CONCRETELANG_RUNTIME_WORKER_POOL_H
+
+#include <condition_variable>
+#include <cstddef>
+#include <deque>
+#include <functional>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace mlir {
+namespace concretelang {
+
+/// A persistent pool of threads used to process the ciphertexts of batched
+/// operations in parallel.
+///
+/// The pool is independent of the dataflow (HPX) and loop (OpenMP) runtimes.
+/// Its size defaults to the number of hardware threads, and can be set using
+/// the `CONCRETE_RUNTIME_NUM_THREADS` environment variable or
+/// `setNumThreads`.
+///
+/// The pool can be used by processes forked after its creation: the threads of
+/// the pool don't exist in the forked process, so the pool is replaced by a new
+/// one (with the same number of threads) the first time it is used there.
+class WorkerPool {
+public:
+  WorkerPool(const WorkerPool &other) = delete;
+  WorkerPool &operator=(const WorkerPool &other) = delete;
+  ~WorkerPool();
+
+  /// Returns the pool shared by the runtime.
+  static WorkerPool &get();
+
+  /// Sets the number of threads working on a batch, including the calling
+  /// thread (0 restores the default).
+  void setNumThreads(size_t numThreads);
+
+  /// Returns the number of threads working on a batch, including the calling
+  /// thread.
+  size_t getNumThreads();
+
+  /// Calls `body(begin, end)` on disjoint chunks covering `[0, size)`, in
+  /// parallel, and returns once all chunks are processed.
+  ///
+  /// The calling thread processes chunks as well, so calls can be nested or
+  /// concurrent without deadlocking.
+  void parallelFor(size_t size,
+                   const std::function<void(size_t, size_t)> &body);
+
+private:
+  WorkerPool();
+
+  void resize(size_t numWorkers);
+  void work();
+
+  /// Handlers registered with `pthread_atfork`, so that no lock is held by
+  /// another thread when the process is forked.
+  static void prepareFork();
+  static void afterForkInParent();
+  static void afterForkInChild();
+
+  std::mutex mutex;
+  std::condition_variable condition;
+  std::deque<std::function<void()>> tasks;
+  std::vector<std::thread> workers;
+  size_t numThreads;
+  bool stopping;
+};
+
+} // namespace concretelang
+} // namespace mlir
+
+#endif
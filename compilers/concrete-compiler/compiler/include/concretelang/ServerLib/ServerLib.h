@@ -26,6 +26,12 @@ using concretelang::transformers::ReturnTransformer;
 using concretelang::transformers::TransformerFactory;
 using concretelang::values::Value;
 
+namespace mlir {
+namespace concretelang {
+struct RuntimeContext;
+} // namespace concretelang
+} // namespace mlir
+
 namespace concretelang {
 namespace serverlib {
 
@@ -42,17 +48,69 @@ private:
   void *libraryHandle;
 };
 
+/// Evaluation keys prepared for execution.
+///
+/// Preparing the keys converts the bootstrap keys to the fourier domain, which
+/// is otherwise done on every call. Prepared keys are never modified by the
+/// calls using them, so they can be shared between calls and threads.
+class PreparedKeys {
+public:
+  /// Prepares the keys of a server keyset.
+  static PreparedKeys prepare(const ServerKeyset &serverKeyset);
+
+  /// Saves the prepared bootstrap keys (i.e., in the fourier domain) to a
+  /// file, so that they can be loaded later without being converted again.
+  Result<void> save(const std::string &path) const;
+
+  /// Loads the prepared bootstrap keys of a server keyset from a file written
+  /// by `save`.
+  ///
+  /// The file is memory-mapped and used in place by the runtime, so its pages
+  /// are shared between all the processes loading it. The file must not be
+  /// modified while the keys are in use.
+  static Result<PreparedKeys> load(const ServerKeyset &serverKeyset,
+                                   const std::string &path);
+
+  /// Returns the runtime context holding the prepared keys.
+  mlir::concretelang::RuntimeContext *getRuntimeContext() const;
+
+private:
+  PreparedKeys() = default;
+
+  std::shared_ptr<mlir::concretelang::RuntimeContext> runtimeContext;
+};
+
+/// A circuit of a server program.
+///
+/// Calls are reentrant: every call uses its own argument and return buffers,
+/// so a single server circuit can be called concurrently from multiple
+/// threads, as long as the keys they use are not modified meanwhile.
 class ServerCircuit {
   friend class ServerProgram;
 
 public:
   /// Call the circuit with public arguments.
-  Result<std::vector<TransportValue>> call(const ServerKeyset &serverKeyset,
-                                           std::vector<TransportValue> &args);
+  Result<std::vector<TransportValue>>
+  call(const ServerKeyset &serverKeyset,
+       std::vector<TransportValue> &args) const;
+
+  /// Call the circuit with public arguments, using prepared keys.
+  Result<std::vector<TransportValue>>
+  call(const PreparedKeys &preparedKeys,
+       std::vector<TransportValue> &args) const;
+
+  /// Call the circuit on a batch of public arguments, using prepared keys.
+  ///
+  /// The calls run in parallel on the runtime worker pool, and share the keys
+  /// and the setup of the circuit. Returns the results in the order of the
+  /// arguments, or the error of the first failing call.
+  Result<std::vector<std::vector<TransportValue>>>
+  callBatch(const PreparedKeys &preparedKeys,
+            std::vector<std::vector<TransportValue>> &argsBatch) const;
 
   /// Simulate the circuit with public arguments.
   Result<std::vector<TransportValue>>
-  simulate(std::vector<TransportValue> &args);
+  simulate(std::vector<TransportValue> &args) const;
 
   /// Returns the name of this circuit.
   std::string getName();
@@ -65,7 +123,13 @@ private:
                     std::shared_ptr<DynamicModule> dynamicModule,
                     bool useSimulation);
 
-  void invoke(const ServerKeyset &serverKeyset);
+  Result<std::vector<TransportValue>>
+  callRegistered(mlir::concretelang::RuntimeContext *runtimeContext,
+                 std::vector<TransportValue> &args) const;
+
+  void invoke(mlir::concretelang::RuntimeContext *runtimeContext,
+              std::vector<Value> &argsBuffer,
+              std::vector<Value> &returnsBuffer) const;
 
   Message<concreteprotocol::CircuitInfo> circuitInfo;
   bool useSimulation;
@@ -73,8 +137,6 @@ private:
   std::shared_ptr<DynamicModule> dynamicModule;
   std::vector<ArgTransformer> argTransformers;
   std::vector<ReturnTransformer> returnTransformers;
-  std::vector<Value> argsBuffer;
-  std::vector<Value> returnsBuffer;
   std::vector<size_t> argDescriptorSizes;
   std::vector<size_t> returnDescriptorSizes;
   size_t argRawSize;
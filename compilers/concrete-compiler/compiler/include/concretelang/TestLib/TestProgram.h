@@ -174,6 +174,21 @@ public:
     return serverCircuit;
   }
 
+  Result<Keyset> getKeyset() {
+    if (!keyset.has_value()) {
+      return StringError("TestProgram: keyset has not been generated\n");
+    }
+    return *keyset;
+  }
+
+  Result<mlir::concretelang::ProgramCompilationFeedback>
+  getCompilationFeedback() {
+    OUTCOME_TRYV(getLibrary());
+    return mlir::concretelang::ProgramCompilationFeedback::load(
+        mlir::concretelang::CompilerEngine::Library::
+            getCompilationFeedbackPath(artifactDirectory));
+  }
+
 private:
   std::string getArtifactDirectory() { return artifactDirectory; }
 
@@ -184,13 +199,6 @@ private:
     return *library;
   }
 
-  Result<Keyset> getKeyset() {
-    if (!keyset.has_value()) {
-      return StringError("TestProgram: keyset has not been generated\n");
-    }
-    return *keyset;
-  }
-
   bool isSimulation() { return compiler.getCompilationOptions().simulate; }
 
   std::string artifactDirectory;
@@ -13,6 +13,7 @@
 #include "concretelang/Dialect/FHE/IR/FHEOpsDialect.h.inc"
 #include "concretelang/Runtime/DFRuntime.hpp"
 #include "concretelang/Runtime/GPUDFG.hpp"
+#include "concretelang/Runtime/worker_pool.h"
 #include "concretelang/ServerLib/ServerLib.h"
 #include "concretelang/Support/logging.h"
 #include <llvm/Support/Debug.h>
@@ -21,6 +22,7 @@
 #include <mlir/Dialect/Func/IR/FuncOps.h>
 #include <mlir/Dialect/MemRef/IR/MemRef.h>
 #include <mlir/ExecutionEngine/OptUtils.h>
+#include <mutex>
 
 #include <pybind11/pybind11.h>
 #include <pybind11/pytypes.h>
@@ -32,13 +34,30 @@
 using mlir::concretelang::CompilationOptions;
 using mlir::concretelang::LambdaArgument;
 
+/// Installs a SIGINT handler for the lifetime of the guard.
+///
+/// Guards can be alive in multiple threads at the same time (e.g., concurrent
+/// server calls), so the handler is installed by the first guard and the
+/// previous handler is restored by the last one.
 class SignalGuard {
 public:
-  SignalGuard() { previousHandler = signal(SIGINT, SignalGuard::handler); }
-  ~SignalGuard() { signal(SIGINT, this->previousHandler); }
+  SignalGuard() {
+    std::lock_guard<std::mutex> lock(guardsMutex);
+    if (aliveGuards++ == 0) {
+      previousHandler = signal(SIGINT, SignalGuard::handler);
+    }
+  }
+  ~SignalGuard() {
+    std::lock_guard<std::mutex> lock(guardsMutex);
+    if (--aliveGuards == 0) {
+      signal(SIGINT, previousHandler);
+    }
+  }
 
 private:
-  void (*previousHandler)(int);
+  static inline std::mutex guardsMutex;
+  static inline size_t aliveGuards = 0;
+  static inline void (*previousHandler)(int) = nullptr;
 
   static void handler(int _signum) {
     llvm::outs() << " Aborting... \n";
@@ -97,6 +116,23 @@ library_compile_module(
   return compilationResult;
 }
 
+/// Runs the compilation up to the parametrization of the TFHE operations (i.e.,
+/// without lowering and code generation) and returns the feedback of the
+/// optimizer.
+mlir::concretelang::ProgramCompilationFeedback select_parameters(
+    mlir::ModuleOp module, mlir::concretelang::CompilationOptions options,
+    std::shared_ptr<mlir::concretelang::CompilationContext> cctx) {
+  mlir::concretelang::CompilerEngine ce{cctx};
+  ce.setCompilationOptions(options);
+  auto target = mlir::concretelang::CompilerEngine::Target::PARAMETRIZED_TFHE;
+  GET_OR_THROW_EXPECTED(auto compilationResult, ce.compile(module, target));
+  if (!compilationResult.feedback.has_value()) {
+    // No parameters are needed, so there is no error to expect either.
+    return mlir::concretelang::ProgramCompilationFeedback{};
+  }
+  return compilationResult.feedback.value();
+}
+
 concretelang::clientlib::ClientParameters library_load_client_parameters(
     LibrarySupport_Py support,
     mlir::concretelang::LibraryCompilationResult &result) {
@@ -162,8 +198,9 @@ key_set(concretelang::clientlib::ClientParameters clientParameters,
   auto encryptionSeed = (((__uint128_t)encSeedMsb) << 64) | encSeedLsb;
 
   if (cache.has_value()) {
+    // The server keys are only loaded from the cache when they are needed.
     GET_OR_THROW_RESULT(Keyset keyset,
-                        (*cache).keysetCache.getKeyset(
+                        (*cache).keysetCache.getLazyKeyset(
                             clientParameters.programInfo.asReader().getKeyset(),
                             secretSeed, encryptionSeed, lweSecretKeys));
     concretelang::clientlib::KeySet output{keyset};
@@ -342,6 +379,10 @@ keySetUnserialize(const std::string &buffer) {
 }
 
 std::string keySetSerialize(concretelang::clientlib::KeySet &keySet) {
+  auto loaded = keySet.keyset.ensureServerLoaded();
+  if (loaded.has_failure()) {
+    throw std::runtime_error(loaded.as_failure().error().mesg);
+  }
   auto keysetProto = keySet.keyset.toProto();
   auto maybeBuffer = keysetProto.writeBinaryToString();
   if (maybeBuffer.has_failure()) {
@@ -716,6 +757,16 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
   m.def("round_trip",
         [](std::string mlir_input) { return roundTrip(mlir_input.c_str()); });
 
+  m.def("select_parameters",
+        [](pybind11::object mlir_module,
+           mlir::concretelang::CompilationOptions options,
+           std::shared_ptr<mlir::concretelang::CompilationContext> cctx) {
+          SignalGuard signalGuard;
+          return select_parameters(
+              unwrap(mlirPythonCapsuleToModule(mlir_module.ptr())).clone(),
+              options, cctx);
+        });
+
   m.def("set_llvm_debug_flag", [](bool enable) { llvm::DebugFlag = enable; });
 
   m.def("set_compiler_logging",
@@ -727,6 +778,13 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
   m.def("check_gpu_runtime_enabled", &checkGPURuntimeEnabled);
   m.def("check_cuda_device_available", &checkCudaDeviceAvailable);
 
+  m.def("set_runtime_num_threads", [](size_t numThreads) {
+    mlir::concretelang::WorkerPool::get().setNumThreads(numThreads);
+  });
+  m.def("get_runtime_num_threads", []() {
+    return mlir::concretelang::WorkerPool::get().getNumThreads();
+  });
+
   m.def("import_tfhers_fheuint8",
         [](const pybind11::bytes &serialized_fheuint,
            TfhersFheIntDescription info, uint32_t encryptionKeyId,
@@ -1189,7 +1247,24 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
                                   circuitName);
           });
   pybind11::class_<::concretelang::clientlib::KeySetCache>(m, "KeySetCache")
-      .def(pybind11::init<std::string &>());
+      .def(pybind11::init([](std::string &backingDirectoryPath,
+                             uint64_t maxSize) {
+             return ::concretelang::clientlib::KeySetCache{
+                 KeysetCache(backingDirectoryPath, maxSize)};
+           }),
+           pybind11::arg("backing_directory_path"),
+           pybind11::arg("max_size") = 0)
+      .def("hits",
+           [](::concretelang::clientlib::KeySetCache &cache) {
+             return cache.keysetCache.hits();
+           })
+      .def("misses",
+           [](::concretelang::clientlib::KeySetCache &cache) {
+             return cache.keysetCache.misses();
+           })
+      .def("evictions", [](::concretelang::clientlib::KeySetCache &cache) {
+        return cache.keysetCache.evictions();
+      });
 
   pybind11::class_<::concretelang::clientlib::LweSecretKeyParam>(
       m, "LweSecretKeyParam")
@@ -1476,6 +1551,10 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
            })
       .def("get_evaluation_keys",
            [](::concretelang::clientlib::KeySet &keySet) {
+             auto loaded = keySet.keyset.ensureServerLoaded();
+             if (loaded.has_failure()) {
+               throw std::runtime_error(loaded.as_failure().error().mesg);
+             }
              return ::concretelang::clientlib::EvaluationKeys{
                  keySet.keyset.server};
            });
@@ -1524,6 +1603,39 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
              return std::make_unique<::concretelang::clientlib::PublicResult>(
                  std::move(res));
            })
+      .def("call",
+           [](ServerCircuit &circuit,
+              ::concretelang::clientlib::PublicArguments &publicArguments,
+              ::concretelang::serverlib::PreparedKeys &preparedKeys) {
+             SignalGuard signalGuard;
+             pybind11::gil_scoped_release release;
+             auto values = publicArguments.values;
+             GET_OR_THROW_RESULT(auto output,
+                                 circuit.call(preparedKeys, values));
+             ::concretelang::clientlib::PublicResult res{output};
+             return std::make_unique<::concretelang::clientlib::PublicResult>(
+                 std::move(res));
+           })
+      .def("call_batch",
+           [](ServerCircuit &circuit,
+              std::vector<::concretelang::clientlib::PublicArguments *>
+                  publicArgumentsBatch,
+              ::concretelang::serverlib::PreparedKeys &preparedKeys) {
+             SignalGuard signalGuard;
+             pybind11::gil_scoped_release release;
+             std::vector<std::vector<TransportValue>> argsBatch;
+             for (auto publicArguments : publicArgumentsBatch) {
+               argsBatch.push_back(publicArguments->values);
+             }
+             GET_OR_THROW_RESULT(auto outputs,
+                                 circuit.callBatch(preparedKeys, argsBatch));
+             std::vector<::concretelang::clientlib::PublicResult> results;
+             for (auto &output : outputs) {
+               results.push_back(
+                   ::concretelang::clientlib::PublicResult{output});
+             }
+             return results;
+           })
       .def("simulate",
            [](ServerCircuit &circuit,
               ::concretelang::clientlib::PublicArguments &publicArguments) {
@@ -1743,6 +1855,36 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
              return pybind11::bytes(evaluationKeysSerialize(evaluationKeys));
            });
 
+  pybind11::class_<::concretelang::serverlib::PreparedKeys>(
+      m, "PreparedEvaluationKeys")
+      .def_static(
+          "prepare",
+          [](::concretelang::clientlib::EvaluationKeys &evaluationKeys) {
+            pybind11::gil_scoped_release release;
+            return ::concretelang::serverlib::PreparedKeys::prepare(
+                evaluationKeys.keyset);
+          })
+      .def_static(
+          "load",
+          [](::concretelang::clientlib::EvaluationKeys &evaluationKeys,
+             std::string path) {
+            pybind11::gil_scoped_release release;
+            GET_OR_THROW_RESULT(
+                auto preparedKeys,
+                ::concretelang::serverlib::PreparedKeys::load(
+                    evaluationKeys.keyset, path));
+            return preparedKeys;
+          })
+      .def("save",
+           [](::concretelang::serverlib::PreparedKeys &preparedKeys,
+              std::string path) {
+             pybind11::gil_scoped_release release;
+             auto maybeError = preparedKeys.save(path);
+             if (maybeError.has_failure()) {
+               throw std::runtime_error(maybeError.as_failure().error().mesg);
+             }
+           });
+
   pybind11::class_<lambdaArgument>(m, "LambdaArgument")
       .def_static("from_tensor_u8",
                   [](std::vector<uint8_t> tensor, std::vector<int64_t> dims) {
@@ -10,12 +10,18 @@ from mlir._mlir_libs._concretelang._compiler import (
     init_df_parallelization as _init_df_parallelization,
     check_gpu_runtime_enabled as _check_gpu_runtime_enabled,
     check_cuda_device_available as _check_cuda_device_available,
+    set_runtime_num_threads as _set_runtime_num_threads,
+    get_runtime_num_threads as _get_runtime_num_threads,
 )
 from mlir._mlir_libs._concretelang._compiler import round_trip as _round_trip
+from mlir._mlir_libs._concretelang._compiler import (
+    select_parameters as _select_parameters,
+)
 from mlir._mlir_libs._concretelang._compiler import (
     set_llvm_debug_flag,
     set_compiler_logging,
 )
+from mlir.ir import Module as MlirModule
 
 # pylint: enable=no-name-in-module,import-error
 
@@ -34,6 +40,7 @@ from .client_support import ClientSupport
 from .library_support import LibrarySupport
 from .lwe_secret_key import LweSecretKey, LweSecretKeyParam
 from .evaluation_keys import EvaluationKeys
+from .prepared_evaluation_keys import PreparedEvaluationKeys
 from .tfhers_int import (
     TfhersExporter,
     TfhersFheIntDescription,
@@ -45,6 +52,7 @@ from .simulated_value_decrypter import SimulatedValueDecrypter
 from .simulated_value_exporter import SimulatedValueExporter
 from .parameter import Parameter
 from .server_program import ServerProgram
+from .server_circuit import ServerCircuit
 
 
 def init_dfr():
@@ -68,6 +76,31 @@ def check_gpu_available() -> bool:
     return _check_cuda_device_available()
 
 
+def set_runtime_num_threads(num_threads: int):
+    """Set the number of threads used to process batched operations at runtime.
+
+    The setting applies to the whole process. Zero restores the default, which is the value of the
+    CONCRETE_RUNTIME_NUM_THREADS environment variable if set, or the number of hardware threads.
+
+    Args:
+        num_threads (int): number of threads, including the calling thread
+
+    Raises:
+        TypeError: if num_threads is not of type int
+        ValueError: if num_threads is negative
+    """
+    if not isinstance(num_threads, int):
+        raise TypeError(f"num_threads must be of type int, not {type(num_threads)}")
+    if num_threads < 0:
+        raise ValueError("num_threads must be positive or zero")
+    _set_runtime_num_threads(num_threads)
+
+
+def get_runtime_num_threads() -> int:
+    """Get the number of threads used to process batched operations at runtime."""
+    return _get_runtime_num_threads()
+
+
 # Cleanly terminate the dataflow runtime if it has been initialized
 # (does nothing otherwise)
 atexit.register(_terminate_df_parallelization)
@@ -90,3 +123,46 @@ def round_trip(mlir_str: str) -> str:
     if not isinstance(mlir_str, str):
         raise TypeError(f"mlir_str must be of type str, not {type(mlir_str)}")
     return _round_trip(mlir_str)
+
+
+def select_parameters(
+    mlir_module: MlirModule,
+    options: CompilationOptions,
+    compilation_context: CompilationContext,
+) -> ProgramCompilationFeedback:
+    """Select the crypto parameters of an MLIR module, without generating code for it.
+
+    Useful to know the error probabilities the optimizer selected for the program, without
+    paying for its compilation.
+
+    Args:
+        mlir_module (MlirModule): mlir module to select the parameters of
+        options (CompilationOptions): compilation options to use
+        compilation_context (CompilationContext): context owning the mlir module
+
+    Raises:
+        TypeError: if one of the arguments is not of the expected type
+
+    Returns:
+        ProgramCompilationFeedback: feedback of the parameter selection
+    """
+    if not isinstance(mlir_module, MlirModule):
+        raise TypeError(
+            f"mlir_module must be of type MlirModule, not {type(mlir_module)}"
+        )
+    if not isinstance(options, CompilationOptions):
+        raise TypeError(
+            f"options must be of type CompilationOptions, not {type(options)}"
+        )
+    if not isinstance(compilation_context, CompilationContext):
+        raise TypeError(
+            "compilation_context must be of type CompilationContext, "
+            f"not {type(compilation_context)}"
+        )
+    return ProgramCompilationFeedback.wrap(
+        _select_parameters(
+            mlir_module._CAPIPtr,  # pylint: disable=protected-access
+            options.cpp(),
+            compilation_context.cpp(),
+        )
+    )
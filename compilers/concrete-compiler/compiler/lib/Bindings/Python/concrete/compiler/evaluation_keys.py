@@ -3,6 +3,8 @@
 
 """EvaluationKeys."""
 
+from typing import Callable, Optional
+
 # pylint: disable=no-name-in-module,import-error
 from mlir._mlir_libs._concretelang._compiler import (
     EvaluationKeys as _EvaluationKeys,
@@ -61,3 +63,48 @@ class EvaluationKeys(WrapperCpp):
         return EvaluationKeys.wrap(
             _EvaluationKeys.deserialize(serialized_evaluation_keys)
         )
+
+
+class LazyEvaluationKeys(EvaluationKeys):
+    """
+    EvaluationKeys which are only loaded once they are used (e.g. serialized).
+
+    Loading the evaluation keys of a cached key set can take a lot of time and memory,
+    which is wasted for clients only encrypting and decrypting.
+    """
+
+    _load: Optional[Callable[[], _EvaluationKeys]]
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, load: Callable[[], _EvaluationKeys]):
+        """Create the evaluation keys, without loading them.
+
+        Args:
+            load (Callable[[], _EvaluationKeys]): function loading the object to wrap
+
+        Raises:
+            TypeError: if load is not callable
+        """
+        if not callable(load):
+            raise TypeError(f"load must be callable, not {type(load)}")
+        self._cpp_obj = None
+        self._load = load
+
+    # pylint: enable=super-init-not-called
+
+    def cpp(self) -> _EvaluationKeys:
+        """Return the Cpp wrapped object, loading it if it's not loaded yet.
+
+        Raises:
+            TypeError: if the loaded object is not of type _EvaluationKeys
+        """
+        if self._cpp_obj is None:
+            assert self._load is not None
+            evaluation_keys = self._load()
+            if not isinstance(evaluation_keys, _EvaluationKeys):
+                raise TypeError(
+                    f"evaluation_keys must be of type _EvaluationKeys, not {type(evaluation_keys)}"
+                )
+            self._cpp_obj = evaluation_keys
+            self._load = None
+        return self._cpp_obj
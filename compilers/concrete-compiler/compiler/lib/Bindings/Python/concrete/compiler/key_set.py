@@ -15,7 +15,7 @@ from mlir._mlir_libs._concretelang._compiler import (
 # pylint: enable=no-name-in-module,import-error
 from .lwe_secret_key import LweSecretKey
 from .wrapper import WrapperCpp
-from .evaluation_keys import EvaluationKeys
+from .evaluation_keys import EvaluationKeys, LazyEvaluationKeys
 
 
 class KeySet(WrapperCpp):
@@ -84,8 +84,10 @@ class KeySet(WrapperCpp):
         """
         Get evaluation keys for execution.
 
+        Evaluation keys are only loaded (e.g. from the cache) once they are used.
+
         Returns:
             EvaluationKeys:
                 evaluation keys for execution
         """
-        return EvaluationKeys(self.cpp().get_evaluation_keys())
+        return LazyEvaluationKeys(self.cpp().get_evaluation_keys)
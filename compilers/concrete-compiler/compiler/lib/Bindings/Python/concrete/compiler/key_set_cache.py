@@ -38,14 +38,18 @@ class KeySetCache(WrapperCpp):
 
     @staticmethod
     # pylint: disable=arguments-differ
-    def new(cache_path: str) -> "KeySetCache":
+    def new(cache_path: str, max_size: int = 0) -> "KeySetCache":
         """Build a KeySetCache located at cache_path.
 
         Args:
             cache_path (str): path to the cache
+            max_size (int): maximum size of the cache in bytes, the least recently used keysets
+                being evicted to stay under it (0 means unbounded)
 
         Raises:
             TypeError: if the path is not of type str.
+            TypeError: if max_size is not of type int.
+            ValueError: if max_size is negative.
 
         Returns:
             KeySetCache
@@ -54,6 +58,34 @@ class KeySetCache(WrapperCpp):
             raise TypeError(
                 f"cache_path must to be of type str, not {type(cache_path)}"
             )
-        return KeySetCache.wrap(_KeySetCache(cache_path))
+        if not isinstance(max_size, int):
+            raise TypeError(f"max_size must be of type int, not {type(max_size)}")
+        if max_size < 0:
+            raise ValueError("max_size must be positive or zero")
+        return KeySetCache.wrap(_KeySetCache(cache_path, max_size))
 
     # pylint: enable=arguments-differ
+
+    def hits(self) -> int:
+        """Get the number of keysets loaded from the cache.
+
+        Returns:
+            int: number of cache hits
+        """
+        return self.cpp().hits()
+
+    def misses(self) -> int:
+        """Get the number of keysets generated because they were not in the cache.
+
+        Returns:
+            int: number of cache misses
+        """
+        return self.cpp().misses()
+
+    def evictions(self) -> int:
+        """Get the number of keysets evicted from the cache.
+
+        Returns:
+            int: number of cache evictions
+        """
+        return self.cpp().evictions()
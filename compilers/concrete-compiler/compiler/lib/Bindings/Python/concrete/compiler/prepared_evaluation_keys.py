@@ -0,0 +1,105 @@
+#  Part of the Concrete Compiler Project, under the BSD3 License with Zama Exceptions.
+#  See https://github.com/zama-ai/concrete/blob/main/LICENSE.txt for license information.
+
+"""PreparedEvaluationKeys."""
+
+# pylint: disable=no-name-in-module,import-error
+from mlir._mlir_libs._concretelang._compiler import (
+    PreparedEvaluationKeys as _PreparedEvaluationKeys,
+)
+
+# pylint: enable=no-name-in-module,import-error
+from .wrapper import WrapperCpp
+from .evaluation_keys import EvaluationKeys
+
+
+class PreparedEvaluationKeys(WrapperCpp):
+    """
+    EvaluationKeys prepared once for execution.
+
+    Preparing evaluation keys converts the bootstrap keys to the fourier domain, which is
+    otherwise done on every call. Prepared keys are read-only, so they can be shared between
+    calls and threads.
+    """
+
+    def __init__(self, prepared_evaluation_keys: _PreparedEvaluationKeys):
+        """Wrap the native Cpp object.
+
+        Args:
+            prepared_evaluation_keys (_PreparedEvaluationKeys): object to wrap
+
+        Raises:
+            TypeError: if prepared_evaluation_keys is not of type _PreparedEvaluationKeys
+        """
+        if not isinstance(prepared_evaluation_keys, _PreparedEvaluationKeys):
+            raise TypeError(
+                f"prepared_evaluation_keys must be of type _PreparedEvaluationKeys, "
+                f"not {type(prepared_evaluation_keys)}"
+            )
+        super().__init__(prepared_evaluation_keys)
+
+    @staticmethod
+    def prepare(evaluation_keys: EvaluationKeys) -> "PreparedEvaluationKeys":
+        """Prepare EvaluationKeys for execution.
+
+        Args:
+            evaluation_keys (EvaluationKeys): evaluation keys to prepare
+
+        Raises:
+            TypeError: if evaluation_keys is not of type EvaluationKeys
+
+        Returns:
+            PreparedEvaluationKeys: prepared evaluation keys
+        """
+        if not isinstance(evaluation_keys, EvaluationKeys):
+            raise TypeError(
+                f"evaluation_keys must be of type EvaluationKeys, "
+                f"not {type(evaluation_keys)}"
+            )
+        return PreparedEvaluationKeys.wrap(
+            _PreparedEvaluationKeys.prepare(evaluation_keys.cpp())
+        )
+
+    def save(self, path: str):
+        """Save the prepared bootstrap keys to a file.
+
+        The file holds the bootstrap keys in the fourier domain, so loading it with `load` skips
+        their conversion.
+
+        Args:
+            path (str): path of the file
+
+        Raises:
+            TypeError: if path is not of type str
+        """
+        if not isinstance(path, str):
+            raise TypeError(f"path must be of type str, not {type(path)}")
+        self.cpp().save(path)
+
+    @staticmethod
+    def load(evaluation_keys: EvaluationKeys, path: str) -> "PreparedEvaluationKeys":
+        """Load prepared evaluation keys from a file written by `save`.
+
+        The file is memory-mapped and used in place, so its pages are shared between the processes
+        loading it. It must not be modified while the keys are in use.
+
+        Args:
+            evaluation_keys (EvaluationKeys): evaluation keys the file was prepared from
+            path (str): path of the file
+
+        Raises:
+            TypeError: if evaluation_keys is not of type EvaluationKeys, or path not of type str
+
+        Returns:
+            PreparedEvaluationKeys: prepared evaluation keys
+        """
+        if not isinstance(evaluation_keys, EvaluationKeys):
+            raise TypeError(
+                f"evaluation_keys must be of type EvaluationKeys, "
+                f"not {type(evaluation_keys)}"
+            )
+        if not isinstance(path, str):
+            raise TypeError(f"path must be of type str, not {type(path)}")
+        return PreparedEvaluationKeys.wrap(
+            _PreparedEvaluationKeys.load(evaluation_keys.cpp(), path)
+        )
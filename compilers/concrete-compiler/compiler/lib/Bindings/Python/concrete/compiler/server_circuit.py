@@ -3,6 +3,8 @@
 
 """ServerCircuit."""
 
+from typing import List, Union
+
 # pylint: disable=no-name-in-module,import-error
 from mlir._mlir_libs._concretelang._compiler import (
     ServerCircuit as _ServerCircuit,
@@ -13,10 +15,15 @@ from .wrapper import WrapperCpp
 from .public_arguments import PublicArguments
 from .public_result import PublicResult
 from .evaluation_keys import EvaluationKeys
+from .prepared_evaluation_keys import PreparedEvaluationKeys
 
 
 class ServerCircuit(WrapperCpp):
-    """ServerCircuit references a circuit that can be called for execution and simulation."""
+    """ServerCircuit references a circuit that can be called for execution and simulation.
+
+    Calls are reentrant and release the GIL while the circuit runs, so the same server circuit
+    can be called concurrently from multiple threads.
+    """
 
     def __init__(self, server_circuit: _ServerCircuit):
         """Wrap the native Cpp object.
@@ -36,17 +43,18 @@ class ServerCircuit(WrapperCpp):
     def call(
         self,
         public_arguments: PublicArguments,
-        evaluation_keys: EvaluationKeys,
+        evaluation_keys: Union[EvaluationKeys, PreparedEvaluationKeys],
     ) -> PublicResult:
         """Executes the circuit on the public arguments.
 
         Args:
             public_arguments (PublicArguments): public arguments to execute on
-            execution_keys (EvaluationKeys): evaluation keys to use for execution.
+            execution_keys (Union[EvaluationKeys, PreparedEvaluationKeys]): evaluation keys to use
+                for execution, prepared keys avoid converting the bootstrap keys on every call.
 
         Raises:
             TypeError: if public_arguments is not of type PublicArguments, or if evaluation_keys is
-                not of type EvaluationKeys
+                not of type EvaluationKeys or PreparedEvaluationKeys
 
         Returns:
             PublicResult: A public result object containing the results.
@@ -56,15 +64,59 @@ class ServerCircuit(WrapperCpp):
                 f"public_arguments must be of type PublicArguments, not "
                 f"{type(public_arguments)}"
             )
-        if not isinstance(evaluation_keys, EvaluationKeys):
+        if not isinstance(evaluation_keys, (EvaluationKeys, PreparedEvaluationKeys)):
             raise TypeError(
-                f"simulation must be of type EvaluationKeys, not "
+                f"evaluation_keys must be of type EvaluationKeys or PreparedEvaluationKeys, not "
                 f"{type(evaluation_keys)}"
             )
         return PublicResult.wrap(
             self.cpp().call(public_arguments.cpp(), evaluation_keys.cpp())
         )
 
+    def call_batch(
+        self,
+        public_arguments_batch: List[PublicArguments],
+        evaluation_keys: Union[EvaluationKeys, PreparedEvaluationKeys],
+    ) -> List[PublicResult]:
+        """Executes the circuit on a batch of public arguments.
+
+        The executions run in parallel on the runtime worker pool, and share the prepared keys.
+
+        Args:
+            public_arguments_batch (List[PublicArguments]): public arguments of each execution
+            evaluation_keys (Union[EvaluationKeys, PreparedEvaluationKeys]): evaluation keys to use
+                for execution, evaluation keys are prepared once for the whole batch.
+
+        Raises:
+            TypeError: if public_arguments_batch is not a list of PublicArguments, or if
+                evaluation_keys is not of type EvaluationKeys or PreparedEvaluationKeys
+
+        Returns:
+            List[PublicResult]: the results of each execution, in the order of the arguments.
+        """
+        if not isinstance(public_arguments_batch, list) or not all(
+            isinstance(public_arguments, PublicArguments)
+            for public_arguments in public_arguments_batch
+        ):
+            raise TypeError(
+                f"public_arguments_batch must be a list of PublicArguments, not "
+                f"{type(public_arguments_batch)}"
+            )
+        if not isinstance(evaluation_keys, (EvaluationKeys, PreparedEvaluationKeys)):
+            raise TypeError(
+                f"evaluation_keys must be of type EvaluationKeys or PreparedEvaluationKeys, not "
+                f"{type(evaluation_keys)}"
+            )
+        if isinstance(evaluation_keys, EvaluationKeys):
+            evaluation_keys = PreparedEvaluationKeys.prepare(evaluation_keys)
+        return [
+            PublicResult.wrap(public_result)
+            for public_result in self.cpp().call_batch(
+                [public_arguments.cpp() for public_arguments in public_arguments_batch],
+                evaluation_keys.cpp(),
+            )
+        ]
+
     def simulate(
         self,
         public_arguments: PublicArguments,
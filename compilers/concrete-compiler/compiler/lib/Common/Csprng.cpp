@@ -103,6 +103,35 @@ EncryptionCSPRNG::~EncryptionCSPRNG() {
   }
 }
 
+void EncryptionCSPRNG::drawSeed(struct Uint128 &seed) {
+  // The masks of ciphertexts are the only uniform values exposed by the
+  // encryption csprng, so a zero is encrypted under a zero key of dimension 2,
+  // whose mask is the seed.
+  uint64_t zeroKey[2] = {0, 0};
+  uint64_t ciphertext[3];
+  concrete_cpu_encrypt_lwe_ciphertext_u64(zeroKey, ciphertext, 0, 2, 0., ptr);
+  readSeed(seed, ciphertext);
+}
+
+std::vector<EncryptionCSPRNG> EncryptionCSPRNG::fork(size_t count) {
+  std::vector<EncryptionCSPRNG> children;
+  children.reserve(count);
+  for (size_t i = 0; i < count; i++) {
+    struct Uint128 u128;
+    __uint128_t seed;
+    // A zero seed would be replaced by a random one
+    do {
+      drawSeed(u128);
+      seed = 0;
+      for (int j = 0; j < 16; j++) {
+        seed |= (__uint128_t)u128.little_endian_bytes[j] << (8 * j);
+      }
+    } while (seed == 0);
+    children.emplace_back(seed);
+  }
+  return children;
+}
+
 void writeSeed(struct Uint128 seed, uint64_t *buffer) {
   buffer[0] = (uint64_t)seed.little_endian_bytes[0];
   buffer[0] += (uint64_t)seed.little_endian_bytes[1] << 8;
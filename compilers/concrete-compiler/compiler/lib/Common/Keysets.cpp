@@ -13,13 +13,19 @@
 #include "kj/common.h"
 #include "kj/io.h"
 #include "llvm/ADT/ScopeExit.h"
+#include "llvm/ADT/StringExtras.h"
 #include "llvm/Support/FileSystem.h"
 #include "llvm/Support/Path.h"
+#include "llvm/Support/SHA256.h"
+#include <algorithm>
 #include <errno.h>
 #include <fcntl.h>
 #include <iostream>
 #include <stdlib.h>
+#include <string.h>
 #include <string>
+#include <sys/file.h>
+#include <sys/stat.h>
 #include <unistd.h>
 #include <utime.h>
 
@@ -135,6 +141,27 @@ Keyset::Keyset(const Message<concreteprotocol::KeysetInfo> &info,
   }
 }
 
+Keyset::Keyset(std::function<Result<ServerKeyset>()> loadServer,
+               ClientKeyset client)
+    : client(client), deferredServer(std::make_shared<DeferredServerKeyset>()) {
+  deferredServer->load = loadServer;
+}
+
+Result<void> Keyset::ensureServerLoaded() {
+  if (deferredServer == nullptr)
+    return outcome::success();
+
+  std::lock_guard<std::mutex> lock(deferredServer->mutex);
+  if (!deferredServer->loaded.has_value()) {
+    OUTCOME_TRY(auto loaded, deferredServer->load());
+    deferredServer->loaded = loaded;
+    // The loader is not needed anymore, and may hold large keys.
+    deferredServer->load = nullptr;
+  }
+  server = *deferredServer->loaded;
+  return outcome::success();
+}
+
 Keyset Keyset::fromProto(const Message<concreteprotocol::Keyset> &proto) {
   auto server = ServerKeyset::fromProto(proto.asReader().getServer());
   auto client = ClientKeyset::fromProto(proto.asReader().getClient());
@@ -191,22 +218,10 @@ Result<void> saveKey(Key key, std::string path) {
   return outcome::success();
 }
 
-Result<Keyset>
-loadKeysFromFiles(const Message<concreteprotocol::KeysetInfo> &keysetInfo,
-                  __uint128_t secret_seed, __uint128_t encryption_seed,
-                  std::string folderPath) {
-#ifdef CONCRETELANG_GENERATE_UNSECURE_SECRET_KEYS
-  getApproval();
-#endif
-
-  // Mark the folder as recently use.
-  // e.g. so the CI can do some cleanup of unused keys.
-  utime(folderPath.c_str(), nullptr);
-
+Result<ClientKeyset> loadClientKeysetFromFiles(
+    const Message<concreteprotocol::KeysetInfo> &keysetInfo,
+    std::string folderPath) {
   std::vector<LweSecretKey> secretKeys;
-  std::vector<LweBootstrapKey> bootstrapKeys;
-  std::vector<LweKeyswitchKey> keyswitchKeys;
-  std::vector<PackingKeyswitchKey> packingKeyswitchKeys;
 
   // Load secret keys
   for (auto keyInfo : keysetInfo.asReader().getLweSecretKeys()) {
@@ -219,6 +234,17 @@ loadKeysFromFiles(const Message<concreteprotocol::KeysetInfo> &keysetInfo,
                               (std::string)path));
     secretKeys.push_back(key);
   }
+
+  return ClientKeyset{secretKeys};
+}
+
+Result<ServerKeyset> loadServerKeysetFromFiles(
+    const Message<concreteprotocol::KeysetInfo> &keysetInfo,
+    std::string folderPath) {
+  std::vector<LweBootstrapKey> bootstrapKeys;
+  std::vector<LweKeyswitchKey> keyswitchKeys;
+  std::vector<PackingKeyswitchKey> packingKeyswitchKeys;
+
   // Load bootstrap keys
   for (auto keyInfo : keysetInfo.asReader().getLweBootstrapKeys()) {
     // TODO - Check parameters?
@@ -254,9 +280,25 @@ loadKeysFromFiles(const Message<concreteprotocol::KeysetInfo> &keysetInfo,
     packingKeyswitchKeys.push_back(key);
   }
 
-  ClientKeyset clientKeyset = ClientKeyset{secretKeys};
-  ServerKeyset serverKeyset =
-      ServerKeyset{bootstrapKeys, keyswitchKeys, packingKeyswitchKeys};
+  return ServerKeyset{bootstrapKeys, keyswitchKeys, packingKeyswitchKeys};
+}
+
+Result<Keyset>
+loadKeysFromFiles(const Message<concreteprotocol::KeysetInfo> &keysetInfo,
+                  __uint128_t secret_seed, __uint128_t encryption_seed,
+                  std::string folderPath) {
+#ifdef CONCRETELANG_GENERATE_UNSECURE_SECRET_KEYS
+  getApproval();
+#endif
+
+  // Mark the folder as recently use.
+  // e.g. so the CI can do some cleanup of unused keys.
+  utime(folderPath.c_str(), nullptr);
+
+  OUTCOME_TRY(auto clientKeyset,
+              loadClientKeysetFromFiles(keysetInfo, folderPath));
+  OUTCOME_TRY(auto serverKeyset,
+              loadServerKeysetFromFiles(keysetInfo, folderPath));
   Keyset keyset = Keyset{serverKeyset, clientKeyset};
 
   return keyset;
@@ -325,76 +367,107 @@ Result<void> saveKeys(Keyset &keyset, llvm::SmallString<0> &folderPath) {
   return outcome::success();
 }
 
-KeysetCache::KeysetCache(std::string backingDirectoryPath) {
-  // check key;
-  this->backingDirectoryPath = backingDirectoryPath;
+/// Opens (creating it if needed) and locks the file at `path`, excluding the
+/// other processes and threads locking it. Returns the file descriptor holding
+/// the lock, which is released when it gets closed, or -1 if `wait` is false
+/// and the file is already locked.
+Result<int> acquireLock(const std::string &path, bool wait) {
+  while (true) {
+    int fd = ::open(path.c_str(), O_RDWR | O_CREAT | O_CLOEXEC, 0666);
+    if (fd < 0) {
+      return StringError("Cannot open \"")
+             << path << "\": " << strerror(errno);
+    }
+    if (::flock(fd, wait ? LOCK_EX : LOCK_EX | LOCK_NB) != 0) {
+      int error = errno;
+      ::close(fd);
+      if (error == EINTR)
+        continue;
+      if (!wait && error == EWOULDBLOCK)
+        return -1;
+      return StringError("Cannot lock \"") << path << "\": " << strerror(error);
+    }
+    // The file may have been removed by an eviction while waiting for the
+    // lock, in which case the lock has to be taken on the new file.
+    struct stat locked, current;
+    if (::fstat(fd, &locked) == 0 && ::stat(path.c_str(), &current) == 0 &&
+        locked.st_dev == current.st_dev && locked.st_ino == current.st_ino) {
+      return fd;
+    }
+    ::close(fd);
+  }
 }
 
+/// Returns the name of the cache entry of a keyset, which is the hash of
+/// everything the keyset is generated from.
+std::string
+keysetEntryName(const Message<concreteprotocol::KeysetInfo> &keysetInfo,
+                __uint128_t secret_seed, __uint128_t encryption_seed,
+                const std::map<uint32_t, LweSecretKey> &lweSecretKeys) {
+  // Each part is prefixed by its size, so that different contents can't be
+  // concatenated into the same string.
+  std::string content;
+  auto append = [&](const void *data, uint64_t size) {
+    content.append(reinterpret_cast<const char *>(&size), sizeof(size));
+    content.append(reinterpret_cast<const char *>(data), size);
+  };
+  auto appendString = [&](const std::string &string) {
+    append(string.data(), string.size());
+  };
+
+  appendString(keysetInfo.asReader().toString().flatten().cStr());
+  append(&secret_seed, sizeof(secret_seed));
+  append(&encryption_seed, sizeof(encryption_seed));
+  for (auto &sk : lweSecretKeys) {
+    append(&sk.first, sizeof(sk.first));
+    appendString(sk.second.getInfo().asReader().toString().flatten().cStr());
+    const std::vector<uint64_t> &buffer = sk.second.getBuffer();
+    append(buffer.data(), buffer.size() * sizeof(uint64_t));
+  }
+
+  auto hash = llvm::SHA256::hash(llvm::ArrayRef<uint8_t>(
+      reinterpret_cast<const uint8_t *>(content.data()), content.size()));
+  return llvm::toHex(hash, /*LowerCase=*/true);
+}
+
+KeysetCache::KeysetCache(std::string backingDirectoryPath, uint64_t maxSize)
+    : backingDirectoryPath(backingDirectoryPath), maxSize(maxSize),
+      statistics(std::make_shared<KeysetCacheStatistics>()) {}
+
 Result<Keyset>
 KeysetCache::getKeyset(const Message<concreteprotocol::KeysetInfo> &keysetInfo,
                        __uint128_t secret_seed, __uint128_t encryption_seed,
                        std::map<uint32_t, LweSecretKey> lweSecretKeys) {
-  std::string hashString = keysetInfo.asReader().toString().flatten().cStr() +
-                           std::to_string((uint64_t)secret_seed) +
-                           std::to_string((uint64_t)(secret_seed >> 64)) +
-                           std::to_string((uint64_t)encryption_seed) +
-                           std::to_string((uint64_t)(encryption_seed >> 64));
-
-  // hash initial keys if any
-  if (lweSecretKeys.size()) {
-    hashString += "InitSKsSig:";
-    for (auto sk : lweSecretKeys) {
-      // key info
-      hashString += sk.second.getInfo().asReader().toString().flatten().cStr();
-      // key buffer
-      std::vector<uint64_t> buffer = sk.second.getBuffer();
-      size_t hash = std::hash<std::string_view>{}(
-          {reinterpret_cast<const char *>(buffer.data()),
-           buffer.size() * sizeof(uint64_t)});
-      hashString += std::to_string(hash);
-      hashString += ",";
-    }
-  }
-
-  size_t hash = std::hash<std::string>{}(hashString);
+  std::string entryName = keysetEntryName(keysetInfo, secret_seed,
+                                          encryption_seed, lweSecretKeys);
 #ifdef CONCRETELANG_GENERATE_UNSECURE_SECRET_KEYS
   getApproval();
 #endif
 
   llvm::SmallString<0> folderPath =
       llvm::SmallString<0>(this->backingDirectoryPath);
-  llvm::sys::path::append(folderPath, std::to_string(hash));
-
-  // Creating a lock for concurrent generation
-  llvm::SmallString<0> lockPath(folderPath);
-  lockPath.append("lock");
-  int FD_lock;
-  llvm::sys::fs::create_directories(llvm::sys::path::parent_path(lockPath));
-  // Open or create the lock file
-  auto err = llvm::sys::fs::openFile(
-      lockPath, FD_lock, llvm::sys::fs::CreationDisposition::CD_OpenAlways,
-      llvm::sys::fs::FileAccess::FA_Write, llvm::sys::fs::OpenFlags::OF_None);
+  llvm::sys::path::append(folderPath, entryName);
 
+  auto err = llvm::sys::fs::create_directories(this->backingDirectoryPath);
   if (err) {
-    // parent does not exists OR right issue (creation or write)
-    return StringError("Cannot access \"")
-           << std::string(lockPath) << "\": " << err.message();
+    return StringError("Cannot create directory \"")
+           << this->backingDirectoryPath << "\": " << err.message();
   }
 
-  // The lock is released when the function returns.
+  // Only one process generates the keyset, the others wait for it to be
+  // generated, and load it then.
   // => any intermediate state in the function is not visible to others.
-  auto unlockAtReturn = llvm::make_scope_exit([&]() {
-    llvm::sys::fs::closeFile(FD_lock);
-    llvm::sys::fs::unlockFile(FD_lock);
-    llvm::sys::fs::remove(lockPath);
-  });
-  llvm::sys::fs::lockFile(FD_lock);
+  llvm::SmallString<0> lockPath(folderPath);
+  lockPath.append(".lock");
+  OUTCOME_TRY(int lockFd, acquireLock(std::string(lockPath), true));
+  auto unlockAtReturn = llvm::make_scope_exit([&]() { ::close(lockFd); });
 
   if (llvm::sys::fs::exists(folderPath)) {
     // Once it has been generated by another process (or was already here)
     auto keys = loadKeysFromFiles(keysetInfo, secret_seed, encryption_seed,
                                   std::string(folderPath));
     if (keys.has_value()) {
+      statistics->hits++;
       return keys;
     } else {
       std::cerr << std::string(keys.error().mesg) << "\n";
@@ -405,6 +478,7 @@ KeysetCache::getKeyset(const Message<concreteprotocol::KeysetInfo> &keysetInfo,
     }
   }
 
+  statistics->misses++;
   std::cerr << "KeySetCache: miss, regenerating " << std::string(folderPath)
             << "\n";
 
@@ -414,8 +488,170 @@ KeysetCache::getKeyset(const Message<concreteprotocol::KeysetInfo> &keysetInfo,
 
   OUTCOME_TRYV(saveKeys(keyset, folderPath));
 
+  evict(entryName);
+
   return std::move(keyset);
 }
 
+Result<Keyset> KeysetCache::getLazyKeyset(
+    const Message<concreteprotocol::KeysetInfo> &keysetInfo,
+    __uint128_t secret_seed, __uint128_t encryption_seed,
+    std::map<uint32_t, LweSecretKey> lweSecretKeys) {
+  std::string entryName = keysetEntryName(keysetInfo, secret_seed,
+                                          encryption_seed, lweSecretKeys);
+#ifdef CONCRETELANG_GENERATE_UNSECURE_SECRET_KEYS
+  getApproval();
+#endif
+
+  llvm::SmallString<0> folderPath =
+      llvm::SmallString<0>(this->backingDirectoryPath);
+  llvm::sys::path::append(folderPath, entryName);
+  llvm::SmallString<0> lockPath(folderPath);
+  lockPath.append(".lock");
+
+  if (llvm::sys::fs::exists(folderPath)) {
+    OUTCOME_TRY(int lockFd, acquireLock(std::string(lockPath), true));
+    auto unlockAtReturn = llvm::make_scope_exit([&]() { ::close(lockFd); });
+
+    auto client =
+        loadClientKeysetFromFiles(keysetInfo, std::string(folderPath));
+    if (client.has_value()) {
+      utime(folderPath.c_str(), nullptr);
+      statistics->hits++;
+      // The cache is copied, so the keyset can outlive it.
+      KeysetCache cache = *this;
+      ClientKeyset clientKeyset = client.value();
+      auto loadServer = [cache, entryName, keysetInfo, encryption_seed,
+                         clientKeyset]() mutable -> Result<ServerKeyset> {
+        return cache.loadServerKeyset(entryName, keysetInfo, encryption_seed,
+                                      clientKeyset);
+      };
+      return Keyset(loadServer, clientKeyset);
+    }
+  }
+
+  // The keyset is missing or invalid, it's generated (or loaded if another
+  // process has generated it in the meantime) as a whole.
+  return getKeyset(keysetInfo, secret_seed, encryption_seed, lweSecretKeys);
+}
+
+Result<ServerKeyset> KeysetCache::loadServerKeyset(
+    const std::string &entryName,
+    const Message<concreteprotocol::KeysetInfo> &keysetInfo,
+    __uint128_t encryption_seed, const ClientKeyset &client) {
+  llvm::SmallString<0> folderPath =
+      llvm::SmallString<0>(this->backingDirectoryPath);
+  llvm::sys::path::append(folderPath, entryName);
+  llvm::SmallString<0> lockPath(folderPath);
+  lockPath.append(".lock");
+
+  OUTCOME_TRY(int lockFd, acquireLock(std::string(lockPath), true));
+  auto unlockAtReturn = llvm::make_scope_exit([&]() { ::close(lockFd); });
+
+  if (llvm::sys::fs::exists(folderPath)) {
+    auto server =
+        loadServerKeysetFromFiles(keysetInfo, std::string(folderPath));
+    if (server.has_value()) {
+      utime(folderPath.c_str(), nullptr);
+      return server;
+    }
+    std::cerr << std::string(server.error().mesg) << "\n";
+    std::cerr << "Invalid KeySetCache entry " << std::string(folderPath)
+              << "\n";
+    llvm::sys::fs::remove_directories(folderPath);
+  }
+
+  // The keyset has been evicted (or corrupted) since its client keyset was
+  // loaded. The seeds can't be used to generate it again, as a zero secret
+  // seed stands for a random one, so the server keyset is generated from the
+  // secret keys which have been loaded, and saved along them.
+  statistics->misses++;
+  std::cerr << "KeySetCache: miss, regenerating server keys of "
+            << std::string(folderPath) << "\n";
+
+  std::map<uint32_t, LweSecretKey> lweSecretKeys;
+  for (auto &key : client.lweSecretKeys) {
+    lweSecretKeys.emplace(key.getInfo().asReader().getId(), key);
+  }
+  // All the secret keys are given, so the secret CSPRNG is not used.
+  auto encryptionCsprng = csprng::EncryptionCSPRNG(encryption_seed);
+  auto secretCsprng = csprng::SecretCSPRNG(0);
+  Keyset keyset(keysetInfo, secretCsprng, encryptionCsprng, lweSecretKeys);
+
+  OUTCOME_TRYV(saveKeys(keyset, folderPath));
+
+  evict(entryName);
+
+  return keyset.server;
+}
+
+void KeysetCache::evict(const std::string &keptEntry) {
+  if (maxSize == 0)
+    return;
+
+  struct Entry {
+    std::string name;
+    uint64_t size;
+    llvm::sys::TimePoint<> lastUse;
+  };
+  std::vector<Entry> entries;
+  uint64_t totalSize = 0;
+
+  std::error_code err;
+  for (llvm::sys::fs::directory_iterator it(backingDirectoryPath, err), end;
+       !err && it != end; it.increment(err)) {
+    auto status = it->status();
+    if (!status || status->type() != llvm::sys::fs::file_type::directory_file)
+      continue;
+
+    uint64_t size = 0;
+    std::error_code fileErr;
+    for (llvm::sys::fs::directory_iterator file(it->path(), fileErr), fileEnd;
+         !fileErr && file != fileEnd; file.increment(fileErr)) {
+      auto fileStatus = file->status();
+      if (fileStatus)
+        size += fileStatus->getSize();
+    }
+
+    totalSize += size;
+    // Loading a keyset marks its folder as used (see `loadKeysFromFiles`).
+    entries.push_back({llvm::sys::path::filename(it->path()).str(), size,
+                       status->getLastModificationTime()});
+  }
+
+  std::sort(entries.begin(), entries.end(), [](const Entry &a, const Entry &b) {
+    return a.lastUse < b.lastUse;
+  });
+
+  for (auto &entry : entries) {
+    if (totalSize <= maxSize)
+      break;
+
+    // Folders of keysets being saved are evicted as well if they are not
+    // locked, as the process saving them has failed then.
+    llvm::StringRef name = entry.name;
+    name.consume_back(".incomplete");
+    if (name == keptEntry)
+      continue;
+
+    llvm::SmallString<0> lockPath(backingDirectoryPath);
+    llvm::sys::path::append(lockPath, name + ".lock");
+    auto lockFd = acquireLock(std::string(lockPath), false);
+    if (lockFd.has_failure() || lockFd.value() < 0) {
+      // The keyset is being loaded or generated.
+      continue;
+    }
+
+    llvm::SmallString<0> folderPath(backingDirectoryPath);
+    llvm::sys::path::append(folderPath, entry.name);
+    if (!llvm::sys::fs::remove_directories(folderPath)) {
+      totalSize -= entry.size;
+      statistics->evictions++;
+    }
+    llvm::sys::fs::remove(lockPath);
+    ::close(lockFd.value());
+  }
+}
+
 } // namespace keysets
 } // namespace concretelang
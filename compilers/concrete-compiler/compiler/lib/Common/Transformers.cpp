@@ -13,6 +13,8 @@
 #include "concretelang/Common/Keysets.h"
 #include "concretelang/Common/Values.h"
 #include "concretelang/Runtime/simulation.h"
+#include "concretelang/Runtime/worker_pool.h"
+#include <algorithm>
 #include <memory>
 #include <stdlib.h>
 #include <string>
@@ -37,6 +39,61 @@ typedef std::function<Result<void>(const TransportValue &)>
 /// A private type for transformers working purely on values.
 typedef std::function<Value(Value)> Transformer;
 
+/// The minimal number of elements for which encodings are spread over threads.
+const size_t ENCODING_PARALLEL_MIN_SIZE = 4096;
+
+/// The minimal number of ciphertexts for which decryptions are spread over
+/// threads.
+const size_t DECRYPTION_PARALLEL_MIN_SIZE = 64;
+
+/// The number of ciphertexts encrypted with each csprng forked for a tensor.
+/// Blocks don't depend on the number of threads, so that the encryption stays
+/// deterministic given the state of the original csprng.
+const size_t ENCRYPTION_BLOCK_SIZE = 256;
+
+/// Calls `body(i)` for each `i` in `[0, size)`, in parallel if `size` is at
+/// least `minSize`.
+template <typename Body>
+void parallelForEach(size_t size, size_t minSize, const Body &body) {
+  if (size < minSize) {
+    for (size_t i = 0; i < size; i++) {
+      body(i);
+    }
+    return;
+  }
+  mlir::concretelang::WorkerPool::get().parallelFor(
+      size, [&](size_t begin, size_t end) {
+        for (size_t i = begin; i < end; i++) {
+          body(i);
+        }
+      });
+}
+
+/// Calls `body(i, csprng)` for each `i` in `[0, size)`. Elements are processed
+/// in parallel, by blocks of `ENCRYPTION_BLOCK_SIZE` elements, each using its
+/// own csprng forked from `csprng`.
+template <typename Body>
+void parallelForEachEncryption(size_t size, csprng::EncryptionCSPRNG &csprng,
+                               const Body &body) {
+  if (size <= ENCRYPTION_BLOCK_SIZE) {
+    for (size_t i = 0; i < size; i++) {
+      body(i, csprng);
+    }
+    return;
+  }
+  auto numBlocks = (size + ENCRYPTION_BLOCK_SIZE - 1) / ENCRYPTION_BLOCK_SIZE;
+  auto blockCsprngs = csprng.fork(numBlocks);
+  mlir::concretelang::WorkerPool::get().parallelFor(
+      numBlocks, [&](size_t begin, size_t end) {
+        for (size_t block = begin; block < end; block++) {
+          auto blockEnd = std::min(size, (block + 1) * ENCRYPTION_BLOCK_SIZE);
+          for (size_t i = block * ENCRYPTION_BLOCK_SIZE; i < blockEnd; i++) {
+            body(i, blockCsprngs[block]);
+          }
+        }
+      });
+}
+
 Result<ValueVerifier> getIndexInputValueVerifier(
     const Message<concreteprotocol::GateInfo> &gateInfo) {
   if (!gateInfo.asReader().getTypeInfo().hasIndex()) {
@@ -391,15 +448,16 @@ Result<Transformer> getChunkedModeIntegerEncodingTransformer(
     outputTensor.dimensions.push_back(size);
     outputTensor.values.resize(outputTensor.values.size() * size);
 
-    for (size_t i = 0; i < inputTensor.values.size(); i++) {
-      auto value = inputTensor.values[i];
-      for (size_t j = 0; j < size; j++) {
-        auto chunk = value & mask;
-        outputTensor.values[i * size + j] = ((uint64_t)chunk)
-                                            << (64 - (chunkWidth + 1));
-        value >>= chunkWidth;
-      }
-    }
+    parallelForEach(
+        inputTensor.values.size(), ENCODING_PARALLEL_MIN_SIZE, [&](size_t i) {
+          auto value = inputTensor.values[i];
+          for (size_t j = 0; j < size; j++) {
+            auto chunk = value & mask;
+            outputTensor.values[i * size + j] = ((uint64_t)chunk)
+                                                << (64 - (chunkWidth + 1));
+            value >>= chunkWidth;
+          }
+        });
 
     return Value{outputTensor};
   };
@@ -479,13 +537,14 @@ Result<Transformer> getCrtModeIntegerEncodingTransformer(
     outputTensor.dimensions.push_back(size);
     outputTensor.values.resize(outputTensor.values.size() * size);
 
-    for (size_t i = 0; i < inputTensor.values.size(); i++) {
-      auto value = inputTensor.values[i];
-      for (size_t j = 0; j < (size_t)size; j++) {
-        outputTensor.values[i * size + j] =
-            concretelang::crt::encode(value, moduli[j], productOfModuli);
-      }
-    }
+    parallelForEach(
+        inputTensor.values.size(), ENCODING_PARALLEL_MIN_SIZE, [&](size_t i) {
+          auto value = inputTensor.values[i];
+          for (size_t j = 0; j < (size_t)size; j++) {
+            outputTensor.values[i * size + j] =
+                concretelang::crt::encode(value, moduli[j], productOfModuli);
+          }
+        });
 
     return Value{outputTensor};
   };
@@ -559,11 +618,13 @@ Result<Transformer> getEncryptionTransformer(
     outputTensor.dimensions.push_back(lweSize);
     outputTensor.values.resize(outputTensor.values.size() * lweSize);
 
-    for (size_t i = 0; i < inputTensor.values.size(); i++) {
-      concrete_cpu_encrypt_lwe_ciphertext_u64(
-          key.getRawPtr(), &outputTensor.values[i * lweSize],
-          inputTensor.values[i], lweDimension, variance, csprng->ptr);
-    }
+    parallelForEachEncryption(
+        inputTensor.values.size(), *csprng,
+        [&](size_t i, csprng::EncryptionCSPRNG &blockCsprng) {
+          concrete_cpu_encrypt_lwe_ciphertext_u64(
+              key.getRawPtr(), &outputTensor.values[i * lweSize],
+              inputTensor.values[i], lweDimension, variance, blockCsprng.ptr);
+        });
 
     return Value{outputTensor};
   };
@@ -584,16 +645,21 @@ Result<Transformer> getSeededEncryptionTransformer(
     auto const ciphertextSize = 3;
     outputTensor.dimensions.push_back(ciphertextSize);
     outputTensor.values.resize(outputTensor.values.size() * ciphertextSize);
-    struct Uint128 seed;
-    for (size_t i = 0; i < inputTensor.values.size(); i++) {
-      csprng::getRandomSeed(&seed);
-      // Write seed
-      csprng::writeSeed(seed, &outputTensor.values[i * 3]);
-      // Encrypt
-      concrete_cpu_encrypt_seeded_lwe_ciphertext_u64(
-          key.getRawPtr(), &outputTensor.values[i * 3 + 2],
-          inputTensor.values[i], lweDimension, seed, variance);
-    }
+    // Seeds are drawn from a csprng seeded once per tensor, instead of being
+    // generated by the system for each ciphertext
+    csprng::EncryptionCSPRNG seedCsprng(0);
+    parallelForEachEncryption(
+        inputTensor.values.size(), seedCsprng,
+        [&](size_t i, csprng::EncryptionCSPRNG &blockCsprng) {
+          struct Uint128 seed;
+          blockCsprng.drawSeed(seed);
+          // Write seed
+          csprng::writeSeed(seed, &outputTensor.values[i * 3]);
+          // Encrypt
+          concrete_cpu_encrypt_seeded_lwe_ciphertext_u64(
+              key.getRawPtr(), &outputTensor.values[i * 3 + 2],
+              inputTensor.values[i], lweDimension, seed, variance);
+        });
     return Value{outputTensor};
   };
 }
@@ -631,11 +697,12 @@ Result<Transformer> getDecryptionTransformer(
     outputTensor.dimensions.pop_back();
     outputTensor.values.resize(outputTensor.values.size() / lweSize);
 
-    for (size_t i = 0; i < outputTensor.values.size(); i++) {
-      concrete_cpu_decrypt_lwe_ciphertext_u64(
-          key.getRawPtr(), &inputTensor.values[i * lweSize], lweDimension,
-          &outputTensor.values[i]);
-    }
+    parallelForEach(outputTensor.values.size(), DECRYPTION_PARALLEL_MIN_SIZE,
+                    [&](size_t i) {
+                      concrete_cpu_decrypt_lwe_ciphertext_u64(
+                          key.getRawPtr(), &inputTensor.values[i * lweSize],
+                          lweDimension, &outputTensor.values[i]);
+                    });
 
     return Value{outputTensor};
   };
@@ -7,6 +7,7 @@
 #include "concretelang/Common/Error.h"
 #include "concretelang/Common/Keysets.h"
 #include <assert.h>
+#include <atomic>
 #include <stdio.h>
 
 namespace mlir {
@@ -29,14 +30,68 @@ FFT::~FFT() {
   }
 }
 
+namespace {
+
+/// The bootstrap buffers of a thread, which are freed when the thread exits.
+/// Buffers only depend on the parameters, so they are shared by all contexts
+/// and don't outlive the threads that use them.
+struct ThreadBootstrapBuffers {
+  std::map<std::pair<size_t, size_t>, std::unique_ptr<BootstrapBuffers>>
+      buffers;
+  /// The buffers last used by the thread, which avoids a lookup on every
+  /// bootstrap.
+  size_t lastPolynomialSize = 0;
+  size_t lastGlweDimension = 0;
+  BootstrapBuffers *last = nullptr;
+};
+thread_local ThreadBootstrapBuffers threadBootstrapBuffers;
+
+std::atomic<size_t> bootstrapBuffersAllocations{0};
+
+} // namespace
+
+BootstrapBuffers::BootstrapBuffers(size_t polynomial_size,
+                                   size_t glwe_dimension,
+                                   const struct Fft *fft) {
+  glwe_ct = (uint64_t *)malloc(polynomial_size * (glwe_dimension + 1) *
+                               sizeof(uint64_t));
+  size_t scratch_align;
+  concrete_cpu_bootstrap_lwe_ciphertext_u64_scratch(
+      &scratch_size, &scratch_align, glwe_dimension, polynomial_size, fft);
+  scratch = (uint8_t *)aligned_alloc(scratch_align, scratch_size);
+}
+
+BootstrapBuffers::~BootstrapBuffers() {
+  free(glwe_ct);
+  free(scratch);
+}
+
 RuntimeContext::RuntimeContext(ServerKeyset serverKeyset)
+    : RuntimeContext(serverKeyset, {}) {}
+
+RuntimeContext::RuntimeContext(
+    ServerKeyset serverKeyset,
+    std::vector<std::shared_ptr<const std::complex<double>>>
+        fourierBootstrapKeys)
     : serverKeyset(serverKeyset) {
+  assert((fourierBootstrapKeys.empty() ||
+          fourierBootstrapKeys.size() ==
+              serverKeyset.lweBootstrapKeys.size()) &&
+         "Number of fourier bootstrap keys does not match the keyset");
 
-  // Initialize for each bootstrap key the fourier one
   for (size_t i = 0; i < serverKeyset.lweBootstrapKeys.size(); i++) {
+    if (!fourierBootstrapKeys.empty()) {
+      auto info = serverKeyset.lweBootstrapKeys[i].getInfo().asReader();
+      fourier_bootstrap_keys.push_back(fourierBootstrapKeys[i]);
+      ffts.emplace_back(info.getParams().getPolynomialSize());
+      continue;
+    }
+    // Initialize for each bootstrap key the fourier one
     auto fdbsk = convert_to_fourier_domain(serverKeyset.lweBootstrapKeys[i]);
     // Store the fourier_bootstrap_key in the context
-    fourier_bootstrap_keys.push_back(fdbsk.second);
+    fourier_bootstrap_keys.push_back(
+        std::shared_ptr<const std::complex<double>>(fdbsk.second,
+                                                    fdbsk.second->data()));
     ffts.push_back(std::move(fdbsk.first));
   }
 
@@ -56,6 +111,32 @@ RuntimeContext::RuntimeContext(ServerKeyset serverKeyset)
 #endif
 }
 
+BootstrapBuffers &RuntimeContext::bootstrap_buffers(size_t polynomial_size,
+                                                    size_t glwe_dimension,
+                                                    const struct Fft *fft) {
+  auto &thread = threadBootstrapBuffers;
+  if (thread.last != nullptr && thread.lastPolynomialSize == polynomial_size &&
+      thread.lastGlweDimension == glwe_dimension) {
+    return *thread.last;
+  }
+
+  auto &buffers = thread.buffers[{polynomial_size, glwe_dimension}];
+  if (buffers == nullptr) {
+    buffers = std::make_unique<BootstrapBuffers>(polynomial_size,
+                                                 glwe_dimension, fft);
+    bootstrapBuffersAllocations.fetch_add(1, std::memory_order_relaxed);
+  }
+
+  thread.lastPolynomialSize = polynomial_size;
+  thread.lastGlweDimension = glwe_dimension;
+  thread.last = buffers.get();
+  return *buffers;
+}
+
+size_t RuntimeContext::bootstrap_buffers_allocations() {
+  return bootstrapBuffersAllocations.load(std::memory_order_relaxed);
+}
+
 std::pair<FFT, std::shared_ptr<std::vector<std::complex<double>>>>
 RuntimeContext::convert_to_fourier_domain(LweBootstrapKey &bsk) {
   auto info = bsk.getInfo().asReader();
@@ -0,0 +1,202 @@
+// Part of the Concrete Compiler Project, under the BSD3 License with Zama
+// Exceptions. See
+// https://github.com/zama-ai/concrete/blob/main/LICENSE.txt
+// for license information.
+
+#include "concretelang/Runtime/worker_pool.h"
+#include <algorithm>
+#include <atomic>
+#include <memory>
+#include <pthread.h>
+#include <stdlib.h>
+
+namespace mlir {
+namespace concretelang {
+
+namespace {
+
+// Number of chunks given to each thread, to balance the load when some
+// threads are slower than others (e.g., when they are shared with other work).
+constexpr size_t CHUNKS_PER_THREAD = 4;
+
+size_t defaultNumThreads() {
+  char *env = getenv("CONCRETE_RUNTIME_NUM_THREADS");
+  if (env != nullptr) {
+    size_t numThreads = strtoul(env, NULL, 10);
+    if (numThreads > 0)
+      return numThreads;
+  }
+  return std::max<size_t>(std::thread::hardware_concurrency(), 1);
+}
+
+// The pool shared by the runtime, which is created on first use. It is never
+// destroyed, as joining its threads while the process exits (or while the
+// runtime library is unloaded) is not safe.
+std::atomic<WorkerPool *> sharedPool{nullptr};
+// Guards the creation of the shared pool.
+std::mutex sharedPoolMutex;
+// Number of threads of the pool of the parent process, in a forked process.
+size_t inheritedNumThreads = 0;
+
+} // namespace
+
+WorkerPool::WorkerPool() : numThreads(0), stopping(false) {
+  setNumThreads(0);
+}
+
+WorkerPool::~WorkerPool() { resize(0); }
+
+WorkerPool &WorkerPool::get() {
+  WorkerPool *pool = sharedPool.load(std::memory_order_acquire);
+  if (pool != nullptr)
+    return *pool;
+
+  std::lock_guard<std::mutex> lock(sharedPoolMutex);
+  pool = sharedPool.load(std::memory_order_relaxed);
+  if (pool == nullptr) {
+    static bool forkHandlersRegistered = false;
+    if (!forkHandlersRegistered) {
+      pthread_atfork(prepareFork, afterForkInParent, afterForkInChild);
+      forkHandlersRegistered = true;
+    }
+    pool = new WorkerPool();
+    if (inheritedNumThreads != 0)
+      pool->setNumThreads(inheritedNumThreads);
+    sharedPool.store(pool, std::memory_order_release);
+  }
+  return *pool;
+}
+
+void WorkerPool::prepareFork() {
+  sharedPoolMutex.lock();
+  WorkerPool *pool = sharedPool.load(std::memory_order_relaxed);
+  if (pool != nullptr)
+    pool->mutex.lock();
+}
+
+void WorkerPool::afterForkInParent() {
+  WorkerPool *pool = sharedPool.load(std::memory_order_relaxed);
+  if (pool != nullptr)
+    pool->mutex.unlock();
+  sharedPoolMutex.unlock();
+}
+
+void WorkerPool::afterForkInChild() {
+  // The threads of the pool don't exist in the child, so the pool can't be
+  // used nor destroyed (joining or destroying its threads is not possible).
+  // It is leaked, and a new pool is created on first use.
+  WorkerPool *pool = sharedPool.load(std::memory_order_relaxed);
+  if (pool != nullptr) {
+    inheritedNumThreads = pool->numThreads;
+    pool->mutex.unlock();
+    sharedPool.store(nullptr, std::memory_order_relaxed);
+  }
+  sharedPoolMutex.unlock();
+}
+
+void WorkerPool::setNumThreads(size_t numThreads) {
+  if (numThreads == 0)
+    numThreads = defaultNumThreads();
+  // The calling thread of a batch works as well, so one less worker is needed.
+  resize(numThreads - 1);
+  std::lock_guard<std::mutex> lock(mutex);
+  this->numThreads = numThreads;
+}
+
+size_t WorkerPool::getNumThreads() {
+  std::lock_guard<std::mutex> lock(mutex);
+  return numThreads;
+}
+
+void WorkerPool::resize(size_t numWorkers) {
+  {
+    std::lock_guard<std::mutex> lock(mutex);
+    stopping = true;
+  }
+  condition.notify_all();
+  for (auto &worker : workers)
+    worker.join();
+
+  std::lock_guard<std::mutex> lock(mutex);
+  // Remaining tasks can be dropped safely, as the chunks they would have
+  // processed are processed by the threads that submitted them.
+  tasks.clear();
+  workers.clear();
+  stopping = false;
+  for (size_t i = 0; i < numWorkers; i++)
+    workers.emplace_back([this]() { work(); });
+}
+
+void WorkerPool::work() {
+  while (true) {
+    std::function<void()> task;
+    {
+      std::unique_lock<std::mutex> lock(mutex);
+      condition.wait(lock, [this]() { return stopping || !tasks.empty(); });
+      if (stopping)
+        return;
+      task = std::move(tasks.front());
+      tasks.pop_front();
+    }
+    task();
+  }
+}
+
+void WorkerPool::parallelFor(size_t size,
+                             const std::function<void(size_t, size_t)> &body) {
+  size_t threads = getNumThreads();
+  if (size < 2 || threads < 2) {
+    if (size > 0)
+      body(0, size);
+    return;
+  }
+
+  size_t chunkSize =
+      (size + threads * CHUNKS_PER_THREAD - 1) / (threads * CHUNKS_PER_THREAD);
+  size_t numChunks = (size + chunkSize - 1) / chunkSize;
+
+  // The state of the batch is shared with the helper tasks, which can start
+  // after the batch is over (and then find no chunk left to process).
+  struct Batch {
+    std::atomic<size_t> nextChunk{0};
+    size_t processedChunks = 0;
+    std::mutex mutex;
+    std::condition_variable condition;
+  };
+  auto batch = std::make_shared<Batch>();
+
+  // `body` is only used while claiming a chunk, which can only happen before
+  // the batch is over, so it can be captured by reference.
+  auto process = [batch, &body, size, chunkSize, numChunks]() {
+    size_t processed = 0;
+    for (size_t chunk = batch->nextChunk++; chunk < numChunks;
+         chunk = batch->nextChunk++) {
+      size_t begin = chunk * chunkSize;
+      body(begin, std::min(size, begin + chunkSize));
+      processed++;
+    }
+    if (processed > 0) {
+      std::lock_guard<std::mutex> lock(batch->mutex);
+      batch->processedChunks += processed;
+      if (batch->processedChunks == numChunks)
+        batch->condition.notify_all();
+    }
+  };
+
+  {
+    std::lock_guard<std::mutex> lock(mutex);
+    size_t helpers = std::min(threads, numChunks) - 1;
+    for (size_t i = 0; i < helpers; i++)
+      tasks.push_back(process);
+  }
+  condition.notify_all();
+
+  process();
+
+  std::unique_lock<std::mutex> lock(batch->mutex);
+  batch->condition.wait(
+      lock, [&]() { return batch->processedChunks == numChunks; });
+}
+
+} // namespace concretelang
+} // namespace mlir
@@ -18,6 +18,7 @@
 #include <vector>
 
 #include "concretelang/Common/CRT.h"
+#include "concretelang/Runtime/worker_pool.h"
 #include "concretelang/Runtime/wrappers.h"
 
 #ifdef CONCRETELANG_CUDA_SUPPORT
@@ -721,15 +722,47 @@ void memref_batched_keyswitch_lwe_u64(
     uint64_t ct0_stride0, uint64_t ct0_stride1, uint32_t level,
     uint32_t base_log, uint32_t input_lwe_dim, uint32_t output_lwe_dim,
     uint32_t ksk_index, mlir::concretelang::RuntimeContext *context) {
-  for (size_t i = 0; i < ct0_size0; i++) {
-    memref_keyswitch_lwe_u64(
-        out_allocated + i * out_size1, out_aligned + i * out_size1, out_offset,
-        out_size1, out_stride1, ct0_allocated + i * ct0_size1,
-        ct0_aligned + i * ct0_size1, ct0_offset, ct0_size1, ct0_stride1, level,
-        base_log, input_lwe_dim, output_lwe_dim, ksk_index, context);
+  mlir::concretelang::WorkerPool::get().parallelFor(
+      ct0_size0, [&](size_t begin, size_t end) {
+        for (size_t i = begin; i < end; i++) {
+          memref_keyswitch_lwe_u64(
+              out_allocated + i * out_size1, out_aligned + i * out_size1,
+              out_offset, out_size1, out_stride1,
+              ct0_allocated + i * ct0_size1, ct0_aligned + i * ct0_size1,
+              ct0_offset, ct0_size1, ct0_stride1, level, base_log,
+              input_lwe_dim, output_lwe_dim, ksk_index, context);
+        }
+      });
+}
+
+namespace {
+
+void bootstrap_lwe_u64(uint64_t *out, uint64_t *ct0, uint64_t *tlu,
+                       uint32_t input_lwe_dimension, uint32_t polynomial_size,
+                       uint32_t decomposition_level_count,
+                       uint32_t decomposition_base_log,
+                       uint32_t glwe_dimension, const struct Fft *fft,
+                       const std::complex<double> *bootstrap_key,
+                       mlir::concretelang::BootstrapBuffers &buffers) {
+  auto glwe_ct = buffers.glwe_ct;
+
+  // Glwe trivial encryption
+  for (size_t i = 0; i < polynomial_size * glwe_dimension; i++) {
+    glwe_ct[i] = 0;
+  }
+  for (size_t i = 0; i < polynomial_size; i++) {
+    glwe_ct[polynomial_size * glwe_dimension + i] = tlu[i];
   }
+
+  // Bootstrap
+  concrete_cpu_bootstrap_lwe_ciphertext_u64(
+      out, ct0, glwe_ct, bootstrap_key, decomposition_level_count,
+      decomposition_base_log, glwe_dimension, polynomial_size,
+      input_lwe_dimension, fft, buffers.scratch, buffers.scratch_size);
 }
 
+} // namespace
+
 void memref_bootstrap_lwe_u64(
     uint64_t *out_allocated, uint64_t *out_aligned, uint64_t out_offset,
     uint64_t out_size, uint64_t out_stride, uint64_t *ct0_allocated,
@@ -741,38 +774,17 @@ void memref_bootstrap_lwe_u64(
     uint32_t glwe_dimension, uint32_t bsk_index,
     mlir::concretelang::RuntimeContext *context) {
 
-  uint64_t glwe_ct_size = polynomial_size * (glwe_dimension + 1);
-  uint64_t *glwe_ct = (uint64_t *)malloc(glwe_ct_size * sizeof(uint64_t));
-  auto tlu = tlu_aligned + tlu_offset;
-
-  // Glwe trivial encryption
-  for (size_t i = 0; i < polynomial_size * glwe_dimension; i++) {
-    glwe_ct[i] = 0;
-  }
-  for (size_t i = 0; i < polynomial_size; i++) {
-    glwe_ct[polynomial_size * glwe_dimension + i] = tlu[i];
-  }
-
   // Get fourrier bootstrap key
   const auto &fft = context->fft(bsk_index);
   auto bootstrap_key = context->fourier_bootstrap_key_buffer(bsk_index);
-  // Get stack parameter
-  size_t scratch_size;
-  size_t scratch_align;
-  concrete_cpu_bootstrap_lwe_ciphertext_u64_scratch(
-      &scratch_size, &scratch_align, glwe_dimension, polynomial_size, fft);
-  // Allocate scratch
-  auto scratch = (uint8_t *)aligned_alloc(scratch_align, scratch_size);
-
-  // Bootstrap
-  concrete_cpu_bootstrap_lwe_ciphertext_u64(
-      out_aligned + out_offset, ct0_aligned + ct0_offset, glwe_ct,
-      bootstrap_key, decomposition_level_count, decomposition_base_log,
-      glwe_dimension, polynomial_size, input_lwe_dimension, fft, scratch,
-      scratch_size);
 
-  free(glwe_ct);
-  free(scratch);
+  auto &buffers =
+      context->bootstrap_buffers(polynomial_size, glwe_dimension, fft);
+  bootstrap_lwe_u64(out_aligned + out_offset, ct0_aligned + ct0_offset,
+                    tlu_aligned + tlu_offset, input_lwe_dimension,
+                    polynomial_size, decomposition_level_count,
+                    decomposition_base_log, glwe_dimension, fft, bootstrap_key,
+                    buffers);
 }
 
 void memref_batched_bootstrap_lwe_u64(
@@ -786,14 +798,20 @@ void memref_batched_bootstrap_lwe_u64(
     uint32_t level, uint32_t base_log, uint32_t glwe_dim, uint32_t bsk_index,
     mlir::concretelang::RuntimeContext *context) {
 
-  for (size_t i = 0; i < out_size0; i++) {
-    memref_bootstrap_lwe_u64(
-        out_allocated + i * out_size1, out_aligned + i * out_size1, out_offset,
-        out_size1, out_stride1, ct0_allocated, ct0_aligned + i * ct0_size1,
-        ct0_offset, ct0_size1, ct0_stride1, tlu_allocated, tlu_aligned,
-        tlu_offset, tlu_size, tlu_stride, input_lwe_dim, poly_size, level,
-        base_log, glwe_dim, bsk_index, context);
-  }
+  const auto &fft = context->fft(bsk_index);
+  auto bootstrap_key = context->fourier_bootstrap_key_buffer(bsk_index);
+
+  mlir::concretelang::WorkerPool::get().parallelFor(
+      out_size0, [&](size_t begin, size_t end) {
+        for (size_t i = begin; i < end; i++) {
+          auto &buffers = context->bootstrap_buffers(poly_size, glwe_dim, fft);
+          bootstrap_lwe_u64(out_aligned + out_offset + i * out_size1,
+                            ct0_aligned + ct0_offset + i * ct0_size1,
+                            tlu_aligned + tlu_offset, input_lwe_dim, poly_size,
+                            level, base_log, glwe_dim, fft, bootstrap_key,
+                            buffers);
+        }
+      });
 }
 
 void memref_batched_mapped_bootstrap_lwe_u64(
@@ -808,15 +826,21 @@ void memref_batched_mapped_bootstrap_lwe_u64(
     uint32_t base_log, uint32_t glwe_dim, uint32_t bsk_index,
     mlir::concretelang::RuntimeContext *context) {
   assert(out_size0 == tlu_size0 && "Number of LUTs does not match batch size");
-  for (size_t i = 0; i < out_size0; i++) {
-    memref_bootstrap_lwe_u64(
-        out_allocated + i * out_size1, out_aligned + i * out_size1, out_offset,
-        out_size1, out_stride1, ct0_allocated, ct0_aligned + i * ct0_size1,
-        ct0_offset, ct0_size1, ct0_stride1, tlu_allocated,
-        tlu_aligned + i * tlu_size1, tlu_offset, tlu_size1, tlu_stride1,
-        input_lwe_dim, poly_size, level, base_log, glwe_dim, bsk_index,
-        context);
-  }
+
+  const auto &fft = context->fft(bsk_index);
+  auto bootstrap_key = context->fourier_bootstrap_key_buffer(bsk_index);
+
+  mlir::concretelang::WorkerPool::get().parallelFor(
+      out_size0, [&](size_t begin, size_t end) {
+        for (size_t i = begin; i < end; i++) {
+          auto &buffers = context->bootstrap_buffers(poly_size, glwe_dim, fft);
+          bootstrap_lwe_u64(out_aligned + out_offset + i * out_size1,
+                            ct0_aligned + ct0_offset + i * ct0_size1,
+                            tlu_aligned + tlu_offset + i * tlu_size1,
+                            input_lwe_dim, poly_size, level, base_log,
+                            glwe_dim, fft, bootstrap_key, buffers);
+        }
+      });
 }
 
 uint64_t encode_crt(int64_t plaintext, uint64_t modulus, uint64_t product) {
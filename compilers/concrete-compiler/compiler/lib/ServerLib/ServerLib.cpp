@@ -4,12 +4,21 @@
 // for license information.
 
 #include <cassert>
+#include <complex>
+#include <fcntl.h>
+#include <fstream>
 #include <functional>
 #include <llvm/ADT/SmallSet.h>
 #include <memory>
+#include <optional>
+#include <string.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
 #include <vector>
 
 #include "boost/outcome.h"
+#include "concrete-cpu.h"
 #include "concrete-protocol.capnp.h"
 #include "concretelang/Common/Error.h"
 #include "concretelang/Common/Keysets.h"
@@ -18,9 +27,11 @@
 #include "concretelang/Common/Values.h"
 #include "concretelang/Runtime/DFRuntime.hpp"
 #include "concretelang/Runtime/context.h"
+#include "concretelang/Runtime/worker_pool.h"
 #include "concretelang/ServerLib/ServerLib.h"
 #include "concretelang/Support/CompilerEngine.h"
 #include "llvm/ADT/ArrayRef.h"
+#include "llvm/Support/SHA256.h"
 
 using concretelang::keysets::ServerKeyset;
 using concretelang::transformers::ArgTransformer;
@@ -429,16 +440,243 @@ bool getGateIsSigned(const Message<concreteprotocol::GateInfo> &gateInfo) {
   assert(false);
 }
 
+PreparedKeys PreparedKeys::prepare(const ServerKeyset &serverKeyset) {
+  PreparedKeys output;
+  output.runtimeContext = std::make_shared<RuntimeContext>(serverKeyset);
+  return output;
+}
+
+RuntimeContext *PreparedKeys::getRuntimeContext() const {
+  return runtimeContext.get();
+}
+
+// Prepared keys files start with a header, followed by an entry per bootstrap
+// key, followed by the fourier bootstrap keys. Keys are aligned on pages, so
+// that they can be used in place once the file is memory-mapped.
+const char PREPARED_KEYS_MAGIC[8] = {'C', 'L', 'P', 'K', 'E', 'Y', 'S', '2'};
+const size_t PREPARED_KEYS_ALIGNMENT = 4096;
+
+struct PreparedKeysHeader {
+  char magic[8];
+  uint64_t bootstrapKeysCount;
+};
+
+struct PreparedBootstrapKeyEntry {
+  uint64_t inputLweDimension;
+  uint64_t glweDimension;
+  uint64_t polynomialSize;
+  uint64_t levelCount;
+  uint64_t baseLog;
+  // Offset of the key in the file, and size of the key in bytes.
+  uint64_t offset;
+  uint64_t size;
+  // SHA-256 of the standard key the fourier key was prepared from, as keys
+  // generated with the same parameters can't be told apart otherwise.
+  uint8_t digest[32];
+};
+
+PreparedBootstrapKeyEntry
+getPreparedBootstrapKeyEntry(
+    const ::concretelang::keys::LweBootstrapKey &bootstrapKey) {
+  auto params = bootstrapKey.getInfo().asReader().getParams();
+  PreparedBootstrapKeyEntry entry;
+  entry.inputLweDimension = params.getInputLweDimension();
+  entry.glweDimension = params.getGlweDimension();
+  entry.polynomialSize = params.getPolynomialSize();
+  entry.levelCount = params.getLevelCount();
+  entry.baseLog = params.getBaseLog();
+  auto &buffer = bootstrapKey.getTransportBuffer();
+  auto digest = llvm::SHA256::hash(
+      llvm::ArrayRef<uint8_t>((const uint8_t *)buffer.data(),
+                              buffer.size() * sizeof(uint64_t)));
+  static_assert(sizeof(digest) == sizeof(entry.digest), "Invalid digest size");
+  memcpy(entry.digest, digest.data(), sizeof(entry.digest));
+  entry.offset = 0;
+  // The fourier key holds a complex for every two integers of the key.
+  entry.size = concrete_cpu_bootstrap_key_size_u64(
+                   entry.levelCount, entry.glweDimension, entry.polynomialSize,
+                   entry.inputLweDimension) /
+               2 * sizeof(std::complex<double>);
+  return entry;
+}
+
+uint64_t alignPreparedKeysOffset(uint64_t offset) {
+  return (offset + PREPARED_KEYS_ALIGNMENT - 1) / PREPARED_KEYS_ALIGNMENT *
+         PREPARED_KEYS_ALIGNMENT;
+}
+
+Result<void> PreparedKeys::save(const std::string &path) const {
+  auto serverKeyset = runtimeContext->getKeys();
+  auto &bootstrapKeys = serverKeyset.lweBootstrapKeys;
+
+  PreparedKeysHeader header;
+  memcpy(header.magic, PREPARED_KEYS_MAGIC, sizeof(header.magic));
+  header.bootstrapKeysCount = bootstrapKeys.size();
+
+  std::vector<PreparedBootstrapKeyEntry> entries;
+  uint64_t offset = sizeof(PreparedKeysHeader) +
+                    bootstrapKeys.size() * sizeof(PreparedBootstrapKeyEntry);
+  for (auto &bootstrapKey : bootstrapKeys) {
+    auto entry = getPreparedBootstrapKeyEntry(bootstrapKey);
+    entry.offset = alignPreparedKeysOffset(offset);
+    offset = entry.offset + entry.size;
+    entries.push_back(entry);
+  }
+
+  std::ofstream out(path, std::ofstream::binary);
+  if (out.fail()) {
+    return StringError("Cannot save prepared keys at path: " + path +
+                       " Error: " + strerror(errno));
+  }
+  out.write((const char *)&header, sizeof(header));
+  out.write((const char *)entries.data(),
+            entries.size() * sizeof(PreparedBootstrapKeyEntry));
+  for (size_t i = 0; i < entries.size(); i++) {
+    std::vector<char> padding(entries[i].offset - (uint64_t)out.tellp(), 0);
+    out.write(padding.data(), padding.size());
+    out.write(
+        (const char *)runtimeContext->fourier_bootstrap_key_buffer(i),
+        entries[i].size);
+  }
+  out.close();
+  if (out.fail()) {
+    return StringError("Cannot save prepared keys at path: " + path +
+                       " Error: " + strerror(errno));
+  }
+  return outcome::success();
+}
+
+Result<PreparedKeys> PreparedKeys::load(const ServerKeyset &serverKeyset,
+                                        const std::string &path) {
+  int fd = ::open(path.c_str(), O_RDONLY);
+  if (fd < 0) {
+    return StringError("Cannot load prepared keys at path " + path +
+                       " Error: " + strerror(errno));
+  }
+  struct stat fileStat;
+  if (fstat(fd, &fileStat) != 0) {
+    ::close(fd);
+    return StringError("Cannot load prepared keys at path " + path +
+                       " Error: " + strerror(errno));
+  }
+  size_t fileSize = fileStat.st_size;
+  if (fileSize < sizeof(PreparedKeysHeader)) {
+    ::close(fd);
+    return StringError("Invalid prepared keys file: " + path);
+  }
+  // The mapping is shared, so the pages of the file are shared by all the
+  // processes loading it.
+  void *data = mmap(nullptr, fileSize, PROT_READ, MAP_SHARED, fd, 0);
+  ::close(fd);
+  if (data == MAP_FAILED) {
+    return StringError("Cannot map prepared keys at path " + path +
+                       " Error: " + strerror(errno));
+  }
+  std::shared_ptr<const char> mapping(
+      (const char *)data,
+      [fileSize](const char *data) { munmap((void *)data, fileSize); });
+
+  auto header = (const PreparedKeysHeader *)mapping.get();
+  auto &bootstrapKeys = serverKeyset.lweBootstrapKeys;
+  if (memcmp(header->magic, PREPARED_KEYS_MAGIC, sizeof(header->magic)) != 0 ||
+      header->bootstrapKeysCount != bootstrapKeys.size() ||
+      fileSize < sizeof(PreparedKeysHeader) +
+                     bootstrapKeys.size() * sizeof(PreparedBootstrapKeyEntry)) {
+    return StringError("Prepared keys at path " + path +
+                       " don't match the evaluation keys");
+  }
+
+  auto entries = (const PreparedBootstrapKeyEntry *)(header + 1);
+  std::vector<std::shared_ptr<const std::complex<double>>> fourierKeys;
+  for (size_t i = 0; i < bootstrapKeys.size(); i++) {
+    auto expected = getPreparedBootstrapKeyEntry(bootstrapKeys[i]);
+    auto &entry = entries[i];
+    if (entry.inputLweDimension != expected.inputLweDimension ||
+        entry.glweDimension != expected.glweDimension ||
+        entry.polynomialSize != expected.polynomialSize ||
+        entry.levelCount != expected.levelCount ||
+        entry.baseLog != expected.baseLog || entry.size != expected.size ||
+        entry.offset % PREPARED_KEYS_ALIGNMENT != 0 ||
+        entry.offset > fileSize || entry.size > fileSize - entry.offset) {
+      return StringError("Prepared keys at path " + path +
+                         " don't match the evaluation keys");
+    }
+    if (memcmp(entry.digest, expected.digest, sizeof(entry.digest)) != 0) {
+      return StringError("Prepared keys at path " + path +
+                         " were not prepared from the evaluation keys");
+    }
+    // The keys share the ownership of the mapping.
+    fourierKeys.push_back(std::shared_ptr<const std::complex<double>>(
+        mapping,
+        (const std::complex<double> *)(mapping.get() + entry.offset)));
+  }
+
+  PreparedKeys output;
+  output.runtimeContext =
+      std::make_shared<RuntimeContext>(serverKeyset, fourierKeys);
+  return output;
+}
+
 Result<std::vector<TransportValue>>
 ServerCircuit::call(const ServerKeyset &serverKeyset,
-                    std::vector<TransportValue> &args) {
-  std::vector<TransportValue> returns(returnsBuffer.size());
+                    std::vector<TransportValue> &args) const {
+  return call(PreparedKeys::prepare(serverKeyset), args);
+}
+
+Result<std::vector<TransportValue>>
+ServerCircuit::call(const PreparedKeys &preparedKeys,
+                    std::vector<TransportValue> &args) const {
   mlir::concretelang::dfr::_dfr_register_lib(dynamicModule->libraryHandle);
   if (!mlir::concretelang::dfr::_dfr_is_root_node()) {
     mlir::concretelang::dfr::_dfr_run_remote_scheduler();
-    return returns;
+    return std::vector<TransportValue>(returnTransformers.size());
   }
 
+  return callRegistered(preparedKeys.getRuntimeContext(), args);
+}
+
+Result<std::vector<std::vector<TransportValue>>> ServerCircuit::callBatch(
+    const PreparedKeys &preparedKeys,
+    std::vector<std::vector<TransportValue>> &argsBatch) const {
+  std::vector<std::vector<TransportValue>> returnsBatch(argsBatch.size());
+
+  // The library is registered once for the whole batch.
+  mlir::concretelang::dfr::_dfr_register_lib(dynamicModule->libraryHandle);
+  if (!mlir::concretelang::dfr::_dfr_is_root_node()) {
+    mlir::concretelang::dfr::_dfr_run_remote_scheduler();
+    return returnsBatch;
+  }
+
+  std::vector<std::optional<std::string>> errors(argsBatch.size());
+  mlir::concretelang::WorkerPool::get().parallelFor(
+      argsBatch.size(), [&](size_t begin, size_t end) {
+        for (size_t i = begin; i < end; i++) {
+          auto returns =
+              callRegistered(preparedKeys.getRuntimeContext(), argsBatch[i]);
+          if (returns.has_failure()) {
+            errors[i] = returns.as_failure().error().mesg;
+          } else {
+            returnsBatch[i] = std::move(returns.value());
+          }
+        }
+      });
+
+  for (auto &error : errors) {
+    if (error.has_value()) {
+      return StringError(error.value());
+    }
+  }
+  return returnsBatch;
+}
+
+Result<std::vector<TransportValue>>
+ServerCircuit::callRegistered(RuntimeContext *runtimeContext,
+                              std::vector<TransportValue> &args) const {
+  // The buffers are local to the call, which makes calls reentrant.
+  std::vector<Value> argsBuffer(argTransformers.size());
+  std::vector<Value> returnsBuffer(returnTransformers.size());
+  std::vector<TransportValue> returns(returnsBuffer.size());
+
   if (args.size() != argsBuffer.size()) {
     return StringError("Called circuit with wrong number of arguments");
   }
@@ -450,7 +688,7 @@ ServerCircuit::call(const ServerKeyset &serverKeyset,
 
   // The arguments has been pushed in the arg buffer, we are now ready to
   // invoke the circuit function.
-  invoke(serverKeyset);
+  invoke(runtimeContext, argsBuffer, returnsBuffer);
 
   // We process the return values to turn them into transport values.
   for (size_t i = 0; i < returnsBuffer.size(); i++) {
@@ -461,7 +699,7 @@ ServerCircuit::call(const ServerKeyset &serverKeyset,
 }
 
 Result<std::vector<TransportValue>>
-ServerCircuit::simulate(std::vector<TransportValue> &args) {
+ServerCircuit::simulate(std::vector<TransportValue> &args) const {
   ServerKeyset emptyKeyset;
   return call(emptyKeyset, args);
 }
@@ -528,11 +766,6 @@ Result<ServerCircuit> ServerCircuit::fromDynamicModule(
     output.returnTransformers.push_back(transformer);
   }
 
-  output.argsBuffer =
-      std::vector<Value>(circuitInfo.asReader().getInputs().size());
-  output.returnsBuffer =
-      std::vector<Value>(circuitInfo.asReader().getOutputs().size());
-
   output.argRawSize = 0;
   for (auto gateInfo : circuitInfo.asReader().getInputs()) {
     auto descriptorSize = getGateDescriptionSize(gateInfo, useSimulation);
@@ -550,12 +783,12 @@ Result<ServerCircuit> ServerCircuit::fromDynamicModule(
   return output;
 }
 
-void ServerCircuit::invoke(const ServerKeyset &serverKeyset) {
+void ServerCircuit::invoke(RuntimeContext *runtimeContext,
+                           std::vector<Value> &argsBuffer,
+                           std::vector<Value> &returnsBuffer) const {
 
-  // We create a runtime context from the keyset, and place a pointer to it in
-  // the structure.
-  RuntimeContext runtimeContext = RuntimeContext(serverKeyset);
-  RuntimeContext *_runtimeContextPtr = &runtimeContext;
+  // We place a pointer to the runtime context in the structure.
+  RuntimeContext *_runtimeContextPtr = runtimeContext;
 
   auto _argRaws = std::vector<void *>(this->argRawSize);
   auto _argRawMaps = std::vector<llvm::MutableArrayRef<void *>>();
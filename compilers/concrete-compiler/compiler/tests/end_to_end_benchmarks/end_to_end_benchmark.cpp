@@ -2,6 +2,7 @@
 #include "concretelang/Common/Compat.h"
 #include "concretelang/TestLib/TestProgram.h"
 #include <concretelang/Runtime/DFRuntime.hpp>
+#include <concretelang/Runtime/context.h>
 
 #include <benchmark/benchmark.h>
 #include <filesystem>
@@ -92,11 +93,77 @@ static void BM_Evaluate(benchmark::State &state, EndToEndDesc description,
   }
 }
 
+/// Benchmark time of the circuit evaluation, with or without prepared keys
+static void BM_EvaluateCircuit(benchmark::State &state,
+                               EndToEndDesc description,
+                               mlir::concretelang::CompilationOptions options,
+                               bool usePreparedKeys) {
+  TestProgram tc(options);
+  assert(tc.compile(description.program));
+  assert(tc.generateKeyset());
+  auto clientCircuit = tc.getClientCircuit().value();
+
+  assert(description.tests.size() > 0);
+  auto test = description.tests[0];
+  auto inputArguments = std::vector<TransportValue>();
+  inputArguments.reserve(test.inputs.size());
+
+  for (size_t i = 0; i < test.inputs.size(); i++) {
+    auto input =
+        clientCircuit.prepareInput(test.inputs[i].getValue(), i).value();
+    inputArguments.push_back(input);
+  }
+
+  auto serverCircuit = tc.getServerCircuit().value();
+  auto serverKeyset = tc.getKeyset().value().server;
+  auto preparedKeys =
+      concretelang::serverlib::PreparedKeys::prepare(serverKeyset);
+
+  // Warmup
+  assert(serverCircuit.call(preparedKeys, inputArguments));
+
+  auto allocations =
+      mlir::concretelang::RuntimeContext::bootstrap_buffers_allocations();
+
+  for (auto _ : state) {
+    if (usePreparedKeys) {
+      assert(serverCircuit.call(preparedKeys, inputArguments));
+    } else {
+      assert(serverCircuit.call(serverKeyset, inputArguments));
+    }
+  }
+
+  // Without per-thread buffers, each bootstrap allocates (and frees) its
+  // accumulator and scratch space, while they are now allocated once per
+  // thread and parameters (so it should be close to zero after the warmup).
+  allocations =
+      mlir::concretelang::RuntimeContext::bootstrap_buffers_allocations() -
+      allocations;
+
+  int64_t bootstrapsPerCall = 0;
+  auto feedback = tc.getCompilationFeedback().value();
+  for (auto &circuitFeedback : feedback.circuitFeedbacks) {
+    if (circuitFeedback.name != "main")
+      continue;
+    for (auto &statistic : circuitFeedback.statistics) {
+      if (statistic.operation == mlir::concretelang::PrimitiveOperation::PBS)
+        bootstrapsPerCall += statistic.count.value_or(0);
+    }
+  }
+
+  state.counters["bootstraps"] = benchmark::Counter(bootstrapsPerCall);
+  state.counters["bootstrap_allocs_without_thread_buffers"] =
+      benchmark::Counter(2 * bootstrapsPerCall);
+  state.counters["bootstrap_allocs"] =
+      benchmark::Counter(2 * allocations, benchmark::Counter::kAvgIterations);
+}
+
 enum Action {
   COMPILE,
   KEYGEN,
   ENCRYPT,
   EVALUATE,
+  PREPARED_KEYS,
 };
 
 void registerEndToEndBenchmark(std::string suiteName,
@@ -138,7 +205,7 @@ void registerEndToEndBenchmark(std::string suiteName,
               BM_ExportArguments(st, description, options);
             });
         break;
-      case Action::EVALUATE:
+      case Action::EVALUATE: {
         auto bench = benchmark::RegisterBenchmark(
             benchName("evaluate").c_str(), [=](::benchmark::State &st) {
               BM_Evaluate(st, description, options);
@@ -147,6 +214,19 @@ void registerEndToEndBenchmark(std::string suiteName,
           bench->Iterations(num_iterations);
         break;
       }
+      case Action::PREPARED_KEYS:
+        for (bool usePreparedKeys : {false, true}) {
+          auto name = usePreparedKeys ? "evaluate-with-prepared-keys"
+                                      : "evaluate-with-keyset";
+          auto bench = benchmark::RegisterBenchmark(
+              benchName(name).c_str(), [=](::benchmark::State &st) {
+                BM_EvaluateCircuit(st, description, options, usePreparedKeys);
+              });
+          if (num_iterations)
+            bench->Iterations(num_iterations);
+        }
+        break;
+      }
     }
   }
   setCurrentStackLimit(stackSizeRequirement);
@@ -166,7 +246,10 @@ int main(int argc, char **argv) {
       llvm::cl::values(
           clEnumValN(Action::ENCRYPT, "encrypt", "Run encrypt benchmark")),
       llvm::cl::values(
-          clEnumValN(Action::EVALUATE, "evaluate", "Run evaluate benchmark")));
+          clEnumValN(Action::EVALUATE, "evaluate", "Run evaluate benchmark")),
+      llvm::cl::values(clEnumValN(
+          Action::PREPARED_KEYS, "prepared-keys",
+          "Run evaluate benchmarks with and without prepared keys")));
 
   // parse end to end test compiler options
   auto options = parseEndToEndCommandLine(argc, argv);
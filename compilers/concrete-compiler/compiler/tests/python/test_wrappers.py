@@ -9,6 +9,7 @@ from concrete.compiler import (
     LibraryCompilationResult,
     LibraryLambda,
     LibrarySupport,
+    PreparedEvaluationKeys,
     PublicArguments,
     PublicResult,
 )
@@ -27,6 +28,7 @@ from concrete.compiler import (
         pytest.param(LibraryCompilationResult, id="LibraryCompilationResult"),
         pytest.param(LibraryLambda, id="LibraryLambda"),
         pytest.param(LibrarySupport, id="LibrarySupport"),
+        pytest.param(PreparedEvaluationKeys, id="PreparedEvaluationKeys"),
         pytest.param(PublicArguments, id="PublicArguments"),
         pytest.param(PublicResult, id="PublicResult"),
     ],
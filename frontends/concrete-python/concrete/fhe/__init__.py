@@ -4,7 +4,15 @@ Concrete.
 
 # pylint: disable=import-error,no-name-in-module
 
-from concrete.compiler import EvaluationKeys, Parameter, PublicArguments, PublicResult
+from concrete.compiler import (
+    EvaluationKeys,
+    Parameter,
+    PreparedEvaluationKeys,
+    PublicArguments,
+    PublicResult,
+    get_runtime_num_threads,
+    set_runtime_num_threads,
+)
 
 from .compilation import (
     DEFAULT_GLOBAL_P_ERROR,
@@ -13,6 +21,8 @@ from .compilation import (
     AllInputs,
     AllOutputs,
     ApproximateRoundingConfig,
+    AutotuneCandidate,
+    AutotuneReport,
     BitwiseStrategy,
     Circuit,
     Client,
@@ -31,6 +41,7 @@ from .compilation import (
     FunctionDebugArtifacts,
     Input,
     Keys,
+    MatmulStrategy,
     MinMaxStrategy,
     ModuleDebugArtifacts,
     MultiParameterStrategy,
@@ -40,8 +51,11 @@ from .compilation import (
     ParameterSelectionStrategy,
     Server,
     Value,
+    ValueHandle,
+    ValueStore,
     Wire,
     Wired,
+    autotune,
     inputset,
 )
 from .compilation.decorators import circuit, compiler, function, module
@@ -54,6 +68,9 @@ from .extensions import (
     bits,
     constant,
     conv,
+    first_match,
+    gather,
+    gather_programmable_bootstrap_counts,
     hint,
     identity,
     if_then_else,
@@ -62,9 +79,18 @@ from .extensions import (
     one,
     ones,
     ones_like,
+    radix_add,
+    radix_decode,
+    radix_encode,
+    radix_equal,
+    radix_less,
+    radix_multiply,
+    radix_tlu,
     refresh,
     relu,
     round_bit_pattern,
+    scan,
+    scatter,
     tag,
     truncate_bit_pattern,
     univariate,
@@ -3,6 +3,7 @@ Glue the compilation process together.
 """
 
 from .artifacts import DebugArtifacts, FunctionDebugArtifacts, ModuleDebugArtifacts
+from .autotune import AutotuneCandidate, AutotuneReport, autotune
 from .circuit import Circuit
 from .client import Client
 from .compiler import Compiler
@@ -15,11 +16,13 @@ from .configuration import (
     ComparisonStrategy,
     Configuration,
     Exactness,
+    MatmulStrategy,
     MinMaxStrategy,
     MultiParameterStrategy,
     MultivariateStrategy,
     ParameterSelectionStrategy,
 )
+from .handles import ValueHandle, ValueStore
 from .keys import Keys
 from .module import FheFunction, FheModule
 from .module_compiler import FunctionDef, ModuleCompiler
@@ -0,0 +1,319 @@
+"""
+Declaration of `autotune` function.
+"""
+
+import itertools
+import multiprocessing
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..representation import Graph
+from .compiler import Compiler
+from .configuration import Configuration
+
+AUTOTUNE_OBJECTIVES = ["complexity", "size_of_keys", "latency"]
+
+
+@dataclass
+class AutotuneCandidate:
+    """
+    Candidate configuration evaluated during autotuning.
+    """
+
+    options: Dict[str, Any]
+    """Options of the candidate, which are applied on top of the base configuration."""
+
+    configuration: Configuration
+    """Configuration of the candidate."""
+
+    complexity: Optional[float] = None
+    """Complexity of the compiled circuit, as estimated by the optimizer."""
+
+    size_of_keys: Optional[int] = None
+    """Size of the evaluation keys (bootstrap and keyswitch keys) of the compiled circuit."""
+
+    programmable_bootstrap_count: Optional[int] = None
+    """Number of programmable bootstraps in the compiled circuit."""
+
+    latency: Optional[float] = None
+    """Median time in seconds to run the compiled circuit (only measured for latency objective)."""
+
+    error: Optional[str] = None
+    """Reason of the failure, if the candidate couldn't be compiled."""
+
+    def score(self, objective: str) -> float:
+        """
+        Get the score of the candidate for an objective (lower is better).
+
+        Args:
+            objective (str):
+                objective to get the score for
+
+        Returns:
+            float:
+                score of the candidate (infinity if the candidate failed)
+        """
+
+        value = getattr(self, objective)
+        return float(value) if self.error is None and value is not None else float("inf")
+
+
+@dataclass
+class AutotuneReport:
+    """
+    Report of autotuning, with evaluated candidates ranked from the best to the worst.
+    """
+
+    objective: str
+    candidates: List[AutotuneCandidate] = field(default_factory=list)
+
+    @property
+    def best(self) -> AutotuneCandidate:
+        """
+        Get the best candidate.
+        """
+
+        return self.candidates[0]
+
+    def format(self) -> str:
+        """
+        Get the textual representation of the report.
+
+        Returns:
+            str:
+                ranking of the candidates
+        """
+
+        lines = []
+        for rank, candidate in enumerate(self.candidates, start=1):
+            options = ", ".join(f"{name}={value}" for name, value in candidate.options.items())
+            if candidate.error is not None:
+                lines.append(f"#{rank} {{{options}}} -> failed ({candidate.error})")
+                continue
+
+            metrics = [
+                f"complexity={candidate.complexity:.0f}",
+                f"size_of_keys={candidate.size_of_keys}",
+                f"programmable_bootstrap_count={candidate.programmable_bootstrap_count}",
+            ]
+            if candidate.latency is not None:
+                metrics.append(f"latency={candidate.latency:.6f}s")
+
+            lines.append(f"#{rank} {{{options}}} -> {', '.join(metrics)}")
+
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.format()
+
+
+def autotune(
+    compiler: Compiler,
+    inputset: Optional[Union[Iterable[Any], Iterable[Tuple[Any, ...]]]] = None,
+    search_space: Optional[Dict[str, List[Any]]] = None,
+    budget: Optional[int] = None,
+    configuration: Optional[Configuration] = None,
+    objective: str = "complexity",
+    workers: int = 1,
+    latency_runs: int = 3,
+    seed: Optional[int] = None,
+    **kwargs,
+) -> Tuple[Configuration, AutotuneReport]:
+    """
+    Search configuration options for the configuration that compiles to the best circuit.
+
+    Function is traced and bounds are measured once, and candidate configurations are compiled
+    from the resulting graph. So options of the search space shouldn't affect tracing
+    (e.g., `enable_tlu_fusing`, `auto_adjust_rounders`), as those are only taken
+    from the base configuration.
+
+    Args:
+        compiler (Compiler):
+            compiler of the function to tune
+
+        inputset (Optional[Union[Iterable[Any], Iterable[Tuple[Any, ...]]]]):
+            optional inputset to extend accumulated inputset of the compiler before tracing
+
+        search_space (Optional[Dict[str, List[Any]]], default = None):
+            values to try for each configuration option
+            (e.g., {"single_precision": [False, True]}),
+            every combination of the values is a candidate
+
+        budget (Optional[int], default = None):
+            maximum number of candidates to compile
+            (candidates are sampled randomly if there are more, all are compiled if None)
+
+        configuration(Optional[Configuration], default = None):
+            base configuration, which candidates are forked from
+
+        objective (str, default = "complexity"):
+            what to minimize, one of "complexity", "size_of_keys" or "latency"
+            (latency requires key generation and execution of each candidate)
+
+        workers (int, default = 1):
+            number of processes to compile candidates in
+            (compilation is serial if it's 1, if processes cannot be forked,
+            or if the objective is "latency", as candidates timed concurrently
+            would compete for the same cores and slow each other down)
+
+        latency_runs (int, default = 3):
+            number of runs to take the median of when measuring latency
+
+        seed (Optional[int], default = None):
+            seed to use when sampling candidates
+
+        kwargs (Dict[str, Any]):
+            configuration options to overwrite in the base configuration
+
+    Returns:
+        Tuple[Configuration, AutotuneReport]:
+            best configuration and the report of all evaluated candidates
+    """
+
+    if objective not in AUTOTUNE_OBJECTIVES:
+        message = (
+            f"Autotuning objective '{objective}' is not supported "
+            f"(expected one of {', '.join(AUTOTUNE_OBJECTIVES)})"
+        )
+        raise ValueError(message)
+
+    if budget is not None and budget < 1:
+        message = f"Autotuning budget should be at least 1 but it's {budget}"
+        raise ValueError(message)
+
+    # pylint: disable=protected-access
+    base_configuration = (
+        configuration
+        if configuration is not None
+        else compiler._module_compiler.default_configuration
+    )
+    # pylint: enable=protected-access
+    if len(kwargs) != 0:
+        base_configuration = base_configuration.fork(**kwargs)
+
+    search_space = search_space if search_space is not None else {}
+    names = list(search_space.keys())
+
+    candidates = []
+    for values in itertools.product(*(search_space[name] for name in names)):
+        options = dict(zip(names, values))
+        candidates.append(
+            AutotuneCandidate(
+                options=options,
+                configuration=base_configuration.fork(**options),
+            )
+        )
+
+    if budget is not None and budget < len(candidates):
+        selected = sorted(random.Random(seed).sample(range(len(candidates)), budget))  # noqa: S311
+        candidates = [candidates[index] for index in selected]
+
+    graph = compiler.trace(inputset, base_configuration)
+
+    # pylint: disable=protected-access
+    function = compiler._module_compiler.functions[compiler._function_name]
+    composition = compiler._module_compiler.composition
+    # pylint: enable=protected-access
+
+    sample = None
+    if objective == "latency":
+        if len(function.inputset) == 0:
+            message = "Autotuning for latency without an inputset is not supported"
+            raise RuntimeError(message)
+        sample = function.inputset[0]
+        sample = sample if isinstance(sample, tuple) else (sample,)
+
+    state = (graph, composition, [candidate.configuration for candidate in candidates], sample)
+    if (
+        workers <= 1
+        or objective == "latency"
+        or len(candidates) <= 1
+        or "fork" not in multiprocessing.get_all_start_methods()
+    ):
+        results = [
+            _evaluate_candidate(state, index, latency_runs) for index in range(len(candidates))
+        ]
+    else:
+        # like bounds measurement, graphs are not picklable in general
+        # so the state is inherited by forked workers and only metrics cross process boundaries
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(candidates)),
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_initialize_autotune_worker,
+            initargs=(state,),
+        ) as executor:
+            futures = [
+                executor.submit(_evaluate_candidate_in_worker, index, latency_runs)
+                for index in range(len(candidates))
+            ]
+            results = [future.result() for future in futures]
+
+    for candidate, result in zip(candidates, results):
+        for name, value in result.items():
+            setattr(candidate, name, value)
+
+    if len(candidates) != 0 and all(candidate.error is not None for candidate in candidates):
+        message = "None of the candidate configurations could be compiled\n\n" + "\n".join(
+            f"{candidate.options} -> {candidate.error}" for candidate in candidates
+        )
+        raise RuntimeError(message)
+
+    report = AutotuneReport(
+        objective=objective,
+        candidates=sorted(candidates, key=lambda candidate: candidate.score(objective)),
+    )
+    return (report.best.configuration if len(candidates) != 0 else base_configuration), report
+
+
+_AUTOTUNE_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _initialize_autotune_worker(state: Tuple[Graph, Any, List[Configuration], Any]):
+    _AUTOTUNE_WORKER_STATE["state"] = state
+
+
+def _evaluate_candidate_in_worker(index: int, latency_runs: int) -> Dict[str, Any]:
+    return _evaluate_candidate(_AUTOTUNE_WORKER_STATE["state"], index, latency_runs)
+
+
+def _evaluate_candidate(
+    state: Tuple[Graph, Any, List[Configuration], Any],
+    index: int,
+    latency_runs: int,
+) -> Dict[str, Any]:
+    graph, composition, configurations, sample = state
+
+    try:
+        # graphs are modified during compilation, so each candidate gets its own copy
+        circuit = Compiler.from_graph(deepcopy(graph), deepcopy(composition)).compile(
+            configuration=configurations[index],
+        )
+
+        result: Dict[str, Any] = {
+            "complexity": float(circuit.complexity),
+            "size_of_keys": int(circuit.size_of_bootstrap_keys + circuit.size_of_keyswitch_keys),
+            "programmable_bootstrap_count": int(circuit.programmable_bootstrap_count),
+        }
+
+        if sample is not None:
+            circuit.keygen()
+            encrypted = circuit.encrypt(*sample)
+
+            timings = []
+            for _ in range(max(latency_runs, 1)):
+                start = time.perf_counter()
+                circuit.run(encrypted)
+                timings.append(time.perf_counter() - start)
+
+            result["latency"] = float(np.median(timings))
+
+        return result
+
+    except Exception as error:  # pylint: disable=broad-except
+        return {"error": f"{type(error).__name__}: {error}"}
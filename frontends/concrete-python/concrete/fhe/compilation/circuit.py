@@ -92,7 +92,10 @@ class Circuit:
         """
         Enable FHE simulation.
         """
-        self._module.simulation_runtime.init()
+        if self._module.configuration.graph_simulation:
+            self._module.graph_simulation_runtime.init()
+        else:
+            self._module.simulation_runtime.init()
 
     def enable_fhe_execution(self):
         """
@@ -522,6 +525,15 @@ class Circuit:
         """
         return self._function.encrypted_negation_count_per_tag_per_parameter  # pragma: no cover
 
+    # Strategy Statistics
+
+    @property
+    def strategies(self) -> Dict[str, str]:
+        """
+        Get the implementation strategy selected for each operation in the circuit.
+        """
+        return self._function.strategies
+
     # All Statistics
 
     @property
@@ -561,6 +573,13 @@ class Circuit:
         """
         return self._module.compilation_context
 
+    @property
+    def rebuilt(self) -> bool:
+        """
+        Return whether the circuit was rebuilt instead of being reused from a previous compilation.
+        """
+        return self._name in self._module.rebuilt_functions
+
     @property
     def client(self) -> Client:
         """
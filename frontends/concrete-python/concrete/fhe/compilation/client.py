@@ -32,9 +32,10 @@ class Client:
         self,
         client_specs: ClientSpecs,
         keyset_cache_directory: Optional[Union[str, Path]] = None,
+        keyset_cache_size: Optional[int] = None,
     ):
         self.specs = client_specs
-        self._keys = Keys(client_specs, keyset_cache_directory)
+        self._keys = Keys(client_specs, keyset_cache_directory, keyset_cache_size)
 
     def save(self, path: Union[str, Path]):
         """
@@ -59,6 +60,7 @@ class Client:
     def load(
         path: Union[str, Path],
         keyset_cache_directory: Optional[Union[str, Path]] = None,
+        keyset_cache_size: Optional[int] = None,
     ) -> "Client":
         """
         Load the client from the given path in zip format.
@@ -70,6 +72,9 @@ class Client:
             keyset_cache_directory (Optional[Union[str, Path]], default = None):
                 keyset cache directory to use
 
+            keyset_cache_size (Optional[int], default = None):
+                maximum size of the keyset cache in bytes (unbounded if None)
+
         Returns:
             Client:
                 client loaded from the filesystem
@@ -80,7 +85,7 @@ class Client:
             with open(Path(tmp_dir) / "client.specs.json", "rb") as f:
                 client_specs = ClientSpecs.deserialize(f.read())
 
-        return Client(client_specs, keyset_cache_directory)
+        return Client(client_specs, keyset_cache_directory, keyset_cache_size)
 
     @property
     def keys(self) -> Keys:
@@ -97,6 +97,40 @@ class Compiler:
         self._module_compiler = ModuleCompiler([func], composition)
         self._function_name = function.__name__
 
+    @staticmethod
+    def from_graph(
+        graph: Graph,
+        composition: Optional[Union[NotComposable, AllComposable]] = None,
+    ) -> "Compiler":
+        """
+        Create a compiler from an already traced graph (e.g., loaded using `Graph.load`).
+
+        Tracing and fusing is skipped, so the original function is not required. If the graph is
+        compiled without an inputset, bounds stored in the graph are used.
+
+        Args:
+            graph (Graph):
+                traced graph to compile
+
+            composition (Optional[Union[NotComposable, AllComposable]], default = None):
+                composition policy to use
+
+        Returns:
+            Compiler:
+                compiler of the graph
+        """
+
+        function = FunctionDef.from_graph(graph)
+
+        compiler = Compiler(
+            function.function,
+            function.parameter_encryption_statuses,  # type: ignore
+            composition,
+        )
+        compiler._module_compiler.functions[compiler._function_name] = function
+
+        return compiler
+
     @property
     def _func_def(self) -> FunctionDef:
         return getattr(self._module_compiler, self._function_name)
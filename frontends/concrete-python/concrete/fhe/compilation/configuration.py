@@ -21,6 +21,30 @@ DEFAULT_P_ERROR = None
 DEFAULT_GLOBAL_P_ERROR = 1 / 100_000
 
 
+def _chunk_sizes(x_bit_width: int, y_bit_width: int) -> List[int]:
+    """
+    Get sizes of the chunks used by chunked implementations (see `Context.best_chunk_ranges`).
+    """
+
+    smaller_bit_width = min(x_bit_width, y_bit_width)
+    bigger_bit_width = max(x_bit_width, y_bit_width)
+
+    chunk_size = max(1, bigger_bit_width // 2)
+    if chunk_size >= smaller_bit_width:
+        sizes = [smaller_bit_width]
+    else:
+        optimal_chunk_size = min(chunk_size, int(np.ceil(smaller_bit_width / 2)))
+        sizes = [
+            optimal_chunk_size,
+            min(optimal_chunk_size, smaller_bit_width - optimal_chunk_size),
+        ]
+
+    if sum(sizes) != bigger_bit_width:
+        sizes.append(bigger_bit_width - sum(sizes))
+
+    return sizes
+
+
 class ParameterSelectionStrategy(str, Enum):
     """
     ParameterSelectionStrategy, to set optimization strategy.
@@ -246,6 +270,15 @@ class ComparisonStrategy(str, Enum):
     # - at most 13 TLUs
     # - it's complicated...
 
+    AUTO = "auto"
+    # ------------
+    # bit-width assignment:
+    # - depends on the selected strategy
+    #
+    # execution:
+    # - the strategy with the lowest estimated cost is selected for each operation
+    # - cost is estimated from the table lookups of the strategy and the promotions it requires
+
     @classmethod
     def parse(cls, string: str) -> "ComparisonStrategy":
         """
@@ -493,6 +526,63 @@ class ComparisonStrategy(str, Enum):
 
         return required_x_bit_width, required_y_bit_width
 
+    def table_lookups(self, x: ValueDescription, y: ValueDescription) -> List[int]:
+        """
+        Get estimated input bit-widths of the table lookups of the strategy.
+
+        Args:
+            x (ValueDescription):
+                description of the lhs of the comparison
+
+            y (ValueDescription):
+                description of the rhs of the comparison
+
+        Returns:
+            List[int]:
+                input bit-width of each table lookup performed by the strategy
+        """
+
+        assert self != ComparisonStrategy.AUTO
+        assert isinstance(x.dtype, Integer)
+        assert isinstance(y.dtype, Integer)
+
+        smaller_bit_width = min(x.dtype.bit_width, y.dtype.bit_width)
+        bigger_bit_width = max(x.dtype.bit_width, y.dtype.bit_width)
+
+        if self == ComparisonStrategy.CHUNKED:
+            lookups = []
+            chunk_sizes = _chunk_sizes(x.dtype.bit_width, y.dtype.bit_width)
+            for chunk_size in chunk_sizes:
+                lookups += [x.dtype.bit_width, y.dtype.bit_width, 2 * chunk_size]
+            return lookups + [4] * len(chunk_sizes)
+
+        if self in {
+            ComparisonStrategy.THREE_TLU_BIGGER_CLIPPED_SMALLER_CASTED,
+            ComparisonStrategy.TWO_TLU_BIGGER_CLIPPED_SMALLER_PROMOTED,
+        }:
+            intermediate_bit_width = min(
+                ComparisonStrategy.TWO_TLU_BIGGER_CLIPPED_SMALLER_PROMOTED.promotions(x, y)
+            )
+            lookups = [bigger_bit_width, intermediate_bit_width]
+            if self == ComparisonStrategy.THREE_TLU_BIGGER_CLIPPED_SMALLER_CASTED:
+                lookups.append(smaller_bit_width)
+            return lookups
+
+        subtraction_bit_width = max(
+            ComparisonStrategy.ONE_TLU_PROMOTED.promotions(x, y)[0],
+            bigger_bit_width,
+        )
+        operand_bit_widths = {
+            ComparisonStrategy.ONE_TLU_PROMOTED: [],
+            ComparisonStrategy.THREE_TLU_CASTED: [smaller_bit_width, bigger_bit_width],
+            ComparisonStrategy.TWO_TLU_BIGGER_PROMOTED_SMALLER_CASTED: [smaller_bit_width],
+            ComparisonStrategy.TWO_TLU_BIGGER_CASTED_SMALLER_PROMOTED: [bigger_bit_width],
+        }[self]
+
+        return [
+            bit_width for bit_width in operand_bit_widths if bit_width != subtraction_bit_width
+        ] + [subtraction_bit_width]
+
 
 class BitwiseStrategy(str, Enum):
     """
@@ -563,6 +653,15 @@ class BitwiseStrategy(str, Enum):
     # - at most 9 TLUs
     # - it's complicated...
 
+    AUTO = "auto"
+    # ------------
+    # bit-width assignment:
+    # - depends on the selected strategy
+    #
+    # execution:
+    # - the strategy with the lowest estimated cost is selected for each operation
+    # - cost is estimated from the table lookups of the strategy and the promotions it requires
+
     @classmethod
     def parse(cls, string: str) -> "BitwiseStrategy":
         """
@@ -691,6 +790,47 @@ class BitwiseStrategy(str, Enum):
 
         return required_x_bit_width, required_y_bit_width
 
+    def table_lookups(self, x: ValueDescription, y: ValueDescription) -> List[int]:
+        """
+        Get estimated input bit-widths of the table lookups of the strategy.
+
+        Args:
+            x (ValueDescription):
+                description of the lhs of the bitwise operation
+
+            y (ValueDescription):
+                description of the rhs of the bitwise operation
+
+        Returns:
+            List[int]:
+                input bit-width of each table lookup performed by the strategy
+        """
+
+        assert self != BitwiseStrategy.AUTO
+        assert isinstance(x.dtype, Integer)
+        assert isinstance(y.dtype, Integer)
+
+        smaller_bit_width = min(x.dtype.bit_width, y.dtype.bit_width)
+        bigger_bit_width = max(x.dtype.bit_width, y.dtype.bit_width)
+
+        if self == BitwiseStrategy.CHUNKED:
+            lookups = []
+            for chunk_size in _chunk_sizes(x.dtype.bit_width, y.dtype.bit_width):
+                lookups += [x.dtype.bit_width, y.dtype.bit_width, 2 * chunk_size]
+            return lookups
+
+        packing_bit_width = x.dtype.bit_width + y.dtype.bit_width
+        operand_bit_widths = {
+            BitwiseStrategy.ONE_TLU_PROMOTED: [],
+            BitwiseStrategy.THREE_TLU_CASTED: [smaller_bit_width, bigger_bit_width],
+            BitwiseStrategy.TWO_TLU_BIGGER_PROMOTED_SMALLER_CASTED: [smaller_bit_width],
+            BitwiseStrategy.TWO_TLU_BIGGER_CASTED_SMALLER_PROMOTED: [bigger_bit_width],
+        }[self]
+
+        return [bit_width for bit_width in operand_bit_widths if bit_width != packing_bit_width] + [
+            packing_bit_width
+        ]
+
 
 class MultivariateStrategy(str, Enum):
     """
@@ -727,6 +867,15 @@ class MultivariateStrategy(str, Enum):
     # - z = tlu(z) :: 2-bits -> 13-bits
     # - tlu(pack(x, y, z)) :: 13-bits -> 8-bits
 
+    AUTO = "auto"
+    # ------------
+    # bit-width assignment:
+    # - depends on the selected strategy
+    #
+    # execution:
+    # - the strategy with the lowest estimated cost is selected for each operation
+    # - cost is estimated from the table lookups of the strategy and the promotions it requires
+
     @classmethod
     def parse(cls, string: str) -> "MultivariateStrategy":
         """
@@ -800,6 +949,34 @@ class MultivariateStrategy(str, Enum):
 
         return tuple(result)
 
+    def table_lookups(self, *args: ValueDescription) -> List[int]:
+        """
+        Get estimated input bit-widths of the table lookups of the strategy.
+
+        Args:
+            args (Tuple[ValueDescription]):
+                description of the arguments of the multivariate operation
+
+        Returns:
+            List[int]:
+                input bit-width of each table lookup performed by the strategy
+        """
+
+        assert self != MultivariateStrategy.AUTO
+
+        bit_widths = []
+        for arg in args:
+            assert isinstance(arg.dtype, Integer)
+            bit_widths.append(arg.dtype.bit_width)
+
+        packing_bit_width = sum(bit_widths)
+        if self == MultivariateStrategy.PROMOTED:
+            return [packing_bit_width]
+
+        return [bit_width for bit_width in bit_widths if bit_width != packing_bit_width] + [
+            packing_bit_width
+        ]
+
 
 class MinMaxStrategy(str, Enum):
     """
@@ -847,6 +1024,15 @@ class MinMaxStrategy(str, Enum):
     # - at most 21 TLUs
     # - it's complicated...
 
+    AUTO = "auto"
+    # ------------
+    # bit-width assignment:
+    # - depends on the selected strategy
+    #
+    # execution:
+    # - the strategy with the lowest estimated cost is selected for each operation
+    # - cost is estimated from the table lookups of the strategy and the promotions it requires
+
     @classmethod
     def parse(cls, string: str) -> "MinMaxStrategy":
         """
@@ -935,6 +1121,96 @@ class MinMaxStrategy(str, Enum):
 
         return x.dtype.bit_width, y.dtype.bit_width
 
+    def table_lookups(self, x: ValueDescription, y: ValueDescription) -> List[int]:
+        """
+        Get estimated input bit-widths of the table lookups of the strategy.
+
+        Args:
+            x (ValueDescription):
+                description of the lhs of the operation
+
+            y (ValueDescription):
+                description of the rhs of the operation
+
+        Returns:
+            List[int]:
+                input bit-width of each table lookup performed by the strategy
+        """
+
+        assert self != MinMaxStrategy.AUTO
+        assert isinstance(x.dtype, Integer)
+        assert isinstance(y.dtype, Integer)
+
+        if self == MinMaxStrategy.CHUNKED:
+            lookups = ComparisonStrategy.CHUNKED.table_lookups(x, y)
+            for bit_width in [x.dtype.bit_width, y.dtype.bit_width]:
+                for chunk_size in [bit_width // 2, bit_width - (bit_width // 2)]:
+                    if chunk_size != 0:
+                        lookups += [bit_width, chunk_size + 1]
+            return lookups
+
+        subtraction_bit_width = max(
+            MinMaxStrategy.ONE_TLU_PROMOTED.promotions(x, y)[0],
+            x.dtype.bit_width,
+            y.dtype.bit_width,
+        )
+        if self == MinMaxStrategy.ONE_TLU_PROMOTED:
+            return [subtraction_bit_width]
+
+        return [
+            bit_width
+            for bit_width in [x.dtype.bit_width, y.dtype.bit_width]
+            if bit_width != subtraction_bit_width
+        ] + [subtraction_bit_width]
+
+
+class MatmulStrategy(str, Enum):
+    """
+    MatmulStrategy, to specify implementation preference for encrypted matrix multiplications.
+    """
+
+    PAIRWISE = "pairwise"
+    # -------------------
+    # execution:
+    # - every product x[i, k] * y[k, j] is computed independently
+    # - 2 TLUs per product, so 2 * M * K * N TLUs for (M, K) @ (K, N)
+
+    SHARED_SQUARES = "shared-squares"
+    # --------------------------------
+    # conditions:
+    # - both operands are matrices
+    # - it requires less TLUs than pairwise, which is when 1/M + 1/N < 1
+    #
+    # execution:
+    # - 2 * x[i, k] * y[k, j] = (x[i, k] + y[k, j])^2 - x[i, k]^2 - y[k, j]^2
+    # - squares of sums are summed over k, squares of operands are computed once and shared
+    # - the result is obtained by reinterpreting the (even) sum with one less bit
+    # - M * K * N + M * K + K * N TLUs for (M, K) @ (K, N)
+
+    @classmethod
+    def parse(cls, string: str) -> "MatmulStrategy":
+        """
+        Convert a string to a MatmulStrategy.
+        """
+
+        if isinstance(string, cls):
+            return string
+
+        if not isinstance(string, str):
+            message = f"{string} cannot be parsed to a {cls.__name__}"
+            raise TypeError(message)
+
+        string = string.lower().replace("_", "-")
+        for value in MatmulStrategy:
+            if string == value.value:
+                return value
+
+        message = (
+            f"'{string}' is not a valid '{friendly_type_format(cls)}' ("
+            f"{', '.join(v.value for v in MatmulStrategy)})"
+        )
+        raise ValueError(message)
+
 
 class Configuration:
     """
@@ -955,11 +1231,13 @@ class Configuration:
     loop_parallelize: bool
     dataflow_parallelize: bool
     auto_parallelize: bool
+    batch_tfhe_ops: bool
     compress_evaluation_keys: bool
     compress_input_ciphertexts: bool
     p_error: Optional[float]
     global_p_error: Optional[float]
     insecure_key_cache_location: Optional[str]
+    insecure_key_cache_size: Optional[int]
     auto_adjust_rounders: bool
     auto_adjust_truncators: bool
     single_precision: bool
@@ -977,6 +1255,7 @@ class Configuration:
     shifts_with_promotion: bool
     multivariate_strategy_preference: List[MultivariateStrategy]
     min_max_strategy_preference: List[MinMaxStrategy]
+    matmul_strategy: MatmulStrategy
     use_gpu: bool
     relu_on_bits_threshold: int
     relu_on_bits_chunk_size: int
@@ -990,10 +1269,15 @@ class Configuration:
     print_tlu_fusing: bool
     optimize_tlu_based_on_original_bit_width: Union[bool, int]
     detect_overflow_in_simulation: bool
+    graph_simulation: bool
     dynamic_indexing_check_out_of_bounds: bool
     dynamic_assignment_check_out_of_bounds: bool
     simulate_encrypt_run_decrypt: bool
     composable: bool
+    bounds_measurement_workers: int
+    inputset_reservoir_size: Optional[int]
+    inputset_reservoir_seed: Optional[int]
+    incremental_compilation: bool
 
     def __init__(
         self,
@@ -1010,9 +1294,11 @@ class Configuration:
         enable_unsafe_features: bool = False,
         use_insecure_key_cache: bool = False,
         insecure_key_cache_location: Optional[Union[Path, str]] = None,
+        insecure_key_cache_size: Optional[int] = None,
         loop_parallelize: bool = True,
         dataflow_parallelize: bool = False,
         auto_parallelize: bool = False,
+        batch_tfhe_ops: bool = False,
         compress_evaluation_keys: bool = False,
         compress_input_ciphertexts: bool = False,
         p_error: Optional[float] = None,
@@ -1046,6 +1332,7 @@ class Configuration:
         min_max_strategy_preference: Optional[
             Union[MinMaxStrategy, str, List[Union[MinMaxStrategy, str]]]
         ] = None,
+        matmul_strategy: Union[MatmulStrategy, str] = MatmulStrategy.PAIRWISE,
         composable: bool = False,
         use_gpu: bool = False,
         relu_on_bits_threshold: int = 7,
@@ -1060,9 +1347,14 @@ class Configuration:
         print_tlu_fusing: bool = False,
         optimize_tlu_based_on_original_bit_width: Union[bool, int] = 8,
         detect_overflow_in_simulation: bool = False,
+        graph_simulation: bool = False,
         dynamic_indexing_check_out_of_bounds: bool = True,
         dynamic_assignment_check_out_of_bounds: bool = True,
         simulate_encrypt_run_decrypt: bool = False,
+        bounds_measurement_workers: int = 1,
+        inputset_reservoir_size: Optional[int] = None,
+        inputset_reservoir_seed: Optional[int] = None,
+        incremental_compilation: bool = False,
     ):
         self.verbose = verbose
         self.compiler_debug_mode = compiler_debug_mode
@@ -1082,9 +1374,11 @@ class Configuration:
             if isinstance(insecure_key_cache_location, Path)
             else insecure_key_cache_location
         )
+        self.insecure_key_cache_size = insecure_key_cache_size
         self.loop_parallelize = loop_parallelize
         self.dataflow_parallelize = dataflow_parallelize
         self.auto_parallelize = auto_parallelize
+        self.batch_tfhe_ops = batch_tfhe_ops
         self.compress_evaluation_keys = compress_evaluation_keys
         self.compress_input_ciphertexts = compress_input_ciphertexts
         self.p_error = p_error
@@ -1141,6 +1435,7 @@ class Configuration:
                 else [MinMaxStrategy.parse(min_max_strategy_preference)]
             )
         )
+        self.matmul_strategy = MatmulStrategy.parse(matmul_strategy)
         self.composable = composable
         self.use_gpu = use_gpu
         self.relu_on_bits_threshold = relu_on_bits_threshold
@@ -1164,12 +1459,18 @@ class Configuration:
         self.optimize_tlu_based_on_original_bit_width = optimize_tlu_based_on_original_bit_width
 
         self.detect_overflow_in_simulation = detect_overflow_in_simulation
+        self.graph_simulation = graph_simulation
 
         self.dynamic_indexing_check_out_of_bounds = dynamic_indexing_check_out_of_bounds
         self.dynamic_assignment_check_out_of_bounds = dynamic_assignment_check_out_of_bounds
 
         self.simulate_encrypt_run_decrypt = simulate_encrypt_run_decrypt
 
+        self.bounds_measurement_workers = bounds_measurement_workers
+        self.inputset_reservoir_size = inputset_reservoir_size
+        self.inputset_reservoir_seed = inputset_reservoir_seed
+        self.incremental_compilation = incremental_compilation
+
         self._validate()
 
     class Keep:
@@ -1193,9 +1494,11 @@ class Configuration:
         enable_unsafe_features: Union[Keep, bool] = KEEP,
         use_insecure_key_cache: Union[Keep, bool] = KEEP,
         insecure_key_cache_location: Union[Keep, Optional[Union[Path, str]]] = KEEP,
+        insecure_key_cache_size: Union[Keep, Optional[int]] = KEEP,
         loop_parallelize: Union[Keep, bool] = KEEP,
         dataflow_parallelize: Union[Keep, bool] = KEEP,
         auto_parallelize: Union[Keep, bool] = KEEP,
+        batch_tfhe_ops: Union[Keep, bool] = KEEP,
         compress_evaluation_keys: Union[Keep, bool] = KEEP,
         compress_input_ciphertexts: Union[Keep, bool] = KEEP,
         p_error: Union[Keep, Optional[float]] = KEEP,
@@ -1228,6 +1531,7 @@ class Configuration:
         min_max_strategy_preference: Union[
             Keep, Optional[Union[MinMaxStrategy, str, List[Union[MinMaxStrategy, str]]]]
         ] = KEEP,
+        matmul_strategy: Union[Keep, Union[MatmulStrategy, str]] = KEEP,
         composable: Union[Keep, bool] = KEEP,
         use_gpu: Union[Keep, bool] = KEEP,
         relu_on_bits_threshold: Union[Keep, int] = KEEP,
@@ -1242,9 +1546,14 @@ class Configuration:
         print_tlu_fusing: Union[Keep, bool] = KEEP,
         optimize_tlu_based_on_original_bit_width: Union[Keep, bool, int] = KEEP,
         detect_overflow_in_simulation: Union[Keep, bool] = KEEP,
+        graph_simulation: Union[Keep, bool] = KEEP,
         dynamic_indexing_check_out_of_bounds: Union[Keep, bool] = KEEP,
         dynamic_assignment_check_out_of_bounds: Union[Keep, bool] = KEEP,
         simulate_encrypt_run_decrypt: Union[Keep, bool] = KEEP,
+        bounds_measurement_workers: Union[Keep, int] = KEEP,
+        inputset_reservoir_size: Union[Keep, Optional[int]] = KEEP,
+        inputset_reservoir_seed: Union[Keep, Optional[int]] = KEEP,
+        incremental_compilation: Union[Keep, bool] = KEEP,
     ) -> "Configuration":
         """
         Get a new configuration from another one specified changes.
@@ -1321,10 +1630,18 @@ class Configuration:
                 )
                 raise RuntimeError(message)
 
+        if self.graph_simulation and self.detect_overflow_in_simulation:
+            message = "Overflow detection in simulation cannot be used with graph simulation"
+            raise RuntimeError(message)
+
         if self.use_insecure_key_cache and self.insecure_key_cache_location is None:
             message = "Insecure key cache cannot be enabled without specifying its location"
             raise RuntimeError(message)
 
+        if self.insecure_key_cache_size is not None and self.insecure_key_cache_size < 1:
+            message = "Insecure key cache size must be positive"
+            raise RuntimeError(message)
+
         if platform.system() == "Darwin" and self.dataflow_parallelize:  # pragma: no cover
             message = "Dataflow parallelism is not available in macOS"
             raise RuntimeError(message)
@@ -1335,6 +1652,23 @@ class Configuration:
             message = "Composition can not be used with MONO parameter selection strategy"
             raise RuntimeError(message)
 
+        if self.bounds_measurement_workers < 1:
+            message = "Bounds measurement cannot be performed with less than 1 worker"
+            raise RuntimeError(message)
+
+        if self.inputset_reservoir_size is not None:
+            if self.inputset_reservoir_size < 0:
+                message = "Inputset reservoir size cannot be negative"
+                raise RuntimeError(message)
+
+            if self.auto_adjust_rounders or self.auto_adjust_truncators:
+                message = (
+                    "Inputset streaming cannot be used with automatic adjustment "
+                    "of rounders or truncators, as adjustment requires multiple passes "
+                    "over the inputset"
+                )
+                raise RuntimeError(message)
+
 
 def __check_fork_consistency():
     hints_init = get_type_hints(Configuration.__init__)
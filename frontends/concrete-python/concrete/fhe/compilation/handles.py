@@ -0,0 +1,346 @@
+"""
+Declaration of `ValueHandle` and `ValueStore` classes.
+"""
+
+import hashlib
+import json
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .value import Value
+
+_owner_identities: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+_owner_identities_lock = threading.Lock()
+
+
+def owner_identity(owner: Optional[Any]) -> Optional[str]:
+    """
+    Get the stable identity of the owner of values.
+
+    Owners which can be serialized (e.g., evaluation keys) are identified by the hash of their
+    content, so the same keys deserialized for each request have the same identity. Other owners
+    (e.g., prepared evaluation keys) are identified by the object itself, as long as it's alive.
+
+    Args:
+        owner (Optional[Any]):
+            owner to identify
+
+    Returns:
+        Optional[str]:
+            identity of the owner, or None if owner is None
+    """
+
+    if owner is None:
+        return None
+
+    with _owner_identities_lock:
+        identity = _owner_identities.get(owner)
+
+    if identity is None:
+        # hashing is done without holding the lock, as keys can be large
+        serialize = getattr(owner, "serialize", None)
+        identity = (
+            hashlib.sha256(serialize()).hexdigest() if callable(serialize) else uuid.uuid4().hex
+        )
+        with _owner_identities_lock:
+            identity = _owner_identities.setdefault(owner, identity)
+
+    return identity
+
+
+@dataclass(frozen=True)
+class ValueHandle:
+    """
+    ValueHandle class, to refer to a value held by a server without transferring it.
+    """
+
+    identifier: str
+    function: str
+    position: int
+
+    def serialize(self) -> bytes:
+        """
+        Serialize the handle into bytes.
+
+        Returns:
+            bytes:
+                serialized handle
+        """
+
+        return json.dumps(
+            {"identifier": self.identifier, "function": self.function, "position": self.position}
+        ).encode("utf-8")
+
+    @staticmethod
+    def deserialize(serialized_handle: bytes) -> "ValueHandle":
+        """
+        Deserialize a handle from bytes.
+
+        Args:
+            serialized_handle (bytes):
+                previously serialized handle
+
+        Returns:
+            ValueHandle:
+                deserialized handle
+        """
+
+        data = json.loads(serialized_handle.decode("utf-8"))
+        return ValueHandle(data["identifier"], data["function"], int(data["position"]))
+
+
+class ValueStore:
+    """
+    ValueStore class, to hold values on the server side between calls.
+
+    Values are kept in memory until they are released, or until they are not used for `ttl`
+    seconds. When `max_resident_values` is set, least recently used values above the limit are
+    serialized into `spill_directory`, and they are loaded back when they are used again.
+
+    The function and the output position which produced a value, as well as the identity of its
+    owner (see `owner_identity`), are kept along the value, as handles can be forged by the
+    clients.
+    """
+
+    ttl: Optional[float]
+    spill_directory: Optional[Path]
+    max_resident_values: Optional[int]
+
+    _resident: "OrderedDict[str, Value]"
+    _spilled: Dict[str, Path]
+    _last_access: Dict[str, float]
+    _origins: Dict[str, Tuple[str, int, Optional[str]]]
+    _lock: threading.RLock
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        spill_directory: Optional[Union[str, Path]] = None,
+        max_resident_values: Optional[int] = None,
+    ):
+        if ttl is not None and ttl <= 0:
+            message = f"Expected ttl to be positive but it's {ttl}"
+            raise ValueError(message)
+
+        if max_resident_values is not None:
+            if spill_directory is None:
+                message = "Expected spill_directory to be set when max_resident_values is set"
+                raise ValueError(message)
+
+            if max_resident_values < 1:
+                message = (
+                    f"Expected max_resident_values to be positive but it's {max_resident_values}"
+                )
+                raise ValueError(message)
+
+        self.ttl = ttl
+        self.spill_directory = Path(spill_directory) if spill_directory is not None else None
+        self.max_resident_values = max_resident_values
+
+        if self.spill_directory is not None:
+            self.spill_directory.mkdir(parents=True, exist_ok=True)
+
+        self._resident = OrderedDict()
+        self._spilled = {}
+        self._last_access = {}
+        self._origins = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self.evict_expired()
+            return len(self._last_access)
+
+    def __contains__(self, handle: ValueHandle) -> bool:
+        with self._lock:
+            self.evict_expired()
+            return handle.identifier in self._last_access
+
+    @property
+    def resident_count(self) -> int:
+        """
+        Get the number of values kept in memory.
+        """
+
+        with self._lock:
+            return len(self._resident)
+
+    @property
+    def spilled_count(self) -> int:
+        """
+        Get the number of values spilled to disk.
+        """
+
+        with self._lock:
+            return len(self._spilled)
+
+    def put(
+        self,
+        value: Value,
+        function: str,
+        position: int,
+        owner: Optional[Any] = None,
+    ) -> ValueHandle:
+        """
+        Hold a value.
+
+        Args:
+            value (Value):
+                value to hold
+
+            function (str):
+                name of the function which produced the value
+
+            position (int):
+                output position of the value in the function
+
+            owner (Optional[Any], default = None):
+                object the value belongs to (e.g., evaluation keys of the client),
+                which (or an object with the same identity) must be given to `get` the value
+
+        Returns:
+            ValueHandle:
+                handle to refer to the value in subsequent calls
+        """
+
+        handle = ValueHandle(uuid.uuid4().hex, function, position)
+        identity = owner_identity(owner)
+        with self._lock:
+            self.evict_expired()
+
+            self._resident[handle.identifier] = value
+            self._last_access[handle.identifier] = time.monotonic()
+            self._origins[handle.identifier] = (function, position, identity)
+
+            self._spill_if_necessary()
+
+        return handle
+
+    def get(self, handle: ValueHandle, owner: Optional[Any] = None) -> Value:
+        """
+        Get a held value.
+
+        Args:
+            handle (ValueHandle):
+                handle of the value
+
+            owner (Optional[Any], default = None):
+                object the value belongs to, as given to `put`
+                (or an object with the same identity, e.g., the same keys deserialized again)
+
+        Returns:
+            Value:
+                held value
+
+        Raises:
+            KeyError:
+                if the value is released or expired, or if it doesn't belong to `owner`
+
+            ValueError:
+                if the value is not produced by the function and output position of the handle
+        """
+
+        identity = owner_identity(owner)
+        with self._lock:
+            self.evict_expired()
+
+            identifier = handle.identifier
+            if identifier not in self._last_access or self._origins[identifier][2] != identity:
+                message = f"Value with handle {identifier} is either released or expired"
+                raise KeyError(message)
+
+            function, position, _ = self._origins[identifier]
+            if (handle.function, handle.position) != (function, position):
+                message = (
+                    f"Value with handle {identifier} is output {position} of {function}, "
+                    f"not output {handle.position} of {handle.function}"
+                )
+                raise ValueError(message)
+
+            self._last_access[identifier] = time.monotonic()
+
+            if identifier in self._resident:
+                self._resident.move_to_end(identifier)
+                return self._resident[identifier]
+
+            path = self._spilled.pop(identifier)
+            value = Value.deserialize(path.read_bytes())
+            path.unlink()
+
+            self._resident[identifier] = value
+            self._spill_if_necessary()
+
+            return value
+
+    def release(self, handle: ValueHandle):
+        """
+        Release a held value.
+
+        Args:
+            handle (ValueHandle):
+                handle of the value
+        """
+
+        with self._lock:
+            self._discard(handle.identifier)
+
+    def evict_expired(self) -> int:
+        """
+        Release values which are not used for `ttl` seconds.
+
+        Returns:
+            int:
+                number of released values
+        """
+
+        if self.ttl is None:
+            return 0
+
+        with self._lock:
+            deadline = time.monotonic() - self.ttl
+            expired = [
+                identifier
+                for identifier, last_access in self._last_access.items()
+                if last_access < deadline
+            ]
+            for identifier in expired:
+                self._discard(identifier)
+
+        return len(expired)
+
+    def clear(self):
+        """
+        Release all values.
+        """
+
+        with self._lock:
+            for identifier in list(self._last_access):
+                self._discard(identifier)
+
+    def _discard(self, identifier: str):
+        self._last_access.pop(identifier, None)
+        self._origins.pop(identifier, None)
+        self._resident.pop(identifier, None)
+
+        path = self._spilled.pop(identifier, None)
+        if path is not None:
+            path.unlink(missing_ok=True)
+
+    def _spill_if_necessary(self):
+        if self.max_resident_values is None:
+            return
+
+        assert self.spill_directory is not None
+        while len(self._resident) > self.max_resident_values:
+            identifier, value = self._resident.popitem(last=False)
+
+            path = self.spill_directory / f"{identifier}.value"
+            path.write_bytes(value.serialize())
+
+            self._spilled[identifier] = path
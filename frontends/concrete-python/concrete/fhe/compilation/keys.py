@@ -25,23 +25,49 @@ class Keys:
 
     client_specs: Optional[ClientSpecs]
     cache_directory: Optional[Union[str, Path]]
+    cache_size: Optional[int]
 
     _keyset_cache: Optional[KeySetCache]
     _keyset: Optional[KeySet]
+    _evaluation_keys: Optional[EvaluationKeys]
 
     def __init__(
         self,
         client_specs: Optional[ClientSpecs],
         cache_directory: Optional[Union[str, Path]] = None,
+        cache_size: Optional[int] = None,
     ):
         self.client_specs = client_specs
         self.cache_directory = cache_directory
+        self.cache_size = cache_size
 
         self._keyset_cache = None
         self._keyset = None
+        self._evaluation_keys = None
 
         if cache_directory is not None:
-            self._keyset_cache = KeySetCache.new(str(cache_directory))
+            self._keyset_cache = KeySetCache.new(
+                str(cache_directory),
+                cache_size if cache_size is not None else 0,
+            )
+
+    @property
+    def cache_statistics(self) -> Optional[Dict[str, int]]:
+        """
+        Get the statistics of the keyset cache (None if no cache is used).
+
+        Statistics are the number of keysets loaded from the cache ("hits"), generated as they were
+        not in the cache ("misses"), and evicted from the cache ("evictions").
+        """
+
+        if self._keyset_cache is None:
+            return None
+
+        return {
+            "hits": self._keyset_cache.hits(),
+            "misses": self._keyset_cache.misses(),
+            "evictions": self._keyset_cache.evictions(),
+        }
 
     @property
     def are_generated(self) -> bool:
@@ -86,6 +112,7 @@ class Keys:
                 encryption_seed,
                 initial_keys,
             )
+            self._evaluation_keys = None
 
     def save(self, location: Union[str, Path]):
         """
@@ -127,10 +154,12 @@ class Keys:
 
         self.client_specs = None
         self.cache_directory = None
+        self.cache_size = None
 
         # pylint: disable=protected-access
         self._keyset_cache = None
         self._keyset = keys._keyset
+        self._evaluation_keys = None
         # pylint: enable=protected-access
 
     def load_if_exists_generate_and_save_otherwise(
@@ -208,4 +237,9 @@ class Keys:
         self.generate(force=False)
         assert self._keyset is not None
 
-        return self._keyset.get_evaluation_keys()
+        # the same object is returned until the keys change
+        # so servers can reuse the evaluation keys they prepared for it
+        if self._evaluation_keys is None:
+            self._evaluation_keys = self._keyset.get_evaluation_keys()
+
+        return self._evaluation_keys
@@ -24,7 +24,7 @@ from .composition import CompositionRule
 from .configuration import Configuration
 from .keys import Keys
 from .server import Server
-from .utils import Lazy, validate_input_args
+from .utils import Lazy, validate_input_args, validate_input_args_of_graph
 from .value import Value
 
 # pylint: enable=import-error,no-member,no-name-in-module
@@ -47,6 +47,14 @@ class SimulationRt(NamedTuple):
     server: Server
 
 
+class GraphSimulationRt(NamedTuple):
+    """
+    Runtime object class for graph simulation.
+    """
+
+    p_error: float
+
+
 class FheFunction:
     """
     Fhe function class, allowing to run or simulate one function of an fhe module.
@@ -54,6 +62,7 @@ class FheFunction:
 
     execution_runtime: Lazy[ExecutionRt]
     simulation_runtime: Lazy[SimulationRt]
+    graph_simulation_runtime: Lazy[GraphSimulationRt]
     graph: Graph
     name: str
     configuration: Configuration
@@ -63,12 +72,14 @@ class FheFunction:
         name: str,
         execution_runtime: Lazy[ExecutionRt],
         simulation_runtime: Lazy[SimulationRt],
+        graph_simulation_runtime: Lazy[GraphSimulationRt],
         graph: Graph,
         configuration: Configuration,
     ):
         self.name = name
         self.execution_runtime = execution_runtime
         self.simulation_runtime = simulation_runtime
+        self.graph_simulation_runtime = graph_simulation_runtime
         self.graph = graph
         self.configuration = configuration
 
@@ -137,6 +148,18 @@ class FheFunction:
                 result of the simulation
         """
 
+        if self.configuration.graph_simulation:
+            # inputs are validated like in the compiled simulation, and every table lookup
+            # on encrypted values (including the ones on inputs) can introduce errors
+            # but it's still an approximation of the compiled simulation, as the optimizer only
+            # reports the probability of error of the whole program, not the one of each lookup
+            ordered_validated_args = validate_input_args_of_graph(self.graph, *args)
+            return self.graph(
+                *ordered_validated_args,
+                p_error=self.graph_simulation_runtime.val.p_error,
+                inject_errors_on_inputs=True,
+            )
+
         ordered_validated_args = validate_input_args(
             self.simulation_runtime.val.server.client_specs,
             *args,
@@ -539,6 +562,22 @@ class FheFunction:
             self.name
         )  # pragma: no cover
 
+    # Strategy Statistics
+
+    @property
+    def strategies(self) -> Dict[str, str]:
+        """
+        Get the implementation strategy selected for each operation in the function.
+
+        Operations are identified the same way they are in `graph.format()` (e.g., "%3").
+        """
+        result = {}
+        for index, node in enumerate(self.graph.query_nodes(ordered=True)):
+            strategy = node.properties.get("strategy")
+            if strategy is not None:
+                result[f"%{index}"] = strategy.value
+        return result
+
     @property
     def statistics(self) -> Dict:
         """
@@ -575,6 +614,7 @@ class FheFunction:
             "encrypted_negation_count_per_parameter",
             "encrypted_negation_count_per_tag",
             "encrypted_negation_count_per_tag_per_parameter",
+            "strategies",
         ]
         return {attribute: getattr(self, attribute) for attribute in attributes}
 
@@ -590,6 +630,8 @@ class FheModule:
     compilation_context: CompilationContext
     execution_runtime: Lazy[ExecutionRt]
     simulation_runtime: Lazy[SimulationRt]
+    graph_simulation_runtime: Lazy[GraphSimulationRt]
+    rebuilt_functions: List[str]
 
     def __init__(
         self,
@@ -604,6 +646,7 @@ class FheModule:
         self.graphs = graphs
         self.mlir_module = mlir
         self.compilation_context = compilation_context
+        self.rebuilt_functions = list(graphs.keys())
 
         def init_simulation():
             simulation_server = Server.create(
@@ -615,7 +658,7 @@ class FheModule:
             return SimulationRt(simulation_server)
 
         self.simulation_runtime = Lazy(init_simulation)
-        if configuration.fhe_simulation:
+        if configuration.fhe_simulation and not configuration.graph_simulation:
             self.simulation_runtime.init()
 
         def init_execution():
@@ -626,17 +669,62 @@ class FheModule:
                 composition_rules=composition_rules,
             )
             keyset_cache_directory = None
+            keyset_cache_size = None
             if self.configuration.use_insecure_key_cache:
                 assert_that(self.configuration.enable_unsafe_features)
                 assert_that(self.configuration.insecure_key_cache_location is not None)
                 keyset_cache_directory = self.configuration.insecure_key_cache_location
-            execution_client = Client(execution_server.client_specs, keyset_cache_directory)
+                keyset_cache_size = self.configuration.insecure_key_cache_size
+            execution_client = Client(
+                execution_server.client_specs,
+                keyset_cache_directory,
+                keyset_cache_size,
+            )
             return ExecutionRt(execution_client, execution_server)
 
         self.execution_runtime = Lazy(init_execution)
         if configuration.fhe_execution:
             self.execution_runtime.init()
 
+        def init_graph_simulation():
+            # only parameters are selected, as the graph is evaluated instead of the compiled code
+            # (unless the compiled simulation is already available)
+            if self.simulation_runtime.initialized:
+                p_error = self.simulation_runtime.val.server.p_error
+            else:
+                p_error = Server.select_parameters(
+                    self.mlir_module,
+                    self.configuration.fork(fhe_simulation=True),
+                    compilation_context=self.compilation_context,
+                ).p_error
+            return GraphSimulationRt(float(p_error))
+
+        self.graph_simulation_runtime = Lazy(init_graph_simulation)
+        if configuration.fhe_simulation and configuration.graph_simulation:
+            self.graph_simulation_runtime.init()
+
+    def with_graphs(self, graphs: Dict[str, Graph]) -> "FheModule":
+        """
+        Create a module of other graphs, compiled exactly the same, sharing the runtime of this one.
+
+        Args:
+            graphs (Dict[str, Graph]):
+                graphs of the new module
+
+        Returns:
+            FheModule:
+                new module, with no rebuilt function
+        """
+
+        # the module is not copied using `copy.copy`, as `__getattr__` is used for functions
+        result = FheModule.__new__(FheModule)
+        result.__dict__.update(self.__dict__)
+
+        result.graphs = graphs
+        result.rebuilt_functions = []
+
+        return result
+
     @property
     def mlir(self) -> str:
         """Textual representation of the MLIR module.
@@ -765,6 +853,7 @@ class FheModule:
                 name,
                 self.execution_runtime,
                 self.simulation_runtime,
+                self.graph_simulation_runtime,
                 self.graphs[name],
                 self.configuration,
             )
@@ -807,6 +896,7 @@ class FheModule:
             item,
             self.execution_runtime,
             self.simulation_runtime,
+            self.graph_simulation_runtime,
             self.graphs[item],
             self.configuration,
         )
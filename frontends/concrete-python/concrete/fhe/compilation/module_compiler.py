@@ -6,6 +6,7 @@ Declaration of `MultiCompiler` class.
 
 import inspect
 import traceback
+from copy import deepcopy
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
@@ -14,11 +15,11 @@ from concrete.compiler import CompilationContext
 
 from ..extensions import AutoRounder, AutoTruncator
 from ..mlir import GraphConverter
-from ..representation import Graph
+from ..representation import Graph, Node
 from ..tracing import Tracer
 from ..values import ValueDescription
 from .artifacts import DebugManager, FunctionDebugArtifacts, ModuleDebugArtifacts
-from .composition import CompositionPolicy
+from .composition import CompositionPolicy, CompositionRule
 from .configuration import Configuration
 from .module import FheModule
 from .status import EncryptionStatus
@@ -45,6 +46,10 @@ class FunctionDef:
     _parameter_values: Dict[str, ValueDescription]
     _trace_wires: Optional[Set["Wire"]]
 
+    _streamed_samples: int
+    _reservoir_rng: Optional[np.random.Generator]
+    _streamed_bounds: Dict[Node, Dict[str, Union[np.integer, np.floating]]]
+
     def __init__(
         self,
         function: Callable,
@@ -105,6 +110,50 @@ class FunctionDef:
             f"{self.function.__code__.co_filename}:{self.function.__code__.co_firstlineno}"
         )
         self._trace_wires = None
+        self._streamed_samples = 0
+        self._streamed_bounds = {}
+        self._reservoir_rng = None
+
+    @staticmethod
+    def from_graph(graph: Graph) -> "FunctionDef":
+        """
+        Create a function definition from an already traced graph (e.g., loaded using `Graph.load`).
+
+        Resulting function definition is not traced again, and evaluating it evaluates the graph.
+
+        Args:
+            graph (Graph):
+                traced graph of the function
+
+        Returns:
+            FunctionDef:
+                function definition of the graph
+        """
+
+        inputs = graph.ordered_inputs()
+
+        def function(*args):
+            return graph(*args)
+
+        function.__name__ = graph.name
+        function.__signature__ = inspect.Signature(  # type: ignore
+            [
+                inspect.Parameter(node.properties["name"], inspect.Parameter.POSITIONAL_OR_KEYWORD)
+                for node in inputs
+            ]
+        )
+
+        result = FunctionDef(
+            function,
+            {
+                node.properties["name"]: "encrypted" if node.output.is_encrypted else "clear"
+                for node in inputs
+            },
+        )
+        result.graph = graph
+        result.location = graph.location
+
+        return result
 
     @property
     def name(self) -> str:
@@ -173,6 +222,48 @@ class FunctionDef:
                 artifact object to store informations in
         """
 
+        self.prepare(action, inputset, configuration, artifacts)
+        if self._is_direct:
+            return
+
+        assert self.graph is not None
+        bounds = (
+            self.graph.measure_bounds(
+                self.inputset,
+                workers=configuration.bounds_measurement_workers,
+            )
+            if len(self.inputset) != 0
+            else {}
+        )
+        self.update_with_bounds(bounds, artifacts)
+
+    def prepare(
+        self,
+        action: str,
+        inputset: Optional[Union[Iterable[Any], Iterable[Tuple[Any, ...]]]],
+        configuration: Configuration,
+        artifacts: FunctionDebugArtifacts,
+    ):
+        """
+        Extend inputset, adjust rounders and truncators, trace and fuse without measuring bounds.
+
+        If inputset streaming is enabled in the configuration, the inputset is consumed in a single
+        pass instead, and bounds of the samples that are not retained are measured as they arrive.
+
+        Args:
+            action (str):
+                action being performed (e.g., "trace", "compile")
+
+            inputset (Optional[Union[Iterable[Any], Iterable[Tuple[Any, ...]]]]):
+                optional inputset to extend accumulated inputset before bounds measurement
+
+            configuration (Configuration):
+                configuration to be used
+
+            artifacts (FunctionDebugArtifacts):
+                artifact object to store informations in
+        """
+
         if self._is_direct:
             self.graph = Tracer.trace(
                 self.function,
@@ -188,7 +279,14 @@ class FunctionDef:
             artifacts.add_graph("final", self.graph)  # pragma: no cover
             return
 
-        if inputset is not None:
+        if inputset is not None and configuration.inputset_reservoir_size is not None:
+            self._stream(
+                inputset,
+                configuration.inputset_reservoir_size,
+                configuration.inputset_reservoir_seed,
+                artifacts,
+            )
+        elif inputset is not None:
             previous_inputset_length = len(self.inputset)
             for index, sample in enumerate(iter(inputset)):
                 self.inputset.append(sample)
@@ -233,8 +331,101 @@ class FunctionDef:
             self.trace(first_sample, artifacts)
             assert self.graph is not None
 
-        bounds = self.graph.measure_bounds(self.inputset)
-        self.graph.update_with_bounds(bounds)
+    def _stream(
+        self,
+        inputset: Union[Iterable[Any], Iterable[Tuple[Any, ...]]],
+        reservoir_size: int,
+        reservoir_seed: Optional[int],
+        artifacts: FunctionDebugArtifacts,
+    ):
+        # the generator is private and kept across calls,
+        # so the reservoir is reproducible and doesn't depend on the global numpy state
+        if self._reservoir_rng is None:
+            self._reservoir_rng = np.random.default_rng(reservoir_seed)
+
+        previous_inputset = list(self.inputset)
+        previous_streamed_samples = self._streamed_samples
+        previous_streamed_bounds = self._streamed_bounds
+        previous_rng_state = self._reservoir_rng.bit_generator.state
+
+        # bounds of samples retained before streaming (e.g., by a previous compilation
+        # without streaming) might not have been accumulated, so they are measured
+        # before any of them is evicted from the reservoir
+        previous_samples_measured = len(previous_inputset) == 0
+
+        try:
+            self._streamed_samples = max(self._streamed_samples, len(self.inputset))
+            for index, sample in enumerate(iter(inputset)):
+                arguments = sample if isinstance(sample, tuple) else (sample,)
+                if len(arguments) != len(self.parameter_encryption_statuses):
+                    expected = (
+                        "a single value"
+                        if len(self.parameter_encryption_statuses) == 1
+                        else f"a tuple of {len(self.parameter_encryption_statuses)} values"
+                    )
+                    actual = (
+                        "a single value"
+                        if len(arguments) == 1
+                        else f"a tuple of {len(arguments)} values"
+                    )
+
+                    message = (
+                        f"Input #{index} of your inputset is not well formed "
+                        f"(expected {expected} got {actual})"
+                    )
+                    raise ValueError(message)
+
+                if self.graph is None:
+                    self.trace(sample, artifacts)
+                    assert self.graph is not None
+
+                # reservoir sampling keeps a uniformly distributed subset of streamed samples
+                self._streamed_samples += 1
+                if len(self.inputset) < reservoir_size:
+                    self.inputset.append(sample)
+                else:
+                    replaced_index = self._reservoir_rng.integers(0, self._streamed_samples)
+                    if replaced_index < reservoir_size:
+                        if not previous_samples_measured:
+                            # pylint: disable-next=protected-access
+                            previous_bounds = self.graph._measure_bounds(previous_inputset)
+                            self._streamed_bounds = Graph.merge_bounds(
+                                self._streamed_bounds,
+                                previous_bounds,
+                            )
+                            previous_samples_measured = True
+
+                        self.inputset[replaced_index] = sample
+
+                # pylint: disable-next=protected-access
+                sample_bounds = self.graph._measure_bounds([sample], first_index=index)
+                self._streamed_bounds = Graph.merge_bounds(self._streamed_bounds, sample_bounds)
+
+        except Exception:
+            self.inputset = previous_inputset
+            self._streamed_samples = previous_streamed_samples
+            self._streamed_bounds = previous_streamed_bounds
+            self._reservoir_rng.bit_generator.state = previous_rng_state
+            raise
+
+    def update_with_bounds(
+        self,
+        bounds: Dict[Node, Dict[str, Union[np.integer, np.floating]]],
+        artifacts: FunctionDebugArtifacts,
+    ):
+        """
+        Update values in the prepared graph according to measured bounds.
+
+        Args:
+            bounds (Dict[Node, Dict[str, Union[np.integer, np.floating]]]):
+                bounds of each node in the graph
+
+            artifacts (FunctionDebugArtifacts):
+                artifact object to store informations in
+        """
+
+        assert self.graph is not None
+        self.graph.update_with_bounds(Graph.merge_bounds(self._streamed_bounds, bounds))
 
         artifacts.add_graph("final", self.graph)
 
@@ -337,6 +528,10 @@ class ModuleCompiler:
     compilation_context: CompilationContext
     composition: CompositionPolicy
 
+    _previous_compilation: Optional[
+        Tuple[Configuration, List[CompositionRule], Dict[str, str], FheModule]
+    ]
+
     def __init__(self, functions: List[FunctionDef], composition: CompositionPolicy):
         self.default_configuration = Configuration(
             p_error=0.00001,
@@ -345,6 +540,7 @@ class ModuleCompiler:
         self.functions = {function.name: function for function in functions}
         self.compilation_context = CompilationContext.new()
         self.composition = composition
+        self._previous_compilation = None
 
     def wire_pipeline(self, inputset: Union[Iterable[Any], Iterable[Tuple[Any, ...]]]):
         """
@@ -402,48 +598,98 @@ class ModuleCompiler:
             for name, function in self.functions.items():
                 inputset = inputsets[name] if inputsets is not None else None
                 function_artifacts = module_artifacts.functions[name]
-                function.evaluate("Compiling", inputset, configuration, function_artifacts)
+                function.prepare("Compiling", inputset, configuration, function_artifacts)
+                assert function.graph is not None
+
+            # Measure bounds of all functions at once, so they share the same pool of workers
+            # pylint: disable=protected-access
+            functions_to_measure = {
+                name: function
+                for name, function in self.functions.items()
+                if not function._is_direct
+            }
+            # pylint: enable=protected-access
+            measured_bounds = Graph.measure_bounds_of_many(
+                [
+                    (function.graph, function.inputset)  # type: ignore
+                    for function in functions_to_measure.values()
+                    if len(function.inputset) != 0
+                ],
+                workers=configuration.bounds_measurement_workers,
+            )
+            measured_bounds_iterator = iter(measured_bounds)
+            for name, function in functions_to_measure.items():
+                bounds = next(measured_bounds_iterator) if len(function.inputset) != 0 else {}
+                function.update_with_bounds(bounds, module_artifacts.functions[name])
+
+            for name, function in self.functions.items():
                 assert function.graph is not None
                 dbg.debug_computation_graph(name, function.graph)
 
-            # Convert the graphs to an mlir module
-            mlir_context = self.compilation_context.mlir_context()
+            # Assign bit widths to copies of the graphs
+            # (graphs of functions are updated in place by later compilations,
+            # while modules compiled from them may still be used)
             graphs = {}
 
             for name, function in self.functions.items():
                 assert function.graph is not None
-                graphs[name] = function.graph
+                graphs[name] = deepcopy(function.graph)
 
-            # pylint: disable=protected-access
-            mlir_module = GraphConverter(
+            composition_rules = list(self.composition.get_rules_iter(list(graphs.values())))
+            converter = GraphConverter(configuration, composition_rules)
+            converter.process(graphs)
+
+            # Find the functions that need to be rebuilt
+            fingerprints = (
+                {name: converter.fingerprint(graph) for name, graph in graphs.items()}
+                if configuration.incremental_compilation
+                else {}
+            )
+            rebuilt_functions = self._rebuilt_functions(
                 configuration,
-                self.composition.get_rules_iter(
-                    list(filter(None, [f.graph for f in self.functions.values()]))
-                ),
-            ).convert_many(graphs, mlir_context)
-            mlir_str = str(mlir_module).strip()
+                composition_rules,
+                fingerprints,
+            )
+
+            if len(rebuilt_functions) != 0:
+                # Convert the graphs to an mlir module
+                mlir_context = self.compilation_context.mlir_context()
+                mlir_module = converter.convert_many_processed(graphs, mlir_context)
+                mlir_str = str(mlir_module).strip()
+            else:
+                # Reuse the runtime of the previous module, as it would be compiled exactly the same
+                # (a new module is created, so the previous one keeps its graphs)
+                assert self._previous_compilation is not None
+                output = self._previous_compilation[3].with_graphs(graphs)
+                mlir_str = output.mlir
+
             dbg.debug_mlir(mlir_str)
             module_artifacts.add_mlir_to_compile(mlir_str)
 
             # Debug some function informations
-            for name, function in self.functions.items():
-                dbg.debug_bit_width_constaints(name, function.graph)
-                dbg.debug_bit_width_assignments(name, function.graph)
-                dbg.debug_assigned_graph(name, function.graph)
-
-            # Compile to a module!
-            with dbg.debug_table("Optimizer", activate=dbg.show_optimizer()):
-                # pylint: disable=protected-access
-                output = FheModule(
-                    graphs,
-                    mlir_module,
-                    self.compilation_context,
-                    configuration,
-                    self.composition.get_rules_iter(
-                        list(filter(None, [f.graph for f in self.functions.values()]))
-                    ),
-                )
-                module_artifacts.add_execution_runtime(output.execution_runtime)
+            for name, graph in graphs.items():
+                dbg.debug_bit_width_constaints(name, graph)
+                dbg.debug_bit_width_assignments(name, graph)
+                dbg.debug_assigned_graph(name, graph)
+
+            if len(rebuilt_functions) != 0:
+                # Compile to a module!
+                with dbg.debug_table("Optimizer", activate=dbg.show_optimizer()):
+                    output = FheModule(
+                        graphs,
+                        mlir_module,
+                        self.compilation_context,
+                        configuration,
+                        composition_rules,
+                    )
+                output.rebuilt_functions = rebuilt_functions
+            module_artifacts.add_execution_runtime(output.execution_runtime)
+
+            self._previous_compilation = (
+                (configuration, composition_rules, fingerprints, output)
+                if configuration.incremental_compilation
+                else None
+            )
 
             dbg.debug_statistics(output)
 
@@ -467,6 +713,53 @@ class ModuleCompiler:
 
     # pylint: enable=too-many-branches,too-many-statements
 
+    def _rebuilt_functions(
+        self,
+        configuration: Configuration,
+        composition_rules: List[CompositionRule],
+        fingerprints: Dict[str, str],
+    ) -> List[str]:
+        """
+        Get the functions that changed since the previous compilation.
+
+        Args:
+            configuration (Configuration):
+                configuration of the current compilation
+
+            composition_rules (List[CompositionRule]):
+                composition rules of the current compilation
+
+            fingerprints (Dict[str, str]):
+                fingerprints of the processed graphs of the current compilation
+
+        Returns:
+            List[str]:
+                names of the functions that changed, or all functions if the module needs to be
+                rebuilt for another reason (e.g., configuration change), or an empty list if the
+                previously compiled module can be reused as is
+        """
+
+        all_functions = list(self.functions.keys())
+
+        if not configuration.incremental_compilation or self._previous_compilation is None:
+            return all_functions
+
+        (
+            previous_configuration,
+            previous_composition_rules,
+            previous_fingerprints,
+            _,
+        ) = self._previous_compilation
+
+        if (
+            vars(configuration) != vars(previous_configuration)
+            or set(composition_rules) != set(previous_composition_rules)
+            or fingerprints.keys() != previous_fingerprints.keys()
+        ):
+            return all_functions
+
+        return [name for name in all_functions if fingerprints[name] != previous_fingerprints[name]]
+
     def __getattr__(self, item):
         if item not in list(self.functions.keys()):
             error = f"No attribute {item}"
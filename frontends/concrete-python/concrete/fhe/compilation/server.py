@@ -8,7 +8,7 @@ import json
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
 # mypy: disable-error-code=attr-defined
 import concrete.compiler
@@ -21,8 +21,10 @@ from concrete.compiler import (
     LibraryCompilationResult,
     LibrarySupport,
     Parameter,
+    PreparedEvaluationKeys,
     ProgramCompilationFeedback,
     PublicArguments,
+    ServerCircuit,
     ServerProgram,
     SimulatedValueExporter,
     set_compiler_logging,
@@ -46,6 +48,7 @@ from .configuration import (
     MultiParameterStrategy,
     ParameterSelectionStrategy,
 )
+from .handles import ValueHandle, ValueStore, owner_identity
 from .specs import ClientSpecs
 from .utils import friendly_type_format
 from .value import Value
@@ -60,12 +63,15 @@ class Server:
 
     client_specs: ClientSpecs
     is_simulated: bool
+    values: ValueStore
 
     _output_dir: Union[None, str, Path]
     _support: LibrarySupport
     _compilation_result: LibraryCompilationResult
     _compilation_feedback: ProgramCompilationFeedback
     _server_program: ServerProgram
+    _server_circuits: Dict[str, ServerCircuit]
+    _prepared_evaluation_keys: Optional[Tuple[Optional[str], PreparedEvaluationKeys]]
 
     _mlir: Optional[str]
     _configuration: Optional[Configuration]
@@ -86,12 +92,15 @@ class Server:
     ):
         self.client_specs = client_specs
         self.is_simulated = is_simulated
+        self.values = ValueStore()
 
         self._output_dir = output_dir
         self._support = support
         self._compilation_result = compilation_result
         self._compilation_feedback = self._support.load_compilation_feedback(compilation_result)
         self._server_program = server_program
+        self._server_circuits = {}
+        self._prepared_evaluation_keys = None
         self._mlir = None
         self._composition_rules = composition_rules
 
@@ -118,31 +127,13 @@ class Server:
         )
 
     @staticmethod
-    def create(
-        mlir: Union[str, MlirModule],
+    def _compilation_options(
         configuration: Configuration,
-        is_simulated: bool = False,
-        compilation_context: Optional[CompilationContext] = None,
-        composition_rules: Optional[Iterable[CompositionRule]] = None,
-    ) -> "Server":
+        is_simulated: bool,
+        composition_rules: Optional[Iterable[CompositionRule]],
+    ) -> CompilationOptions:
         """
-        Create a server using MLIR and output sign information.
-
-        Args:
-            mlir (MlirModule):
-                mlir to compile
-
-            is_simulated (bool, default = False):
-                whether to compile in simulation mode or not
-
-            configuration (Optional[Configuration]):
-                configuration to use
-
-            compilation_context (CompilationContext):
-                context to use for the Compiler
-
-            composition_rules (Iterable[Tuple[str, int, str, int]]):
-                composition rules to be applied when compiling
+        Get the compilation options corresponding to a configuration.
         """
 
         backend = Backend.GPU if configuration.use_gpu else Backend.CPU
@@ -153,6 +144,7 @@ class Server:
         options.set_loop_parallelize(configuration.loop_parallelize)
         options.set_dataflow_parallelize(configuration.dataflow_parallelize)
         options.set_auto_parallelize(configuration.auto_parallelize)
+        options.set_batch_tfhe_ops(configuration.batch_tfhe_ops)
         options.set_compress_evaluation_keys(configuration.compress_evaluation_keys)
         options.set_compress_input_ciphertexts(configuration.compress_input_ciphertexts)
         options.set_enable_overflow_detection_in_simulation(
@@ -160,15 +152,9 @@ class Server:
         )
 
         options.set_composable(configuration.composable)
-        composition_rules = list(composition_rules) if composition_rules else []
-        for rule in composition_rules:
+        for rule in composition_rules or []:
             options.add_composition(rule.from_.func, rule.from_.pos, rule.to.func, rule.to.pos)
 
-        if configuration.auto_parallelize or configuration.dataflow_parallelize:
-            # pylint: disable=c-extension-no-member,no-member
-            concrete.compiler.init_dfr()
-            # pylint: enable=c-extension-no-member,no-member
-
         global_p_error_is_set = configuration.global_p_error is not None
         p_error_is_set = configuration.p_error is not None
 
@@ -222,6 +208,44 @@ class Server:
         options.set_enable_tlu_fusing(configuration.enable_tlu_fusing)
         options.set_print_tlu_fusing(configuration.print_tlu_fusing)
 
+        return options
+
+    @staticmethod
+    def create(
+        mlir: Union[str, MlirModule],
+        configuration: Configuration,
+        is_simulated: bool = False,
+        compilation_context: Optional[CompilationContext] = None,
+        composition_rules: Optional[Iterable[CompositionRule]] = None,
+    ) -> "Server":
+        """
+        Create a server using MLIR and output sign information.
+
+        Args:
+            mlir (MlirModule):
+                mlir to compile
+
+            is_simulated (bool, default = False):
+                whether to compile in simulation mode or not
+
+            configuration (Optional[Configuration]):
+                configuration to use
+
+            compilation_context (CompilationContext):
+                context to use for the Compiler
+
+            composition_rules (Iterable[Tuple[str, int, str, int]]):
+                composition rules to be applied when compiling
+        """
+
+        if configuration.auto_parallelize or configuration.dataflow_parallelize:
+            # pylint: disable=c-extension-no-member,no-member
+            concrete.compiler.init_dfr()
+            # pylint: enable=c-extension-no-member,no-member
+
+        composition_rules = list(composition_rules) if composition_rules else []
+        options = Server._compilation_options(configuration, is_simulated, composition_rules)
+
         try:
             if configuration.compiler_debug_mode:  # pragma: no cover
                 set_llvm_debug_flag(True)
@@ -267,6 +291,49 @@ class Server:
 
         return result
 
+    @staticmethod
+    def select_parameters(
+        mlir: MlirModule,
+        configuration: Configuration,
+        compilation_context: CompilationContext,
+        composition_rules: Optional[Iterable[CompositionRule]] = None,
+    ) -> ProgramCompilationFeedback:
+        """
+        Select the parameters of an MLIR module, without generating code for it.
+
+        Args:
+            mlir (MlirModule):
+                mlir to select the parameters of
+
+            configuration (Configuration):
+                configuration to use
+
+            compilation_context (CompilationContext):
+                context to use for the Compiler
+
+            composition_rules (Optional[Iterable[CompositionRule]], default = None):
+                composition rules to be applied when selecting the parameters
+
+        Returns:
+            ProgramCompilationFeedback:
+                feedback of the parameter selection (e.g., probabilities of error)
+        """
+
+        options = Server._compilation_options(configuration, False, composition_rules)
+
+        try:
+            if configuration.compiler_debug_mode:  # pragma: no cover
+                set_llvm_debug_flag(True)
+            if configuration.compiler_verbose_mode:  # pragma: no cover
+                set_compiler_logging(True)
+
+            # pylint: disable=c-extension-no-member,no-member
+            return concrete.compiler.select_parameters(mlir, options, compilation_context)
+            # pylint: enable=c-extension-no-member,no-member
+        finally:
+            set_llvm_debug_flag(False)
+            set_compiler_logging(False)
+
     def save(self, path: Union[str, Path], via_mlir: bool = False):
         """
         Save the server into the given path in zip format.
@@ -399,28 +466,138 @@ class Server:
 
     def run(
         self,
-        *args: Optional[Union[Value, Tuple[Optional[Value], ...]]],
-        evaluation_keys: Optional[EvaluationKeys] = None,
+        *args: Optional[Union[Value, ValueHandle, Tuple[Optional[Union[Value, ValueHandle]], ...]]],
+        evaluation_keys: Optional[Union[EvaluationKeys, PreparedEvaluationKeys]] = None,
         function_name: Optional[str] = None,
-    ) -> Union[Value, Tuple[Value, ...]]:
+        return_handles: bool = False,
+    ) -> Union[Value, ValueHandle, Tuple[Union[Value, ValueHandle], ...]]:
         """
         Evaluate.
 
+        Evaluation is thread-safe and releases the GIL while the circuit runs,
+        so a single server can evaluate concurrent requests from multiple threads.
+
         Args:
-            *args (Optional[Union[Value, Tuple[Optional[Value], ...]]]):
-                argument(s) for evaluation
+            *args (Optional[Union[Value, ValueHandle, Tuple[...]]]):
+                argument(s) for evaluation, where handles refer to values held in `self.values`
+                (only allowed if the composition rules of the module allow the output
+                which produced the handle to be used as the argument, and if the handle
+                was returned by a call with the same `evaluation_keys`)
 
-            evaluation_keys (Optional[EvaluationKeys], default = None):
+            evaluation_keys (Optional[Union[EvaluationKeys, PreparedEvaluationKeys]]):
                 evaluation keys required for fhe execution
+                (evaluation keys are prepared once and reused as long as the same keys are given,
+                even if they are deserialized again for each call)
 
             function_name (str):
                 The name of the function to run
 
+            return_handles (bool, default = False):
+                whether to hold the result(s) in `self.values` and return handles to them
+                instead of the values themselves
+
         Returns:
-            Union[Value, Tuple[Value, ...]]:
+            Union[Value, ValueHandle, Tuple[Union[Value, ValueHandle], ...]]:
                 result(s) of evaluation
         """
 
+        function_name = self._resolve_function_name(function_name)
+
+        if evaluation_keys is None and not self.is_simulated:
+            message = "Expected evaluation keys to be provided when not in simulation mode"
+            raise RuntimeError(message)
+
+        public_args = self._public_arguments(args, function_name, evaluation_keys)
+        server_circuit = self._server_circuit(function_name)
+
+        if self.is_simulated:
+            public_result = server_circuit.simulate(public_args)
+        else:
+            assert evaluation_keys is not None
+            prepared_evaluation_keys = self._prepare_evaluation_keys(evaluation_keys)
+            public_result = server_circuit.call(public_args, prepared_evaluation_keys)
+
+        values = tuple(Value(public_result.get_value(i)) for i in range(public_result.n_values()))
+        result: Tuple[Union[Value, ValueHandle], ...] = (
+            tuple(
+                self.values.put(value, function_name, i, owner=evaluation_keys)
+                for i, value in enumerate(values)
+            )
+            if return_handles
+            else values
+        )
+
+        return result if len(result) > 1 else result[0]
+
+    def run_batch(
+        self,
+        args_batch: Sequence[
+            Union[
+                Optional[Union[Value, ValueHandle]],
+                Tuple[Optional[Union[Value, ValueHandle]], ...],
+            ]
+        ],
+        evaluation_keys: Optional[Union[EvaluationKeys, PreparedEvaluationKeys]] = None,
+        function_name: Optional[str] = None,
+    ) -> List[Union[Value, Tuple[Value, ...]]]:
+        """
+        Evaluate on a batch of arguments.
+
+        The evaluations run in parallel on the runtime worker pool, sharing the prepared
+        evaluation keys and the setup of the function, which is faster than calling `run`
+        for each set of arguments.
+
+        Args:
+            args_batch (Sequence[Union[Optional[Union[Value, ValueHandle]], Tuple[...]]]):
+                arguments of each evaluation, as given to `run`
+
+            evaluation_keys (Optional[Union[EvaluationKeys, PreparedEvaluationKeys]]):
+                evaluation keys required for fhe execution
+
+            function_name (str):
+                The name of the function to run
+
+        Returns:
+            List[Union[Value, Tuple[Value, ...]]]:
+                result(s) of each evaluation, in the order of the arguments
+        """
+
+        function_name = self._resolve_function_name(function_name)
+
+        if evaluation_keys is None and not self.is_simulated:
+            message = "Expected evaluation keys to be provided when not in simulation mode"
+            raise RuntimeError(message)
+
+        public_args_batch = [
+            self._public_arguments(
+                args if isinstance(args, tuple) else (args,),
+                function_name,
+                evaluation_keys,
+            )
+            for args in args_batch
+        ]
+        server_circuit = self._server_circuit(function_name)
+
+        if self.is_simulated:
+            public_results = [
+                server_circuit.simulate(public_args) for public_args in public_args_batch
+            ]
+        else:
+            assert evaluation_keys is not None
+            prepared_evaluation_keys = self._prepare_evaluation_keys(evaluation_keys)
+            public_results = server_circuit.call_batch(
+                public_args_batch, prepared_evaluation_keys
+            )
+
+        results: List[Union[Value, Tuple[Value, ...]]] = []
+        for public_result in public_results:
+            values = tuple(
+                Value(public_result.get_value(i)) for i in range(public_result.n_values())
+            )
+            results.append(values if len(values) > 1 else values[0])
+        return results
+
+    def _resolve_function_name(self, function_name: Optional[str]) -> str:
         if function_name is None:
             functions = self.client_specs.client_parameters.function_list()
             if len(functions) == 1:
@@ -429,12 +606,18 @@ class Server:
                 msg = "The client contains more than one functions. \
 Provide a `function_name` keyword argument to disambiguate."
                 raise TypeError(msg)
+        return function_name
 
-        if evaluation_keys is None and not self.is_simulated:
-            message = "Expected evaluation keys to be provided when not in simulation mode"
-            raise RuntimeError(message)
-
-        flattened_args: List[Optional[Value]] = []
+    def _public_arguments(
+        self,
+        args: Tuple[
+            Optional[Union[Value, ValueHandle, Tuple[Optional[Union[Value, ValueHandle]], ...]]],
+            ...,
+        ],
+        function_name: str,
+        evaluation_keys: Optional[Union[EvaluationKeys, PreparedEvaluationKeys]],
+    ) -> PublicArguments:
+        flattened_args: List[Optional[Union[Value, ValueHandle]]] = []
         for arg in args:
             if isinstance(arg, tuple):
                 flattened_args.extend(arg)
@@ -447,6 +630,13 @@ Provide a `function_name` keyword argument to disambiguate."
                 message = f"Expected argument {i} to be an fhe.Value but it's None"
                 raise ValueError(message)
 
+            if isinstance(arg, ValueHandle):
+                # handles come from the clients, so they are checked against the held values
+                # before their origin is checked against the composition rules
+                handle = arg
+                arg = self.values.get(handle, owner=evaluation_keys)
+                self._check_handle_composition(handle, function_name, i)
+
             if not isinstance(arg, Value):
                 if i not in self._clear_input_indices[function_name]:
                     message = (
@@ -475,22 +665,56 @@ Provide a `function_name` keyword argument to disambiguate."
             else:
                 buffers.append(arg)
 
-        public_args = PublicArguments.new(self.client_specs.client_parameters, buffers)
-        server_circuit = self._server_program.get_server_circuit(function_name)
+        return PublicArguments.new(self.client_specs.client_parameters, buffers)
 
-        if self.is_simulated:
-            public_result = server_circuit.simulate(public_args)
-        else:
-            public_result = server_circuit.call(public_args, evaluation_keys)
+    def _server_circuit(self, function_name: str) -> ServerCircuit:
+        server_circuit = self._server_circuits.get(function_name)
+        if server_circuit is None:
+            server_circuit = self._server_program.get_server_circuit(function_name)
+            self._server_circuits[function_name] = server_circuit
+        return server_circuit
 
-        result = tuple(Value(public_result.get_value(i)) for i in range(public_result.n_values()))
-        return result if len(result) > 1 else result[0]
+    def _prepare_evaluation_keys(
+        self,
+        evaluation_keys: Union[EvaluationKeys, PreparedEvaluationKeys],
+    ) -> PreparedEvaluationKeys:
+        if isinstance(evaluation_keys, PreparedEvaluationKeys):
+            return evaluation_keys
+
+        # preparing evaluation keys converts bootstrap keys to the fourier domain
+        # which is as expensive as a few bootstraps, so it's only done when keys change
+        #
+        # keys are compared by their content, not by the object, since servers usually
+        # deserialize the evaluation keys of the client for each request
+        identity = owner_identity(evaluation_keys)
+        prepared = self._prepared_evaluation_keys
+        if prepared is None or prepared[0] != identity:
+            prepared = (identity, PreparedEvaluationKeys.prepare(evaluation_keys))
+            self._prepared_evaluation_keys = prepared
+
+        return prepared[1]
+
+    def _check_handle_composition(self, handle: ValueHandle, function_name: str, position: int):
+        rule = CompositionRule(
+            CompositionClause(handle.function, handle.position),
+            CompositionClause(function_name, position),
+        )
+        if self._composition_rules is None or rule not in self._composition_rules:
+            message = (
+                f"Expected argument {position} of {function_name} to be an fhe.Value "
+                f"but it's a handle to output {handle.position} of {handle.function}, "
+                f"which cannot be used as argument {position} of {function_name} "
+                f"as it's not allowed by the composition rules"
+            )
+            raise ValueError(message)
 
     def cleanup(self):
         """
-        Cleanup the temporary library output directory.
+        Cleanup the temporary library output directory and release held values.
         """
 
+        self.values.clear()
+        self._prepared_evaluation_keys = None
         if self._output_dir is not None:
             shutil.rmtree(Path(self._output_dir).resolve())
 
@@ -147,23 +147,9 @@ def validate_input_args(
 
     assert "inputs" in client_parameters_json
     input_specs = client_parameters_json["inputs"]
-    if len(args) != len(input_specs):
-        message = f"Expected {len(input_specs)} inputs but got {len(args)}"
-        raise ValueError(message)
-
-    sanitized_args: Dict[int, Optional[Union[int, np.ndarray]]] = {}
-    for index, (arg, spec) in enumerate(zip(args, input_specs)):
-        if arg is None:
-            sanitized_args[index] = None
-            continue
-
-        if isinstance(arg, list):
-            arg = np.array(arg)
-
-        is_valid = isinstance(arg, (int, np.integer)) or (
-            isinstance(arg, np.ndarray) and np.issubdtype(arg.dtype, np.integer)
-        )
 
+    expected_values = []
+    for spec in input_specs:
         if "lweCiphertext" in spec["typeInfo"].keys():
             type_info = spec["typeInfo"]["lweCiphertext"]
             is_encrypted = True
@@ -182,7 +168,77 @@ def validate_input_args(
             raise ValueError(message)
 
         expected_dtype = SignedInteger(width) if is_signed else UnsignedInteger(width)
-        expected_value = ValueDescription(expected_dtype, shape, is_encrypted)
+        expected_values.append(ValueDescription(expected_dtype, shape, is_encrypted))
+
+    return validate_input_args_against(expected_values, *args)
+
+
+def validate_input_args_of_graph(
+    graph: Graph,
+    *args: Optional[Union[int, np.ndarray, List]],
+) -> List[Optional[Union[int, np.ndarray]]]:
+    """Validate input arguments of a graph with assigned bit widths.
+
+    Args:
+        graph (Graph):
+            graph to validate the arguments of
+        *args (Optional[Union[int, np.ndarray, List]]):
+            argument(s) for evaluation
+
+    Returns:
+        List[Optional[Union[int, np.ndarray]]]: ordered validated args
+    """
+
+    expected_values = []
+    for node in graph.ordered_inputs():
+        assert isinstance(node.output.dtype, Integer)
+        expected_dtype = (
+            SignedInteger(node.output.dtype.bit_width)
+            if node.output.dtype.is_signed
+            else UnsignedInteger(node.output.dtype.bit_width)
+        )
+        expected_values.append(
+            ValueDescription(expected_dtype, node.output.shape, node.output.is_encrypted)
+        )
+
+    return validate_input_args_against(expected_values, *args)
+
+
+def validate_input_args_against(
+    expected_values: List[ValueDescription],
+    *args: Optional[Union[int, np.ndarray, List]],
+) -> List[Optional[Union[int, np.ndarray]]]:
+    """Validate input arguments against descriptions of the expected values.
+
+    Args:
+        expected_values (List[ValueDescription]):
+            descriptions of the expected values
+        *args (Optional[Union[int, np.ndarray, List]]):
+            argument(s) for evaluation
+
+    Returns:
+        List[Optional[Union[int, np.ndarray]]]: ordered validated args
+    """
+
+    if len(args) != len(expected_values):
+        message = f"Expected {len(expected_values)} inputs but got {len(args)}"
+        raise ValueError(message)
+
+    sanitized_args: Dict[int, Optional[Union[int, np.ndarray]]] = {}
+    for index, (arg, expected_value) in enumerate(zip(args, expected_values)):
+        if arg is None:
+            sanitized_args[index] = None
+            continue
+
+        if isinstance(arg, list):
+            arg = np.array(arg)
+
+        is_valid = isinstance(arg, (int, np.integer)) or (
+            isinstance(arg, np.ndarray) and np.issubdtype(arg.dtype, np.integer)
+        )
+
+        expected_dtype = expected_value.dtype
+        is_encrypted = expected_value.is_encrypted
         if is_valid:
             expected_min = expected_dtype.min()
             expected_max = expected_dtype.max()
@@ -825,7 +881,7 @@ def convert_subgraph_to_subgraph_node(
         "subgraph",
         deepcopy(subgraph_variable_input_node.inputs),
         terminal_node.output,
-        lambda x, subgraph, terminal_node: subgraph.evaluate(x)[terminal_node],
+        _evaluate_subgraph,
         kwargs={
             "subgraph": subgraph,
             "terminal_node": terminal_node,
@@ -934,3 +990,7 @@ def get_terminal_size() -> int:
         columns = 80
 
     return columns
+
+
+def _evaluate_subgraph(x: Any, subgraph: Graph, terminal_node: Node) -> Any:
+    return subgraph.evaluate(x)[terminal_node]
@@ -8,13 +8,24 @@ from .array import array
 from .bits import bits
 from .constant import constant
 from .convolution import conv
+from .gather import gather, gather_programmable_bootstrap_counts, scatter
 from .hint import hint
 from .identity import identity, refresh
 from .maxpool import maxpool
 from .multivariate import multivariate
 from .ones import one, ones, ones_like
+from .radix import (
+    radix_add,
+    radix_decode,
+    radix_encode,
+    radix_equal,
+    radix_less,
+    radix_multiply,
+    radix_tlu,
+)
 from .relu import relu
 from .round_bit_pattern import AutoRounder, round_bit_pattern
+from .scan import first_match, scan
 from .table import LookupTable
 from .tag import tag
 from .truncate_bit_pattern import AutoTruncator, truncate_bit_pattern
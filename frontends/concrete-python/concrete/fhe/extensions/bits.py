@@ -103,34 +103,6 @@ class Bits:
             message = f"Bits of {self.value} cannot be extracted since it's not an integer"
             raise ValueError(message)
 
-        def evaluator(x, bits):  # pylint: disable=redefined-outer-name
-            if isinstance(bits, (int, np.integer)):
-                return (x >> bits) & 1
-
-            assert isinstance(bits, slice)
-
-            step = bits.step or 1
-
-            assert step != 0
-            assert step > 0 or bits.start is not None
-
-            if np.any(x < 0) and bits.stop is None and step > 0:
-                message = (
-                    f"Extracting bits without an upper bound (stop is None) "
-                    f"isn't supported on signed values (e.g., {x})"
-                )
-                raise ValueError(message)
-
-            start = bits.start or MIN_EXTRACTABLE_BIT
-            stop = bits.stop or (MAX_EXTRACTABLE_BIT if step > 0 else (MIN_EXTRACTABLE_BIT - 1))
-
-            result = 0
-            for i, bit in enumerate(range(start, stop, step)):
-                value = (x >> bit) & 1
-                result += value << i
-
-            return result
-
         if isinstance(self.value, Tracer):
             output_value = deepcopy(self.value.output)
             direct_single_bit = (
@@ -144,12 +116,12 @@ class Bits:
                 "extract_bit_pattern",
                 [deepcopy(self.value.output)],
                 output_value,
-                evaluator,
+                _evaluate,
                 kwargs={"bits": index},
             )
             return Tracer(computation, [self.value])
 
-        return evaluator(self.value, bits=index)
+        return _evaluate(self.value, bits=index)
 
 
 def bits(x: Union[int, np.integer, list, np.ndarray, Tracer]) -> Bits:
@@ -166,3 +138,32 @@ def bits(x: Union[int, np.integer, list, np.ndarray, Tracer]) -> Bits:
     """
 
     return Bits(x)
+
+
+def _evaluate(x, bits):  # pylint: disable=redefined-outer-name
+    if isinstance(bits, (int, np.integer)):
+        return (x >> bits) & 1
+
+    assert isinstance(bits, slice)
+
+    step = bits.step or 1
+
+    assert step != 0
+    assert step > 0 or bits.start is not None
+
+    if np.any(x < 0) and bits.stop is None and step > 0:
+        message = (
+            f"Extracting bits without an upper bound (stop is None) "
+            f"isn't supported on signed values (e.g., {x})"
+        )
+        raise ValueError(message)
+
+    start = bits.start or MIN_EXTRACTABLE_BIT
+    stop = bits.stop or (MAX_EXTRACTABLE_BIT if step > 0 else (MIN_EXTRACTABLE_BIT - 1))
+
+    result = 0
+    for i, bit in enumerate(range(start, stop, step)):
+        value = (x >> bit) & 1
+        result += value << i
+
+    return result
@@ -0,0 +1,222 @@
+"""
+Declaration of `gather` and `scatter` extensions.
+"""
+
+from typing import Any, Dict, Iterable, Optional, Union
+
+import numpy as np
+
+from ..tracing import Tracer
+from .table import LookupTable
+from .tag import tag
+from .zeros import zero
+
+
+def gather(table: Union[Tracer, Any], index: Union[Tracer, Any]) -> Union[Tracer, Any]:
+    """
+    Get an entry of a table using an encrypted index.
+
+    Computes:
+        table[index]
+
+    Entries are selected obliviously using a one-hot selection over the index domain,
+    which is computed with a single batched equality of `index` with every position.
+    Then, depending on the table:
+        - clear tables use a clear-encrypted dot product with the selection,
+          or a table lookup on `index` for each element of the entry,
+          whichever requires less table lookups
+        - encrypted tables multiply each entry with its selection bit chunk by chunk,
+          (see `if_then_else_chunk_size` configuration option), and sum the results
+
+    Nodes created by the operation are tagged with `gather`, so its cost can be seen in
+    statistics (e.g., `circuit.programmable_bootstrap_count_per_tag["gather"]`),
+    and it can be compared with a naive selection using `gather_programmable_bootstrap_counts`.
+
+    Args:
+        table (Union[Tracer, Any]):
+            clear or encrypted table to get the entry from (first axis is indexed)
+
+        index (Union[Tracer, Any]):
+            index of the entry to get, which must be in range [0, len(table))
+
+    Returns:
+        Union[Tracer, Any]:
+            Tracer that represent the operation during tracing
+            `table[index]` otherwise
+    """
+
+    if not isinstance(table, Tracer):
+        table = np.array(table)
+
+    if not isinstance(index, Tracer):
+        return table[index]
+
+    _check_table(table, "gather")
+
+    with tag("gather"):
+        size = table.shape[0]
+        entry_shape = table.shape[1:]
+        entry_size = int(np.prod(entry_shape))
+
+        if isinstance(table, Tracer):
+            selection = _selection(index, size, len(entry_shape))
+            return np.sum(np.where(selection, table, 0), axis=0)
+
+        if entry_size <= size:
+            if len(entry_shape) == 0:
+                return LookupTable(table)[index]
+
+            columns = table.reshape((size, entry_size))
+            lookup = LookupTable([LookupTable(columns[:, i]) for i in range(entry_size)])
+            return lookup[index + np.zeros(entry_size, dtype=np.int64)].reshape(entry_shape)
+
+        selection = _selection(index, size, 0)
+        if len(entry_shape) == 0:
+            return np.dot(selection, table)
+
+        return np.matmul(selection, table.reshape((size, entry_size))).reshape(entry_shape)
+
+
+def scatter(
+    table: Union[Tracer, Any],
+    index: Union[Tracer, Any],
+    value: Union[Tracer, Any],
+) -> Union[Tracer, Any]:
+    """
+    Set an entry of a table using an encrypted index.
+
+    Computes:
+        result = table.copy()
+        result[index] = value
+
+    Entries are selected obliviously using a one-hot selection over the index domain,
+    which is computed with a single batched equality of `index` with every position.
+    Then, encrypted entries and values are multiplied with the selection chunk by chunk
+    (see `if_then_else_chunk_size` configuration option), while clear ones are multiplied
+    with the selection without any table lookups.
+
+    Nodes created by the operation are tagged with `scatter`, so its cost can be seen in
+    statistics (e.g., `circuit.programmable_bootstrap_count_per_tag["scatter"]`).
+
+    Args:
+        table (Union[Tracer, Any]):
+            clear or encrypted table to set the entry of (first axis is indexed)
+
+        index (Union[Tracer, Any]):
+            index of the entry to set, which must be in range [0, len(table))
+
+        value (Union[Tracer, Any]):
+            clear or encrypted value to set, which is broadcast to the shape of the entry
+
+    Returns:
+        Union[Tracer, Any]:
+            Tracer that represent the operation during tracing
+            copy of `table` with `value` at `index` otherwise
+    """
+
+    if not isinstance(table, Tracer):
+        table = np.array(table)
+
+    if not isinstance(index, Tracer):
+        result = table + zero()
+        result[index] = value
+        return result
+
+    _check_table(table, "scatter")
+
+    with tag("scatter"):
+        size = table.shape[0]
+        selection = _selection(index, size, table.ndim - 1)
+
+        set_value = (
+            np.where(selection, value, 0) if isinstance(value, Tracer) else selection * value
+        )
+        kept_entries = (
+            np.where(selection, 0, table) if isinstance(table, Tracer) else (1 - selection) * table
+        )
+
+        return np.broadcast_to(set_value + kept_entries, table.shape)
+
+
+def gather_programmable_bootstrap_counts(
+    table: Optional[Any],
+    inputset: Iterable[Any],
+    configuration: Optional[Any] = None,
+    **kwargs,
+) -> Dict[str, int]:
+    """
+    Get the number of programmable bootstraps of `gather` and of a naive selection.
+
+    The naive selection compares the index with each position separately,
+    and multiplies each entry with the result of its comparison.
+
+    Both forms are compiled with the same inputset and configuration,
+    as the number of programmable bootstraps depends on the bit widths assigned during compilation.
+
+    Args:
+        table (Optional[Any]):
+            clear table to get entries from,
+            or None if the table is encrypted (samples of `inputset` are then `(table, index)`)
+
+        inputset (Iterable[Any]):
+            indices (or tables and indices) to compile with
+
+        configuration (Optional[Configuration], default = None):
+            configuration to compile with
+
+        kwargs (Dict[str, Any]):
+            configuration options to overwrite
+
+    Returns:
+        Dict[str, int]:
+            number of programmable bootstraps of `gather` (under "gather" key)
+            and of the naive selection (under "naive" key)
+    """
+
+    # pylint: disable=cyclic-import,import-outside-toplevel
+    from ..compilation import Compiler
+
+    # pylint: enable=cyclic-import,import-outside-toplevel
+
+    inputset = list(inputset)
+
+    if table is None:
+        functions = {
+            "gather": lambda table, index: gather(table, index),
+            "naive": lambda table, index: _naive_gather(table, index),
+        }
+        encryption_statuses = {"table": "encrypted", "index": "encrypted"}
+    else:
+        table = np.array(table)
+        functions = {
+            "gather": lambda index: gather(table, index),
+            "naive": lambda index: _naive_gather(table, index),
+        }
+        encryption_statuses = {"index": "encrypted"}
+
+    return {
+        name: Compiler(function, encryption_statuses)
+        .compile(inputset, configuration, **kwargs)
+        .programmable_bootstrap_count
+        for name, function in functions.items()
+    }
+
+
+def _naive_gather(table: Union[Tracer, Any], index: Tracer) -> Tracer:
+    return sum((index == position) * table[position] for position in range(table.shape[0]))
+
+
+def _check_table(table: Union[Tracer, np.ndarray], name: str):
+    if table.ndim == 0:
+        message = f"{name} from a scalar table is not supported"
+        raise ValueError(message)
+
+    if not isinstance(table, Tracer) and not np.issubdtype(table.dtype, np.integer):
+        message = f"{name} from a table of {table.dtype} is not supported"
+        raise ValueError(message)
+
+
+def _selection(index: Tracer, size: int, entry_dimensions: int) -> Tracer:
+    # single batched equality over the index domain
+    selection = np.arange(size) == index
+    return selection.reshape((size,) + (1,) * entry_dimensions)
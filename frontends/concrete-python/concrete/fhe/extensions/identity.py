@@ -32,7 +32,7 @@ def identity(x: Union[Tracer, Any]) -> Union[Tracer, Any]:
         "identity",
         [deepcopy(x.output)],
         x.output,
-        lambda x: deepcopy(x),  # pylint: disable=unnecessary-lambda
+        _evaluate,
     )
     return Tracer(computation, [x])
 
@@ -61,7 +61,11 @@ def refresh(x: Union[Tracer, Any]) -> Union[Tracer, Any]:
         "identity",
         [deepcopy(x.output)],
         x.output,
-        lambda x, **_kwargs: deepcopy(x),
+        _evaluate,
         kwargs={"force_noise_refresh": True},
     )
     return Tracer(computation, [x])
+
+
+def _evaluate(x: Any, **_kwargs: Any) -> Any:
+    return deepcopy(x)
@@ -98,7 +98,7 @@ def multivariate(
             function.__name__,
             [deepcopy(arg.output) for arg in args],
             output_value,
-            lambda *args: function(*args),  # pylint: disable=unnecessary-lambda
+            function,
             attributes={"is_multivariate": True},
         )
         return Tracer(computation, list(args))
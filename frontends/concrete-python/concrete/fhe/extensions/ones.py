@@ -2,6 +2,7 @@
 Declaration of `ones` and `one` functions, to simplify creation of encrypted ones.
 """
 
+from functools import partial
 from typing import Tuple, Union
 
 import numpy as np
@@ -36,7 +37,7 @@ def ones(shape: Union[int, Tuple[int, ...]]) -> Union[np.ndarray, Tracer]:
             "ones",
             [],
             ValueDescription.of(numpy_ones, is_encrypted=True),
-            lambda: np.ones(shape, dtype=np.int64),
+            partial(np.ones, shape, dtype=np.int64),
         )
         return Tracer(computation, [])
 
@@ -0,0 +1,463 @@
+"""
+Declaration of radix extensions, to operate on integers wider than table lookups support.
+"""
+
+from typing import Any, Callable, Optional, Tuple, Union
+
+import numpy as np
+
+from ..tracing import Tracer
+from .multivariate import multivariate
+from .scan import scan
+from .univariate import univariate
+
+# states of chunks during carry propagation and comparison
+# (chosen so that `_PROPAGATE` is 0, which is the padding of exclusive scans)
+_PROPAGATE = 0
+_KILL = 1
+_GENERATE = 2
+
+_EQUAL = 0
+_LESS = 1
+_GREATER = 2
+
+
+def radix_encode(value: Any, chunk_width: int, number_of_chunks: int) -> np.ndarray:
+    """
+    Decompose unsigned integers into radix chunks.
+
+    Computes:
+        result[..., i] = (value >> (chunk_width * i)) & (2**chunk_width - 1)
+
+    Chunks are stored in an additional last axis, least significant chunk first,
+    which is the representation expected by the other radix extensions.
+
+    Args:
+        value (Any):
+            unsigned integer or tensor of unsigned integers to decompose
+
+        chunk_width (int):
+            number of bits in each chunk
+
+        number_of_chunks (int):
+            number of chunks to decompose into
+
+    Returns:
+        np.ndarray:
+            chunks of `value` with shape `np.shape(value) + (number_of_chunks,)`
+    """
+
+    _check_chunking(chunk_width, number_of_chunks)
+
+    value = np.array(value, dtype=object)
+    if np.any(value < 0) or np.any(value >= 2 ** (chunk_width * number_of_chunks)):
+        message = (
+            f"radix_encode of values outside of [0, {2 ** (chunk_width * number_of_chunks)}) "
+            f"into {number_of_chunks} {chunk_width}-bit chunks is not supported"
+        )
+        raise ValueError(message)
+
+    mask = (2**chunk_width) - 1
+    chunks = [(value >> (chunk_width * i)) & mask for i in range(number_of_chunks)]
+    return np.stack(chunks, axis=-1).astype(np.int64)
+
+
+def radix_decode(chunks: Any, chunk_width: int) -> np.ndarray:
+    """
+    Compose unsigned integers from radix chunks.
+
+    Computes:
+        result = sum(chunks[..., i] << (chunk_width * i))
+
+    Args:
+        chunks (Any):
+            chunks to compose, least significant chunk first in the last axis
+
+        chunk_width (int):
+            number of bits in each chunk
+
+    Returns:
+        np.ndarray:
+            composed integers (with `object` dtype if they don't fit in 63 bits)
+    """
+
+    chunks = np.array(chunks, dtype=object)
+    _check_chunking(chunk_width, chunks.shape[-1] if chunks.ndim > 0 else 0)
+
+    result = sum(chunks[..., i] << (chunk_width * i) for i in range(chunks.shape[-1]))
+    result = np.array(result, dtype=object)
+
+    if chunk_width * chunks.shape[-1] <= 63:
+        result = result.astype(np.int64)
+
+    return result
+
+
+def radix_add(
+    x: Union[Tracer, Any],
+    y: Union[Tracer, Any],
+    chunk_width: int = 4,
+) -> Union[Tracer, Any]:
+    """
+    Add integers represented as radix chunks.
+
+    Computes:
+        radix_encode((radix_decode(x) + radix_decode(y)) % 2**(chunk_width * N))
+
+    Chunks are added without any table lookups, and then carries are propagated
+    using generate/propagate states and a prefix scan (i.e., carry-lookahead),
+    so the depth of the computation is logarithmic in the number of chunks,
+    and every table lookup is on values of `chunk_width + 1` bits.
+
+    Args:
+        x (Union[Tracer, Any]):
+            chunks of the lhs, least significant chunk first in the last axis
+
+        y (Union[Tracer, Any]):
+            chunks of the rhs, least significant chunk first in the last axis
+
+        chunk_width (int, default = 4):
+            number of bits in each chunk
+
+    Returns:
+        Union[Tracer, Any]:
+            Tracer that represent the operation during tracing
+            chunks of the sum otherwise
+    """
+
+    x, y = _check_operands(x, y, chunk_width, "radix_add")
+    return _propagate_carries(x + y, chunk_width)
+
+
+def radix_multiply(
+    x: Union[Tracer, Any],
+    y: Union[Tracer, Any],
+    chunk_width: int = 4,
+) -> Union[Tracer, Any]:
+    """
+    Multiply integers represented as radix chunks.
+
+    Computes:
+        radix_encode((radix_decode(x) * radix_decode(y)) % 2**(chunk_width * N))
+
+    Every chunk of `x` is multiplied with every chunk of `y` at once (i.e., schoolbook
+    multiplication), and the products are split into their low and high chunks.
+    Then, low and high chunks are summed into columns using clear matrix multiplications,
+    and columns are normalized by moving everything above a chunk to the next column,
+    until carries are small enough to be propagated like in `radix_add`.
+
+    Args:
+        x (Union[Tracer, Any]):
+            chunks of the lhs, least significant chunk first in the last axis
+
+        y (Union[Tracer, Any]):
+            chunks of the rhs, least significant chunk first in the last axis
+
+        chunk_width (int, default = 4):
+            number of bits in each chunk
+
+    Returns:
+        Union[Tracer, Any]:
+            Tracer that represent the operation during tracing
+            chunks of the product otherwise
+    """
+
+    x, y = _check_operands(x, y, chunk_width, "radix_multiply")
+
+    base = 2**chunk_width
+    number_of_chunks = x.shape[-1]
+
+    batch_shape = np.broadcast_shapes(x.shape[:-1], y.shape[:-1])
+    x = np.broadcast_to(x, batch_shape + (number_of_chunks,))
+    y = np.broadcast_to(y, batch_shape + (number_of_chunks,))
+
+    products = x.reshape(batch_shape + (number_of_chunks, 1)) * y.reshape(
+        batch_shape + (1, number_of_chunks)
+    )
+    products = products.reshape(batch_shape + (number_of_chunks * number_of_chunks,))
+
+    low_to_column = np.zeros((number_of_chunks * number_of_chunks, number_of_chunks), np.int64)
+    high_to_column = np.zeros((number_of_chunks * number_of_chunks, number_of_chunks), np.int64)
+    for i in range(number_of_chunks):
+        for j in range(number_of_chunks):
+            if i + j < number_of_chunks:
+                low_to_column[i * number_of_chunks + j, i + j] = 1
+            if i + j + 1 < number_of_chunks:
+                high_to_column[i * number_of_chunks + j, i + j + 1] = 1
+
+    low = products % base
+    high = products // base
+
+    columns = np.matmul(low, low_to_column) + np.matmul(high, high_to_column)
+    maximum = number_of_chunks * (base - 1) + (number_of_chunks - 1) * ((base - 1) ** 2 // base)
+
+    while maximum > 2 * (base - 1):
+        low = columns % base
+        high = columns // base
+
+        shifted_high = np.concatenate(
+            (_chunks(high, slice(None, 1)) * 0, _chunks(high, slice(None, -1))),
+            axis=-1,
+        )
+        columns = low + shifted_high
+
+        maximum = (base - 1) + (maximum // base)
+
+    return _propagate_carries(columns, chunk_width)
+
+
+def radix_less(
+    x: Union[Tracer, Any],
+    y: Union[Tracer, Any],
+    chunk_width: int = 4,
+) -> Union[Tracer, Any]:
+    """
+    Compare integers represented as radix chunks.
+
+    Computes:
+        radix_decode(x) < radix_decode(y)
+
+    Chunks are compared with a single table lookup each, and comparisons are reduced
+    pairwise with a log-depth tree, where more significant chunks take precedence
+    unless they are equal.
+
+    Args:
+        x (Union[Tracer, Any]):
+            chunks of the lhs, least significant chunk first in the last axis
+
+        y (Union[Tracer, Any]):
+            chunks of the rhs, least significant chunk first in the last axis
+
+        chunk_width (int, default = 4):
+            number of bits in each chunk
+
+    Returns:
+        Union[Tracer, Any]:
+            Tracer that represent the operation during tracing
+            result of the comparison otherwise
+    """
+
+    x, y = _check_operands(x, y, chunk_width, "radix_less")
+
+    states = univariate(
+        lambda difference: np.where(
+            difference < 0, _LESS, np.where(difference > 0, _GREATER, _EQUAL)
+        )
+    )(x - y)
+
+    while states.shape[-1] > 1:
+        size = states.shape[-1]
+        half = size // 2
+
+        combined = _combine(
+            _chunks(states, slice(1, 2 * half, 2)),
+            _chunks(states, slice(0, 2 * half, 2)),
+        )
+        if size % 2 == 1:
+            combined = np.concatenate((combined, _chunks(states, slice(-1, None))), axis=-1)
+
+        states = combined
+
+    return _chunks(states, 0) == _LESS
+
+
+def radix_equal(
+    x: Union[Tracer, Any],
+    y: Union[Tracer, Any],
+    chunk_width: int = 4,
+) -> Union[Tracer, Any]:
+    """
+    Check equality of integers represented as radix chunks.
+
+    Computes:
+        radix_decode(x) == radix_decode(y)
+
+    Args:
+        x (Union[Tracer, Any]):
+            chunks of the lhs, least significant chunk first in the last axis
+
+        y (Union[Tracer, Any]):
+            chunks of the rhs, least significant chunk first in the last axis
+
+        chunk_width (int, default = 4):
+            number of bits in each chunk
+
+    Returns:
+        Union[Tracer, Any]:
+            Tracer that represent the operation during tracing
+            result of the equality check otherwise
+    """
+
+    x, y = _check_operands(x, y, chunk_width, "radix_equal")
+    return np.sum(x != y, axis=-1) == 0
+
+
+def radix_tlu(
+    x: Union[Tracer, Any],
+    function: Callable[[int], int],
+    chunk_width: int = 4,
+    number_of_output_chunks: Optional[int] = None,
+) -> Union[Tracer, Any]:
+    """
+    Apply a univariate function to integers represented as radix chunks.
+
+    Computes:
+        radix_encode(function(radix_decode(x)), chunk_width, number_of_output_chunks)
+
+    Function is tabulated over the whole domain of `x`, and the table is reduced one chunk
+    at a time, least significant chunk first. Each chunk is turned into a one-hot selection
+    with a single batched equality. The first selection picks a candidate in every row of
+    the table with a clear matrix multiplication (i.e., without table lookups), and each of
+    the following ones picks among the remaining candidates like `gather` does for encrypted
+    tables, so every table lookup is on values of about `chunk_width` bits.
+
+    The number of candidates after the first chunk is `2**(chunk_width * (N - 1))` for each
+    output chunk, so it's only practical for integers of a few chunks (e.g., 8 to 12 bits).
+
+    Args:
+        x (Union[Tracer, Any]):
+            chunks of the input, least significant chunk first in the last axis
+
+        function (Callable[[int], int]):
+            function to apply, which must map every integer in [0, 2**(chunk_width * N))
+            to an integer in [0, 2**(chunk_width * number_of_output_chunks))
+
+        chunk_width (int, default = 4):
+            number of bits in each chunk
+
+        number_of_output_chunks (Optional[int], default = None):
+            number of chunks of the result (number of chunks of `x` if None)
+
+    Returns:
+        Union[Tracer, Any]:
+            Tracer that represent the operation during tracing
+            chunks of the result otherwise
+    """
+
+    x = _check_operand(x, chunk_width, "radix_tlu")
+
+    base = 2**chunk_width
+    number_of_chunks = x.shape[-1]
+    if number_of_output_chunks is None:
+        number_of_output_chunks = number_of_chunks
+    _check_chunking(chunk_width, number_of_output_chunks)
+
+    maximum = base**number_of_output_chunks
+    results = []
+    for value in range(base**number_of_chunks):
+        result = function(value)
+        if not isinstance(result, (int, np.integer)) or not 0 <= result < maximum:
+            message = (
+                f"radix_tlu of a function which returns {result} for {value} is not supported "
+                f"(results must be integers in [0, {maximum}))"
+            )
+            raise ValueError(message)
+        results.append(int(result))
+
+    # table[value, i] is chunk i of function(value)
+    table = radix_encode(results, chunk_width, number_of_output_chunks)
+
+    if not isinstance(x, Tracer):
+        return table[radix_decode(x, chunk_width)]
+
+    batch_shape = x.shape[:-1]
+
+    def selection(index: int) -> Tracer:
+        return np.arange(base) == _chunks(x, slice(index, index + 1))
+
+    # candidates[chunk 0, (higher chunks, output chunk)]
+    candidates = np.transpose(
+        table.reshape((base ** (number_of_chunks - 1), base, number_of_output_chunks)),
+        (1, 0, 2),
+    ).reshape((base, -1))
+    result = np.matmul(selection(0), candidates)
+
+    for index in range(1, number_of_chunks):
+        result = result.reshape(
+            batch_shape
+            + (base ** (number_of_chunks - 1 - index), base, number_of_output_chunks)
+        )
+        chunk_selection = selection(index).reshape(batch_shape + (1, base, 1))
+        result = np.sum(np.where(chunk_selection, result, 0), axis=-2)
+
+    return result.reshape(batch_shape + (number_of_output_chunks,))
+
+
+def _check_chunking(chunk_width: int, number_of_chunks: int):
+    if chunk_width < 1:
+        message = f"radix representation with {chunk_width}-bit chunks is not supported"
+        raise ValueError(message)
+
+    if number_of_chunks < 1:
+        message = f"radix representation with {number_of_chunks} chunks is not supported"
+        raise ValueError(message)
+
+
+def _check_operands(
+    x: Union[Tracer, Any],
+    y: Union[Tracer, Any],
+    chunk_width: int,
+    name: str,
+) -> Tuple[Union[Tracer, np.ndarray], Union[Tracer, np.ndarray]]:
+    x = _check_operand(x, chunk_width, name)
+    y = _check_operand(y, chunk_width, name)
+
+    if x.shape[-1] != y.shape[-1]:
+        message = (
+            f"{name} of radix values with different number of chunks "
+            f"({x.shape[-1]} and {y.shape[-1]}) is not supported"
+        )
+        raise ValueError(message)
+
+    return x, y
+
+
+def _check_operand(
+    x: Union[Tracer, Any],
+    chunk_width: int,
+    name: str,
+) -> Union[Tracer, np.ndarray]:
+    if not isinstance(x, Tracer):
+        x = np.array(x)
+
+    if x.ndim == 0:
+        message = f"{name} of scalars is not supported (radix values need an axis of chunks)"
+        raise ValueError(message)
+
+    _check_chunking(chunk_width, x.shape[-1])
+    return x
+
+
+def _chunks(x: Union[Tracer, np.ndarray], index: Union[int, slice]) -> Union[Tracer, Any]:
+    return x[(slice(None),) * (x.ndim - 1) + (index,)]
+
+
+def _combine(higher: Union[Tracer, Any], lower: Union[Tracer, Any]) -> Union[Tracer, Any]:
+    # more significant state wins, unless it defers to the less significant one
+    # (works for both carry states and comparison states, as `_PROPAGATE == _EQUAL == 0`)
+    function = lambda higher, lower: np.where(higher == 0, lower, higher)  # noqa: E731
+    if isinstance(higher, Tracer) and isinstance(lower, Tracer):
+        return multivariate(function)(higher, lower)
+    return function(higher, lower)
+
+
+def _propagate_carries(columns: Union[Tracer, Any], chunk_width: int) -> Union[Tracer, Any]:
+    # each column is in [0, 2 * (base - 1)], so carries are either 0 or 1
+
+    base = 2**chunk_width
+    if not isinstance(columns, Tracer):
+        columns = np.array(columns)
+
+    states = univariate(
+        lambda column: np.where(
+            column >= base,
+            _GENERATE,
+            np.where(column == base - 1, _PROPAGATE, _KILL),
+        )
+    )(columns)
+    incoming = scan(states, _combine, axis=-1, exclusive=True)
+
+    function = lambda column, incoming: (column + (incoming == _GENERATE)) % base  # noqa: E731
+    if isinstance(columns, Tracer):
+        return multivariate(function)(columns, incoming)
+    return function(columns, incoming)
@@ -29,11 +29,8 @@ def relu(x: Union[Tracer, Any]) -> Union[Tracer, Any]:
             result of ReLU on `x` otherwise
     """
 
-    def evaluator(x):
-        return np.where(x >= 0, x, 0)
-
     if not isinstance(x, Tracer):
-        return evaluator(x)
+        return _evaluate(x)
 
     resulting_value = deepcopy(x.output)
     if isinstance(resulting_value.dtype, Integer) and resulting_value.dtype.is_signed:
@@ -43,6 +40,10 @@ def relu(x: Union[Tracer, Any]) -> Union[Tracer, Any]:
         "relu",
         [deepcopy(x.output)],
         resulting_value,
-        evaluator,
+        _evaluate,
     )
     return Tracer(computation, [x])
+
+
+def _evaluate(x: Any) -> Any:
+    return np.where(x >= 0, x, 0)
@@ -248,26 +248,12 @@ def round_bit_pattern(
 
     assert isinstance(lsbs_to_remove, int)
 
-    def evaluator(
-        x: Union[int, np.integer, np.ndarray],
-        lsbs_to_remove: int,
-        overflow_protection: bool,  # pylint: disable=unused-argument
-        exactness: Optional[Exactness],  # pylint: disable=unused-argument
-    ) -> Union[int, np.integer, np.ndarray]:
-        if lsbs_to_remove == 0:
-            return x
-
-        unit = 1 << lsbs_to_remove
-        half = 1 << lsbs_to_remove - 1
-        rounded = (x + half) // unit
-        return rounded * unit
-
     if isinstance(x, Tracer):
         computation = Node.generic(
             "round_bit_pattern",
             [deepcopy(x.output)],
             deepcopy(x.output),
-            evaluator,
+            _evaluate,
             kwargs={
                 "lsbs_to_remove": lsbs_to_remove,
                 "overflow_protection": overflow_protection,
@@ -292,6 +278,21 @@ def round_bit_pattern(
         message = f"Expected input to be an int or a numpy array but it's {type(x).__name__}"
         raise TypeError(message)
 
-    return evaluator(x, lsbs_to_remove, overflow_protection, exactness)
+    return _evaluate(x, lsbs_to_remove, overflow_protection, exactness)
 
     # pylint: enable=protected-access,too-many-branches
+
+
+def _evaluate(
+    x: Union[int, np.integer, np.ndarray],
+    lsbs_to_remove: int,
+    overflow_protection: bool,  # pylint: disable=unused-argument
+    exactness: Optional[Exactness],  # pylint: disable=unused-argument
+) -> Union[int, np.integer, np.ndarray]:
+    if lsbs_to_remove == 0:
+        return x
+
+    unit = 1 << lsbs_to_remove
+    half = 1 << lsbs_to_remove - 1
+    rounded = (x + half) // unit
+    return rounded * unit
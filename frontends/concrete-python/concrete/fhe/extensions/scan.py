@@ -0,0 +1,131 @@
+"""
+Declaration of `scan` and `first_match` extensions.
+"""
+
+from typing import Any, Callable, Tuple, Union
+
+import numpy as np
+
+from ..tracing import Tracer
+
+
+def scan(
+    x: Union[Tracer, Any],
+    function: Callable[[Any, Any], Any] = np.add,
+    axis: int = 0,
+    exclusive: bool = False,
+) -> Union[Tracer, Any]:
+    """
+    Compute the prefix scan of a tensor along an axis, using a log-depth tree.
+
+    Computes:
+        result[0] = x[0]
+        result[i] = function(x[i], result[i - 1])
+
+    Instead of applying `function` sequentially, which creates a dependency chain of N
+    operations, partial results are combined pairwise in ceil(log2(N)) steps
+    (i.e., Hillis-Steele scan). So `function` must be associative, and each step applies
+    it to all the elements at once, which allows the runtime to evaluate them in parallel.
+
+    Examples:
+        scan(x, np.add) -> prefix sum of `x`, without any table lookups
+        scan(x, np.bitwise_or) -> prefix OR of `x`
+        scan(x, np.maximum) -> prefix maximum of `x`
+
+    Args:
+        x (Union[Tracer, Any]):
+            tensor to scan
+
+        function (Callable[[Any, Any], Any], default = np.add):
+            associative binary function to combine elements with
+
+        axis (int, default = 0):
+            axis to scan along
+
+        exclusive (bool, default = False):
+            whether to exclude the element itself from its result
+            (i.e., result[0] = 0 and result[i] = inclusive_result[i - 1])
+
+    Returns:
+        Union[Tracer, Any]:
+            Tracer that represent the operation during tracing
+            prefix scan of `x` otherwise
+    """
+
+    if not isinstance(x, Tracer):
+        x = np.array(x)
+
+    axis = _normalize_axis(x, axis, "scan")
+
+    size = x.shape[axis]
+    distance = 1
+    while distance < size:
+        x = np.concatenate(
+            (
+                x[_along(axis, None, distance)],
+                function(x[_along(axis, distance, None)], x[_along(axis, None, -distance)]),
+            ),
+            axis=axis,
+        )
+        distance *= 2
+
+    if exclusive:
+        x = np.concatenate(
+            (
+                x[_along(axis, None, 1)] * 0,
+                x[_along(axis, None, -1)],
+            ),
+            axis=axis,
+        )
+
+    return x
+
+
+def first_match(x: Union[Tracer, Any], axis: int = 0) -> Union[Tracer, Any]:
+    """
+    Select the first non-zero element of a tensor of 0s and 1s along an axis.
+
+    Computes:
+        result[i] = 1 if x[i] == 1 and all(x[j] == 0 for j < i) else 0
+
+    Elements seen before each position are computed using a prefix OR with `scan`,
+    and then a single table lookup per element combines it with the element itself.
+    So the depth of the computation is logarithmic in the size of the axis,
+    instead of the linear depth of a running `found` flag.
+
+    Args:
+        x (Union[Tracer, Any]):
+            tensor of 0s and 1s to select from
+
+        axis (int, default = 0):
+            axis to select along
+
+    Returns:
+        Union[Tracer, Any]:
+            Tracer that represent the operation during tracing
+            one-hot selection of the first match along `axis` (or all 0s if there are none)
+    """
+
+    if not isinstance(x, Tracer):
+        x = np.array(x)
+
+    axis = _normalize_axis(x, axis, "first_match")
+
+    seen = scan(x, np.bitwise_or, axis=axis, exclusive=True)
+    return (seen * 2 + x) == 1
+
+
+def _normalize_axis(x: Union[Tracer, np.ndarray], axis: int, name: str) -> int:
+    if x.ndim == 0:
+        message = f"{name} of a scalar is not supported"
+        raise ValueError(message)
+
+    if not -x.ndim <= axis < x.ndim:
+        message = f"{name} along axis {axis} of a {x.ndim}-dimensional tensor is not supported"
+        raise ValueError(message)
+
+    return axis + x.ndim if axis < 0 else axis
+
+
+def _along(axis: int, start: Any, stop: Any) -> Tuple[slice, ...]:
+    return (slice(None),) * axis + (slice(start, stop),)
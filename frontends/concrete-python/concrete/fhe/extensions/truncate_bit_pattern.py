@@ -220,18 +220,12 @@ def truncate_bit_pattern(
 
     assert isinstance(lsbs_to_remove, int)
 
-    def evaluator(
-        x: Union[int, np.integer, np.ndarray],
-        lsbs_to_remove: int,
-    ) -> Union[int, np.integer, np.ndarray]:
-        return (x >> lsbs_to_remove) << lsbs_to_remove
-
     if isinstance(x, Tracer):
         computation = Node.generic(
             "truncate_bit_pattern",
             [deepcopy(x.output)],
             deepcopy(x.output),
-            evaluator,
+            _evaluate,
             kwargs={"lsbs_to_remove": lsbs_to_remove},
         )
         return Tracer(computation, [x])
@@ -252,6 +246,13 @@ def truncate_bit_pattern(
         message = f"Expected input to be an int or a numpy array but it's {type(x).__name__}"
         raise TypeError(message)
 
-    return evaluator(x, lsbs_to_remove)
+    return _evaluate(x, lsbs_to_remove)
 
     # pylint: enable=protected-access,too-many-branches
+
+
+def _evaluate(
+    x: Union[int, np.integer, np.ndarray],
+    lsbs_to_remove: int,
+) -> Union[int, np.integer, np.ndarray]:
+    return (x >> lsbs_to_remove) << lsbs_to_remove
@@ -78,7 +78,7 @@ def univariate(
                 function.__name__,
                 [deepcopy(x.output)],
                 output_value,
-                lambda x: function(x),  # pylint: disable=unnecessary-lambda
+                function,
             )
             return Tracer(computation, [x])
 
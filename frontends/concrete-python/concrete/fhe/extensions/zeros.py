@@ -2,6 +2,7 @@
 Declaration of `zeros` and `zero` functions, to simplify creation of encrypted zeros.
 """
 
+from functools import partial
 from typing import Tuple, Union
 
 import numpy as np
@@ -36,7 +37,7 @@ def zeros(shape: Union[int, Tuple[int, ...]]) -> Union[np.ndarray, Tracer]:
             "zeros",
             [],
             ValueDescription.of(numpy_zeros, is_encrypted=True),
-            lambda: np.zeros(shape, dtype=np.int64),
+            partial(np.zeros, shape, dtype=np.int64),
         )
         return Tracer(computation, [])
 
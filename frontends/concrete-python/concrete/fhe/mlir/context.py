@@ -4,6 +4,7 @@ Declaration of `Context` class.
 
 # pylint: disable=import-error,no-name-in-module
 
+from collections import deque
 from random import randint
 from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
@@ -35,6 +36,7 @@ from ..compilation.configuration import (
     ComparisonStrategy,
     Configuration,
     Exactness,
+    MatmulStrategy,
     MinMaxStrategy,
 )
 from ..dtypes import Integer
@@ -43,7 +45,7 @@ from ..representation import Graph, GraphProcessor, Node
 from ..tfhers.dtypes import TFHERSIntegerType
 from ..values import ValueDescription
 from .conversion import Conversion, ConversionType
-from .utils import MAXIMUM_TLU_BIT_WIDTH, Comparison, _FromElementsOp
+from .utils import MAXIMUM_TLU_BIT_WIDTH, Comparison, _FromElementsOp, is_zero_constant
 
 # pylint: enable=import-error,no-name-in-module
 
@@ -1822,6 +1824,80 @@ class Context:
 
         return result
 
+    def matmul_with_shared_squares(
+        self,
+        resulting_type: ConversionType,
+        x: Conversion,
+        y: Conversion,
+    ) -> Conversion:
+        """
+        Calculate encrypted matrix multiplication using shared squares.
+
+        Idea:
+            2 * x[i, k] * y[k, j] = (x[i, k] + y[k, j])^2 - x[i, k]^2 - y[k, j]^2
+            2 * (x @ y)[i, j] = sum_k (x[i, k] + y[k, j])^2 - sum_k x[i, k]^2 - sum_k y[k, j]^2
+
+            where squares of the operands are computed once and shared by every product
+
+        Notes:
+            - squares are computed with one more bit than the result,
+              which is enough to compute 2 * (x @ y) modulo the message space
+            - 2 * (x @ y) is even, so reinterpreting it with one less bit divides it by 2 exactly
+        """
+
+        assert x.is_encrypted and y.is_encrypted
+        assert len(x.shape) == 2 and len(y.shape) == 2
+
+        m, k = x.shape
+        n = y.shape[1]
+
+        if x.is_signed or y.is_signed:
+            x = self.to_signed(x)
+            y = self.to_signed(y)
+
+        intermediate_bit_width = resulting_type.bit_width + 1
+        intermediate_scalar_type = self.eint(intermediate_bit_width)
+
+        def squares(on: Conversion, shape: Tuple[int, ...]) -> Conversion:
+            dtype = Integer(is_signed=on.is_signed, bit_width=on.bit_width)
+
+            values = list(range(dtype.max() + 1))
+            if on.is_signed:
+                values += list(range(dtype.min(), 0))
+
+            table = [(value**2) % (2**intermediate_bit_width) for value in values]
+            return self.tlu(self.tensor(intermediate_scalar_type, shape), on, table)
+
+        sums = self.add(
+            self.tensor(self.element_typeof(x), shape=(m, k, n)),
+            self.reshape(x, shape=(m, k, 1)),
+            self.reshape(y, shape=(1, k, n)),
+        )
+
+        squares_of_sums = self.sum(
+            self.tensor(intermediate_scalar_type, shape=(m, n)),
+            squares(sums, (m, k, n)),
+            axes=1,
+        )
+        squares_of_x = self.reshape(
+            self.sum(self.tensor(intermediate_scalar_type, shape=(m,)), squares(x, (m, k)), axes=1),
+            shape=(m, 1),
+        )
+        squares_of_y = self.reshape(
+            self.sum(self.tensor(intermediate_scalar_type, shape=(n,)), squares(y, (k, n)), axes=0),
+            shape=(1, n),
+        )
+
+        intermediate_type = self.tensor(intermediate_scalar_type, shape=(m, n))
+        doubled_result = self.sub(intermediate_type, squares_of_sums, squares_of_x)
+        doubled_result = self.sub(intermediate_type, doubled_result, squares_of_y)
+
+        return self.reinterpret(
+            doubled_result,
+            bit_width=resulting_type.bit_width,
+            signed=resulting_type.is_signed,
+        )
+
     def cast_to_original_bit_width(self, value: Conversion) -> Conversion:
         """
         Cast a value to its original bit width using multiplication and reinterpretation.
@@ -2662,6 +2738,22 @@ class Context:
         else:
             assert self.is_bit_width_compatible(resulting_type, x, y)
 
+        if (
+            x.is_encrypted
+            and y.is_encrypted
+            and self.configuration.matmul_strategy == MatmulStrategy.SHARED_SQUARES
+            and len(x.shape) == 2
+            and len(y.shape) == 2
+            and resulting_type.bit_width < MAXIMUM_TLU_BIT_WIDTH
+        ):
+            m, k = x.shape
+            n = y.shape[1]
+
+            # pairwise lowering uses 2 tlus per product
+            # shared squares lowering uses 1 tlu per product and 1 tlu per operand element
+            if (m * k) + (k * n) < (m * k * n):
+                return self.matmul_with_shared_squares(resulting_type, x, y)
+
         if resulting_type.shape == ():
             if x.is_clear:
                 x, y = y, x
@@ -3892,9 +3984,14 @@ class Context:
         resulting_element_type = (self.eint if resulting_type.is_unsigned else self.esint)(
             resulting_type.bit_width
         )
-        while len(xs) > 1:
-            a = xs.pop()
-            b = xs.pop()
+
+        # operands are added pairwise from the back of the queue and results are queued at the front
+        # so every level of the tree is consumed before the next one, which keeps the depth at
+        # ceil(log2(len(xs))) even when the number of operands is not a power of two
+        queue = deque(xs)
+        while len(queue) > 1:
+            a = queue.pop()
+            b = queue.pop()
 
             intermediate_type = self.tensor(
                 resulting_element_type,
@@ -3902,9 +3999,9 @@ class Context:
             )
 
             result = self.add(intermediate_type, a, b)
-            xs.insert(0, result)
+            queue.appendleft(result)
 
-        return xs[0]
+        return queue[0]
 
     def truncate_bit_pattern(self, x: Conversion, lsbs_to_remove: int) -> Conversion:
         if x.is_clear:
@@ -3958,14 +4055,19 @@ class Context:
             }
             self.error(highlights)
 
-        if when_true.is_clear:
+        # outcomes which are clear zero constants don't contribute to the result
+        # so e.g., np.where(condition, x, 0) is a single multiplication with boolean
+
+        when_true_is_zero = when_true.is_clear and is_zero_constant(when_true.origin)
+        if when_true.is_clear and not when_true_is_zero:
             highlights = {
                 when_true.origin: "outcome of true condition is not encrypted",
                 self.converting: "but it needs to be for where operation",
             }
             self.error(highlights)
 
-        if when_false.is_clear:
+        when_false_is_zero = when_false.is_clear and is_zero_constant(when_false.origin)
+        if when_false.is_clear and not when_false_is_zero:
             highlights = {
                 when_false.origin: "outcome of false condition is not encrypted",
                 self.converting: "but it needs to be for where operation",
@@ -3979,28 +4081,69 @@ class Context:
             }
             self.error(highlights)
 
+        chunk_size = self.configuration.if_then_else_chunk_size
+
+        if when_true_is_zero != when_false_is_zero:
+            outcome = when_false if when_true_is_zero else when_true
+            if outcome.original_bit_width <= chunk_size:
+                # outcome fits in a single chunk, so instead of extracting the chunk
+                # a single table lookup is applied on the outcome and the condition packed
+
+                outcome_dtype = Integer(
+                    is_signed=outcome.is_signed,
+                    bit_width=outcome.original_bit_width,
+                )
+                outcome_values = range(outcome_dtype.min(), outcome_dtype.max() + 1)
+                selected_condition = 0 if when_true_is_zero else 1
+
+                table = [
+                    (value if condition_value == selected_condition else 0)
+                    for condition_value in [0, 1]
+                    for value in outcome_values
+                ]
+                selected_type = self.tensor(
+                    (
+                        self.esint(resulting_type.bit_width)
+                        if resulting_type.is_signed
+                        else self.eint(resulting_type.bit_width)
+                    ),
+                    shape=np.broadcast_shapes(outcome.shape, condition.shape),
+                )
+                selected = self.multivariate_tlu(selected_type, [outcome, condition], table)
+
+                if selected.shape != resulting_type.shape:
+                    selected = self.broadcast_to(selected, resulting_type.shape)
+                return selected
+
         if condition.bit_width != 1:
             shifter = self.constant(self.i(condition.bit_width + 1), 2 ** (condition.bit_width - 1))
             condition = self.reinterpret(self.mul(condition.type, condition, shifter), bit_width=1)
 
-        chunk_size = self.configuration.if_then_else_chunk_size
+        contributions = [
+            self.multiplication_with_boolean(
+                condition,
+                outcome,
+                resulting_bit_width=resulting_type.bit_width,
+                chunk_size=chunk_size,
+                inverted=inverted,
+            )
+            for outcome, inverted, is_zero in [
+                (when_true, False, when_true_is_zero),
+                (when_false, True, when_false_is_zero),
+            ]
+            if not is_zero
+        ]
 
-        when_true_contribution = self.multiplication_with_boolean(
-            condition,
-            when_true,
-            resulting_bit_width=resulting_type.bit_width,
-            chunk_size=chunk_size,
-            inverted=False,
-        )
-        when_false_contribution = self.multiplication_with_boolean(
-            condition,
-            when_false,
-            resulting_bit_width=resulting_type.bit_width,
-            chunk_size=chunk_size,
-            inverted=True,
-        )
+        if len(contributions) == 0:
+            return self.zeros(resulting_type)
+
+        if len(contributions) == 1:
+            result = self.to_signedness(contributions[0], of=resulting_type)
+            if result.shape != resulting_type.shape:
+                result = self.broadcast_to(result, resulting_type.shape)
+            return result
 
-        return self.add(resulting_type, when_true_contribution, when_false_contribution)
+        return self.add(resulting_type, *contributions)
 
     def zeros(self, resulting_type: ConversionType) -> Conversion:
         assert resulting_type.is_encrypted
@@ -4,9 +4,10 @@ Declaration of `Converter` class.
 
 # pylint: disable=import-error,no-name-in-module
 
+import hashlib
 import math
 import sys
-from typing import Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import concrete.lang
 import concrete.lang.dialects.tracing
@@ -67,6 +68,27 @@ class Converter:
                 In-memory MLIR module corresponding to the graph
         """
         self.process(graphs)
+        return self.convert_many_processed(graphs, mlir_context)
+
+    def convert_many_processed(
+        self,
+        graphs: Dict[str, Graph],
+        mlir_context: MlirContext,
+    ) -> MlirModule:
+        """
+        Convert multiple computation graphs, which are already processed, to an MLIR module.
+
+        Args:
+            graphs (Dict[str, Graph]):
+                processed graphs to convert
+
+            mlir_context (MlirContext):
+                MLIR Context to use for module generation
+
+        Return:
+            MlirModule:
+                In-memory MLIR module corresponding to the graph
+        """
 
         with mlir_context as context, MlirLocation.unknown():
             concrete.lang.register_dialects(context)  # pylint: disable=no-member
@@ -263,6 +285,7 @@ class Converter:
                     shifts_with_promotion=configuration.shifts_with_promotion,
                     multivariate_strategy_preference=configuration.multivariate_strategy_preference,
                     min_max_strategy_preference=configuration.min_max_strategy_preference,
+                    if_then_else_chunk_size=configuration.if_then_else_chunk_size,
                 ),
                 ProcessRounding(
                     rounding_exactness=configuration.rounding_exactness,
@@ -282,6 +305,84 @@ class Converter:
                 for graph in graphs.values():
                     processor.apply(graph)
 
+    def fingerprint(self, graph: Graph) -> str:
+        """
+        Compute the fingerprint of a processed computation graph.
+
+        Fingerprint covers everything MLIR conversion depends on (e.g., operations, properties,
+        assigned bit widths, contents of table lookups), but not the measured bounds themselves,
+        so processed graphs with the same fingerprint are converted to the same MLIR.
+
+        Args:
+            graph (Graph):
+                processed graph to fingerprint
+
+        Returns:
+            str:
+                hexadecimal digest of the graph
+        """
+
+        digest = hashlib.sha256()
+
+        def update(value: Any):
+            if isinstance(value, np.ndarray):
+                digest.update(f"array({value.dtype}, {value.shape})".encode())
+                digest.update(np.ascontiguousarray(value).tobytes())
+            elif isinstance(value, dict):
+                digest.update(b"{")
+                for key in sorted(value.keys(), key=str):
+                    update(key)
+                    update(value[key])
+                digest.update(b"}")
+            elif isinstance(value, (list, tuple)):
+                digest.update(b"[")
+                for element in value:
+                    update(element)
+                digest.update(b"]")
+            else:
+                digest.update(repr(value).encode())
+            digest.update(b";")
+
+        ordered_nodes = list(nx.lexicographical_topological_sort(graph.graph))
+        indices = {node: index for index, node in enumerate(ordered_nodes)}
+
+        update((graph.name, graph.location, graph.is_direct))
+        update([indices[node] for node in graph.ordered_inputs()])
+        update([indices[node] for node in graph.ordered_outputs()])
+
+        for node in ordered_nodes:
+            preds = graph.ordered_preds_of(node)
+            update(
+                (
+                    node.operation.value,
+                    str(node.output),
+                    [str(value) for value in node.inputs],
+                    [indices[pred] for pred in preds],
+                    node.location,
+                    node.tag,
+                    node.properties,
+                )
+            )
+
+            # tables of the other nodes are fully determined by their name and bit widths
+            if node.operation != Operation.Generic or hasattr(self, node.properties["name"]):
+                continue
+
+            variable_inputs = [pred for pred in preds if pred.operation != Operation.Constant]
+            if (
+                len(variable_inputs) == 0
+                or sum(pred.properties["original_bit_width"] for pred in variable_inputs)
+                > MAXIMUM_TLU_BIT_WIDTH
+                or max(pred.output.dtype.bit_width for pred in variable_inputs)
+                > MAXIMUM_TLU_BIT_WIDTH
+            ):
+                # conversion will fail for this node, so there is no point in constructing tables
+                continue
+
+            update(construct_deduplicated_tables(node, preds, self.configuration))
+
+        return digest.hexdigest()
+
     def node(self, ctx: Context, node: Node, preds: List[Conversion]) -> Conversion:
         """
         Convert a computation graph node into MLIR.
@@ -31,6 +31,11 @@ def check_out_of_bounds_in_runtime(
     """
     Add out of bounds checks in runtime.
 
+    Indexing elements are compared with the dimension size using a single unsigned comparison,
+    as negative indices become larger than any valid index when they are seen as unsigned.
+    Tensors of indexing elements are flattened and reduced into a single flag with a single loop,
+    so there is only one branch emitting the warning, regardless of the shape of the tensor.
+
     Args:
         ctx (Context):
             conversion context
@@ -57,6 +62,45 @@ def check_out_of_bounds_in_runtime(
             indexing_element.result,
         )
 
+    def is_out_of_bounds(element: Conversion) -> Conversion:
+        return ctx.operation(
+            arith.CmpIOp,
+            ctx.i(1),
+            ctx.attribute(ctx.i(64), 9),  # unsigned greater than or equal
+            element.result,
+            dimension_size_variable.result,
+            use_cache=False,
+        )
+
+    if indexing_element.is_scalar:
+        out_of_bounds = is_out_of_bounds(indexing_element)
+    else:
+        number_of_elements = int(np.prod(indexing_element.shape))
+        flattened_indexing_element = ctx.reshape(indexing_element, (number_of_elements,))
+
+        def body(i: Conversion, any_out_of_bounds: Conversion) -> Conversion:
+            element = ctx.operation(
+                tensor.ExtractOp,
+                ctx.element_typeof(flattened_indexing_element),
+                flattened_indexing_element.result,
+                (i.result,),
+                use_cache=False,
+            )
+            return ctx.operation(
+                arith.OrIOp,
+                ctx.i(1),
+                any_out_of_bounds.result,
+                is_out_of_bounds(element).result,
+                use_cache=False,
+            )
+
+        out_of_bounds = ctx.for_loop(  # type: ignore
+            0,
+            number_of_elements,
+            body,
+            output=ctx.constant(ctx.i(1), 0),
+        )
+
     def warn_out_of_memory_access():
         pred_ids = [pred.properties["id"] for pred in ctx.graph.ordered_preds_of(ctx.converting)]
         operation_string = ctx.converting.format(pred_ids)
@@ -67,63 +111,7 @@ def check_out_of_bounds_in_runtime(
             )
         )
 
-    if indexing_element.is_scalar:
-        indexing_element_too_large_condition = ctx.operation(
-            arith.CmpIOp,
-            ctx.i(1),
-            ctx.attribute(ctx.i(64), 5),  # signed greater than or equal
-            indexing_element.result,
-            dimension_size_variable.result,
-        )
-        ctx.conditional(
-            None,
-            indexing_element_too_large_condition,
-            warn_out_of_memory_access,
-        )
-
-        indexing_element_too_small_condition = ctx.operation(
-            arith.CmpIOp,
-            ctx.i(1),
-            ctx.attribute(ctx.i(64), 2),  # signed less than
-            indexing_element.result,
-            ctx.constant(indexing_element.type, 0).result,
-        )
-        ctx.conditional(
-            None,
-            indexing_element_too_small_condition,
-            warn_out_of_memory_access,
-        )
-
-    else:
-
-        def create_for_body(indexing_element_shape, indices):
-            remaining_shape = indexing_element_shape[1:]
-
-            def body(i):
-                new_indices = indices + (i,)
-                if remaining_shape != ():
-                    ctx.for_loop(
-                        0,
-                        remaining_shape[0],
-                        create_for_body(remaining_shape, new_indices),
-                    )
-                    return
-
-                element = indexing(
-                    ctx,
-                    ctx.element_typeof(indexing_element),
-                    indexing_element,
-                    new_indices,
-                )
-                check_out_of_bounds_in_runtime(ctx, element, dimension_size)
-
-            return body
-
-        ctx.for_loop(
-            0,
-            indexing_element.shape[0],
-            create_for_body(indexing_element.shape, ()),
-        )
+    ctx.conditional(None, out_of_bounds, warn_out_of_memory_access)
 
 
 def process_indexing_element(
@@ -266,11 +254,6 @@ def process_indexing_element(
                         lambda: index,
                     )
                     assert sanitized_index is not None
-
-                    if check_out_of_bounds:
-                        check_out_of_bounds_in_runtime(ctx, sanitized_index, dimension_size)
-
-                    assert sanitized_index is not None
                     ctx.operation(
                         tensor.YieldOp,
                         element_type,
@@ -283,6 +266,9 @@ def process_indexing_element(
                     sanitized_indexing_element.result,
                 )
 
+                if check_out_of_bounds:
+                    check_out_of_bounds_in_runtime(ctx, indexing_element, dimension_size)
+
         elif check_out_of_bounds:
             check_out_of_bounds_in_runtime(ctx, indexing_element, dimension_size)
 
@@ -2,8 +2,7 @@
 Conversion of min and max operations.
 """
 
-from copy import deepcopy
-from typing import Sequence, Set, Tuple, Union
+from typing import Sequence, Union
 
 import numpy as np
 
@@ -85,241 +84,65 @@ def min_max(
             axes[i] += input_dimensions
         assert 0 <= axes[i] < input_dimensions
 
-    # if all axes are reduced
-    if len(axes) == 0 or len(axes) == len(x.shape):
-        # we flatten the input to use the `reduce` implementation
-        x = ctx.flatten(x)
-
-    # if the input is a vector
-    if len(x.shape) == 1:
-        # we reduce the vector to its min/max value
-        result = reduce(ctx, ctx.element_typeof(resulting_type), x, operation=operation)
-
-        # if the user wants to keep the reduced dimensions
-        if keep_dims:
-            # reshape the result into the resulting shape
-            result = ctx.reshape(result, shape=resulting_type.shape)
-
-        # return the result
-        return result
-
-    # if the reduce implementation is not used
-    # mock implementation will be used instead
-    #
-    # the idea is to let numpy compute the indices that will be compared to obtain the result
-    #
-    # for example, if input.shape == (2, 3) and axis == 1
-    # we'll be computing
-    # [
-    #     [
-    #         {(0, 2, 0), (0, 0, 0), (0, 3, 0), (0, 1, 0)}
-    #         {(0, 2, 1), (0, 0, 1), (0, 3, 1), (0, 1, 1)}
-    #         {(0, 1, 2), (0, 2, 2), (0, 3, 2), (0, 0, 2)}
-    #     ]
-    #     [
-    #         {(1, 0, 0), (1, 3, 0), (1, 1, 0), (1, 2, 0)}
-    #         {(1, 2, 1), (1, 0, 1), (1, 1, 1), (1, 3, 1)}
-    #         {(1, 3, 2), (1, 2, 2), (1, 0, 2), (1, 1, 2)}
-    #     ]
-    # ]
-    #
-    # this means to compute output[0, 0] we need to compare
-    # - input[0, 2, 0]
-    # - input[0, 0, 0]
-    # - input[0, 3, 0]
-    # - input[0, 1, 0]
-    #
-    # or to compute output[1, 2] we need to compare
-    # - input[1, 3, 2]
-    # - input[1, 2, 2]
-    # - input[1, 0, 2]
-    # - input[1, 1, 2]
-    #
-    # notice that number of comparisons (say n) are always the same in each output cell
-    # this opens up the possibility to use fancy indexing to extract n slices from the input
-    # and compare the slices in a tree-like fashion to obtain the result
-    #
-    # in the end, we'll be performing
-    #
-    # slice1 = [
-    #     [input[0, 2, 0], input[0, 2, 1], input[0, 1, 2]],
-    #     [input[1, 0, 0], input[1, 2, 1], input[1, 3, 2]],
-    # ]
-    # slice2 = [
-    #     [input[0, 0, 0], input[0, 0, 1], input[0, 2, 2]],
-    #     [input[1, 3, 0], input[1, 0, 1], input[1, 2, 2]],
-    # ]
-    # slice3 = [
-    #     [input[0, 3, 0], input[0, 3, 1], input[0, 3, 2]],
-    #     [input[1, 1, 0], input[1, 1, 1], input[1, 0, 2]],
-    # ]
-    # slice4 = [
-    #     [input[0, 1, 0], input[0, 1, 1], input[0, 0, 2]],
-    #     [input[1, 2, 0], input[1, 3, 1], input[1, 1, 2]],
-    # ]
-    #
-    # minimum_slice1_slice2 = np.minimum(slice1, slice2)
-    # minimum_slice3_slice4 = np.minimum(slice3, slice4)
-    #
-    # result = np.minimum(minimum_slice1_slice2, minimum_slice3_slice4)
-    #
-    # notice that all slices have the same shape as the result
-
-    class Mock:
-        """
-        Class to track accumulation of the operation.
-        """
-
-        # list of indices that have been accumulated
-        indices: Set[Tuple[int, ...]]
-
-        # initialize the mock with a starting index
-        def __init__(self, index: Tuple[int, ...]):
-            self.indices = {index}
-
-        # get the representation of the mock
-        def __repr__(self) -> str:
-            return f"{self.indices}"  # pragma: no cover
+    # empty list means reduce all axes
+    if len(axes) == 0:
+        axes = list(range(input_dimensions))
+    axes.sort()
+
+    # compute the axes that will stay in the result
+    kept_axes = [axis for axis in range(input_dimensions) if axis not in axes]
+
+    # if reduced axes are not the last axes of the input
+    if kept_axes + axes != list(range(input_dimensions)):
+        # we move them to the end using a transpose
+        #
+        # e.g., if input.shape == (2, 3, 4) and axes == (0, 2)
+        # input is transposed to (3, 2, 4)
+
+        permutation = kept_axes + axes
+        transposed_shape = tuple(x.shape[axis] for axis in permutation)
+
+        x = ctx.transpose(
+            ctx.tensor(ctx.element_typeof(x), shape=transposed_shape),
+            x,
+            axes=permutation,
+        )
 
-        # combine the indices of the mock with another mock into a new mock
-        def combine(self, other: "Mock") -> "Mock":
-            result = deepcopy(self)
-            for index in other.indices:
-                result.indices.add(index)
-            return result
+    # compute the shape of the result without the reduced dimensions
+    kept_shape = x.shape[: len(kept_axes)]
 
-    # create the mock input
-    #
-    # [[[{(0, 0, 0)} {(0, 0, 1)} {(0, 0, 2)}]
-    #   [{(0, 1, 0)} {(0, 1, 1)} {(0, 1, 2)}]
-    #   [{(0, 2, 0)} {(0, 2, 1)} {(0, 2, 2)}]
-    #   [{(0, 3, 0)} {(0, 3, 1)} {(0, 3, 2)}]]
-    #
-    #  [[{(1, 0, 0)} {(1, 0, 1)} {(1, 0, 2)}]
-    #   [{(1, 1, 0)} {(1, 1, 1)} {(1, 1, 2)}]
-    #   [{(1, 2, 0)} {(1, 2, 1)} {(1, 2, 2)}]
-    #   [{(1, 3, 0)} {(1, 3, 1)} {(1, 3, 2)}]]]
+    # if more than one axis is reduced
+    if len(axes) > 1:
+        # we collapse reduced axes into a single last axis
+        #
+        # e.g., (3, 2, 4) is collapsed to (3, 8)
+        # so the whole reduction can be done using a single balanced tree
+        # instead of one tree per axis (which would be deeper for odd sizes)
 
-    mock_input = []
-    for index in np.ndindex(x.shape):
-        mock_input.append(Mock(index))
-    mock_input = np.array(mock_input).reshape(x.shape)
+        number_of_reduced_values = int(np.prod(x.shape[len(kept_axes) :]))
+        x = ctx.reshape(x, shape=(*kept_shape, number_of_reduced_values))
 
-    # use numpy reduction to compute the mock output
-    #
-    # [[{(0, 2, 0), (0, 0, 0), (0, 3, 0), (0, 1, 0)}
-    #   {(0, 2, 1), (0, 0, 1), (0, 3, 1), (0, 1, 1)}
-    #   {(0, 1, 2), (0, 2, 2), (0, 3, 2), (0, 0, 2)}]
-    #  [{(1, 0, 0), (1, 3, 0), (1, 1, 0), (1, 2, 0)}
-    #   {(1, 2, 1), (1, 0, 1), (1, 1, 1), (1, 3, 1)}
-    #   {(1, 3, 2), (1, 2, 2), (1, 0, 2), (1, 1, 2)}]]
-
-    mock_output = np.frompyfunc(lambda mock1, mock2: mock1.combine(mock2), 2, 1).reduce(
-        mock_input,
-        axis=tuple(axes),
-        keepdims=keep_dims,
-    )
+    # we reduce the last axis to its min/max values
+    result = reduce(ctx, ctx.element_typeof(resulting_type), x, operation=operation)
 
-    # extract a sample mock from the mock output
-    sample_mock = mock_output.flat[0]
-
-    # extract the indices of the sample mock
-    sample_mock_indices = sample_mock.indices
-
-    # compute number of comparisons
-    number_of_comparisons = len(sample_mock_indices)
-
-    # extract a sample index from the sample mock indices
-    sample_mock_index = next(iter(sample_mock_indices))
-
-    # compute the number of indices
-    number_of_indices = len(sample_mock_index)
-
-    # compute the shape of fancy indexing indices
-    index_shape = resulting_type.shape
-
-    # compute the fancy indices to extract for comparison
-    to_compare = []
-    for _ in range(number_of_comparisons):
-        indices = []
-        for _ in range(number_of_indices):
-            index = np.zeros(index_shape, dtype=np.int64)  # type: ignore
-            indices.append(index)
-        to_compare.append(tuple(indices))
-    for position in np.ndindex(mock_output.shape):
-        mock_indices = list(mock_output[position].indices)
-        for i in range(number_of_comparisons):
-            for j in range(number_of_indices):
-                to_compare[i][j][position] = mock_indices[i][j]  # type: ignore
-
-    # to_compare will look like
-    # [
-    #     # for the first slice
-    #     (
-    #         [[0, 0, 0], [1, 1, 1]],  # i
-    #         [[2, 2, 1], [0, 2, 3]],  # j
-    #         [[0, 1, 2], [0, 1, 2]],  # k
-    #     ),
-    #     # for the second slice
-    #     (
-    #         [[0, 0, 0], [1, 1, 1]],  # i
-    #         [[0, 0, 2], [3, 0, 2]],  # j
-    #         [[0, 1, 2], [0, 1, 2]],  # k
-    #     ),
-    #     # for the third slice
-    #     (
-    #         [[0, 0, 0], [1, 1, 1]],  # i
-    #         [[3, 3, 3], [1, 1, 0]],  # j
-    #         [[0, 1, 2], [0, 1, 2]],  # k
-    #     ),
-    #     # for the fourth slice
-    #     (
-    #         [[0, 0, 0], [1, 1, 1]],  # i
-    #         [[1, 1, 0], [2, 3, 1]],  # j
-    #         [[0, 1, 2], [0, 1, 2]],  # k
-    #     ),
-    # ]
-
-    # find the type of the slices
-    slices_type = ctx.tensor(ctx.element_typeof(x), shape=resulting_type.shape)
-
-    # extract the slices
-    slices = []
-    for index in to_compare:
-        slices.append(ctx.index(slices_type, x, index))  # type: ignore
-
-    # while there are more than 1 slices
-    while len(slices) > 1:
-        # pop the last two slices
-        a = slices.pop()
-        b = slices.pop()
-
-        # compare the last two slices
-        if operation == "min":
-            c = ctx.minimum(resulting_type, a, b)
-        else:
-            c = ctx.maximum(resulting_type, a, b)
-
-        # we need to set the original bit width manually
-        # as minimum/maximum doesn't constraint their output bit width.
-        c.set_original_bit_width(x.original_bit_width)
-
-        # insert the slice back at the beginning of the slice queue
-        slices.insert(0, c)
+    # if the user wants to keep the reduced dimensions
+    if keep_dims:
+        # reshape the result into the resulting shape
+        result = ctx.reshape(result, shape=resulting_type.shape)
 
     # return the result
-    return slices[0]
+    return result
 
 
 def reduce(
     ctx: Context,
-    resulting_type: ConversionType,
+    resulting_element_type: ConversionType,
     values: Conversion,
     *,
     operation: str,
 ) -> Conversion:
     """
-    Reduce a vector of values to its min/max value.
+    Reduce the last axis of a tensor of values to its min/max values.
     """
 
     # make sure the operation is valid
@@ -327,102 +150,114 @@ def reduce(
 
     # make sure the value is valid
     assert values.is_tensor
-    assert len(values.shape) == 1
     assert values.is_encrypted
 
     # make sure the resulting type is valid
-    assert resulting_type.is_scalar
-    assert resulting_type.is_encrypted
+    assert resulting_element_type.is_scalar
+    assert resulting_element_type.is_encrypted
 
     # let's say the vector was [1, 4, 2, 3, 0]
     # and we're computing np.min(vector)
 
-    # find the element type of the vector = fhe.uint3
+    # find the element type of the values = fhe.uint3
     values_element_type = ctx.element_typeof(values)
 
-    # find the middle of the vector = 2
-    middle = values.shape[0] // 2
-
-    # we'll be splitting the array into two halves
-    # [1, 4] and [2, 3] in our case
-    # then we'll compute np.minimum(first_half, second_half)
-    # [1, 3] in our case
-    # if the reduction is a scalar, we'll return it
-    # otherwise, we'll reduce recursively until we obtain a scalar
-    # 1 in our case
-
-    # find the half type of the vector which is
-    # fhe.tensor[fhe.uint3, 2] in the first iteration
-    # fhe.uint3 in the last iteration
-    half_type = (
-        ctx.tensor(values_element_type, shape=(middle,)) if middle != 1 else values_element_type
-    )
+    # find the shape of the result, which is the shape of the values without the last axis
+    kept_shape = values.shape[:-1]
 
-    # find the accumulated type of the vector which is
-    # fhe.tensor[fhe.uint3, 2] in the first iteration
-    # fhe.uint3 in the last iteration
-    accumulated_type = (
-        ctx.tensor(resulting_type, shape=(middle,)) if middle != 1 else resulting_type
-    )
+    # we'll be using full slices for the kept axes while indexing the last axis
+    kept_index = [slice(None, None, None)] * len(kept_shape)
 
-    # if there is only one element in each half (e.g., vector = [1, 3], halfs = [1], [3])
-    if middle == 1:
-        # extract the first element in the vector
-        first_half = ctx.index(half_type, values, index=[0])
-        # extract the second element in the vector
-        second_half = ctx.index(half_type, values, index=[1])
-    else:
-        # extract the elements from 0 to middle as the first half
-        first_half = ctx.index(half_type, values, index=[slice(0, middle)])
-        # extract the elements from middle to 2*middle as the second half
-        second_half = ctx.index(half_type, values, index=[slice(middle, 2 * middle)])
-
-    # compare halfs
-    if operation == "min":
-        # [1, 3] in the first iteration
-        # 1 in the last iteration
-        reduced = ctx.minimum(accumulated_type, first_half, second_half)
-    else:
-        reduced = ctx.maximum(accumulated_type, first_half, second_half)
-
-    # set the original bit width of the reduced so the following operation work as intended
-    # this is required here since ctx.minimum and ctx.maximum does not constraint output bit width
-    reduced.set_original_bit_width(values.original_bit_width)
+    # while there are more than 2 values in the last axis
+    while values.shape[-1] > 2:
+        # find the number of values in the last axis = 5
+        size = values.shape[-1]
 
-    result = (
-        # if reduced value is a scalar, we end the recursion
-        reduced
-        if reduced.is_scalar
-        # otherwise, we reduce the result of comparison of halfs
-        else reduce(ctx, resulting_type, reduced, operation=operation)
-    )
+        # find the number of pairs = 2
+        pairs = size // 2
+
+        # we'll be splitting the array into two halves and a leftover
+        # [1, 4], [2, 3] and [0] in our case
+        # then we'll compute np.minimum(first_half, second_half)
+        # [1, 3] in our case
+        #
+        # when size is odd, the unpaired element is carried to the next level
+        # by appending it to the result of the comparison, [1, 3, 0] in our case,
+        # instead of comparing it with the result of the whole reduction at the end
+        #
+        # this way, every level is a single tensor comparison and the depth is ceil(log2(n))
+
+        half_type = ctx.tensor(values_element_type, shape=(*kept_shape, pairs))
+        accumulated_type = ctx.tensor(resulting_element_type, shape=(*kept_shape, pairs))
 
-    # if we have one more element that wasn't in the halfs
-    if values.shape[0] % 2 == 1:
-        # we extract it
-        last_value = ctx.index(values_element_type, values, index=[-1])
-        # and compare it with the result we obtained from the halfs
-        result = (
-            ctx.minimum(resulting_type, result, last_value)
+        first_half = ctx.index(half_type, values, index=[*kept_index, slice(0, pairs)])
+        second_half = ctx.index(half_type, values, index=[*kept_index, slice(pairs, 2 * pairs)])
+
+        reduced = (
+            ctx.minimum(accumulated_type, first_half, second_half)
             if operation == "min"
-            else ctx.maximum(resulting_type, result, last_value)
+            else ctx.maximum(accumulated_type, first_half, second_half)
         )
-        # again, we need to set the original bit width
-        result.set_original_bit_width(values.original_bit_width)
+
+        # set the original bit width of the reduced so the following operation work as intended
+        # this is required since ctx.minimum and ctx.maximum does not constraint output bit width
+        reduced.set_original_bit_width(values.original_bit_width)
+
+        if size % 2 == 1:
+            leftover_type = ctx.tensor(values_element_type, shape=(*kept_shape, 1))
+            leftover = ctx.index(leftover_type, values, index=[*kept_index, slice(size - 1, size)])
+
+            carried_type = ctx.tensor(resulting_element_type, shape=(*kept_shape, pairs + 1))
+            reduced = ctx.concatenate(carried_type, [reduced, leftover], axis=-1)
+            reduced.set_original_bit_width(values.original_bit_width)
+
+        values = reduced
+        values_element_type = ctx.element_typeof(values)
+
+    # find the type of the last values which is
+    # fhe.uint3 for vectors
+    # fhe.tensor[fhe.uint3, *kept_shape] for tensors
+    last_type = ctx.tensor(values_element_type, shape=kept_shape)
+
+    # if there is a single value left, it's the result
+    if values.shape[-1] == 1:
+        return ctx.index(last_type, values, index=[*kept_index, 0])
+
+    # otherwise, compare the last two values
+    first = ctx.index(last_type, values, index=[*kept_index, 0])
+    second = ctx.index(last_type, values, index=[*kept_index, 1])
+
+    resulting_type = ctx.tensor(resulting_element_type, shape=kept_shape)
+    result = (
+        ctx.minimum(resulting_type, first, second)
+        if operation == "min"
+        else ctx.maximum(resulting_type, first, second)
+    )
+
+    # again, we need to set the original bit width
+    result.set_original_bit_width(values.original_bit_width)
 
     # here is the visualization of the algorithm
     #
     # [ 1, 4, 2, 3, 0 ]
     #
-    #  [1, 4][2, 3],0
-    #     \   /     |
-    #     [1, 3]    |
-    #        \     /
-    #        1    /
-    #         \  /
-    #          0
+    #   [1, 4][2, 3][0]
+    #      \   /    |
+    #      [1, 3]  [0]
+    #         \    /
+    #        [1, 3, 0]
+    #
+    #     [1][3][0]
+    #       \ /  |
+    #       [1] [0]
+    #         \ /
+    #       [1, 0]
+    #
+    #       1   0
+    #        \ /
+    #         0
     #
-    # it has O(log(n)) - 1 number of tensor comparisons (of sizes n/2, n/4, ...)
-    # and up to 1 + O(log(n)) number of scalar comparisons (depending on the oddity of n/2, n/4, ..)
+    # it has ceil(log2(n)) tensor comparisons (of sizes floor(n/2), ...)
+    # where each comparison is done on all kept positions at once
 
     return result
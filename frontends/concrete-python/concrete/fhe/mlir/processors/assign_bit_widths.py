@@ -2,7 +2,7 @@
 Declaration of `AssignBitWidths` graph processor.
 """
 
-from typing import Dict, List
+from typing import Dict, List, Union
 
 import z3
 
@@ -15,6 +15,7 @@ from ...compilation.configuration import (
 )
 from ...dtypes import Integer
 from ...representation import Graph, MultiGraphProcessor, Node, Operation
+from ..utils import is_zero_constant
 
 
 class AssignBitWidths(MultiGraphProcessor):
@@ -28,6 +29,8 @@ class AssignBitWidths(MultiGraphProcessor):
     There is preference list for comparison strategies.
     - Strategies will be traversed in order and bit-widths
       will be assigned according to the first available strategy.
+    - "auto" strategy is always available, and it's resolved to the available strategy
+      with the lowest estimated cost for the operation.
     """
 
     single_precision: bool
@@ -37,6 +40,7 @@ class AssignBitWidths(MultiGraphProcessor):
     shifts_with_promotion: bool
     multivariate_strategy_preference: List[MultivariateStrategy]
     min_max_strategy_preference: List[MinMaxStrategy]
+    if_then_else_chunk_size: int
 
     def __init__(
         self,
@@ -47,6 +51,7 @@ class AssignBitWidths(MultiGraphProcessor):
         shifts_with_promotion: bool,
         multivariate_strategy_preference: List[MultivariateStrategy],
         min_max_strategy_preference: List[MinMaxStrategy],
+        if_then_else_chunk_size: int = 3,
     ):
         self.single_precision = single_precision
         self.composition_rules = composition_rules
@@ -55,6 +60,7 @@ class AssignBitWidths(MultiGraphProcessor):
         self.shifts_with_promotion = shifts_with_promotion
         self.multivariate_strategy_preference = multivariate_strategy_preference
         self.min_max_strategy_preference = min_max_strategy_preference
+        self.if_then_else_chunk_size = if_then_else_chunk_size
 
     def apply_many(self, graphs: Dict[str, Graph]):
         optimizer = z3.Optimize()
@@ -73,6 +79,7 @@ class AssignBitWidths(MultiGraphProcessor):
                 self.shifts_with_promotion,
                 self.multivariate_strategy_preference,
                 self.min_max_strategy_preference,
+                self.if_then_else_chunk_size,
             )
 
             nodes = graph.query_nodes(ordered=True)
@@ -142,6 +149,7 @@ class AdditionalConstraints:
     shifts_with_promotion: bool
     multivariate_strategy_preference: List[MultivariateStrategy]
     min_max_strategy_preference: List[MinMaxStrategy]
+    if_then_else_chunk_size: int
 
     node: Node
     bit_width: z3.Int
@@ -158,6 +166,7 @@ class AdditionalConstraints:
         shifts_with_promotion: bool,
         multivariate_strategy_preference: List[MultivariateStrategy],
         min_max_strategy_preference: List[MinMaxStrategy],
+        if_then_else_chunk_size: int = 3,
     ):
         self.optimizer = optimizer
         self.graph = graph
@@ -168,6 +177,7 @@ class AdditionalConstraints:
         self.shifts_with_promotion = shifts_with_promotion
         self.multivariate_strategy_preference = multivariate_strategy_preference
         self.min_max_strategy_preference = min_max_strategy_preference
+        self.if_then_else_chunk_size = if_then_else_chunk_size
 
     def generate_for(self, node: Node, bit_width: z3.Int):
         """
@@ -229,6 +239,62 @@ class AdditionalConstraints:
         node.bit_width_constraints.append(constraint)
         self.optimizer.add(constraint)
 
+    def cheapest(
+        self,
+        strategy_type: type,
+        node: Node,
+        preds: List[Node],
+    ) -> Union[ComparisonStrategy, BitwiseStrategy, MultivariateStrategy, MinMaxStrategy]:
+        """
+        Get the strategy with the lowest estimated cost for an operation.
+
+        Cost of a table lookup is estimated as the size of its table, since the cost of
+        programmable bootstrapping roughly doubles with each bit of precision. Promoting an
+        operand is charged as if every other operation using the operand were a table lookup
+        with increased precision, as the promotion propagates to them.
+
+        Args:
+            strategy_type (type):
+                type of the strategies to consider (e.g., ComparisonStrategy)
+
+            node (Node):
+                operation to select the strategy for
+
+            preds (List[Node]):
+                operands of the operation
+
+        Returns:
+            Union[ComparisonStrategy, BitwiseStrategy, MultivariateStrategy, MinMaxStrategy]:
+                strategy with the lowest estimated cost
+                (or an unavailable strategy if none of the strategies are available)
+        """
+
+        operands = [pred.output for pred in preds]
+        strategies = [strategy for strategy in strategy_type if strategy.value != "auto"]
+
+        candidates = []
+        for strategy in strategies:
+            if not strategy.can_be_used(*operands):
+                continue
+
+            lookups = strategy.table_lookups(*operands)
+            cost = sum(2**bit_width for bit_width in lookups)
+
+            for pred, promotion in zip(preds, strategy.promotions(*operands)):
+                assert isinstance(pred.output.dtype, Integer)
+                if promotion > pred.output.dtype.bit_width:
+                    other_users = [
+                        user for user in self.graph.graph.successors(pred) if user != node
+                    ]
+                    cost += len(other_users) * ((2**promotion) - (2**pred.output.dtype.bit_width))
+
+            candidates.append((cost, len(lookups), strategy))
+
+        if len(candidates) == 0:
+            return strategies[0]
+
+        return min(candidates, key=lambda candidate: candidate[:2])[2]
+
     # ==========
     # Conditions
     # ==========
@@ -280,6 +346,9 @@ class AdditionalConstraints:
         ]
 
         for strategy in strategies + fallback:
+            if strategy == ComparisonStrategy.AUTO:
+                strategy = self.cheapest(ComparisonStrategy, node, [x, y])
+
             if strategy.can_be_used(x.output, y.output):
                 new_x_bit_width, new_y_bit_width = strategy.promotions(x.output, y.output)
                 self.constraint(node, self.bit_widths[x] >= new_x_bit_width)
@@ -306,6 +375,9 @@ class AdditionalConstraints:
         ]
 
         for strategy in strategies + fallback:
+            if strategy == BitwiseStrategy.AUTO:
+                strategy = self.cheapest(BitwiseStrategy, node, [x, y])
+
             if strategy.can_be_used(x.output, y.output):
                 new_x_bit_width, new_y_bit_width = strategy.promotions(x.output, y.output)
                 self.constraint(node, self.bit_widths[x] >= new_x_bit_width)
@@ -336,6 +408,9 @@ class AdditionalConstraints:
         ]
 
         for strategy in strategies + fallback:
+            if strategy == MultivariateStrategy.AUTO:
+                strategy = self.cheapest(MultivariateStrategy, node, preds)
+
             if strategy.can_be_used(*(pred.output for pred in preds)):
                 promotions = strategy.promotions(*(pred.output for pred in preds))
                 for pred, promotion in zip(preds, promotions):
@@ -377,6 +452,9 @@ class AdditionalConstraints:
         ]
 
         for strategy in strategies + fallback:
+            if strategy == MinMaxStrategy.AUTO:
+                strategy = self.cheapest(MinMaxStrategy, node, [x, y])
+
             if strategy.can_be_used(x.output, y.output):
                 new_x_bit_width, new_y_bit_width = strategy.promotions(x.output, y.output)
                 self.constraint(node, self.bit_widths[x] >= new_x_bit_width)
@@ -393,6 +471,31 @@ class AdditionalConstraints:
         assert len(preds) == 1
         self.minimum_maximum(node, [preds[0], preds[0]])
 
+    def where(self, node: Node, preds: List[Node]):
+        assert len(preds) == 3
+        condition, when_true, when_false = preds
+
+        when_true_is_zero = is_zero_constant(when_true)
+        when_false_is_zero = is_zero_constant(when_false)
+        if when_true_is_zero == when_false_is_zero:
+            return
+
+        outcome = when_false if when_true_is_zero else when_true
+        if not (condition.output.is_encrypted and outcome.output.is_encrypted):
+            return
+
+        assert isinstance(outcome.output.dtype, Integer)
+        if outcome.output.dtype.bit_width > self.if_then_else_chunk_size:
+            return
+
+        # outcome fits in a single chunk, so it's selected with a single table lookup
+        # on the outcome and the condition packed together, which is only possible
+        # without casting if both of them have an extra bit
+
+        required_bit_width = outcome.output.dtype.bit_width + 1
+        self.constraint(node, self.bit_widths[condition] >= required_bit_width)
+        self.constraint(node, self.bit_widths[outcome] == self.bit_widths[condition])
+
     # ==========
     # Operations
     # ==========
@@ -169,7 +169,7 @@ class ProcessRounding(GraphProcessor):
                 "reinterpret",
                 [deepcopy(node.output)],
                 deepcopy(node.output),
-                lambda x: x,
+                _evaluate_reinterpret,
             )
             identity.properties["original_bit_width"] = node.properties["original_bit_width"]
 
@@ -193,3 +193,7 @@ class ProcessRounding(GraphProcessor):
             if candidate is node:
                 identity = initialize(identity)
                 graph.output_nodes[i] = identity
+
+
+def _evaluate_reinterpret(x):
+    return x
@@ -273,6 +273,22 @@ def construct_table(node: Node, preds: List[Node], configuration: Configuration)
     return table
 
 
+def is_zero_constant(node: Node) -> bool:
+    """
+    Get whether a node is a constant with all zeros.
+
+    Args:
+        node (Node):
+            node to check
+
+    Returns:
+        bool:
+            True if the node is a constant with all zeros, False otherwise
+    """
+
+    return node.operation == Operation.Constant and bool(np.all(node() == 0))
+
+
 def construct_deduplicated_tables(
     node: Node,
     preds: List[Node],
@@ -3,10 +3,12 @@ Declaration of `Graph` class.
 """
 
 import math
+import multiprocessing
 import os
 import re
 import tempfile
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
@@ -74,6 +76,7 @@ class Graph:
         self,
         *args: Any,
         p_error: Optional[float] = None,
+        inject_errors_on_inputs: bool = False,
     ) -> Union[
         np.bool_,
         np.integer,
@@ -81,7 +84,11 @@ class Graph:
         np.ndarray,
         Tuple[Union[np.bool_, np.integer, np.floating, np.ndarray], ...],
     ]:
-        evaluation = self.evaluate(*args, p_error=p_error)
+        evaluation = self.evaluate(
+            *args,
+            p_error=p_error,
+            inject_errors_on_inputs=inject_errors_on_inputs,
+        )
         result = tuple(evaluation[node] for node in self.ordered_outputs())
         return result if len(result) > 1 else result[0]
 
@@ -89,6 +96,7 @@ class Graph:
         self,
         *args: Any,
         p_error: Optional[float] = None,
+        inject_errors_on_inputs: bool = False,
     ) -> Dict[Node, Union[np.bool_, np.integer, np.floating, np.ndarray]]:
         r"""
         Perform the computation `Graph` represents and get resulting values for all nodes.
@@ -100,6 +108,10 @@ class Graph:
             p_error (Optional[float]):
                 probability of error for table lookups
 
+            inject_errors_on_inputs (bool, default = False):
+                whether to introduce errors in table lookups applied directly on inputs
+                (e.g., to simulate circuits where inputs are encrypted and bootstrapped)
+
         Returns:
             Dict[Node, Union[np.bool\_, np.integer, np.floating, np.ndarray]]:
                 nodes and their values during computation
@@ -129,7 +141,7 @@ class Graph:
 
                 for index in variable_input_indices:
                     pred_node = self.ordered_preds_of(node)[index]
-                    if pred_node.operation != Operation.Input:
+                    if inject_errors_on_inputs or pred_node.operation != Operation.Input:
                         dtype = node.inputs[index].dtype
                         if isinstance(dtype, Integer):
                             # see https://github.com/zama-ai/concrete/blob/main/docs/_static/p_error_simulation.pdf  # noqa: E501  # pylint: disable=line-too-long
@@ -625,9 +637,64 @@ class Graph:
 
         return result[:-1]
 
+    def save(self, path: Union[str, Path]):
+        """
+        Save the graph to a file, so it can be compiled later without tracing it again.
+
+        Graph is saved in a compact format, consisting of a JSON description of the nodes, edges
+        and properties, and binary arrays for constants (e.g., tables, weights).
+
+        Operations of the nodes are saved by reference, so they need to be importable when
+        the graph is loaded (e.g., numpy functions, functions defined at module level).
+
+        Args:
+            path (Union[str, Path]):
+                path to save the graph to
+
+        Raises:
+            RuntimeError:
+                if the graph contains an operation or a property that cannot be saved
+        """
+
+        # pylint: disable=cyclic-import,import-outside-toplevel
+        from .serialization import GraphEncoder
+
+        # pylint: enable=cyclic-import,import-outside-toplevel
+
+        GraphEncoder().save(self, path)
+
+    @staticmethod
+    def load(path: Union[str, Path], trusted_modules: Iterable[str] = ()) -> "Graph":
+        """
+        Load a graph saved with `Graph.save`.
+
+        Loaded graphs are evaluated, so graph files must come from trusted sources. Operations
+        can only be imported from numpy, Concrete and `trusted_modules`.
+
+        Args:
+            path (Union[str, Path]):
+                path to load the graph from
+
+            trusted_modules (Iterable[str], default = ()):
+                additional modules operations can be imported from
+                (e.g., the module defining the functions given to `fhe.univariate`)
+
+        Returns:
+            Graph:
+                loaded graph
+        """
+
+        # pylint: disable=cyclic-import,import-outside-toplevel
+        from .serialization import GraphDecoder
+
+        # pylint: enable=cyclic-import,import-outside-toplevel
+
+        return GraphDecoder.load(path, trusted_modules)
+
     def measure_bounds(
         self,
         inputset: Union[Iterable[Any], Iterable[Tuple[Any, ...]]],
+        workers: int = 1,
     ) -> Dict[Node, Dict[str, Union[np.integer, np.floating]]]:
         """
         Evaluate the `Graph` using an inputset and measure bounds.
@@ -656,11 +723,52 @@ class Graph:
             inputset (Union[Iterable[Any], Iterable[Tuple[Any, ...]]]):
                 inputset to use
 
+            workers (int, default = 1):
+                number of processes to shard the inputset across
+                (measurement is serial if it's 1 or if processes cannot be forked)
+
         Returns:
             Dict[Node, Dict[str, Union[np.integer, np.floating]]]:
                 bounds of each node in the `Graph`
         """
 
+        return Graph.measure_bounds_of_many([(self, inputset)], workers)[0]
+
+    @staticmethod
+    def measure_bounds_of_many(
+        graphs_and_inputsets: List[Tuple["Graph", Union[Iterable[Any], Iterable[Tuple[Any, ...]]]]],
+        workers: int = 1,
+    ) -> List[Dict[Node, Dict[str, Union[np.integer, np.floating]]]]:
+        """
+        Measure bounds of multiple graphs, using a single pool of workers.
+
+        Args:
+            graphs_and_inputsets (List[Tuple[Graph, Union[Iterable[Any], Iterable[Tuple]]]]):
+                graphs to measure bounds of, along with the inputsets to use
+
+            workers (int, default = 1):
+                number of processes to shard the inputsets across
+                (measurement is serial if it's 1 or if processes cannot be forked)
+
+        Returns:
+            List[Dict[Node, Dict[str, Union[np.integer, np.floating]]]]:
+                bounds of each node in each `Graph`, in the same order as the graphs
+        """
+
+        if workers <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+            return [graph._measure_bounds(inputset) for graph, inputset in graphs_and_inputsets]
+
+        graphs_and_samples = [(graph, list(inputset)) for graph, inputset in graphs_and_inputsets]
+        if sum(len(samples) for _, samples in graphs_and_samples) <= 1:
+            return [graph._measure_bounds(samples) for graph, samples in graphs_and_samples]
+
+        return Graph._measure_bounds_in_parallel(graphs_and_samples, workers)
+
+    def _measure_bounds(
+        self,
+        inputset: Union[Iterable[Any], Iterable[Tuple[Any, ...]]],
+        first_index: int = 0,
+    ) -> Dict[Node, Dict[str, Union[np.integer, np.floating]]]:
         bounds = {}
 
         inputset_iterator = iter(inputset)
@@ -669,7 +777,7 @@ class Graph:
         if not isinstance(sample, tuple):
             sample = (sample,)
 
-        index = 0
+        index = first_index
         try:
             evaluation = self.evaluate(*sample)
             for node, value in evaluation.items():
@@ -696,6 +804,89 @@ class Graph:
 
         return bounds
 
+    @staticmethod
+    def _measure_bounds_in_parallel(
+        graphs_and_samples: List[Tuple["Graph", List[Any]]],
+        workers: int,
+    ) -> List[Dict[Node, Dict[str, Union[np.integer, np.floating]]]]:
+        # graphs are not picklable in general (e.g., lambdas of fused subgraphs)
+        # so the graphs and the samples are inherited by forked workers instead
+        # and only shard boundaries and partial bounds cross process boundaries
+
+        shards: List[List[Tuple[int, int, int]]] = []
+        for graph_index, (_, samples) in enumerate(graphs_and_samples):
+            shard_size = max(math.ceil(len(samples) / workers), 1)
+            shards.append(
+                [
+                    (graph_index, start, min(start + shard_size, len(samples)))
+                    for start in range(0, len(samples), shard_size)
+                ]
+            )
+
+        with ProcessPoolExecutor(
+            max_workers=min(workers, sum(len(graph_shards) for graph_shards in shards)),
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_initialize_bounds_measurement_worker,
+            initargs=(graphs_and_samples,),
+        ) as executor:
+            futures = [
+                [executor.submit(_measure_bounds_of_shard, *shard) for shard in graph_shards]
+                for graph_shards in shards
+            ]
+
+            result = []
+            for (graph, samples), graph_futures in zip(graphs_and_samples, futures):
+                if len(samples) == 0:
+                    # raise the same error as serial measurement
+                    graph._measure_bounds(samples)
+
+                # shards are merged in order, which results in the same bounds as serial
+                # measurement since min and max are associative
+
+                nodes = list(graph.graph.nodes())
+                bounds: Dict[Node, Dict[str, Union[np.integer, np.floating]]] = {}
+                for future in graph_futures:
+                    shard_bounds = {
+                        nodes[node_index]: {"min": min_bound, "max": max_bound}
+                        for node_index, (min_bound, max_bound) in future.result().items()
+                    }
+                    bounds = Graph.merge_bounds(bounds, shard_bounds)
+
+                result.append(bounds)
+
+        return result
+
+    @staticmethod
+    def merge_bounds(
+        bounds: Dict[Node, Dict[str, Union[np.integer, np.floating]]],
+        other_bounds: Dict[Node, Dict[str, Union[np.integer, np.floating]]],
+    ) -> Dict[Node, Dict[str, Union[np.integer, np.floating]]]:
+        """
+        Merge bounds measured over two parts of an inputset.
+
+        Args:
+            bounds (Dict[Node, Dict[str, Union[np.integer, np.floating]]]):
+                bounds measured over the first part of the inputset
+
+            other_bounds (Dict[Node, Dict[str, Union[np.integer, np.floating]]]):
+                bounds measured over the second part of the inputset
+
+        Returns:
+            Dict[Node, Dict[str, Union[np.integer, np.floating]]]:
+                bounds over the whole inputset
+        """
+
+        result = dict(bounds)
+        for node, node_bounds in other_bounds.items():
+            if node not in result:
+                result[node] = node_bounds
+            else:
+                result[node] = {
+                    "min": np.minimum(result[node]["min"], node_bounds["min"]),
+                    "max": np.maximum(result[node]["max"], node_bounds["max"]),
+                }
+        return result
+
     def update_with_bounds(self, bounds: Dict[Node, Dict[str, Union[np.integer, np.floating]]]):
         """
         Update `ValueDescription`s within the `Graph` according to measured bounds.
@@ -1002,6 +1193,32 @@ class Graph:
         return len(self.output_nodes)
 
 
+_BOUNDS_MEASUREMENT_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _initialize_bounds_measurement_worker(graphs_and_samples: List[Tuple[Graph, List[Any]]]):
+    _BOUNDS_MEASUREMENT_WORKER_STATE["graphs_and_samples"] = graphs_and_samples
+
+
+def _measure_bounds_of_shard(
+    graph_index: int,
+    start: int,
+    stop: int,
+) -> Dict[int, Tuple[Any, Any]]:
+    graph, samples = _BOUNDS_MEASUREMENT_WORKER_STATE["graphs_and_samples"][graph_index]
+
+    # pylint: disable=protected-access
+    bounds = graph._measure_bounds(samples[start:stop], first_index=start)
+    # pylint: enable=protected-access
+
+    # nodes are identified by their position in the graph, as node objects are process local
+    return {
+        index: (bounds[node]["min"], bounds[node]["max"])
+        for index, node in enumerate(graph.graph.nodes())
+        if node in bounds
+    }
+
+
 class GraphProcessor(ABC):
     """
     GraphProcessor base class, to define the API for a graph processing pipeline.
@@ -0,0 +1,598 @@
+"""
+Declaration of `GraphEncoder` and `GraphDecoder` classes, to save and load computation graphs.
+"""
+
+import importlib
+import json
+from enum import Enum
+from functools import partial
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, Tuple, Union
+
+import networkx as nx
+import numpy as np
+
+from ..dtypes import Float, Integer
+from ..values import ValueDescription
+from .evaluator import ConstantEvaluator, InputEvaluator
+from .graph import Graph
+from .node import Node
+from .operation import Operation
+
+GRAPH_FORMAT_VERSION = 1
+
+# modules objects referenced by loaded graphs can be imported from (more can be trusted explicitly)
+TRUSTED_MODULES = ("numpy", "concrete.fhe")
+
+# modules whose private objects can be referenced by loaded graphs
+# (e.g., evaluators of operations created by the library)
+LIBRARY_MODULES = ("concrete.fhe",)
+
+# builtins which can be referenced by loaded graphs (e.g., as the dtype of an `astype`)
+TRUSTED_BUILTINS = (bool, int, float, complex)
+
+
+def is_trusted_module(name: str, trusted_modules: Tuple[str, ...]) -> bool:
+    """
+    Get if a module is one of the trusted modules, or within one of them.
+
+    Args:
+        name (str):
+            name of the module
+
+        trusted_modules (Tuple[str, ...]):
+            names of the trusted modules
+
+    Returns:
+        bool:
+            whether the module is trusted
+    """
+
+    return any(name == module or name.startswith(f"{module}.") for module in trusted_modules)
+
+
+class GraphEncoder:
+    """
+    GraphEncoder class, to convert graphs into a JSON description and a set of binary arrays.
+    """
+
+    arrays: Dict[str, np.ndarray]
+    node_ids: Dict[Node, int]
+
+    def __init__(self):
+        self.arrays = {}
+        self.node_ids = {}
+
+    def save(self, graph: Graph, path: Union[str, Path]):
+        """
+        Save a graph to a file.
+
+        Args:
+            graph (Graph):
+                graph to save
+
+            path (Union[str, Path]):
+                path to save the graph to
+        """
+
+        description = {
+            "version": GRAPH_FORMAT_VERSION,
+            "graph": self.encode_graph(graph),
+        }
+        serialized_description = json.dumps(description, separators=(",", ":")).encode("utf-8")
+
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f,
+                description=np.frombuffer(serialized_description, dtype=np.uint8),
+                **self.arrays,
+            )
+
+    def encode_graph(self, graph: Graph) -> Dict[str, Any]:
+        """
+        Encode a graph.
+
+        Args:
+            graph (Graph):
+                graph to encode
+
+        Returns:
+            Dict[str, Any]:
+                JSON compatible description of the graph
+        """
+
+        nodes = list(graph.graph.nodes())
+        for node in nodes:
+            self.node_ids[node] = len(self.node_ids)
+
+        return {
+            "name": graph.name,
+            "location": graph.location,
+            "is_direct": graph.is_direct,
+            "nodes": [self.encode_node(node) for node in nodes],
+            "edges": [
+                [self.node_ids[pred], self.node_ids[succ], key, self.encode(data)]
+                for pred, succ, key, data in graph.graph.edges(keys=True, data=True)
+            ],
+            "input_nodes": [
+                [index, self.node_ids[node]] for index, node in graph.input_nodes.items()
+            ],
+            "output_nodes": [
+                [index, self.node_ids[node]] for index, node in graph.output_nodes.items()
+            ],
+        }
+
+    def encode_node(self, node: Node) -> Dict[str, Any]:
+        """
+        Encode a node.
+
+        Args:
+            node (Node):
+                node to encode
+
+        Returns:
+            Dict[str, Any]:
+                JSON compatible description of the node
+        """
+
+        operation = None
+        if node.operation == Operation.Generic:
+            try:
+                operation = self.encode(node.evaluator.operation)
+            except RuntimeError as error:
+                message = (
+                    f"Graph cannot be saved because the operation of '{node.label()}' node "
+                    f"at {node.location} cannot be referenced "
+                    f"(only numpy functions and module level functions are supported)"
+                )
+                raise RuntimeError(message) from error
+
+        return {
+            "id": self.node_ids[node],
+            "operation": node.operation.value,
+            "evaluator": operation,
+            "inputs": [self.encode_value_description(value) for value in node.inputs],
+            "output": self.encode_value_description(node.output),
+            "properties": self.encode(node.properties),
+            "bounds": self.encode(node.bounds),
+            "location": node.location,
+            "tag": node.tag,
+            "created_at": node.created_at,
+        }
+
+    def encode_value_description(self, value: ValueDescription) -> Dict[str, Any]:
+        """
+        Encode a value description.
+
+        Args:
+            value (ValueDescription):
+                value description to encode
+
+        Returns:
+            Dict[str, Any]:
+                JSON compatible description of the value description
+        """
+
+        return {
+            "dtype": self.encode(value.dtype),
+            "shape": list(value.shape),
+            "is_encrypted": value.is_encrypted,
+        }
+
+    def encode(self, value: Any) -> Any:
+        """
+        Encode an arbitrary value (e.g., a property of a node).
+
+        Args:
+            value (Any):
+                value to encode
+
+        Returns:
+            Any:
+                JSON compatible description of the value
+
+        Raises:
+            RuntimeError:
+                if the value cannot be encoded
+        """
+
+        # pylint: disable=cyclic-import,import-outside-toplevel,too-many-return-statements
+        from ..extensions.table import LookupTable
+
+        # pylint: enable=cyclic-import,import-outside-toplevel
+
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+
+        if isinstance(value, np.generic):
+            return {"type": "scalar", "dtype": value.dtype.str, "value": value.item()}
+
+        if isinstance(value, np.ndarray):
+            if value.dtype == object:
+                return {
+                    "type": "object_array",
+                    "shape": list(value.shape),
+                    "items": [self.encode(item) for item in value.flat],
+                }
+
+            key = f"array_{len(self.arrays)}"
+            self.arrays[key] = value
+            return {"type": "array", "key": key}
+
+        if isinstance(value, (list, tuple)):
+            return {
+                "type": "list" if isinstance(value, list) else "tuple",
+                "items": [self.encode(item) for item in value],
+            }
+
+        if isinstance(value, dict):
+            # graphs are encoded first, so nodes within them can be referenced by the other items
+            items = sorted(value.items(), key=lambda item: not isinstance(item[1], Graph))
+            return {
+                "type": "dict",
+                "items": [[self.encode(key), self.encode(item)] for key, item in items],
+            }
+
+        if isinstance(value, slice):
+            return {
+                "type": "slice",
+                "items": [
+                    self.encode(value.start),
+                    self.encode(value.stop),
+                    self.encode(value.step),
+                ],
+            }
+
+        if value is Ellipsis:
+            return {"type": "ellipsis"}
+
+        if isinstance(value, Enum):
+            return {
+                "type": "enum",
+                "class": self.encode_reference(type(value)),
+                "value": self.encode(value.value),
+            }
+
+        if type(value) is Integer:  # pylint: disable=unidiomatic-typecheck
+            return {"type": "integer", "is_signed": value.is_signed, "bit_width": value.bit_width}
+
+        if type(value) is Float:  # pylint: disable=unidiomatic-typecheck
+            return {"type": "float", "bit_width": value.bit_width}
+
+        if isinstance(value, LookupTable):
+            return {"type": "lookup_table", "table": self.encode(value.table)}
+
+        if isinstance(value, Graph):
+            return {"type": "graph", "graph": self.encode_graph(value)}
+
+        if isinstance(value, Node) and value in self.node_ids:
+            return {"type": "node", "id": self.node_ids[value]}
+
+        if isinstance(value, partial):
+            return {
+                "type": "partial",
+                "function": self.encode(value.func),
+                "args": self.encode(value.args),
+                "kwargs": self.encode(value.keywords),
+            }
+
+        if isinstance(value, type) or callable(value):
+            return {"type": "reference", "reference": self.encode_reference(value)}
+
+        message = f"{repr(value)} of type {type(value).__name__} cannot be saved"
+        raise RuntimeError(message)
+
+    @staticmethod
+    def encode_reference(value: Union[type, Callable]) -> str:
+        """
+        Encode a reference to an importable object (e.g., a module level function).
+
+        Args:
+            value (Union[type, Callable]):
+                object to encode the reference of
+
+        Returns:
+            str:
+                reference to the object in `module:qualified.name` format
+
+        Raises:
+            RuntimeError:
+                if the object cannot be imported using the reference
+        """
+
+        if isinstance(value, np.ufunc):
+            module, name = "numpy", value.__name__
+        else:
+            module = getattr(value, "__module__", None)
+            name = getattr(value, "__qualname__", None)
+
+        reference = f"{module}:{name}"
+        try:
+            resolved = GraphDecoder.decode_reference(reference, trusted_modules=(str(module),))
+        except Exception:  # pylint: disable=broad-except
+            resolved = None
+
+        if resolved is not value:
+            message = f"{repr(value)} cannot be referenced"
+            raise RuntimeError(message)
+
+        return reference
+
+
+class GraphDecoder:
+    """
+    GraphDecoder class, to convert descriptions created by `GraphEncoder` back into graphs.
+    """
+
+    arrays: Dict[str, np.ndarray]
+    nodes: Dict[int, Node]
+    trusted_modules: Tuple[str, ...]
+
+    def __init__(self, arrays: Dict[str, np.ndarray], trusted_modules: Iterable[str] = ()):
+        self.arrays = arrays
+        self.nodes = {}
+        self.trusted_modules = tuple(trusted_modules)
+
+    @staticmethod
+    def load(path: Union[str, Path], trusted_modules: Iterable[str] = ()) -> Graph:
+        """
+        Load a graph from a file.
+
+        Args:
+            path (Union[str, Path]):
+                path to load the graph from
+
+            trusted_modules (Iterable[str], default = ()):
+                modules, in addition to `TRUSTED_MODULES`, operations can be imported from
+
+        Returns:
+            Graph:
+                loaded graph
+
+        Raises:
+            RuntimeError:
+                if the file is saved using an unsupported format
+        """
+
+        with np.load(path, allow_pickle=False) as archive:
+            arrays = {key: archive[key] for key in archive.files}
+
+        description = json.loads(arrays.pop("description").tobytes().decode("utf-8"))
+        if description.get("version") != GRAPH_FORMAT_VERSION:
+            message = (
+                f"Graph cannot be loaded because it's saved using "
+                f"format version {description.get('version')} "
+                f"but only format version {GRAPH_FORMAT_VERSION} is supported"
+            )
+            raise RuntimeError(message)
+
+        return GraphDecoder(arrays, trusted_modules).decode_graph(description["graph"])
+
+    def decode_graph(self, description: Dict[str, Any]) -> Graph:
+        """
+        Decode a graph.
+
+        Args:
+            description (Dict[str, Any]):
+                description of the graph
+
+        Returns:
+            Graph:
+                decoded graph
+        """
+
+        nx_graph = nx.MultiDiGraph()
+        for node_description in description["nodes"]:
+            node = self.decode_node(node_description)
+            self.nodes[node_description["id"]] = node
+            nx_graph.add_node(node)
+
+        for pred, succ, key, data in description["edges"]:
+            nx_graph.add_edge(self.nodes[pred], self.nodes[succ], key=key, **self.decode(data))
+
+        return Graph(
+            nx_graph,
+            {index: self.nodes[node] for index, node in description["input_nodes"]},
+            {index: self.nodes[node] for index, node in description["output_nodes"]},
+            description["name"],
+            is_direct=description["is_direct"],
+            location=description["location"],
+        )
+
+    def decode_node(self, description: Dict[str, Any]) -> Node:
+        """
+        Decode a node.
+
+        Args:
+            description (Dict[str, Any]):
+                description of the node
+
+        Returns:
+            Node:
+                decoded node
+        """
+
+        inputs = [self.decode_value_description(value) for value in description["inputs"]]
+        output = self.decode_value_description(description["output"])
+        properties = self.decode(description["properties"])
+
+        operation = Operation(description["operation"])
+        if operation == Operation.Constant:
+            node = Node(inputs, output, operation, ConstantEvaluator(properties), properties)
+        elif operation == Operation.Input:
+            node = Node(inputs, output, operation, InputEvaluator(), properties)
+        else:
+            node = Node.generic(
+                properties.pop("name"),
+                inputs,
+                output,
+                self.decode(description["evaluator"]),
+                args=properties.pop("args"),
+                kwargs=properties.pop("kwargs"),
+                attributes=properties.pop("attributes"),
+            )
+            node.properties.update(properties)
+
+        bounds = self.decode(description["bounds"])
+        node.bounds = tuple(bounds) if bounds is not None else None
+
+        node.location = description["location"]
+        node.tag = description["tag"]
+        node.created_at = description["created_at"]
+
+        return node
+
+    def decode_value_description(self, description: Dict[str, Any]) -> ValueDescription:
+        """
+        Decode a value description.
+
+        Args:
+            description (Dict[str, Any]):
+                description of the value description
+
+        Returns:
+            ValueDescription:
+                decoded value description
+        """
+
+        return ValueDescription(
+            self.decode(description["dtype"]),
+            tuple(description["shape"]),
+            description["is_encrypted"],
+        )
+
+    def decode(self, description: Any) -> Any:
+        """
+        Decode an arbitrary value.
+
+        Args:
+            description (Any):
+                description of the value
+
+        Returns:
+            Any:
+                decoded value
+        """
+
+        # pylint: disable=cyclic-import,import-outside-toplevel,too-many-return-statements
+        from ..extensions.table import LookupTable
+
+        # pylint: enable=cyclic-import,import-outside-toplevel
+
+        if not isinstance(description, dict):
+            return description
+
+        kind = description["type"]
+
+        if kind == "scalar":
+            return np.dtype(description["dtype"]).type(description["value"])
+
+        if kind == "array":
+            return self.arrays[description["key"]]
+
+        if kind == "object_array":
+            result = np.empty(len(description["items"]), dtype=object)
+            for index, item in enumerate(description["items"]):
+                result[index] = self.decode(item)
+            return result.reshape(description["shape"])
+
+        if kind in {"list", "tuple"}:
+            items = [self.decode(item) for item in description["items"]]
+            return items if kind == "list" else tuple(items)
+
+        if kind == "dict":
+            return {self.decode(key): self.decode(item) for key, item in description["items"]}
+
+        if kind == "slice":
+            return slice(*[self.decode(item) for item in description["items"]])
+
+        if kind == "ellipsis":
+            return Ellipsis
+
+        if kind == "enum":
+            enum = self.decode_reference(description["class"], self.trusted_modules)
+            return enum(self.decode(description["value"]))
+
+        if kind == "integer":
+            return Integer(description["is_signed"], description["bit_width"])
+
+        if kind == "float":
+            return Float(description["bit_width"])
+
+        if kind == "lookup_table":
+            return LookupTable(self.decode(description["table"]))
+
+        if kind == "graph":
+            return self.decode_graph(description["graph"])
+
+        if kind == "node":
+            return self.nodes[description["id"]]
+
+        if kind == "partial":
+            return partial(
+                self.decode(description["function"]),
+                *self.decode(description["args"]),
+                **self.decode(description["kwargs"]),
+            )
+
+        assert kind == "reference"
+        return self.decode_reference(description["reference"], self.trusted_modules)
+
+    @staticmethod
+    def decode_reference(reference: str, trusted_modules: Iterable[str] = ()) -> Any:
+        """
+        Import the object a reference created by `GraphEncoder.encode_reference` points to.
+
+        References come from graph files, so only objects of trusted modules can be imported,
+        as calling arbitrary objects (e.g., `os:system`) would run arbitrary code.
+        Private objects (e.g., evaluators of library operations) can only be imported from
+        `LIBRARY_MODULES`, and special attributes (e.g., `__globals__`) are never followed.
+
+        Args:
+            reference (str):
+                reference in `module:qualified.name` format
+
+            trusted_modules (Iterable[str], default = ()):
+                modules, in addition to `TRUSTED_MODULES`, objects can be imported from
+
+        Returns:
+            Any:
+                referenced object
+
+        Raises:
+            RuntimeError:
+                if the reference doesn't point to an object of a trusted module
+        """
+
+        trusted = TRUSTED_MODULES + tuple(trusted_modules)
+        message = f"Reference '{reference}' cannot be loaded as it's not within trusted modules"
+
+        module, _, name = reference.partition(":")
+        if module == "builtins":
+            result = next((value for value in TRUSTED_BUILTINS if value.__name__ == name), None)
+            if result is None:
+                raise RuntimeError(message)
+            return result
+
+        if not is_trusted_module(module, trusted):
+            raise RuntimeError(message)
+
+        is_library_module = is_trusted_module(module, LIBRARY_MODULES)
+
+        result: Any = importlib.import_module(module)
+        for attribute in name.split("."):
+            # special attributes, private attributes of user modules, and other modules
+            # could lead outside of the trusted modules
+            if attribute.startswith("__") or (attribute.startswith("_") and not is_library_module):
+                raise RuntimeError(message)
+
+            result = getattr(result, attribute)
+            if isinstance(result, ModuleType) and not is_trusted_module(result.__name__, trusted):
+                raise RuntimeError(message)
+
+        origin = getattr(result, "__module__", None)
+        if isinstance(origin, str) and not is_trusted_module(origin, trusted):
+            raise RuntimeError(message)
+
+        return result
@@ -657,7 +657,7 @@ class Tracer:
                 "astype",
                 [deepcopy(self.output)],
                 output_value,
-                lambda x: x,  # unused for direct definition
+                _evaluate_direct_astype,  # unused for direct definition
             )
             return Tracer(computation, [self])
 
@@ -681,21 +681,9 @@ class Tracer:
         output_value = deepcopy(self.output)
         output_value.dtype = ValueDescription.of(dtype(0)).dtype  # type: ignore
 
-        if np.issubdtype(dtype, np.integer):
-
-            def evaluator(x, dtype):
-                if np.any(np.isnan(x)):
-                    message = "A `NaN` value is tried to be converted to integer"
-                    raise ValueError(message)
-                if np.any(np.isinf(x)):
-                    message = "An `Inf` value is tried to be converted to integer"
-                    raise ValueError(message)
-                return x.astype(dtype)
-
-        else:
-
-            def evaluator(x, dtype):
-                return x.astype(dtype)
+        evaluator = (
+            _evaluate_astype_to_integer if np.issubdtype(dtype, np.integer) else _evaluate_astype
+        )
 
         computation = Node.generic(
             "astype",
@@ -780,7 +768,7 @@ class Tracer:
                 "dynamic_tlu",
                 [deepcopy(index.output), deepcopy(self.output)],
                 deepcopy(index.output),
-                lambda on, table: table[on],
+                _evaluate_dynamic_tlu,
             )
             return Tracer(computation, [index, self])
 
@@ -862,24 +850,11 @@ class Tracer:
                 else:
                     static_indices.append(indexing_element)
 
-            def index_dynamic_evaluator(tensor, *dynamic_indices, static_indices):
-                final_indices = []
-
-                cursor = 0
-                for index in static_indices:
-                    if index is None:
-                        final_indices.append(dynamic_indices[cursor])
-                        cursor += 1
-                    else:
-                        final_indices.append(index)
-
-                return tensor[tuple(final_indices)]
-
             computation = Node.generic(
                 "index_dynamic",
                 [deepcopy(self.output)] + [deepcopy(index.output) for index in dynamic_indices],
                 output_value,
-                index_dynamic_evaluator,
+                _evaluate_index_dynamic,
                 kwargs={"static_indices": static_indices},
             )
             return Tracer(computation, [self] + [index for index in dynamic_indices])
@@ -888,7 +863,7 @@ class Tracer:
             "index_static",
             [deepcopy(self.output)],
             output_value,
-            lambda x, index: x[index],
+            _evaluate_index_static,
             kwargs={"index": index},
         )
         return Tracer(computation, [self])
@@ -984,23 +959,6 @@ class Tracer:
                 else:
                     static_indices.append(indexing_element)
 
-            def assign_dynamic(tensor, *dynamic_indices_and_value, static_indices):
-                dynamic_indices = dynamic_indices_and_value[:-1]
-                value = dynamic_indices_and_value[-1]
-
-                final_indices = []
-
-                cursor = 0
-                for index in static_indices:
-                    if index is None:
-                        final_indices.append(dynamic_indices[cursor])
-                        cursor += 1
-                    else:
-                        final_indices.append(index)
-
-                tensor[tuple(final_indices)] = value
-                return tensor
-
             sanitized_value = self.sanitize(value)
             computation = Node.generic(
                 "assign_dynamic",
@@ -1008,7 +966,7 @@ class Tracer:
                 + [deepcopy(index.output) for index in dynamic_indices]
                 + [sanitized_value.output],
                 output_value,
-                assign_dynamic,
+                _evaluate_assign_dynamic,
                 kwargs={"static_indices": static_indices},
             )
             new_version = Tracer(
@@ -1016,17 +974,12 @@ class Tracer:
             )
 
         else:
-
-            def assign(x, value, index):
-                x[index] = value
-                return x
-
             sanitized_value = self.sanitize(value)
             computation = Node.generic(
                 "assign_static",
                 [deepcopy(self.output), deepcopy(sanitized_value.output)],
                 deepcopy(self.output),
-                assign,
+                _evaluate_assign_static,
                 kwargs={"index": index},
             )
             new_version = Tracer(computation, [self, sanitized_value])
@@ -1091,3 +1044,70 @@ class TensorAnnotation(Annotation):
     """
     Base tensor annotation for direct definition.
     """
+
+
+# Evaluators of the operations traced above are defined at module level,
+# so they can be referenced when graphs are saved.
+
+
+def _evaluate_direct_astype(x):
+    return x
+
+
+def _evaluate_astype(x, dtype):
+    return x.astype(dtype)
+
+
+def _evaluate_astype_to_integer(x, dtype):
+    if np.any(np.isnan(x)):
+        message = "A `NaN` value is tried to be converted to integer"
+        raise ValueError(message)
+    if np.any(np.isinf(x)):
+        message = "An `Inf` value is tried to be converted to integer"
+        raise ValueError(message)
+    return x.astype(dtype)
+
+
+def _evaluate_dynamic_tlu(on, table):
+    return table[on]
+
+
+def _evaluate_index_static(x, index):
+    return x[index]
+
+
+def _evaluate_index_dynamic(tensor, *dynamic_indices, static_indices):
+    final_indices = []
+
+    cursor = 0
+    for index in static_indices:
+        if index is None:
+            final_indices.append(dynamic_indices[cursor])
+            cursor += 1
+        else:
+            final_indices.append(index)
+
+    return tensor[tuple(final_indices)]
+
+
+def _evaluate_assign_static(x, value, index):
+    x[index] = value
+    return x
+
+
+def _evaluate_assign_dynamic(tensor, *dynamic_indices_and_value, static_indices):
+    dynamic_indices = dynamic_indices_and_value[:-1]
+    value = dynamic_indices_and_value[-1]
+
+    final_indices = []
+
+    cursor = 0
+    for index in static_indices:
+        if index is None:
+            final_indices.append(dynamic_indices[cursor])
+            cursor += 1
+        else:
+            final_indices.append(index)
+
+    tensor[tuple(final_indices)] = value
+    return tensor
@@ -98,16 +98,7 @@ class StaticKeyValueDatabase:
             def insert(state, key, value):
                 flags = state[:, flag_slice]
 
-                selection = fhe.zeros(number_of_entries)
-
-                found = fhe.zero()
-                for i in range(number_of_entries):
-                    is_selected = fhe.multivariate(
-                        lambda found, flag: int(found == 0 and flag == 0)
-                    )(found, flags[i])
-
-                    selection[i] = is_selected
-                    found += is_selected
+                selection = fhe.first_match(1 - flags)
 
                 state_update = fhe.zeros(state_shape)
                 state_update[:, flag_slice] = selection
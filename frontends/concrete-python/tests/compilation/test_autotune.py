@@ -0,0 +1,152 @@
+"""
+Tests of `autotune` function.
+"""
+
+import importlib
+import os
+
+import pytest
+
+from concrete import fhe
+
+# `concrete.fhe.compilation.autotune` is shadowed by the function it declares
+autotune_module = importlib.import_module("concrete.fhe.compilation.autotune")
+
+
+def comparison(x, y):
+    """
+    Function with a comparison, which can be lowered using different strategies.
+    """
+
+    return x < y
+
+
+COMPARISON_SEARCH_SPACE = {
+    "comparison_strategy_preference": [
+        fhe.ComparisonStrategy.ONE_TLU_PROMOTED,
+        fhe.ComparisonStrategy.THREE_TLU_CASTED,
+        fhe.ComparisonStrategy.CHUNKED,
+    ],
+}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_autotune(workers, helpers):
+    """
+    Test `autotune` function.
+    """
+
+    configuration = helpers.configuration()
+    compiler = fhe.Compiler(comparison, {"x": "encrypted", "y": "encrypted"})
+
+    inputset = [(x, y) for x in range(16) for y in range(4)]
+    best, report = fhe.autotune(
+        compiler,
+        inputset,
+        COMPARISON_SEARCH_SPACE,
+        configuration=configuration,
+        workers=workers,
+    )
+
+    assert report.objective == "complexity"
+    assert len(report.candidates) == 3
+    assert all(candidate.error is None for candidate in report.candidates)
+
+    complexities = [candidate.complexity for candidate in report.candidates]
+    assert complexities == sorted(complexities)
+    assert best is report.best.configuration
+
+    for candidate in report.candidates:
+        circuit = compiler.compile(inputset, candidate.configuration)
+        assert circuit.complexity == candidate.complexity
+        assert circuit.programmable_bootstrap_count == candidate.programmable_bootstrap_count
+        assert (
+            circuit.size_of_bootstrap_keys + circuit.size_of_keyswitch_keys
+            == candidate.size_of_keys
+        )
+        compiler.reset()
+
+    assert report.format().startswith(
+        f"#1 {{comparison_strategy_preference={report.best.options['comparison_strategy_preference']}}}"
+        f" -> complexity="
+    )
+
+
+def test_autotune_budget_and_latency(helpers, monkeypatch):
+    """
+    Test `autotune` function with a budget and latency objective.
+    """
+
+    configuration = helpers.configuration()
+    compiler = fhe.Compiler(comparison, {"x": "encrypted", "y": "encrypted"})
+
+    # running a circuit takes as many ticks of a fake clock as it has programmable bootstraps
+    # so latency is deterministic, and processes running it are recorded
+    clock = [0.0]
+    processes = set()
+
+    original_run = fhe.Circuit.run
+
+    def run(circuit, *args):
+        processes.add(os.getpid())
+        clock[0] += circuit.programmable_bootstrap_count
+        return original_run(circuit, *args)
+
+    monkeypatch.setattr(fhe.Circuit, "run", run)
+    monkeypatch.setattr(autotune_module.time, "perf_counter", lambda: clock[0])
+
+    inputset = [(x, y) for x in range(8) for y in range(8)]
+    best, report = fhe.autotune(
+        compiler,
+        inputset,
+        COMPARISON_SEARCH_SPACE,
+        budget=2,
+        configuration=configuration,
+        objective="latency",
+        workers=2,
+        latency_runs=1,
+        seed=0,
+    )
+
+    assert len(report.candidates) == 2
+    assert best is report.best.configuration
+
+    # candidates are timed one after the other in this process, even with multiple workers
+    assert processes == {os.getpid()}
+
+    for candidate in report.candidates:
+        assert candidate.latency == candidate.programmable_bootstrap_count
+    assert report.best.programmable_bootstrap_count == min(
+        candidate.programmable_bootstrap_count for candidate in report.candidates
+    )
+
+
+def test_autotune_bad_usage(helpers):
+    """
+    Test `autotune` function with bad parameters.
+    """
+
+    configuration = helpers.configuration()
+    compiler = fhe.Compiler(comparison, {"x": "encrypted", "y": "encrypted"})
+
+    with pytest.raises(ValueError) as excinfo:
+        fhe.autotune(compiler, objective="speed")
+
+    assert str(excinfo.value) == (
+        "Autotuning objective 'speed' is not supported "
+        "(expected one of complexity, size_of_keys, latency)"
+    )
+
+    with pytest.raises(ValueError) as excinfo:
+        fhe.autotune(compiler, budget=0)
+
+    assert str(excinfo.value) == "Autotuning budget should be at least 1 but it's 0"
+
+    compiler = fhe.Compiler(lambda x: x * 1.5, {"x": "encrypted"})
+    with pytest.raises(RuntimeError) as excinfo:
+        fhe.autotune(compiler, range(8), COMPARISON_SEARCH_SPACE, configuration=configuration)
+
+    assert str(excinfo.value).startswith(
+        "None of the candidate configurations could be compiled\n\n"
+        "{'comparison_strategy_preference': <ComparisonStrategy.ONE_TLU_PROMOTED: "
+    )
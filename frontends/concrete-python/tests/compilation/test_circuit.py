@@ -3,6 +3,7 @@ Tests of `Circuit` class.
 """
 
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -11,7 +12,15 @@ from concrete.compiler import CompilationContext
 from mlir.ir import Module as MlirModule
 
 from concrete import fhe
-from concrete.fhe import Client, ClientSpecs, EvaluationKeys, LookupTable, Server, Value
+from concrete.fhe import (
+    Client,
+    ClientSpecs,
+    EvaluationKeys,
+    LookupTable,
+    PreparedEvaluationKeys,
+    Server,
+    Value,
+)
 
 
 def test_circuit_str(helpers):
@@ -335,6 +344,208 @@ def test_client_server_api_run_with_clear(helpers):
     assert str(excinfo.value) == "Tried to transform plaintext value with incompatible shape."
 
 
+def test_client_server_api_with_prepared_evaluation_keys(helpers):
+    """
+    Test running server run API with prepared evaluation keys.
+    """
+
+    configuration = helpers.configuration()
+
+    @fhe.compiler({"x": "encrypted"})
+    def function(x):
+        return (x**2) % 7
+
+    inputset = fhe.inputset(fhe.uint3)
+    circuit = function.compile(inputset, configuration.fork())
+
+    client = circuit.client
+    server = circuit.server
+
+    evaluation_keys = client.evaluation_keys
+    assert client.evaluation_keys is evaluation_keys
+
+    prepared_evaluation_keys = PreparedEvaluationKeys.prepare(evaluation_keys)
+    for x in range(8):
+        encrypted_x = client.encrypt(x)
+
+        result = client.decrypt(server.run(encrypted_x, evaluation_keys=evaluation_keys))
+        assert result == (x**2) % 7
+
+        result = client.decrypt(server.run(encrypted_x, evaluation_keys=prepared_evaluation_keys))
+        assert result == (x**2) % 7
+
+
+def test_client_server_api_with_saved_prepared_evaluation_keys(helpers):
+    """
+    Test running server run API with prepared evaluation keys loaded from a file.
+    """
+
+    configuration = helpers.configuration()
+
+    @fhe.compiler({"x": "encrypted"})
+    def function(x):
+        return (x**2) % 7
+
+    inputset = fhe.inputset(fhe.uint3)
+    circuit = function.compile(inputset, configuration.fork())
+
+    client = circuit.client
+    server = circuit.server
+
+    evaluation_keys = client.evaluation_keys
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = str(Path(tmp_dir) / "prepared_keys")
+        PreparedEvaluationKeys.prepare(evaluation_keys).save(path)
+        prepared_evaluation_keys = PreparedEvaluationKeys.load(evaluation_keys, path)
+
+        for x in range(8):
+            encrypted_x = client.encrypt(x)
+            result = client.decrypt(
+                server.run(encrypted_x, evaluation_keys=prepared_evaluation_keys)
+            )
+            assert result == (x**2) % 7
+
+        # new keys have the same parameters, but the file must not be used with them
+        circuit.keygen(force=True, seed=1, encryption_seed=1)
+        with pytest.raises(RuntimeError, match="were not prepared from the evaluation keys"):
+            PreparedEvaluationKeys.load(client.evaluation_keys, path)
+
+
+def test_client_server_api_run_batch(helpers):
+    """
+    Test running server run batch API.
+    """
+
+    configuration = helpers.configuration()
+
+    @fhe.compiler({"x": "encrypted", "y": "encrypted"})
+    def function(x, y):
+        return (x * y) % 7, x + y
+
+    inputset = [(x, y) for x in range(8) for y in range(8)]
+    circuit = function.compile(inputset, configuration.fork())
+
+    client = circuit.client
+    server = circuit.server
+
+    samples = [(x, (x * 3) % 8) for x in range(8)]
+    args_batch = [client.encrypt(x, y) for x, y in samples]
+    results = server.run_batch(args_batch, evaluation_keys=client.evaluation_keys)
+
+    assert len(results) == len(samples)
+    for (x, y), result in zip(samples, results):
+        assert client.decrypt(result) == ((x * y) % 7, x + y)
+
+
+def test_client_server_api_concurrent_run(helpers):
+    """
+    Test running server run API from multiple threads at the same time.
+    """
+
+    configuration = helpers.configuration()
+
+    @fhe.compiler({"x": "encrypted"})
+    def function(x):
+        return (x**2) % 7
+
+    inputset = fhe.inputset(fhe.uint3)
+    circuit = function.compile(inputset, configuration.fork())
+
+    client = circuit.client
+    server = circuit.server
+
+    sample = list(range(8)) * 2
+    encrypted_sample = [client.encrypt(x) for x in sample]
+
+    def run(encrypted_x):
+        return server.run(encrypted_x, evaluation_keys=client.evaluation_keys)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        encrypted_results = list(executor.map(run, encrypted_sample))
+
+    for x, encrypted_result in zip(sample, encrypted_results):
+        assert client.decrypt(encrypted_result) == (x**2) % 7
+
+
+def test_circuit_with_batched_tfhe_ops(helpers):
+    """
+    Test running a circuit with batched tfhe operations processed by multiple runtime threads.
+    """
+
+    configuration = helpers.configuration().fork(batch_tfhe_ops=True)
+
+    @fhe.compiler({"x": "encrypted"})
+    def function(x):
+        return (x**2) % 7
+
+    inputset = fhe.inputset(fhe.tensor[fhe.uint3, 10])  # type: ignore
+
+    fhe.set_runtime_num_threads(3)
+    try:
+        # compiling doesn't change the number of threads of the runtime
+        circuit = function.compile(inputset, configuration)
+        assert fhe.get_runtime_num_threads() == 3
+
+        sample = np.random.randint(0, 2**3, size=(10,))
+        helpers.check_execution(circuit, function, sample)
+    finally:
+        fhe.set_runtime_num_threads(0)
+
+
+@pytest.mark.parametrize("compress_input_ciphertexts", [False, True])
+def test_circuit_with_large_encrypted_tensor(compress_input_ciphertexts, helpers):
+    """
+    Test running a circuit on a tensor encrypted and decrypted by multiple threads.
+    """
+
+    configuration = helpers.configuration().fork(
+        compress_input_ciphertexts=compress_input_ciphertexts
+    )
+
+    @fhe.compiler({"x": "encrypted"})
+    def function(x):
+        return x + 1
+
+    inputset = fhe.inputset(fhe.tensor[fhe.uint3, 1000])  # type: ignore
+    circuit = function.compile(inputset, configuration)
+
+    sample = np.random.randint(0, 2**3, size=(1000,))
+    helpers.check_execution(circuit, function, sample)
+
+
+def test_circuit_large_encrypted_tensor_is_deterministic(helpers):
+    """
+    Test that encrypting a tensor split into blocks gives the same ciphertexts for any thread count.
+    """
+
+    configuration = helpers.configuration()
+
+    @fhe.compiler({"x": "encrypted"})
+    def function(x):
+        return x + 1
+
+    inputset = fhe.inputset(fhe.tensor[fhe.uint3, 1000])  # type: ignore
+    circuit = function.compile(inputset, configuration)
+    circuit.keygen(force=True, seed=0, encryption_seed=0)
+
+    sample = np.random.randint(0, 2**3, size=(1000,))
+
+    serialized = []
+    try:
+        for num_threads in [1, 4, 4]:
+            fhe.set_runtime_num_threads(num_threads)
+            serialized.append(circuit.encrypt(sample).serialize())
+    finally:
+        fhe.set_runtime_num_threads(0)
+
+    # blocks are encrypted with csprngs forked from the same seed,
+    # so ciphertexts don't depend on the number of threads nor on scheduling
+    assert serialized[0] == serialized[1]
+    assert serialized[1] == serialized[2]
+
+    assert np.array_equal(circuit.decrypt(circuit.run(circuit.encrypt(sample))), sample + 1)
+
+
 def test_client_server_api_crt(helpers):
     """
     Test client/server API on a CRT circuit.
@@ -841,3 +1052,74 @@ def test_simulate_encrypt_run_decrypt(helpers):
     assert isinstance(encrypted_y, int)
     assert hasattr(circuit, "simulator")
     assert isinstance(encrypted_result, int)
+
+
+@pytest.mark.parametrize(
+    "f",
+    [
+        pytest.param(lambda x: (x + 1) ** 2, id="(x + 1) ** 2"),
+        pytest.param(lambda x: x**2, id="x ** 2"),
+    ],
+)
+def test_graph_simulation(f, helpers):
+    """
+    Test `graph_simulation` configuration option against the compiled simulation.
+    """
+
+    random = np.random.RandomState(0)
+
+    inputset = [random.randint(0, 15, size=(1000,)) for _ in range(10)]
+    configuration = helpers.configuration().fork(
+        global_p_error=None,
+        p_error=0.1,
+        fhe_execution=False,
+        fhe_simulation=True,
+    )
+
+    compiler = fhe.Compiler(f, {"x": "encrypted"})
+    compiled_circuit = compiler.compile(inputset, configuration)
+
+    p_error = compiled_circuit.simulator.p_error
+
+    compiler = fhe.Compiler(f, {"x": "encrypted"})
+    graph_circuit = compiler.compile(inputset, configuration.fork(graph_simulation=True))
+
+    # pylint: disable=protected-access
+    assert not graph_circuit._module.simulation_runtime.initialized
+    assert graph_circuit._module.graph_simulation_runtime.val.p_error == p_error
+    # pylint: enable=protected-access
+
+    samples = [random.randint(0, 15, size=(1000,)) for _ in range(4)]
+    sample_count = sum(sample.size for sample in samples)
+
+    def error_rate(circuit):
+        errors = sum(np.count_nonzero(circuit.simulate(sample) != f(sample)) for sample in samples)
+        return errors / sample_count
+
+    compiled_error_rate = error_rate(compiled_circuit)
+
+    # errors of the graph simulation are drawn using the global random state of numpy
+    np.random.seed(0)
+    graph_error_rate = error_rate(graph_circuit)
+
+    # pylint: disable=protected-access
+    assert not graph_circuit._module.simulation_runtime.initialized
+    # pylint: enable=protected-access
+
+    # there is a single table lookup (applied directly on the input or not),
+    # so both simulations have the same probability of error, and their error rates
+    # only differ by sampling noise (5 standard deviations) and by how noise is modeled
+    tolerance = 5 * np.sqrt(p_error * (1 - p_error) / sample_count) + 0.02
+    assert compiled_error_rate > 0
+    assert abs(compiled_error_rate - p_error) < tolerance
+    assert abs(graph_error_rate - p_error) < tolerance
+    assert abs(graph_error_rate - compiled_error_rate) < 2 * tolerance
+
+    # inputs are validated the same way
+    for bad_input in [np.array([100] * 1000), np.array([1, 2, 3]), 1.5]:
+        with pytest.raises(ValueError) as compiled_excinfo:
+            compiled_circuit.simulate(bad_input)
+        with pytest.raises(ValueError) as graph_excinfo:
+            graph_circuit.simulate(bad_input)
+
+        assert str(graph_excinfo.value) == str(compiled_excinfo.value)
@@ -436,6 +436,137 @@ def test_compiler_enable_fusing(helpers):
     assert circuit4.programmable_bootstrap_count == 6
 
 
+@pytest.mark.parametrize("reservoir_size", [0, 10, 1000])
+def test_compiler_streaming_inputset(reservoir_size, helpers):
+    """
+    Test compilation with a streamed inputset.
+    """
+
+    def f(x, y):
+        return (x**2) // 3 - y
+
+    inputset = fhe.inputset(fhe.tensor[fhe.uint5, 3], fhe.int4, size=200)  # type: ignore
+    consumed = []
+
+    def stream():
+        for sample in inputset:
+            consumed.append(sample)
+            yield sample
+
+    configuration = helpers.configuration().fork(fhe_execution=False)
+
+    expected = Compiler(f, {"x": "encrypted", "y": "encrypted"})
+    expected_graph = expected.trace(inputset, configuration)
+
+    compiler = Compiler(f, {"x": "encrypted", "y": "encrypted"})
+    graph = compiler.trace(
+        stream(),
+        configuration.fork(inputset_reservoir_size=reservoir_size),
+    )
+
+    assert len(consumed) == len(inputset)
+    assert graph.format() == expected_graph.format()
+
+    retained = compiler._func_def.inputset  # pylint: disable=protected-access
+    assert len(retained) == min(reservoir_size, len(inputset))
+    for sample in retained:
+        assert any(sample is candidate for candidate in inputset)
+
+    # compiling again without an inputset uses bounds of all streamed samples
+    expected_circuit = expected.compile(configuration=configuration)
+    circuit = compiler.compile(configuration=configuration)
+    assert circuit.graph.format() == expected_circuit.graph.format()
+
+    # streaming more samples extends the measured bounds
+    additional_inputset = [(np.array([40, 50, 63]), -8)]
+    expected_graph = expected.trace(additional_inputset, configuration)
+    graph = compiler.trace(
+        iter(additional_inputset),
+        configuration.fork(inputset_reservoir_size=reservoir_size),
+    )
+    assert graph.format() == expected_graph.format()
+
+
+def test_compiler_streaming_inputset_seed(helpers):
+    """
+    Test that streamed inputsets are retained reproducibly with a seed.
+    """
+
+    def f(x):
+        return x + 1
+
+    inputset = list(range(100))
+    configuration = helpers.configuration().fork(
+        fhe_execution=False,
+        inputset_reservoir_size=10,
+        inputset_reservoir_seed=42,
+    )
+
+    retained = []
+    for _ in range(2):
+        np.random.seed(0)
+        global_state = np.random.get_state()[1].copy()
+
+        compiler = Compiler(f, {"x": "encrypted"})
+        compiler.trace(iter(inputset), configuration)
+
+        # global numpy random state is neither used nor modified
+        assert np.array_equal(np.random.get_state()[1], global_state)
+
+        retained.append(list(compiler._func_def.inputset))  # pylint: disable=protected-access
+
+    assert retained[0] == retained[1]
+    assert retained[0] != inputset[:10]
+
+
+def test_compiler_streaming_after_regular_inputset(helpers):
+    """
+    Test that streaming keeps bounds of samples retained before streaming.
+    """
+
+    def f(x):
+        return x * 2
+
+    configuration = helpers.configuration().fork(fhe_execution=False)
+    compiler = Compiler(f, {"x": "encrypted"})
+
+    compiler.compile([-20, 50, 3], configuration)
+
+    # extremes of the first inputset are evicted from the reservoir
+    circuit = compiler.compile(
+        iter([1] * 200),
+        configuration.fork(inputset_reservoir_size=2, inputset_reservoir_seed=0),
+    )
+    retained = compiler._func_def.inputset  # pylint: disable=protected-access
+    assert len(retained) == 3
+    assert -20 not in retained or 50 not in retained
+
+    # but they still set the bounds
+    assert circuit.graph.ordered_inputs()[0].bounds == (-20, 50)
+    assert circuit.graph.ordered_outputs()[0].bounds == (-40, 100)
+
+
+def test_compiler_streaming_bad_inputset(helpers):
+    """
+    Test compilation with a streamed inputset that is not well formed.
+    """
+
+    def f(x, y):
+        return x + y
+
+    configuration = helpers.configuration().fork(inputset_reservoir_size=5)
+    compiler = Compiler(f, {"x": "encrypted", "y": "encrypted"})
+
+    with pytest.raises(ValueError) as excinfo:
+        compiler.compile(iter([(1, 2), (3, 4), 5]), configuration)
+
+    assert str(excinfo.value) == (
+        "Input #2 of your inputset is not well formed "
+        "(expected a tuple of 2 values got a single value)"
+    )
+    assert compiler._func_def.inputset == []  # pylint: disable=protected-access
+
+
 def test_compiler_reset(helpers):
     def f(x, y):
         return x + y
@@ -496,3 +627,76 @@ module {
         circuit3.mlir.strip(),
     )
     compiler.reset()
+
+
+def test_compiler_incremental_compilation(helpers):
+    """
+    Test recompilation reusing the previous module when bit width assignment doesn't change.
+    """
+
+    def f(x):
+        return (x**2) // 3
+
+    compiler = Compiler(f, {"x": "encrypted"})
+    configuration = helpers.configuration().fork(incremental_compilation=True)
+
+    circuit = compiler.compile([2, 11], configuration)
+    assert circuit.rebuilt
+
+    # bounds are extended, but bit widths stay the same
+    graph = circuit.graph
+    bounds = [node.bounds for node in graph.graph.nodes]
+    reused_circuit = compiler.compile([0], configuration)
+    assert not reused_circuit.rebuilt
+    assert reused_circuit.server is circuit.server
+    assert reused_circuit.mlir == circuit.mlir
+    helpers.check_execution(reused_circuit, f, 0)
+
+    # previous circuit is not changed by the reuse
+    assert circuit.rebuilt
+    assert circuit.graph is graph
+    assert reused_circuit.graph is not graph
+    assert [node.bounds for node in graph.graph.nodes] == bounds
+    assert graph.ordered_inputs()[0].bounds == (2, 11)
+    assert reused_circuit.graph.ordered_inputs()[0].bounds == (0, 11)
+
+    # bit widths change
+    rebuilt_circuit = compiler.compile([30], configuration)
+    assert rebuilt_circuit.rebuilt
+    assert rebuilt_circuit.server is not circuit.server
+    helpers.check_execution(rebuilt_circuit, f, 30)
+
+    # configuration changes
+    assert compiler.compile(configuration=configuration.fork(p_error=0.001)).rebuilt
+
+    # incremental compilation is disabled
+    assert compiler.compile(configuration=configuration.fork(incremental_compilation=False)).rebuilt
+    assert compiler.compile(configuration=configuration).rebuilt
+
+
+def test_compiler_from_graph(helpers, tmp_path):
+    """
+    Test compiling a saved graph without tracing the original function again.
+    """
+
+    def f(x, y):
+        return fhe.round_bit_pattern(x * 4, lsbs_to_remove=2) + np.sum(y[1:])
+
+    inputset = fhe.inputset(fhe.uint4, fhe.tensor[fhe.uint3, 3])  # type: ignore
+    configuration = helpers.configuration()
+
+    compiler = Compiler(f, {"x": "encrypted", "y": "encrypted"})
+    path = tmp_path / "graph.npz"
+    compiler.trace(inputset, configuration).save(path)
+
+    circuit = compiler.compile(inputset, configuration)
+
+    # bounds of the saved graph are used when no inputset is given
+    loaded_circuit = Compiler.from_graph(fhe.Graph.load(path)).compile(configuration=configuration)
+    assert loaded_circuit.mlir == circuit.mlir
+
+    # bounds are measured again when an inputset is given
+    loaded_circuit = Compiler.from_graph(fhe.Graph.load(path)).compile(inputset, configuration)
+    assert loaded_circuit.mlir == circuit.mlir
+
+    helpers.check_execution(loaded_circuit, f, [7, np.array([1, 2, 3])])
@@ -30,11 +30,40 @@ from ..conftest import USE_MULTI_PRECISION
             RuntimeError,
             "Insecure key cache cannot be enabled without specifying its location",
         ),
+        pytest.param(
+            {"insecure_key_cache_size": 0},
+            RuntimeError,
+            "Insecure key cache size must be positive",
+        ),
         pytest.param(
             {"enable_unsafe_features": False, "simulate_encrypt_run_decrypt": True},
             RuntimeError,
             "Simulating encrypt/run/decrypt cannot be used without enabling unsafe features",
         ),
+        pytest.param(
+            {"graph_simulation": True, "detect_overflow_in_simulation": True},
+            RuntimeError,
+            "Overflow detection in simulation cannot be used with graph simulation",
+        ),
+        pytest.param(
+            {"bounds_measurement_workers": 0},
+            RuntimeError,
+            "Bounds measurement cannot be performed with less than 1 worker",
+        ),
+        pytest.param(
+            {"inputset_reservoir_size": -1},
+            RuntimeError,
+            "Inputset reservoir size cannot be negative",
+        ),
+        pytest.param(
+            {"inputset_reservoir_size": 10, "auto_adjust_rounders": True},
+            RuntimeError,
+            (
+                "Inputset streaming cannot be used with automatic adjustment "
+                "of rounders or truncators, as adjustment requires multiple passes "
+                "over the inputset"
+            ),
+        ),
     ],
 )
 def test_configuration_bad_init(kwargs, expected_error, expected_message):
@@ -143,7 +172,8 @@ FORK_NAME = "fork" if sys.version_info < (3, 10) else "Configuration.fork"
             "two-tlu-bigger-casted-smaller-promoted, "
             "three-tlu-bigger-clipped-smaller-casted, "
             "two-tlu-bigger-clipped-smaller-promoted, "
-            "chunked"
+            "chunked, "
+            "auto"
             ")",
         ),
         pytest.param(
@@ -159,7 +189,8 @@ FORK_NAME = "fork" if sys.version_info < (3, 10) else "Configuration.fork"
             "three-tlu-casted, "
             "two-tlu-bigger-promoted-smaller-casted, "
             "two-tlu-bigger-casted-smaller-promoted, "
-            "chunked"
+            "chunked, "
+            "auto"
             ")",
         ),
         pytest.param(
@@ -170,7 +201,7 @@ FORK_NAME = "fork" if sys.version_info < (3, 10) else "Configuration.fork"
         pytest.param(
             {"multivariate_strategy_preference": "bad"},
             ValueError,
-            "'bad' is not a valid 'MultivariateStrategy' (promoted, casted)",
+            "'bad' is not a valid 'MultivariateStrategy' (promoted, casted, auto)",
         ),
         pytest.param(
             {"min_max_strategy_preference": 42},
@@ -180,7 +211,18 @@ FORK_NAME = "fork" if sys.version_info < (3, 10) else "Configuration.fork"
         pytest.param(
             {"min_max_strategy_preference": "bad"},
             ValueError,
-            "'bad' is not a valid 'MinMaxStrategy' (one-tlu-promoted, three-tlu-casted, chunked)",
+            "'bad' is not a valid 'MinMaxStrategy' "
+            "(one-tlu-promoted, three-tlu-casted, chunked, auto)",
+        ),
+        pytest.param(
+            {"matmul_strategy": 42},
+            TypeError,
+            "42 cannot be parsed to a MatmulStrategy",
+        ),
+        pytest.param(
+            {"matmul_strategy": "bad"},
+            ValueError,
+            "'bad' is not a valid 'MatmulStrategy' (pairwise, shared-squares)",
         ),
         pytest.param(
             {"additional_pre_processors": "bad"},
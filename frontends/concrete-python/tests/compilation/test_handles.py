@@ -0,0 +1,283 @@
+"""
+Tests of `ValueHandle` and `ValueStore` classes.
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from concrete import fhe
+
+# pylint: disable=missing-class-docstring, missing-function-docstring, no-self-argument, unused-variable, no-member
+# same disables for ruff:
+# ruff: noqa: N805, E501
+
+
+def compile_counter(helpers, policy=None):
+    configuration = helpers.configuration()
+    policy = policy if policy is not None else fhe.NotComposable()
+
+    @fhe.module()
+    class Counter:
+        @fhe.function({"x": "encrypted"})
+        def inc(x):
+            return (x + 1) % 16
+
+        @fhe.function({"x": "encrypted"})
+        def dec(x):
+            return (x - 1) % 16
+
+        composition = policy
+
+    inputset = [np.random.randint(0, 16, size=()) for _ in range(100)]
+    module = Counter.compile({"inc": inputset, "dec": inputset}, configuration)
+    module.keygen()
+
+    return module
+
+
+def test_server_run_with_handles(helpers):
+    """
+    Test running a server with handles to values held by the server.
+    """
+
+    module = compile_counter(helpers, fhe.AllComposable())
+
+    server = module.server
+    client = module.client
+
+    evaluation_keys = client.evaluation_keys
+    arg = client.encrypt(5, function_name="inc")
+
+    handle = server.run(
+        arg, evaluation_keys=evaluation_keys, function_name="inc", return_handles=True
+    )
+    assert isinstance(handle, fhe.ValueHandle)
+    assert handle in server.values
+
+    for _ in range(3):
+        handle = fhe.ValueHandle.deserialize(handle.serialize())
+        handle = server.run(
+            handle,
+            evaluation_keys=evaluation_keys,
+            function_name="inc",
+            return_handles=True,
+        )
+
+    result = server.run(handle, evaluation_keys=evaluation_keys, function_name="dec")
+    assert isinstance(result, fhe.Value)
+    assert client.decrypt(result, function_name="dec") == 8
+
+    assert (
+        client.decrypt(server.values.get(handle, owner=evaluation_keys), function_name="inc") == 9
+    )
+    assert len(server.values) == 4
+
+    server.values.release(handle)
+    assert handle not in server.values
+    assert len(server.values) == 3
+
+    with pytest.raises(KeyError):
+        server.run(handle, evaluation_keys=evaluation_keys, function_name="inc")
+
+    server.values.clear()
+    assert len(server.values) == 0
+
+
+def test_server_run_with_handles_against_composition(helpers):
+    """
+    Test running a server with handles which are not allowed by the composition rules.
+    """
+
+    module = compile_counter(helpers)
+
+    server = module.server
+    client = module.client
+
+    evaluation_keys = client.evaluation_keys
+    arg = client.encrypt(5, function_name="inc")
+
+    handle = server.run(
+        arg, evaluation_keys=evaluation_keys, function_name="inc", return_handles=True
+    )
+    with pytest.raises(ValueError) as excinfo:
+        server.run(handle, evaluation_keys=evaluation_keys, function_name="dec")
+
+    assert str(excinfo.value) == (
+        "Expected argument 0 of dec to be an fhe.Value "
+        "but it's a handle to output 0 of inc, "
+        "which cannot be used as argument 0 of dec "
+        "as it's not allowed by the composition rules"
+    )
+
+
+def test_server_run_with_forged_handles(helpers):
+    """
+    Test running a server with handles which don't match the values held by the server.
+    """
+
+    configuration = helpers.configuration()
+
+    @fhe.module()
+    class Counter:
+        @fhe.function({"x": "encrypted"})
+        def inc(x):
+            return (x + 1) % 16
+
+        @fhe.function({"x": "encrypted"})
+        def dec(x):
+            return (x - 1) % 16
+
+        composition = fhe.Wired({fhe.Wire(fhe.Output(inc, 0), fhe.Input(inc, 0))})
+
+    inputset = [np.random.randint(0, 16, size=()) for _ in range(100)]
+    module = Counter.compile({"inc": inputset, "dec": inputset}, configuration)
+    module.keygen()
+
+    server = module.server
+    client = module.client
+
+    evaluation_keys = client.evaluation_keys
+    arg = client.encrypt(5, function_name="dec")
+
+    handle = server.run(
+        arg, evaluation_keys=evaluation_keys, function_name="dec", return_handles=True
+    )
+
+    # output of dec is relabeled as output of inc, which is allowed to be used as argument of inc
+    forged_handle = fhe.ValueHandle(handle.identifier, "inc", handle.position)
+    with pytest.raises(ValueError) as excinfo:
+        server.run(forged_handle, evaluation_keys=evaluation_keys, function_name="inc")
+
+    assert str(excinfo.value) == (
+        f"Value with handle {handle.identifier} is output 0 of dec, not output 0 of inc"
+    )
+
+    # values can only be used with the evaluation keys they were produced with
+    handle = server.run(
+        client.encrypt(5, function_name="inc"),
+        evaluation_keys=evaluation_keys,
+        function_name="inc",
+        return_handles=True,
+    )
+    value = server.values.get(handle, owner=evaluation_keys)
+    assert client.decrypt(value, function_name="inc") == 6
+
+    module.keygen(force=True, seed=1, encryption_seed=1)
+    other_evaluation_keys = client.evaluation_keys
+    assert other_evaluation_keys is not evaluation_keys
+
+    with pytest.raises(KeyError):
+        server.run(handle, evaluation_keys=other_evaluation_keys, function_name="inc")
+    with pytest.raises(KeyError):
+        server.values.get(handle)
+
+
+def test_server_run_with_handles_and_deserialized_keys(helpers):
+    """
+    Test running a server with handles, deserializing the evaluation keys for each call.
+    """
+
+    module = compile_counter(helpers, fhe.AllComposable())
+
+    server = module.server
+    client = module.client
+
+    serialized_evaluation_keys = client.evaluation_keys.serialize()
+    arg = client.encrypt(5, function_name="inc")
+
+    handle = server.run(
+        arg,
+        evaluation_keys=fhe.EvaluationKeys.deserialize(serialized_evaluation_keys),
+        function_name="inc",
+        return_handles=True,
+    )
+    prepared_evaluation_keys = server._prepared_evaluation_keys  # pylint: disable=protected-access
+
+    for _ in range(3):
+        handle = server.run(
+            fhe.ValueHandle.deserialize(handle.serialize()),
+            evaluation_keys=fhe.EvaluationKeys.deserialize(serialized_evaluation_keys),
+            function_name="inc",
+            return_handles=True,
+        )
+
+    # keys with the same content are prepared only once
+    assert server._prepared_evaluation_keys is prepared_evaluation_keys  # pylint: disable=protected-access
+
+    value = server.values.get(
+        handle,
+        owner=fhe.EvaluationKeys.deserialize(serialized_evaluation_keys),
+    )
+    assert client.decrypt(value, function_name="inc") == 9
+
+    module.keygen(force=True, seed=1, encryption_seed=1)
+    with pytest.raises(KeyError):
+        server.values.get(handle, owner=client.evaluation_keys)
+
+
+def test_value_store_ttl_and_spill(helpers):
+    """
+    Test expiration and spilling of values held in a value store.
+    """
+
+    module = compile_counter(helpers)
+    client = module.client
+
+    values = [client.encrypt(i, function_name="inc") for i in range(4)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir)
+
+        store = fhe.ValueStore(spill_directory=tmp_dir_path, max_resident_values=2)
+        handles = [store.put(value, "inc", 0) for value in values]
+
+        assert store.resident_count == 2
+        assert store.spilled_count == 2
+        assert len(list(tmp_dir_path.iterdir())) == 2
+
+        for value, handle in zip(values, handles):
+            assert store.get(handle).serialize() == value.serialize()
+
+        assert store.resident_count == 2
+        assert store.spilled_count == 2
+
+        store.clear()
+        assert len(list(tmp_dir_path.iterdir())) == 0
+
+    store = fhe.ValueStore(ttl=0.5)
+    handle = store.put(values[0], "inc", 0)
+
+    time.sleep(0.25)
+    assert store.get(handle).serialize() == values[0].serialize()
+
+    time.sleep(0.25)
+    assert handle in store
+
+    time.sleep(0.75)
+    assert handle not in store
+    assert store.evict_expired() == 0
+
+    with pytest.raises(KeyError):
+        store.get(handle)
+
+
+def test_bad_value_store():
+    """
+    Test creating value stores with bad parameters.
+    """
+
+    with pytest.raises(ValueError) as excinfo:
+        fhe.ValueStore(ttl=0)
+
+    assert str(excinfo.value) == "Expected ttl to be positive but it's 0"
+
+    with pytest.raises(ValueError) as excinfo:
+        fhe.ValueStore(max_resident_values=10)
+
+    assert (
+        str(excinfo.value) == "Expected spill_directory to be set when max_resident_values is set"
+    )
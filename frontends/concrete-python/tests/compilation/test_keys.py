@@ -2,6 +2,7 @@
 Tests of `Keys` class.
 """
 
+import shutil
 import tempfile
 from pathlib import Path
 
@@ -168,3 +169,109 @@ def test_keys_generate_manual_seed(helpers):
     assert same_circuit.keys.are_generated
 
     assert same_circuit.decrypt(evaluation) == 25
+
+
+def test_keys_cache_statistics_and_eviction(helpers):
+    """
+    Test statistics and eviction of the keyset cache.
+    """
+
+    @fhe.compiler({"x": "encrypted"})
+    def f(x):
+        return x**2
+
+    inputset = range(10)
+
+    circuit = f.compile(inputset, helpers.configuration().fork(use_insecure_key_cache=False))
+    assert circuit.keys.cache_statistics is None
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir)
+        configuration = helpers.configuration().fork(insecure_key_cache_location=tmp_dir_path)
+
+        circuit1 = f.compile(inputset, configuration)
+        circuit1.keygen(seed=1, encryption_seed=1)
+        assert circuit1.keys.cache_statistics == {"hits": 0, "misses": 1, "evictions": 0}
+
+        circuit2 = f.compile(inputset, configuration)
+        circuit2.keygen(seed=1, encryption_seed=1)
+        assert circuit2.keys.cache_statistics == {"hits": 1, "misses": 0, "evictions": 0}
+
+        sample = circuit1.encrypt(5)
+        evaluation = circuit1.run(sample)
+        assert circuit2.decrypt(evaluation) == 25
+
+        circuit3 = f.compile(inputset, configuration.fork(insecure_key_cache_size=1))
+        circuit3.keygen(seed=2, encryption_seed=2)
+        assert circuit3.keys.cache_statistics == {"hits": 0, "misses": 1, "evictions": 1}
+
+        assert len([entry for entry in tmp_dir_path.iterdir() if entry.is_dir()]) == 1
+
+
+def test_keys_cache_lazy_evaluation_keys(helpers):
+    """
+    Test loading evaluation keys from the keyset cache only when they are used.
+    """
+
+    @fhe.compiler({"x": "encrypted"})
+    def f(x):
+        return x**2
+
+    inputset = range(10)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir)
+        configuration = helpers.configuration().fork(insecure_key_cache_location=tmp_dir_path)
+
+        circuit1 = f.compile(inputset, configuration)
+        circuit1.keygen(seed=1, encryption_seed=1)
+
+        circuit2 = f.compile(inputset, configuration)
+        circuit2.keygen(seed=1, encryption_seed=1)
+        assert circuit2.keys.cache_statistics == {"hits": 1, "misses": 0, "evictions": 0}
+
+        # encryption and decryption only need the secret keys
+        sample = circuit2.encrypt(5)
+
+        # the evaluation keys are generated again if the entry is gone by the time they are used
+        for entry in tmp_dir_path.iterdir():
+            if entry.is_dir():
+                shutil.rmtree(entry)
+
+        assert circuit2.keys.evaluation.serialize() == circuit1.keys.evaluation.serialize()
+        assert circuit2.decrypt(circuit2.run(sample)) == 25
+
+
+def test_keys_cache_eviction_between_encrypt_and_run(helpers):
+    """
+    Test evicting a cached keyset after encrypting and before running with its evaluation keys.
+    """
+
+    @fhe.compiler({"x": "encrypted"})
+    def f(x):
+        return x**2
+
+    inputset = range(10)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir_path = Path(tmp_dir)
+        configuration = helpers.configuration().fork(insecure_key_cache_location=tmp_dir_path)
+
+        # keys are generated from random seeds
+        circuit1 = f.compile(inputset, configuration)
+        circuit1.keygen()
+
+        circuit2 = f.compile(inputset, configuration)
+        circuit2.keygen()
+        assert circuit2.keys.cache_statistics == {"hits": 1, "misses": 0, "evictions": 0}
+
+        sample = circuit2.encrypt(5)
+
+        # another compilation evicts the keyset of the circuits
+        circuit3 = f.compile(inputset, configuration.fork(insecure_key_cache_size=1))
+        circuit3.keygen(seed=2, encryption_seed=2)
+        assert circuit3.keys.cache_statistics == {"hits": 0, "misses": 1, "evictions": 1}
+
+        # the evaluation keys generated again match the secret keys used to encrypt
+        assert circuit2.decrypt(circuit2.run(sample)) == 25
+        assert circuit2.keys.cache_statistics == {"hits": 1, "misses": 1, "evictions": 0}
@@ -256,6 +256,87 @@ def test_compile():
         assert repr(module.dec) == "FheFunction(name=dec)"
 
 
+def test_compile_with_bounds_measurement_workers(helpers):
+    """
+    Test that compiling a module with multiple bounds measurement workers gives the same result.
+    """
+
+    def create_module():
+        @fhe.module()
+        class Module:
+            @fhe.function({"x": "encrypted"})
+            def square(x):
+                return x**2
+
+            @fhe.function({"x": "encrypted", "y": "encrypted"})
+            def sin_add(x, y):
+                return np.round(np.sin(x) * 10).astype(np.int64) + y
+
+        return Module
+
+    inputsets = {
+        "square": fhe.inputset(fhe.tensor[fhe.uint3, 2, 3], size=50),  # type: ignore
+        "sin_add": fhe.inputset(fhe.uint4, fhe.int3, size=30),
+    }
+
+    configuration = helpers.configuration().fork(fhe_execution=False)
+    serial = create_module().compile(inputsets, configuration)
+    parallel = create_module().compile(
+        inputsets,
+        configuration.fork(bounds_measurement_workers=3),
+    )
+
+    assert parallel.mlir == serial.mlir
+    for name in ["square", "sin_add"]:
+        assert parallel.graphs[name] is not serial.graphs[name]
+        assert parallel.graphs[name].format() == serial.graphs[name].format()
+
+
+def test_compile_incrementally(helpers):
+    """
+    Test that recompiling a module only rebuilds it when bit width assignment changes.
+    """
+
+    @fhe.module()
+    class Module:
+        @fhe.function({"x": "encrypted"})
+        def square(x):
+            return x**2
+
+        @fhe.function({"x": "encrypted", "y": "encrypted"})
+        def sin_add(x, y):
+            return np.round(np.sin(x) * 10).astype(np.int64) + y
+
+        composition = fhe.NotComposable()
+
+    configuration = helpers.configuration().fork(
+        fhe_execution=False,
+        single_precision=False,
+        parameter_selection_strategy="multi",
+        incremental_compilation=True,
+    )
+
+    module = Module.compile(
+        {"square": [1, 7], "sin_add": [(0, 0), (15, -4)]},
+        configuration,
+    )
+    assert sorted(module.rebuilt_functions) == ["sin_add", "square"]
+
+    reused = Module.compile({"square": [0], "sin_add": [(0, 0)]}, configuration)
+    assert reused is not module
+    assert reused.execution_runtime is module.execution_runtime
+    assert reused.rebuilt_functions == []
+
+    # previous module is not changed by the reuse
+    assert sorted(module.rebuilt_functions) == ["sin_add", "square"]
+    assert module.graphs["square"] is not reused.graphs["square"]
+
+    rebuilt = Module.compile({"square": [100], "sin_add": [(0, 0)]}, configuration)
+    assert rebuilt is not module
+    assert rebuilt.rebuilt_functions == ["square"]
+    assert rebuilt.mlir != module.mlir
+
+
 def test_compiled_wrong_attribute():
     """
     Test that getting unexisting attribute on module fails
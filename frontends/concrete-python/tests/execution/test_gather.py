@@ -0,0 +1,164 @@
+"""
+Tests of execution of gather and scatter extensions.
+"""
+
+import numpy as np
+import pytest
+
+from concrete import fhe
+
+# pylint: disable=redefined-outer-name
+
+CLEAR_VECTOR = np.array([3, 1, 4, 1, 5, 9, 2, 6])
+CLEAR_TALL_MATRIX = np.array([[i, (i * 3) % 8, (i * 5) % 8] for i in range(8)])
+CLEAR_WIDE_MATRIX = np.array([[(i * j) % 16 for j in range(12)] for i in range(4)])
+
+
+def test_plain_gather_scatter():
+    """
+    Test plain evaluation of gather and scatter extensions.
+    """
+
+    assert fhe.gather(CLEAR_VECTOR, 5) == 9
+    assert np.array_equal(fhe.gather(CLEAR_TALL_MATRIX, 3), CLEAR_TALL_MATRIX[3])
+
+    result = fhe.scatter(CLEAR_VECTOR, 2, 7)
+    assert np.array_equal(result, [3, 1, 7, 1, 5, 9, 2, 6])
+    assert np.array_equal(CLEAR_VECTOR, [3, 1, 4, 1, 5, 9, 2, 6])
+
+
+@pytest.mark.parametrize(
+    "function,parameters,expected_programmable_bootstrap_count,clear_table",
+    [
+        pytest.param(
+            lambda index: fhe.gather(CLEAR_VECTOR, index),
+            {
+                "index": {"range": [0, 7], "status": "encrypted"},
+            },
+            # single table lookup
+            1,
+            CLEAR_VECTOR,
+            id="fhe.gather(clear_vector, index)",
+        ),
+        pytest.param(
+            lambda index: fhe.gather(CLEAR_TALL_MATRIX, index),
+            {
+                "index": {"range": [0, 7], "status": "encrypted"},
+            },
+            # table lookup for each column
+            3,
+            CLEAR_TALL_MATRIX,
+            id="fhe.gather(clear_tall_matrix, index)",
+        ),
+        pytest.param(
+            lambda index: fhe.gather(CLEAR_WIDE_MATRIX, index),
+            {
+                "index": {"range": [0, 3], "status": "encrypted"},
+            },
+            # selection and dot product
+            4,
+            CLEAR_WIDE_MATRIX,
+            id="fhe.gather(clear_wide_matrix, index)",
+        ),
+        pytest.param(
+            lambda table, index: fhe.gather(table, index),
+            {
+                "table": {"range": [0, 7], "status": "encrypted", "shape": (6, 2)},
+                "index": {"range": [0, 5], "status": "encrypted"},
+            },
+            # selection and a single table lookup for each entry
+            6 + 12,
+            None,
+            id="fhe.gather(table, index)",
+        ),
+        pytest.param(
+            lambda table, index, value: fhe.scatter(table, index, value),
+            {
+                "table": {"range": [0, 7], "status": "encrypted", "shape": (6, 2)},
+                "index": {"range": [0, 5], "status": "encrypted"},
+                "value": {"range": [0, 7], "status": "encrypted", "shape": (2,)},
+            },
+            None,
+            None,
+            id="fhe.scatter(table, index, value)",
+        ),
+        pytest.param(
+            lambda index, value: fhe.scatter(CLEAR_TALL_MATRIX, index, value),
+            {
+                "index": {"range": [0, 7], "status": "encrypted"},
+                "value": {"range": [0, 7], "status": "encrypted"},
+            },
+            None,
+            None,
+            id="fhe.scatter(clear_tall_matrix, index, value)",
+        ),
+        pytest.param(
+            lambda table, index: fhe.scatter(table, index, 5),
+            {
+                "table": {"range": [0, 7], "status": "encrypted", "shape": (6,)},
+                "index": {"range": [0, 5], "status": "encrypted"},
+            },
+            None,
+            None,
+            id="fhe.scatter(table, index, 5)",
+        ),
+    ],
+)
+def test_gather_scatter(
+    function,
+    parameters,
+    expected_programmable_bootstrap_count,
+    clear_table,
+    helpers,
+):
+    """
+    Test encrypted evaluation of gather and scatter extensions.
+    """
+
+    parameter_encryption_statuses = helpers.generate_encryption_statuses(parameters)
+    configuration = helpers.configuration()
+
+    compiler = fhe.Compiler(function, parameter_encryption_statuses)
+
+    inputset = helpers.generate_inputset(parameters)
+    circuit = compiler.compile(inputset, configuration)
+
+    if expected_programmable_bootstrap_count is not None:
+        assert circuit.programmable_bootstrap_count == expected_programmable_bootstrap_count
+
+        # compare with selecting entries using a separate comparison for each position
+        counts = fhe.gather_programmable_bootstrap_counts(clear_table, inputset, configuration)
+        assert counts["gather"] == circuit.programmable_bootstrap_count
+        assert counts["gather"] <= counts["naive"]
+
+        tag = "gather" if "gather" in circuit.programmable_bootstrap_count_per_tag else "scatter"
+        assert (
+            circuit.programmable_bootstrap_count_per_tag[tag]
+            == circuit.programmable_bootstrap_count
+        )
+
+    for sample in inputset[:3]:
+        sample = list(sample) if isinstance(sample, tuple) else sample
+        helpers.check_execution(circuit, function, sample, retries=3)
+
+
+def test_bad_gather_scatter():
+    """
+    Test gather and scatter extensions with bad parameters.
+    """
+
+    def gather_from_scalar(index):
+        return fhe.gather(3, index)
+
+    with pytest.raises(ValueError) as excinfo:
+        fhe.Compiler(gather_from_scalar, {"index": "encrypted"}).trace(range(4))
+
+    assert str(excinfo.value) == "gather from a scalar table is not supported"
+
+    def gather_from_float_table(index):
+        return fhe.gather([1.5, 2.5], index)
+
+    with pytest.raises(ValueError) as excinfo:
+        fhe.Compiler(gather_from_float_table, {"index": "encrypted"}).trace(range(2))
+
+    assert str(excinfo.value) == "gather from a table of float64 is not supported"
@@ -130,3 +130,55 @@ def test_if_then_else(
 
     for sample in random.sample(inputset, 8):
         helpers.check_execution(circuit, function, list(sample), retries=3)
+
+
+@pytest.mark.parametrize(
+    "function,expected_programmable_bootstrap_count",
+    [
+        pytest.param(
+            lambda condition, value: np.where(condition, value, 0),
+            3,
+            id="np.where(condition, value, 0)",
+        ),
+        pytest.param(
+            lambda condition, value: np.where(condition, 0, value),
+            3,
+            id="np.where(condition, 0, value)",
+        ),
+        pytest.param(
+            lambda condition, value: np.where(condition, value - 4, 0) + 100,
+            3,
+            id="np.where(condition, value - 4, 0) + 100",
+        ),
+        pytest.param(
+            lambda condition, value: np.where(condition, value * 3, np.zeros((2, 3), np.int64)),
+            None,
+            id="np.where(condition, value * 3, np.zeros((2, 3), np.int64))",
+        ),
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [2, 3])
+def test_if_then_else_with_zero(
+    function,
+    expected_programmable_bootstrap_count,
+    chunk_size,
+    helpers,
+):
+    """
+    Test encrypted evaluation of `if_then_else` extension with a zero outcome.
+    """
+
+    inputset = [
+        (np.random.randint(0, 2, size=(3,)), np.random.randint(0, 8, size=(3,))) for _ in range(100)
+    ]
+    configuration = helpers.configuration().fork(if_then_else_chunk_size=chunk_size)
+
+    compiler = fhe.Compiler(function, {"condition": "encrypted", "value": "encrypted"})
+    circuit = compiler.compile(inputset, configuration)
+
+    if chunk_size == 3 and expected_programmable_bootstrap_count is not None:
+        # outcome fits in a single chunk, so it's a single table lookup per element
+        assert circuit.programmable_bootstrap_count == expected_programmable_bootstrap_count
+
+    for sample in random.sample(inputset, 4):
+        helpers.check_execution(circuit, function, list(sample), retries=3)
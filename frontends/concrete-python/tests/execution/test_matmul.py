@@ -362,3 +362,51 @@ def test_zero_matmul(bit_width, signed, helpers):
     ]
 
     helpers.check_execution(circuit, function, sample, retries=3)
+
+
+@pytest.mark.parametrize(
+    "lhs_shape,rhs_shape,bounds",
+    [
+        pytest.param((3, 4), (4, 5), (0, 4)),
+        pytest.param((2, 3), (3, 3), (-4, 4)),
+        pytest.param((4, 2), (2, 4), (0, 8)),
+    ],
+)
+def test_matmul_with_shared_squares(lhs_shape, rhs_shape, bounds, helpers):
+    """
+    Test encrypted matmul with shared squares strategy.
+    """
+
+    minimum, maximum = bounds
+
+    @fhe.compiler({"x": "encrypted", "y": "encrypted"})
+    def function(x, y):
+        return x @ y
+
+    inputset = [
+        (
+            np.random.randint(minimum, maximum, size=lhs_shape),
+            np.random.randint(minimum, maximum, size=rhs_shape),
+        )
+        for _ in range(100)
+    ]
+
+    configuration = helpers.configuration()
+
+    pairwise_circuit = function.compile(
+        inputset,
+        configuration.fork(matmul_strategy=fhe.MatmulStrategy.PAIRWISE),
+    )
+    shared_squares_circuit = function.compile(
+        inputset,
+        configuration.fork(matmul_strategy="shared-squares"),
+    )
+
+    m, k = lhs_shape
+    n = rhs_shape[1]
+
+    assert pairwise_circuit.programmable_bootstrap_count == 2 * m * k * n
+    assert shared_squares_circuit.programmable_bootstrap_count == (m * k * n) + (m * k) + (k * n)
+
+    for sample in [list(inputset[-1]), list(inputset[-2])]:
+        helpers.check_execution(shared_squares_circuit, function, sample, retries=3)
@@ -15,7 +15,7 @@ cases = []
 for operation in ["max", "min"]:
     for bit_width in range(1, 5):
         for is_signed in [False, True]:
-            for shape in [(), (4,), (3, 3)]:
+            for shape in [(), (4,), (3, 3), (5,), (2, 3, 5)]:
                 for keepdims in [False, True]:
                     for strategy in [
                         fhe.MinMaxStrategy.ONE_TLU_PROMOTED,
@@ -177,3 +177,40 @@ def test_min_max(
     ]
     for sample in samples:
         helpers.check_execution(circuit, function, sample, retries=5)
+
+
+@pytest.mark.parametrize(
+    "operation,shape,axis,expected_depth",
+    [
+        pytest.param("min", (7,), None, 3),
+        pytest.param("max", (5, 3), 0, 3),
+        pytest.param("min", (3, 5), None, 4),
+        pytest.param("max", (2, 3, 5), (0, 2), 4),
+        pytest.param("min", (3, 3, 3), (0, 1, 2), 5),
+    ],
+)
+def test_min_max_depth(operation, shape, axis, expected_depth, helpers):
+    """
+    Test np.min/np.max are lowered into a balanced reduction tree.
+    """
+
+    def function(x):
+        if operation == "min":
+            return np.min(x, axis=axis)
+        else:
+            return np.max(x, axis=axis)
+
+    configuration = helpers.configuration().fork(
+        min_max_strategy_preference=[fhe.MinMaxStrategy.ONE_TLU_PROMOTED],
+    )
+    compiler = fhe.Compiler(function, {"x": "encrypted"})
+
+    inputset = [np.random.randint(0, 2**3, size=shape) for _ in range(100)]
+    circuit = compiler.compile(inputset, configuration)
+
+    # each level of the tree is a single tensor comparison, which is a single table lookup
+    # with the promoted strategy, so number of table lookups is the depth of the tree
+    assert circuit.mlir.count("apply_lookup_table") == expected_depth
+
+    sample = np.random.randint(0, 2**3, size=shape)
+    helpers.check_execution(circuit, function, sample, retries=5)
@@ -0,0 +1,206 @@
+"""
+Tests of execution of radix extensions.
+"""
+
+import numpy as np
+import pytest
+
+from concrete import fhe
+
+
+@pytest.mark.parametrize(
+    "chunk_width,number_of_chunks",
+    [
+        pytest.param(1, 5),
+        pytest.param(2, 3),
+        pytest.param(3, 7),
+        pytest.param(4, 8),
+    ],
+)
+def test_plain_radix(chunk_width, number_of_chunks):
+    """
+    Test plain evaluation of radix extensions.
+    """
+
+    modulus = 2 ** (chunk_width * number_of_chunks)
+    values = [0, 1, modulus - 1] + list(np.random.randint(0, modulus, size=(20,)))
+
+    for a in values:
+        for b in values[:5]:
+            x = fhe.radix_encode(a, chunk_width, number_of_chunks)
+            y = fhe.radix_encode(b, chunk_width, number_of_chunks)
+
+            assert fhe.radix_decode(x, chunk_width) == a
+
+            assert fhe.radix_decode(fhe.radix_add(x, y, chunk_width), chunk_width) == (
+                (int(a) + int(b)) % modulus
+            )
+            assert fhe.radix_decode(fhe.radix_multiply(x, y, chunk_width), chunk_width) == (
+                (int(a) * int(b)) % modulus
+            )
+
+            assert fhe.radix_less(x, y, chunk_width) == (a < b)
+            assert fhe.radix_less(y, x, chunk_width) == (b < a)
+            assert fhe.radix_equal(x, y, chunk_width) == (a == b)
+
+
+def test_plain_radix_tlu():
+    """
+    Test plain evaluation of radix table lookups.
+    """
+
+    values = np.array([[0, 255], [17, 200]])
+    x = fhe.radix_encode(values, 4, 2)
+
+    result = fhe.radix_tlu(x, lambda value: (value * 7) % 256)
+    assert np.array_equal(fhe.radix_decode(result, 4), (values * 7) % 256)
+
+    result = fhe.radix_tlu(x, lambda value: value * value, number_of_output_chunks=4)
+    assert np.array_equal(fhe.radix_decode(result, 4), values * values)
+
+
+@pytest.mark.parametrize(
+    "function,operation,chunk_width,number_of_chunks",
+    [
+        pytest.param(
+            fhe.radix_add,
+            lambda a, b: (a + b) % 2**24,
+            4,
+            6,
+            id="fhe.radix_add(x, y)",
+        ),
+        pytest.param(
+            fhe.radix_multiply,
+            lambda a, b: (a * b) % 2**16,
+            2,
+            8,
+            id="fhe.radix_multiply(x, y)",
+        ),
+        pytest.param(
+            fhe.radix_less,
+            lambda a, b: int(a < b),
+            4,
+            6,
+            id="fhe.radix_less(x, y)",
+        ),
+        pytest.param(
+            fhe.radix_equal,
+            lambda a, b: int(a == b),
+            4,
+            6,
+            id="fhe.radix_equal(x, y)",
+        ),
+    ],
+)
+def test_radix(function, operation, chunk_width, number_of_chunks, helpers):
+    """
+    Test encrypted evaluation of radix extensions on integers wider than chunks.
+    """
+
+    configuration = helpers.configuration()
+    modulus = 2 ** (chunk_width * number_of_chunks)
+
+    def sample():
+        a, b = np.random.randint(0, modulus, size=(2,))
+        if np.random.randint(0, 4) == 0:
+            b = a
+        return int(a), int(b)
+
+    samples = [sample() for _ in range(100)] + [(modulus - 1, modulus - 1), (0, 0)]
+    inputset = [
+        (
+            fhe.radix_encode(a, chunk_width, number_of_chunks),
+            fhe.radix_encode(b, chunk_width, number_of_chunks),
+        )
+        for a, b in samples
+    ]
+
+    compiler = fhe.Compiler(
+        lambda x, y: function(x, y, chunk_width),
+        {"x": "encrypted", "y": "encrypted"},
+    )
+    circuit = compiler.compile(inputset, configuration)
+
+    # every table lookup is on small chunks instead of wide values
+    assert circuit.graph.maximum_integer_bit_width() <= 6
+
+    for (a, b), (x, y) in list(zip(samples, inputset))[:3]:
+        result = circuit.encrypt_run_decrypt(x, y)
+        if np.ndim(result) != 0:
+            result = fhe.radix_decode(result, chunk_width)
+        assert result == operation(a, b)
+
+
+@pytest.mark.parametrize(
+    "function,chunk_width,number_of_chunks,number_of_output_chunks",
+    [
+        pytest.param(lambda value: (value * value) % 64, 2, 3, None, id="square"),
+        pytest.param(lambda value: value // 3, 3, 2, 2, id="division"),
+        pytest.param(lambda value: int(value > 100), 4, 2, 1, id="threshold"),
+        pytest.param(lambda value: (value * 37) % 5, 2, 1, None, id="single-chunk"),
+    ],
+)
+def test_radix_tlu(function, chunk_width, number_of_chunks, number_of_output_chunks, helpers):
+    """
+    Test encrypted evaluation of radix table lookups.
+    """
+
+    configuration = helpers.configuration()
+    modulus = 2 ** (chunk_width * number_of_chunks)
+
+    samples = [0, modulus - 1] + [int(value) for value in np.random.randint(0, modulus, size=(50,))]
+    inputset = [fhe.radix_encode(value, chunk_width, number_of_chunks) for value in samples]
+
+    compiler = fhe.Compiler(
+        lambda x: fhe.radix_tlu(x, function, chunk_width, number_of_output_chunks),
+        {"x": "encrypted"},
+    )
+    circuit = compiler.compile(inputset, configuration)
+
+    # every table lookup is on small chunks instead of wide values
+    assert circuit.graph.maximum_integer_bit_width() <= chunk_width + 2
+
+    for value, x in list(zip(samples, inputset))[:3]:
+        result = circuit.encrypt_run_decrypt(x)
+        assert fhe.radix_decode(result, chunk_width) == function(value)
+
+
+def test_bad_radix():
+    """
+    Test radix extensions with bad parameters.
+    """
+
+    with pytest.raises(ValueError) as excinfo:
+        fhe.radix_encode(256, 4, 2)
+
+    assert str(excinfo.value) == (
+        "radix_encode of values outside of [0, 256) into 2 4-bit chunks is not supported"
+    )
+
+    with pytest.raises(ValueError) as excinfo:
+        fhe.radix_encode(3, 0, 2)
+
+    assert str(excinfo.value) == "radix representation with 0-bit chunks is not supported"
+
+    with pytest.raises(ValueError) as excinfo:
+        fhe.radix_add(3, 4)
+
+    assert str(excinfo.value) == (
+        "radix_add of scalars is not supported (radix values need an axis of chunks)"
+    )
+
+    with pytest.raises(ValueError) as excinfo:
+        fhe.radix_multiply([1, 2], [1, 2, 3])
+
+    assert str(excinfo.value) == (
+        "radix_multiply of radix values with different number of chunks (2 and 3) "
+        "is not supported"
+    )
+
+    with pytest.raises(ValueError) as excinfo:
+        fhe.radix_tlu([1, 2], lambda value: value + 256)
+
+    assert str(excinfo.value) == (
+        "radix_tlu of a function which returns 256 for 0 is not supported "
+        "(results must be integers in [0, 256))"
+    )
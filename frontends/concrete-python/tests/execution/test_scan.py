@@ -0,0 +1,145 @@
+"""
+Tests of execution of scan and first match extensions.
+"""
+
+import numpy as np
+import pytest
+
+from concrete import fhe
+
+
+@pytest.mark.parametrize(
+    "function,sample,expected_output",
+    [
+        pytest.param(
+            lambda x: fhe.scan(x),
+            [1, 2, 3, 4, 5],
+            [1, 3, 6, 10, 15],
+            id="fhe.scan(x)",
+        ),
+        pytest.param(
+            lambda x: fhe.scan(x, exclusive=True),
+            [1, 2, 3, 4, 5],
+            [0, 1, 3, 6, 10],
+            id="fhe.scan(x, exclusive=True)",
+        ),
+        pytest.param(
+            lambda x: fhe.scan(x, np.bitwise_or),
+            [0, 0, 1, 0, 1, 0],
+            [0, 0, 1, 1, 1, 1],
+            id="fhe.scan(x, np.bitwise_or)",
+        ),
+        pytest.param(
+            lambda x: fhe.scan(x, np.maximum, axis=1),
+            [[1, 3, 2, 7, 0], [5, 1, 6, 0, 2]],
+            [[1, 3, 3, 7, 7], [5, 5, 6, 6, 6]],
+            id="fhe.scan(x, np.maximum, axis=1)",
+        ),
+        pytest.param(
+            lambda x: fhe.first_match(x),
+            [0, 0, 1, 0, 1, 1],
+            [0, 0, 1, 0, 0, 0],
+            id="fhe.first_match(x)",
+        ),
+        pytest.param(
+            lambda x: fhe.first_match(x, axis=-1),
+            [[0, 1, 1], [0, 0, 0]],
+            [[0, 1, 0], [0, 0, 0]],
+            id="fhe.first_match(x, axis=-1)",
+        ),
+    ],
+)
+def test_plain_scan(function, sample, expected_output):
+    """
+    Test plain evaluation of scan and first match extensions.
+    """
+
+    assert np.array_equal(function(sample), expected_output)
+
+
+@pytest.mark.parametrize(
+    "function,bit_width,shape",
+    [
+        pytest.param(
+            lambda x: fhe.scan(x),
+            3,
+            (7,),
+            id="fhe.scan(x)",
+        ),
+        pytest.param(
+            lambda x: fhe.scan(x, np.maximum, axis=1, exclusive=True),
+            3,
+            (2, 5),
+            id="fhe.scan(x, np.maximum, axis=1, exclusive=True)",
+        ),
+        pytest.param(
+            lambda x: fhe.scan(x, np.bitwise_or),
+            1,
+            (8,),
+            id="fhe.scan(x, np.bitwise_or)",
+        ),
+        pytest.param(
+            lambda x: fhe.first_match(x),
+            1,
+            (8,),
+            id="fhe.first_match(x)",
+        ),
+        pytest.param(
+            lambda x: fhe.first_match(1 - x, axis=0),
+            1,
+            (5, 2),
+            id="fhe.first_match(1 - x, axis=0)",
+        ),
+    ],
+)
+def test_scan(function, bit_width, shape, helpers):
+    """
+    Test encrypted evaluation of scan and first match extensions.
+    """
+
+    inputset = [np.random.randint(0, 2**bit_width, size=shape) for _ in range(100)]
+    configuration = helpers.configuration()
+
+    compiler = fhe.Compiler(function, {"x": "encrypted"})
+    circuit = compiler.compile(inputset, configuration)
+
+    for value in inputset[:3]:
+        helpers.check_execution(circuit, function, value, retries=3)
+
+
+def test_first_match_depth(helpers):
+    """
+    Test that first match has logarithmic depth instead of a sequential chain.
+    """
+
+    configuration = helpers.configuration()
+
+    inputset = [np.random.randint(0, 2, size=(16,)) for _ in range(100)]
+    circuit = fhe.Compiler(lambda x: fhe.first_match(x), {"x": "encrypted"}).compile(
+        inputset, configuration
+    )
+
+    # log2(16) levels of bitwise or and a single comparison
+    bitwise_nodes = circuit.graph.query_nodes(operation_filter="bitwise_or")
+    comparison_nodes = circuit.graph.query_nodes(operation_filter="equal")
+
+    assert len(bitwise_nodes) == 4
+    assert len(comparison_nodes) == 1
+
+
+def test_bad_scan():
+    """
+    Test scan and first match extensions with bad parameters.
+    """
+
+    with pytest.raises(ValueError) as excinfo:
+        fhe.scan(3)
+
+    assert str(excinfo.value) == "scan of a scalar is not supported"
+
+    with pytest.raises(ValueError) as excinfo:
+        fhe.first_match([0, 1], axis=1)
+
+    assert str(excinfo.value) == (
+        "first_match along axis 1 of a 1-dimensional tensor is not supported"
+    )
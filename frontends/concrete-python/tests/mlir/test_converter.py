@@ -1723,17 +1723,12 @@ module {
   func.func @"<lambda>"(%arg0: tensor<8x!FHE.eint<4>>, %arg1: i4) -> !FHE.eint<4> {
     %c8_i5 = arith.constant 8 : i5
     %0 = arith.extsi %arg1 : i4 to i5
-    %1 = arith.cmpi sge, %0, %c8_i5 : i5
+    %1 = arith.cmpi uge, %0, %c8_i5 : i5
     scf.if %1 {
       "Tracing.trace_message"() {msg = "Runtime Warning: Index out of range on \\22%2 = %0[%1]\\22\\0A"} : () -> ()
     }
-    %c0_i5 = arith.constant 0 : i5
-    %2 = arith.cmpi slt, %0, %c0_i5 : i5
-    scf.if %2 {
-      "Tracing.trace_message"() {msg = "Runtime Warning: Index out of range on \\22%2 = %0[%1]\\22\\0A"} : () -> ()
-    }
-    %3 = arith.index_cast %arg1 : i4 to index
-    %extracted = tensor.extract %arg0[%3] : tensor<8x!FHE.eint<4>>
+    %2 = arith.index_cast %arg1 : i4 to index
+    %extracted = tensor.extract %arg0[%2] : tensor<8x!FHE.eint<4>>
     return %extracted : !FHE.eint<4>
   }
 }
@@ -1757,21 +1752,17 @@ module {
     %c0_i5 = arith.constant 0 : i5
     %0 = arith.cmpi slt, %arg1, %c0_i5 : i5
     %1 = scf.if %0 -> (i5) {
-      %5 = arith.addi %arg1, %c8_i5 : i5
-      scf.yield %5 : i5
+      %4 = arith.addi %arg1, %c8_i5 : i5
+      scf.yield %4 : i5
     } else {
       scf.yield %arg1 : i5
     }
-    %2 = arith.cmpi sge, %1, %c8_i5 : i5
+    %2 = arith.cmpi uge, %1, %c8_i5 : i5
     scf.if %2 {
       "Tracing.trace_message"() {msg = "Runtime Warning: Index out of range on \\22%2 = %0[%1]\\22\\0A"} : () -> ()
     }
-    %3 = arith.cmpi slt, %1, %c0_i5 : i5
-    scf.if %3 {
-      "Tracing.trace_message"() {msg = "Runtime Warning: Index out of range on \\22%2 = %0[%1]\\22\\0A"} : () -> ()
-    }
-    %4 = arith.index_cast %1 : i5 to index
-    %extracted = tensor.extract %arg0[%4] : tensor<8x!FHE.eint<4>>
+    %3 = arith.index_cast %1 : i5 to index
+    %extracted = tensor.extract %arg0[%3] : tensor<8x!FHE.eint<4>>
     return %extracted : !FHE.eint<4>
   }
 }
@@ -1849,29 +1840,23 @@ module {
   func.func @"<lambda>"(%arg0: tensor<8x!FHE.eint<4>>, %arg1: tensor<3x2xi4>) -> tensor<3x2x!FHE.eint<4>> {
     %c8_i5 = arith.constant 8 : i5
     %0 = arith.extsi %arg1 : tensor<3x2xi4> to tensor<3x2xi5>
+    %collapsed = tensor.collapse_shape %0 [[0, 1]] : tensor<3x2xi5> into tensor<6xi5>
+    %false = arith.constant false
     %c0 = arith.constant 0 : index
-    %c3 = arith.constant 3 : index
+    %c6 = arith.constant 6 : index
     %c1 = arith.constant 1 : index
-    scf.for %arg2 = %c0 to %c3 step %c1 {
-      %c0_0 = arith.constant 0 : index
-      %c2 = arith.constant 2 : index
-      %c1_1 = arith.constant 1 : index
-      scf.for %arg3 = %c0_0 to %c2 step %c1_1 {
-        %extracted = tensor.extract %0[%arg2, %arg3] : tensor<3x2xi5>
-        %3 = arith.cmpi sge, %extracted, %c8_i5 : i5
-        scf.if %3 {
-          "Tracing.trace_message"() {msg = "Runtime Warning: Index out of range on \\22%2 = %0[%1]\\22\\0A"} : () -> ()
-        }
-        %c0_i5 = arith.constant 0 : i5
-        %4 = arith.cmpi slt, %extracted, %c0_i5 : i5
-        scf.if %4 {
-          "Tracing.trace_message"() {msg = "Runtime Warning: Index out of range on \\22%2 = %0[%1]\\22\\0A"} : () -> ()
-        }
-      }
+    %1 = scf.for %arg2 = %c0 to %c6 step %c1 iter_args(%arg3 = %false) -> (i1) {
+      %extracted = tensor.extract %collapsed[%arg2] : tensor<6xi5>
+      %4 = arith.cmpi uge, %extracted, %c8_i5 : i5
+      %5 = arith.ori %arg3, %4 : i1
+      scf.yield %5 : i1
     }
-    %1 = arith.index_cast %arg1 : tensor<3x2xi4> to tensor<3x2xindex>
-    %2 = "FHELinalg.fancy_index"(%arg0, %1) : (tensor<8x!FHE.eint<4>>, tensor<3x2xindex>) -> tensor<3x2x!FHE.eint<4>>
-    return %2 : tensor<3x2x!FHE.eint<4>>
+    scf.if %1 {
+      "Tracing.trace_message"() {msg = "Runtime Warning: Index out of range on \\22%2 = %0[%1]\\22\\0A"} : () -> ()
+    }
+    %2 = arith.index_cast %arg1 : tensor<3x2xi4> to tensor<3x2xindex>
+    %3 = "FHELinalg.fancy_index"(%arg0, %2) : (tensor<8x!FHE.eint<4>>, tensor<3x2xindex>) -> tensor<3x2x!FHE.eint<4>>
+    return %3 : tensor<3x2x!FHE.eint<4>>
   }
 }
 
@@ -1895,27 +1880,32 @@ module {
     ^bb0(%arg2: index, %arg3: index):
       %extracted = tensor.extract %arg1[%arg2, %arg3] : tensor<3x2xi5>
       %c0_i5 = arith.constant 0 : i5
-      %2 = arith.cmpi slt, %extracted, %c0_i5 : i5
-      %3 = scf.if %2 -> (i5) {
-        %6 = arith.addi %extracted, %c8_i5 : i5
-        scf.yield %6 : i5
+      %3 = arith.cmpi slt, %extracted, %c0_i5 : i5
+      %4 = scf.if %3 -> (i5) {
+        %5 = arith.addi %extracted, %c8_i5 : i5
+        scf.yield %5 : i5
       } else {
         scf.yield %extracted : i5
       }
-      %4 = arith.cmpi sge, %3, %c8_i5 : i5
-      scf.if %4 {
-        "Tracing.trace_message"() {msg = "Runtime Warning: Index out of range on \\22%2 = %0[%1]\\22\\0A"} : () -> ()
-      }
-      %c0_i5_0 = arith.constant 0 : i5
-      %5 = arith.cmpi slt, %3, %c0_i5_0 : i5
-      scf.if %5 {
-        "Tracing.trace_message"() {msg = "Runtime Warning: Index out of range on \\22%2 = %0[%1]\\22\\0A"} : () -> ()
-      }
-      tensor.yield %3 : i5
+      tensor.yield %4 : i5
     } : tensor<3x2xi5>
-    %0 = arith.index_cast %generated : tensor<3x2xi5> to tensor<3x2xindex>
-    %1 = "FHELinalg.fancy_index"(%arg0, %0) : (tensor<8x!FHE.eint<4>>, tensor<3x2xindex>) -> tensor<3x2x!FHE.eint<4>>
-    return %1 : tensor<3x2x!FHE.eint<4>>
+    %collapsed = tensor.collapse_shape %generated [[0, 1]] : tensor<3x2xi5> into tensor<6xi5>
+    %false = arith.constant false
+    %c0 = arith.constant 0 : index
+    %c6 = arith.constant 6 : index
+    %c1 = arith.constant 1 : index
+    %0 = scf.for %arg4 = %c0 to %c6 step %c1 iter_args(%arg5 = %false) -> (i1) {
+      %extracted_0 = tensor.extract %collapsed[%arg4] : tensor<6xi5>
+      %6 = arith.cmpi uge, %extracted_0, %c8_i5 : i5
+      %7 = arith.ori %arg5, %6 : i1
+      scf.yield %7 : i1
+    }
+    scf.if %0 {
+      "Tracing.trace_message"() {msg = "Runtime Warning: Index out of range on \\22%2 = %0[%1]\\22\\0A"} : () -> ()
+    }
+    %1 = arith.index_cast %generated : tensor<3x2xi5> to tensor<3x2xindex>
+    %2 = "FHELinalg.fancy_index"(%arg0, %1) : (tensor<8x!FHE.eint<4>>, tensor<3x2xindex>) -> tensor<3x2x!FHE.eint<4>>
+    return %2 : tensor<3x2x!FHE.eint<4>>
   }
 }
 
@@ -2245,3 +2235,89 @@ def test_converter_process_single_precision(function, parameters, expected_graph
             del node.properties["original_bit_width"]
 
     helpers.check_str(expected_graph, graph.format())
+
+
+@pytest.mark.parametrize(
+    "function,parameters,option,expected_strategy",
+    [
+        pytest.param(
+            lambda x, y: x & y,
+            {
+                "x": {"range": [0, 7], "status": "encrypted"},
+                "y": {"range": [0, 15], "status": "encrypted"},
+            },
+            "bitwise_strategy_preference",
+            fhe.BitwiseStrategy.CHUNKED,
+        ),
+        pytest.param(
+            lambda x, y: x == y,
+            {
+                "x": {"range": [0, 15], "status": "encrypted"},
+                "y": {"range": [0, 127], "status": "encrypted"},
+            },
+            "comparison_strategy_preference",
+            fhe.ComparisonStrategy.TWO_TLU_BIGGER_CLIPPED_SMALLER_PROMOTED,
+        ),
+        pytest.param(
+            lambda x, y: x < y,
+            {
+                "x": {"range": [0, 7], "status": "encrypted"},
+                "y": {"range": [0, 7], "status": "encrypted"},
+            },
+            "comparison_strategy_preference",
+            fhe.ComparisonStrategy.ONE_TLU_PROMOTED,
+        ),
+        pytest.param(
+            lambda x, y: np.maximum(x, y),
+            {
+                "x": {"range": [0, 15], "status": "encrypted"},
+                "y": {"range": [0, 3], "status": "encrypted"},
+            },
+            "min_max_strategy_preference",
+            fhe.MinMaxStrategy.ONE_TLU_PROMOTED,
+        ),
+        pytest.param(
+            lambda x, y: fhe.multivariate(lambda x, y: (x * y) // 3)(x, y),
+            {
+                "x": {"range": [0, 7], "status": "encrypted"},
+                "y": {"range": [0, 7], "status": "encrypted"},
+            },
+            "multivariate_strategy_preference",
+            fhe.MultivariateStrategy.PROMOTED,
+        ),
+        pytest.param(
+            lambda x, y: fhe.multivariate(lambda x, y: (x * y) // 3)(x, y) + (x // 2) + (x // 3),
+            {
+                "x": {"range": [0, 7], "status": "encrypted"},
+                "y": {"range": [0, 7], "status": "encrypted"},
+            },
+            "multivariate_strategy_preference",
+            fhe.MultivariateStrategy.CASTED,
+            id="multivariate-with-shared-operand",
+        ),
+    ],
+)
+def test_converter_process_auto_strategy(
+    function,
+    parameters,
+    option,
+    expected_strategy,
+    helpers,
+):
+    """
+    Test `process` method of `Converter` with "auto" strategy preference.
+    """
+
+    parameter_encryption_statuses = helpers.generate_encryption_statuses(parameters)
+    configuration = helpers.configuration().fork(**{option: "auto"})
+
+    compiler = fhe.Compiler(function, parameter_encryption_statuses)
+
+    inputset = helpers.generate_inputset(parameters)
+    circuit = compiler.compile(inputset, configuration, fhe_simulation=True, fhe_execution=False)
+
+    assert list(circuit.strategies.values()) == [expected_strategy.value]
+    assert circuit.statistics["strategies"] == circuit.strategies
+
+    sample = helpers.generate_sample(parameters)
+    helpers.check_execution(circuit, function, sample, only_simulation=True)
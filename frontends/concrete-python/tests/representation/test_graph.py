@@ -498,3 +498,235 @@ def test_graph_inputs_outputs_count(
 
     assert graph.inputs_count == expected_inputs_count
     assert graph.outputs_count == expected_outputs_count
+
+
+@pytest.mark.parametrize(
+    "function,encryption_status,inputset",
+    [
+        pytest.param(
+            lambda x: (x + 1, x * 2),
+            {"x": "encrypted"},
+            fhe.inputset(fhe.tensor[fhe.uint4, 3, 2]),  # type: ignore
+        ),
+        pytest.param(
+            lambda x, y: np.sin(x) * 10 + y,
+            {"x": "encrypted", "y": "encrypted"},
+            fhe.inputset(fhe.uint4, fhe.int4, size=37),
+        ),
+        pytest.param(
+            lambda x: x**2,
+            {"x": "encrypted"},
+            [3],
+        ),
+    ],
+)
+def test_graph_measure_bounds_in_parallel(function, encryption_status, inputset, helpers):
+    """
+    Test `measure_bounds` method of `Graph` class with multiple workers.
+    """
+
+    configuration = helpers.configuration()
+
+    compiler = fhe.Compiler(function, encryption_status)
+    graph = compiler.trace(inputset, configuration)
+
+    serial_bounds = graph.measure_bounds(inputset)
+    parallel_bounds = graph.measure_bounds(iter(inputset), workers=4)
+
+    assert serial_bounds.keys() == parallel_bounds.keys()
+    for node, bounds in serial_bounds.items():
+        for key in ["min", "max"]:
+            assert type(parallel_bounds[node][key]) is type(bounds[key])  # noqa: E721
+            assert parallel_bounds[node][key] == bounds[key]
+
+
+def test_graph_measure_bounds_in_parallel_bad_inputset(helpers):
+    """
+    Test `measure_bounds` method of `Graph` class with multiple workers and a bad inputset.
+    """
+
+    configuration = helpers.configuration()
+
+    compiler = fhe.Compiler(lambda x: x + 1, {"x": "encrypted"})
+    graph = compiler.trace(range(10), configuration)
+
+    with pytest.raises(RuntimeError) as excinfo:
+        graph.measure_bounds([1, 2, 3, 4, 5, 6, np.array([1, 2]), 8, np.array([1, 2])], workers=3)
+
+    assert str(excinfo.value) == "Bound measurement using inputset[6] failed"
+
+
+@pytest.mark.parametrize(
+    "function,encryption_status,inputset",
+    [
+        pytest.param(
+            lambda x, y: np.round(np.sin(x) * 3).astype(np.int64) + np.sum(x[1:]) + y,
+            {"x": "encrypted", "y": "clear"},
+            fhe.inputset(fhe.tensor[fhe.uint3, 3], fhe.uint4),  # type: ignore
+        ),
+        pytest.param(
+            lambda x: fhe.round_bit_pattern(x * 4, lsbs_to_remove=2) + fhe.bits(x)[1],
+            {"x": "encrypted"},
+            fhe.inputset(fhe.uint4),
+        ),
+        pytest.param(
+            lambda x: fhe.LookupTable([3, 2, 1, 0, 4, 5, 6, 7])[x] + fhe.ones((2,)),
+            {"x": "encrypted"},
+            fhe.inputset(fhe.uint3),
+        ),
+        pytest.param(
+            lambda x: fhe.multivariate(np.maximum)(x[0], x[1]) - fhe.zeros(()),
+            {"x": "encrypted"},
+            fhe.inputset(fhe.tensor[fhe.int3, 2]),  # type: ignore
+        ),
+    ],
+)
+def test_graph_save_load(function, encryption_status, inputset, helpers, tmp_path):
+    """
+    Test `save` and `load` methods of `Graph` class.
+    """
+
+    configuration = helpers.configuration()
+
+    compiler = fhe.Compiler(function, encryption_status)
+    graph = compiler.trace(inputset, configuration)
+
+    path = tmp_path / "graph.npz"
+    graph.save(path)
+    loaded = fhe.Graph.load(path)
+
+    assert loaded.format() == graph.format()
+    for sample in inputset[:5]:
+        sample = sample if isinstance(sample, tuple) else (sample,)
+        assert np.array_equal(loaded(*sample), graph(*sample))
+
+
+def test_graph_save_load_fused_subgraph(helpers, tmp_path):
+    """
+    Test `save` and `load` methods of `Graph` class with a fused subgraph.
+    """
+
+    configuration = helpers.configuration()
+
+    def function(x):
+        return (np.sin(x) * 10).astype(np.int64) + x[0]
+
+    compiler = fhe.Compiler(function, {"x": "encrypted"})
+    inputset = fhe.inputset(fhe.tensor[fhe.uint4, 3])  # type: ignore
+    graph = compiler.trace(inputset, configuration)
+
+    # evaluators of fused subgraphs and indexing are private functions of the library
+    assert any("subgraph" in node.properties["kwargs"] for node in graph.graph.nodes)
+
+    path = tmp_path / "graph.npz"
+    graph.save(path)
+    loaded = fhe.Graph.load(path)
+
+    assert loaded.format() == graph.format()
+    for sample in inputset[:5]:
+        assert np.array_equal(loaded(sample), graph(sample))
+
+
+def test_graph_load_private_reference(helpers, tmp_path):
+    """
+    Test `load` method of `Graph` class with private or special references of user modules.
+    """
+
+    configuration = helpers.configuration()
+
+    compiler = fhe.Compiler(lambda x: fhe.univariate(halve)(x), {"x": "encrypted"})
+    graph = compiler.trace(range(10), configuration)
+
+    path = tmp_path / "graph.npz"
+    graph.save(path)
+
+    with np.load(path) as archive:
+        arrays = {key: archive[key] for key in archive.files}
+    description = arrays["description"].tobytes().decode("utf-8")
+
+    for forged_reference in [f"{__name__}:_private_halve", f"{__name__}:halve.__globals__"]:
+        forged_description = description.replace(f"{__name__}:halve", forged_reference)
+        arrays["description"] = np.frombuffer(forged_description.encode("utf-8"), dtype=np.uint8)
+
+        forged_path = tmp_path / "forged_graph.npz"
+        np.savez_compressed(forged_path, **arrays)
+
+        with pytest.raises(RuntimeError) as excinfo:
+            fhe.Graph.load(forged_path, trusted_modules=[__name__])
+
+        assert str(excinfo.value) == (
+            f"Reference '{forged_reference}' cannot be loaded as it's not within trusted modules"
+        )
+
+
+def _private_halve(x):
+    return x // 2
+
+
+def test_graph_save_unreferenceable_operation(helpers, tmp_path):
+    """
+    Test `save` method of `Graph` class with an operation that cannot be referenced.
+    """
+
+    configuration = helpers.configuration()
+
+    compiler = fhe.Compiler(lambda x: fhe.univariate(lambda x: x // 2)(x), {"x": "encrypted"})
+    graph = compiler.trace(range(10), configuration)
+
+    with pytest.raises(RuntimeError) as excinfo:
+        graph.save(tmp_path / "graph.npz")
+
+    assert str(excinfo.value).startswith(
+        "Graph cannot be saved because the operation of '<lambda>' node at "
+    )
+
+
+def halve(x):
+    """
+    Example function to save by reference.
+    """
+
+    return x // 2
+
+
+def test_graph_load_untrusted_reference(helpers, tmp_path):
+    """
+    Test `load` method of `Graph` class with references outside of trusted modules.
+    """
+
+    configuration = helpers.configuration()
+
+    compiler = fhe.Compiler(lambda x: fhe.univariate(halve)(x), {"x": "encrypted"})
+    graph = compiler.trace(range(10), configuration)
+
+    path = tmp_path / "graph.npz"
+    graph.save(path)
+
+    reference = f"{__name__}:halve"
+    with pytest.raises(RuntimeError) as excinfo:
+        fhe.Graph.load(path)
+
+    assert str(excinfo.value) == (
+        f"Reference '{reference}' cannot be loaded as it's not within trusted modules"
+    )
+
+    loaded = fhe.Graph.load(path, trusted_modules=[__name__])
+    assert loaded.format() == graph.format()
+
+    # references in files can point to anything, so they are not trusted even if they are given
+    with np.load(path) as archive:
+        arrays = {key: archive[key] for key in archive.files}
+    description = arrays["description"].tobytes().decode("utf-8")
+    assert reference in description
+    description = description.replace(reference, "os:system")
+    arrays["description"] = np.frombuffer(description.encode("utf-8"), dtype=np.uint8)
+
+    forged_path = tmp_path / "forged_graph.npz"
+    np.savez_compressed(forged_path, **arrays)
+
+    with pytest.raises(RuntimeError) as excinfo:
+        fhe.Graph.load(forged_path, trusted_modules=[__name__])
+
+    assert str(excinfo.value) == (
+        "Reference 'os:system' cannot be loaded as it's not within trusted modules"
+    )